@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+"""
+Measures what the undo history costs per committed edit on a large song.
+
+The script fills every channel with patterns of note rows, then commits single-cell edits through
+a strict `HistoryManager` and reports the capture time of each commit and the bytes each edit adds
+to the retained snapshots, next to the time a whole-project deep copy takes on the same song.
+
+Usage:
+    python scripts/benchmarks/history.py [--patterns 64] [--edits 200]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Final, List
+
+from sampletones_application.logic.history.action import HistoryAction
+from sampletones_application.logic.history.manager import HistoryManager
+from sampletones_application.logic.project.controller import ProjectController
+from sampletones_application.logic.project.manager import ProjectManager
+from sampletones_application.logic.shared.project_source import snapshot_project
+from sampletones_core.constants.enums import GeneratorName
+from sampletones_shared.constants.memory import BYTES_PER_MEBIBYTE
+from sampletones_shared.logger import logger
+
+DEFAULT_PATTERNS: Final[int] = 64
+DEFAULT_EDITS: Final[int] = 200
+UNBOUNDED_BUDGET: Final[int] = 1 << 40
+TRANSPOSE_SPAN: Final[int] = 24
+MILLISECONDS_PER_SECOND: Final[float] = 1000.0
+
+
+def build_song(controller: ProjectController, patterns: int) -> None:
+    rows_per_pattern = controller.song.rows_per_pattern
+    for generator in GeneratorName.items():
+        for _ in range(patterns):
+            index = controller.add_pattern(generator)
+            for row in range(rows_per_pattern):
+                controller.set_row(generator, index, row, transpose=(row + index) % TRANSPOSE_SPAN)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark undo history capture time and bytes per edit.")
+    parser.add_argument("--patterns", type=int, default=DEFAULT_PATTERNS, help="Patterns per channel.")
+    parser.add_argument("--edits", type=int, default=DEFAULT_EDITS, help="Single-cell edits to commit.")
+    arguments = parser.parse_args()
+
+    controller = ProjectController(ProjectManager())
+    history = HistoryManager(controller, budget=arguments.edits + 1, memory_budget=UNBOUNDED_BUDGET, strict=True)
+    controller.new()
+    build_song(controller, arguments.patterns)
+    controller.on_mutation = history.handle_mutation
+    history.reset()
+    baseline_bytes = history.retained_bytes
+
+    start = time.perf_counter()
+    snapshot_project(controller.project)
+    deep_copy_time = time.perf_counter() - start
+
+    rows_per_pattern = controller.song.rows_per_pattern
+    generators = GeneratorName.items()
+    capture_times: List[float] = []
+    for edit in range(arguments.edits):
+        generator = generators[edit % len(generators)]
+        row = edit % rows_per_pattern
+        start = time.perf_counter()
+        with history.transaction(HistoryAction.EDIT_ROW):
+            controller.set_row(generator, edit % arguments.patterns, row, transpose=(row + 1) % TRANSPOSE_SPAN)
+        capture_times.append(time.perf_counter() - start)
+
+    bytes_per_edit = (history.retained_bytes - baseline_bytes) / arguments.edits
+    logger.info(f"Song: {arguments.patterns} patterns x {len(generators)} channels x {rows_per_pattern} rows")
+    logger.info(f"Baseline snapshot: {baseline_bytes / BYTES_PER_MEBIBYTE:.2f} MiB")
+    logger.info(f"Whole-project deep copy: {deep_copy_time * MILLISECONDS_PER_SECOND:.2f} ms")
+    logger.info(f"Capture per edit (median): {statistics.median(capture_times) * MILLISECONDS_PER_SECOND:.2f} ms")
+    logger.info(f"Capture per edit (max): {max(capture_times) * MILLISECONDS_PER_SECOND:.2f} ms")
+    logger.info(f"Bytes per edit: {bytes_per_edit:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""
+Measures how much faster than real time the tracker synthesizer renders a song.
+
+The script fills every channel with a looping sample of varied instructions, places notes on
+a share of the rows with changing transpose and volume, renders the whole song row by row
+through a `RowSynthesizer` and reports the seconds of audio rendered per second of work.
+
+Usage:
+    python scripts/benchmarks/synthesis.py [--patterns 8] [--instructions 120] [--note-every 4]
+"""
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import Dict, Final, List
+
+import numpy as np
+
+from sampletones_application.logic.project.controller import ProjectController
+from sampletones_application.logic.project.manager import ProjectManager
+from sampletones_application.logic.sequencer.channels import ALL_CHANNELS
+from sampletones_application.logic.sequencer.playback.synthesizer import RowSynthesizer
+from sampletones_application.logic.shared.project_source import ProjectSnapshot
+from sampletones_core.configs import Config
+from sampletones_core.constants.audio import DEFAULT_SAMPLE_RATE
+from sampletones_core.constants.enums import GeneratorName
+from sampletones_core.generators.maps import GENERATOR_CLASSES
+from sampletones_core.instructions import InstructionUnion
+from sampletones_core.project.instruments.instrument import Instrument
+from sampletones_core.reconstructions import Reconstruction
+from sampletones_shared.logger import logger
+
+DEFAULT_PATTERNS: Final[int] = 8
+DEFAULT_INSTRUCTIONS: Final[int] = 120
+DEFAULT_NOTE_EVERY: Final[int] = 4
+SEED: Final[int] = 0
+TRANSPOSE_SPAN: Final[int] = 12
+APPROXIMATION_LENGTH: Final[int] = 64
+
+
+def build_reconstruction(generator_name: GeneratorName, count: int, rng: random.Random) -> Reconstruction:
+    generator = GENERATOR_CLASSES[generator_name](Config(), generator_name.value)
+    possible: List[InstructionUnion] = generator.get_possible_instructions()[1:]  # type: ignore[assignment]
+    instructions = [rng.choice(possible) for _ in range(count)]
+    return Reconstruction.create(
+        approximation=np.zeros(APPROXIMATION_LENGTH, dtype=np.float32),
+        approximations={generator_name: np.zeros(APPROXIMATION_LENGTH, dtype=np.float32)},
+        instructions={generator_name: instructions},
+        config=Config(),
+        coefficient=1.0,
+        audio_filepath=Path("/dev/null"),
+    )
+
+
+def build_song(controller: ProjectController, patterns: int, instructions: int, note_every: int) -> None:
+    rng = random.Random(SEED)
+    sample_ids: Dict[GeneratorName, str] = {}
+    for generator_name in GeneratorName.items():
+        sample = controller.add_sample(build_reconstruction(generator_name, instructions, rng), generator_name.value)
+        controller.set_sample_loop(sample.id, loop=True)
+        sample_ids[generator_name] = sample.id
+
+    rows_per_pattern = controller.song.rows_per_pattern
+    for order_position in range(patterns):
+        if order_position > 0:
+            controller.append_frame()
+
+        for generator_name in GeneratorName.items():
+            pattern_index = controller.add_pattern(generator_name)
+            controller.set_order_entry(generator_name, order_position, pattern_index)
+            for row in range(0, rows_per_pattern, note_every):
+                controller.set_row(
+                    generator_name,
+                    pattern_index,
+                    row,
+                    command=Instrument(sample_id=sample_ids[generator_name], generator_name=generator_name),
+                    transpose=rng.randrange(TRANSPOSE_SPAN),
+                    volume=rng.randrange(1, 16),
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark tracker song synthesis against real time.")
+    parser.add_argument("--patterns", type=int, default=DEFAULT_PATTERNS, help="Order rows in the song.")
+    parser.add_argument("--instructions", type=int, default=DEFAULT_INSTRUCTIONS, help="Frames per sample.")
+    parser.add_argument("--note-every", type=int, default=DEFAULT_NOTE_EVERY, help="Rows between notes.")
+    arguments = parser.parse_args()
+
+    controller = ProjectController(ProjectManager())
+    controller.new()
+    build_song(controller, arguments.patterns, arguments.instructions, arguments.note_every)
+
+    synthesizer = RowSynthesizer(
+        ProjectSnapshot.capture(controller),
+        Config(),
+        active_channels=lambda: ALL_CHANNELS,
+        sample_rate=lambda: DEFAULT_SAMPLE_RATE,
+    )
+
+    samples = 0
+    rows = 0
+    start = time.perf_counter()
+    while not synthesizer.is_finished:
+        audio, _ = synthesizer.render_row()
+        samples += len(audio)
+        rows += 1
+    elapsed = time.perf_counter() - start
+
+    duration = samples / DEFAULT_SAMPLE_RATE
+    logger.info(f"Song: {rows} rows, {duration:.1f} s of audio at {DEFAULT_SAMPLE_RATE} Hz")
+    logger.info(f"Render time: {elapsed:.2f} s ({elapsed / rows * 1000:.2f} ms per row)")
+    logger.info(f"Real-time factor: {duration / elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
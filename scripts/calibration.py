@@ -1,14 +1,23 @@
 import argparse
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Final
+from typing import Final, List
 
 from sampletones_core.calibration.config.corpus import CorpusConfig
 from sampletones_core.calibration.corpus.synthesis import build_corpus
 from sampletones_core.calibration.corpus.writer import write_corpus
 from sampletones_core.calibration.referee.factory import build_referees
-from sampletones_core.calibration.report import write_csv, write_markdown
-from sampletones_core.calibration.runner import build_variants, evaluate_variants
+from sampletones_core.calibration.report import (
+    append_csv,
+    read_csv,
+    write_csv,
+    write_markdown,
+)
+from sampletones_core.calibration.runner import (
+    CalibrationRow,
+    build_variants,
+    evaluate_variants,
+)
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import (
     DEFAULT_GENERATORS,
@@ -64,7 +73,20 @@ def main() -> None:
         default=DEFAULT_GENERATOR_NAMES,
         help="Comma-separated channel generators every variant reconstructs with.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes evaluating (variant, item) pairs at once; defaults to general.max_workers.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the interrupted run in --output, skipping the pairs its report already holds.",
+    )
     arguments = parser.parse_args()
+    if arguments.resume and arguments.output is None:
+        parser.error("--resume requires --output")
 
     generators = [GeneratorName(name.strip()) for name in arguments.generators.split(",") if name.strip()]
     if not generators:
@@ -98,10 +120,28 @@ def main() -> None:
     logger.info(
         f"Evaluating {len(variants)} variants x {len(items)} items x {len(referees)} referees on {channel_names}"
     )
-    rows = evaluate_variants(variants, items, item_paths, referees)
+    csv_path = output / "report.csv"
+    markdown_path = output / "report.md"
+    rows: List[CalibrationRow] = read_csv(csv_path) if arguments.resume else []
+    if not arguments.resume:
+        write_csv(rows, csv_path)
+
+    def record(pair_rows: List[CalibrationRow]) -> None:
+        rows.extend(pair_rows)
+        append_csv(pair_rows, csv_path)
+        write_markdown(rows, markdown_path)
+
+    evaluate_variants(
+        variants,
+        items,
+        item_paths,
+        referees,
+        max_workers=arguments.workers or base.general.max_workers,
+        completed={(row.variant, row.item) for row in rows},
+        on_rows=record,
+    )
 
-    write_csv(rows, output / "report.csv")
-    write_markdown(rows, output / "report.md")
+    write_markdown(rows, markdown_path)
     logger.info(f"Report written to {output}")
 
 
@@ -38,7 +38,9 @@ VISUAL = [
 ]
 
 SERVICE_CONTRACTS = [
+    "sampletones_application.services.library.result",
     "sampletones_application.services.result",
+    "sampletones_application.services.render.plan",
     "sampletones_application.services.render.result",
     "sampletones_application.services.song_player.result",
 ]
@@ -3,12 +3,14 @@ import multiprocessing
 from argparse import RawTextHelpFormatter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
+from sampletones_core.trackers.format import BATCH_EXPORT_FORMATS
 from sampletones_shared.paths.extensions import EXT_FILES_AUDIO
 
 if TYPE_CHECKING:
     from sampletones_core.configs import Config
+    from sampletones_core.reconstructions import ReconstructionCache
 
 HELP_PATH = """Path to either:
     * audio file path/directory to reconstruct
@@ -20,9 +22,29 @@ HELP_OUTPUT = """Output path for reconstruction."""
 HELP_CONFIG = """Path to a configuration .json file
     (if not provided, default configuration will be used)"""
 
+HELP_CONFIGS = """Paths to several configuration .json files to reconstruct
+    an audio file or directory under at once, such as PAL, NTSC and
+    high-rate variants; each file is decoded and analysed once for
+    every configuration sharing the settings, and each configuration
+    writes to its own reconstructions directory"""
+
 HELP_GENERATE = """Generate library data for given configuration
     (using default one if not provided)"""
 
+HELP_RESUME = """Resume a directory reconstruction from its manifest,
+    skipping files already reconstructed with the same contents
+    and configuration and retrying failed ones"""
+
+HELP_CACHE = """Reuse reconstructions of audio converted before
+    with the same settings, and cache new ones"""
+
+HELP_PROFILE = """Report the time each reconstruction stage took
+    and the work it did, per file and in total"""
+
+HELP_EXPORT = """Export the tracker instruments of a reconstruction or audio
+    file, or of every one under a directory, in the given format
+    (audio is reconstructed first; written beside the input unless -o is given)"""
+
 HELP_HELP = """Show this help message and exit"""
 
 HELP_VERSION = "Show application version information"
@@ -30,17 +52,26 @@ HELP_VERSION = "Show application version information"
 HELP_SELF_CHECK = """Verify that the imports, bundled resources
     and configuration files this build ships are all usable"""
 
+HELP_TIMINGS = """With --self-check, report the time each check spent
+    importing modules and initializing, and the slowest imports"""
+
 
 @dataclass(frozen=True)
 class ProgramArguments:
     path: Optional[Path] = None
     output: Optional[Path] = None
     config: Optional[Path] = None
+    configs: Optional[List[Path]] = None
 
     help: bool = False
     version: bool = False
     generate: bool = False
+    resume: bool = False
+    cache: bool = False
+    profile: bool = False
     self_check: bool = False
+    timings: bool = False
+    export: Optional[str] = None
 
 
 def _load_config(config_path: Optional[Path]) -> "Config":
@@ -49,6 +80,15 @@ def _load_config(config_path: Optional[Path]) -> "Config":
     return Config.load(config_path) if config_path else Config.default()
 
 
+def _load_cache(enabled: bool) -> Optional["ReconstructionCache"]:
+    if not enabled:
+        return None
+
+    from sampletones_core.reconstructions import ReconstructionCache
+
+    return ReconstructionCache()
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         prog="SampleToNES",
@@ -75,12 +115,35 @@ def main() -> None:
         default=None,
         help=HELP_CONFIG,
     )
+    parser.add_argument(
+        "--configs",
+        type=Path,
+        nargs="+",
+        default=None,
+        help=HELP_CONFIGS,
+    )
     parser.add_argument(
         "--generate",
         "-g",
         action="store_true",
         help=HELP_GENERATE,
     )
+    parser.add_argument(
+        "--resume",
+        "-r",
+        action="store_true",
+        help=HELP_RESUME,
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=HELP_CACHE,
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=HELP_PROFILE,
+    )
     parser.add_argument(
         "--help",
         "-h",
@@ -98,6 +161,18 @@ def main() -> None:
         action="store_true",
         help=HELP_SELF_CHECK,
     )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help=HELP_TIMINGS,
+    )
+    parser.add_argument(
+        "--export",
+        "-e",
+        choices=tuple(BATCH_EXPORT_FORMATS),
+        default=None,
+        help=HELP_EXPORT,
+    )
     args: ProgramArguments = ProgramArguments(**vars(parser.parse_args()))
 
     if args.help:
@@ -114,7 +189,7 @@ def main() -> None:
     if args.self_check:
         from sampletones.self_check import run_self_check
 
-        raise SystemExit(run_self_check())
+        raise SystemExit(run_self_check(timings=args.timings))
 
     config_path = Path(args.config) if args.config else None
     output_path = Path(args.output) if args.output else None
@@ -131,6 +206,37 @@ def main() -> None:
         config = _load_config(config_path)
         return generate_library(config)
 
+    if args.export:
+        if not args.path:
+            raise RuntimeError("Exporting instruments requires a reconstruction or audio file, or a directory.")
+
+        from sampletones_core.scripts.export import export_instruments
+
+        config = _load_config(config_path)
+        return export_instruments(
+            Path(args.path),
+            config,
+            BATCH_EXPORT_FORMATS[args.export],
+            output_path,
+            cache=_load_cache(args.cache),
+        )
+
+    if args.configs:
+        if not args.path:
+            raise RuntimeError("Reconstructing under several configurations requires an audio file or a directory.")
+
+        if args.config or args.output or args.resume or args.profile:
+            raise RuntimeError("--configs cannot be combined with --config, --output, --resume or --profile.")
+
+        from sampletones_core.configs import Config
+        from sampletones_core.scripts.reconstruction import reconstruct_configs
+
+        return reconstruct_configs(
+            Path(args.path),
+            [Config.load(path) for path in args.configs],
+            cache=_load_cache(args.cache),
+        )
+
     project_path: Optional[Path] = None
     library_path: Optional[Path] = None
     reconstruction_path: Optional[Path] = None
@@ -154,7 +260,13 @@ def main() -> None:
                 )
 
                 config = _load_config(config_path)
-                return reconstruct_file(path, config, output_path)
+                return reconstruct_file(
+                    path,
+                    config,
+                    output_path,
+                    cache=_load_cache(args.cache),
+                    profile=args.profile,
+                )
 
             else:
                 raise RuntimeError(
@@ -169,7 +281,13 @@ def main() -> None:
             )
 
             config = _load_config(config_path)
-            return reconstruct_directory(path, config)
+            return reconstruct_directory(
+                path,
+                config,
+                resume=args.resume,
+                cache=_load_cache(args.cache),
+                profile=args.profile,
+            )
 
         else:
             raise RuntimeError("Unsupported path type or file extension.")
@@ -1,8 +1,11 @@
 import sys
+import time
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Final, List, Tuple, Type
+from typing import TYPE_CHECKING, Callable, Final, List, Optional, Tuple, Type
 
 from sampletones_shared.exceptions import SampleToNESError
+from sampletones_shared.utils.system.imports import ImportTimer
 
 if TYPE_CHECKING:
     from sampletones_application.utils.palette.catalog import PaletteCatalog
@@ -24,6 +27,9 @@ FAILURE_STATUS: Final[int] = 1
 SUCCESS_PREFIX: Final[str] = "[ok]"
 FAILURE_PREFIX: Final[str] = "[FAIL]"
 
+TIMINGS_LIMIT: Final[int] = 20
+MILLISECONDS: Final[float] = 1000.0
+
 
 @dataclass(frozen=True)
 class SelfCheck:
@@ -145,21 +151,80 @@ CHECKS: Final[Tuple[SelfCheck, ...]] = (
 )
 
 
-def run_self_check() -> int:
+def run_self_check(timings: bool = False) -> int:
     """Runs every startup check in order and returns the process exit status.
 
     Prints one line per check so a passing run doubles as an inventory of what the build
     carries, and stops at the first failure with the offending check named on the standard
     error stream. A packaged build runs this to prove it starts before it is shipped.
+
+    With timings, each line also splits the time its check took into the time spent
+    importing modules and the time left for initialization, and a passing run ends with
+    the import time per package and the slowest modules to import.
     """
+    timer = ImportTimer() if timings else None
+    with timer if timer is not None else nullcontext():
+        passed = _run_checks(timer)
+
+    if not passed:
+        return FAILURE_STATUS
+
+    print(f"{SUCCESS_PREFIX} {len(CHECKS)} checks passed")
+    if timer is not None:
+        print(format_import_timings(timer))
+
+    return SUCCESS_STATUS
+
+
+def _run_checks(timer: Optional[ImportTimer]) -> bool:
     for check in CHECKS:
+        imported = timer.total if timer is not None else 0.0
+        start = time.perf_counter()
         try:
             detail = check.run()
         except CHECK_FAILURES as exception:
             print(f"{FAILURE_PREFIX} {check.name}: {type(exception).__name__}: {exception}", file=sys.stderr)
-            return FAILURE_STATUS
+            return False
+
+        if timer is not None:
+            imports = timer.total - imported
+            initialization = time.perf_counter() - start - imports
+            detail += f" (import {_milliseconds(imports)}, init {_milliseconds(initialization)})"
 
         print(f"{SUCCESS_PREFIX} {check.name}: {detail}")
 
-    print(f"{SUCCESS_PREFIX} {len(CHECKS)} checks passed")
-    return SUCCESS_STATUS
+    return True
+
+
+def format_import_timings(timer: ImportTimer) -> str:
+    """Renders what a timer recorded as plain-text tables.
+
+    Own import time per top-level package comes first, then the slowest modules to import
+    with their own and cumulative time.
+    """
+    packages = list(timer.by_package().items())[:TIMINGS_LIMIT]
+    package_rows = [[package, _milliseconds(seconds)] for package, seconds in packages]
+    module_rows = [
+        [timing.name, _milliseconds(timing.own), _milliseconds(timing.cumulative)]
+        for timing in timer.slowest(TIMINGS_LIMIT)
+    ]
+
+    lines = [f"imported {len(timer.timings)} modules in {_milliseconds(timer.total)}", ""]
+    lines += _table(["package", "import"], package_rows)
+    lines.append("")
+    lines += _table(["module", "own", "cumulative"], module_rows)
+    return "\n".join(lines)
+
+
+def _milliseconds(seconds: float) -> str:
+    return f"{seconds * MILLISECONDS:.1f} ms"
+
+
+def _table(header: List[str], rows: List[List[str]]) -> List[str]:
+    widths = [max(len(row[index]) for row in [header, *rows]) for index in range(len(header))]
+    return [_table_line(row, widths) for row in [header, ["-" * width for width in widths], *rows]]
+
+
+def _table_line(cells: List[str], widths: List[int]) -> str:
+    first, *rest = cells
+    return "  ".join([first.ljust(widths[0]), *(cell.rjust(width) for cell, width in zip(rest, widths[1:]))])
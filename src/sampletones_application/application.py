@@ -67,6 +67,7 @@ from sampletones_application.paths import (
 from sampletones_application.services import (
     ConversionService,
     ExportService,
+    LibraryLoadService,
     RegeneratedInstrument,
     RegenerationService,
     RetunedSample,
@@ -222,6 +223,7 @@ class Application:
         self.library_manager = InstructionsLibraryManager(
             self.config_manager,
             language_manager=self.language_manager,
+            memory_budget=self.session_manager.library_memory_budget,
         )
         self.browser_manager = BrowserManager(
             self.config_manager,
@@ -232,9 +234,13 @@ class Application:
         )
 
         _priority = self.layout.behavior.scheduling.priorities.schedule
-        self.conversion_service: ConversionService = ConversionService(priority=_priority)
+        self.conversion_service: ConversionService = ConversionService(
+            priority=_priority,
+            cache=self.session_manager.reconstruction_cache,
+        )
         self.regeneration_service: RegenerationService = RegenerationService(priority=_priority)
         self.export_service: ExportService = ExportService(priority=_priority)
+        self.library_load_service: LibraryLoadService = LibraryLoadService(priority=_priority)
         self.render_service: SongRenderService = SongRenderService(priority=_priority)
         self.retune_service: SampleRetuneService = SampleRetuneService(priority=_priority)
         self.retune_service.subscribe(self._on_retune_result)
@@ -246,6 +252,7 @@ class Application:
         self.history: HistoryManager = HistoryManager(
             self.project_controller,
             budget=self.session_manager.history_budget,
+            memory_budget=self.session_manager.history_memory_budget,
             strict=self.deployment.strict_history,
         )
         self.project_controller.on_mutation = self.history.handle_mutation
@@ -408,6 +415,7 @@ class Application:
             session_manager=self.session_manager,
             audio_device_manager=self.audio_device_manager,
             library_manager=self.library_manager,
+            library_load_service=self.library_load_service,
             on_audio_state_changed=self._update_menu,
             on_generation_state_changed=self._on_library_operation_changed,
             is_operation_active=self._is_operation_active,
@@ -40,6 +40,8 @@ class InstructionsLibraryElements(AbstractElement):
     LIBRARY_NOT_EXISTS_TEMPLATE = "library_not_exists_template"
     LIBRARY_EXISTS_TEMPLATE = "library_exists_template"
     LIBRARY_LOADED_TEMPLATE = "library_loaded_template"
+    LIBRARY_LOADING_TEMPLATE = "library_loading_template"
+    LIBRARY_LOADING_PROGRESS_TEMPLATE = "library_loading_progress_template"
     INCOMPATIBLE_VERSION_TEMPLATE = "incompatible_version_template"
 
 
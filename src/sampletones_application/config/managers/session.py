@@ -10,6 +10,8 @@ from sampletones_application.config.session.state.state import ApplicationState
 from sampletones_application.constants.playback import FollowMode
 from sampletones_core.audio import AudioDeviceManager, CurrentDevice
 from sampletones_core.constants.audio import BufferSize
+from sampletones_core.reconstructions import ReconstructionCache
+from sampletones_shared.constants.memory import BYTES_PER_MEBIBYTE
 
 
 class SessionManager:
@@ -274,3 +276,22 @@ class SessionManager:
     @property
     def history_budget(self) -> int:
         return self._config_manager.config.history.budget
+
+    @property
+    def history_memory_budget(self) -> int:
+        """The memory budget of the undo history, in bytes."""
+        return self._config_manager.config.history.memory_budget * BYTES_PER_MEBIBYTE
+
+    @property
+    def library_memory_budget(self) -> int:
+        """The memory budget of the loaded instruction libraries, in bytes."""
+        return self._config_manager.config.library.memory_budget * BYTES_PER_MEBIBYTE
+
+    @property
+    def reconstruction_cache(self) -> Optional[ReconstructionCache]:
+        """The cache conversions reuse reconstructions from, when enabled."""
+        config = self._config_manager.config.reconstructions
+        if not config.enabled:
+            return None
+
+        return ReconstructionCache(max_bytes=config.size * BYTES_PER_MEBIBYTE)
@@ -5,7 +5,11 @@ from sampletones_application.config.session.application.browser import BrowserCo
 from sampletones_application.config.session.application.display import DisplayConfig
 from sampletones_application.config.session.application.favorites import Favorites
 from sampletones_application.config.session.application.history import HistoryConfig
+from sampletones_application.config.session.application.library import LibraryCacheConfig
 from sampletones_application.config.session.application.playback import PlaybackConfig
+from sampletones_application.config.session.application.reconstruction import (
+    ReconstructionCacheConfig,
+)
 from sampletones_application.config.session.application.shortcuts import ShortcutsConfig
 from sampletones_core.data import Metadata
 
@@ -37,10 +41,18 @@ class ApplicationConfig(BaseModel):
         default_factory=HistoryConfig,
         description="The undo/redo history preferences.",
     )
+    library: LibraryCacheConfig = Field(
+        default_factory=LibraryCacheConfig,
+        description="The instruction library cache preferences.",
+    )
     playback: PlaybackConfig = Field(
         default_factory=PlaybackConfig,
         description="Playback behaviour preferences.",
     )
+    reconstructions: ReconstructionCacheConfig = Field(
+        default_factory=ReconstructionCacheConfig,
+        description="The reconstruction cache preferences.",
+    )
     shortcuts: ShortcutsConfig = Field(
         default_factory=ShortcutsConfig,
         description="The keybinding scheme and the actions rebound on it.",
@@ -3,14 +3,16 @@ from typing import Final
 from pydantic import BaseModel, Field
 
 DEFAULT_HISTORY_BUDGET: Final[int] = 500
+DEFAULT_HISTORY_MEMORY_BUDGET: Final[int] = 64
 
 
 class HistoryConfig(BaseModel):
     """Persisted history preferences.
 
-    ``budget`` caps how many undo entries the session keeps; once exceeded, the
-    oldest entries are evicted. It is a user-facing preference, so it lives with
-    the application configuration and survives across sessions.
+    ``budget`` caps how many undo entries the session keeps and ``memory_budget``
+    caps the memory, in MiB, their snapshots occupy; once either is exceeded, the
+    oldest entries are evicted. They are user-facing preferences, so they live with
+    the application configuration and survive across sessions.
     """
 
     budget: int = Field(
@@ -18,3 +20,8 @@ class HistoryConfig(BaseModel):
         ge=1,
         description="Maximum number of undo entries retained per session.",
     )
+    memory_budget: int = Field(
+        default=DEFAULT_HISTORY_MEMORY_BUDGET,
+        ge=1,
+        description="Maximum memory, in MiB, the retained undo snapshots may occupy.",
+    )
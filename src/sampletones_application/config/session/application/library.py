@@ -0,0 +1,20 @@
+from typing import Final
+
+from pydantic import BaseModel, Field
+
+DEFAULT_LIBRARY_MEMORY_BUDGET: Final[int] = 512
+
+
+class LibraryCacheConfig(BaseModel):
+    """Persisted instruction library cache preferences.
+
+    ``memory_budget`` caps the memory, in MiB, the instruction libraries kept loaded
+    may occupy; once it is exceeded, the least recently used libraries are dropped,
+    while the library on display is always kept.
+    """
+
+    memory_budget: int = Field(
+        default=DEFAULT_LIBRARY_MEMORY_BUDGET,
+        ge=1,
+        description="Maximum memory, in MiB, the loaded instruction libraries may occupy.",
+    )
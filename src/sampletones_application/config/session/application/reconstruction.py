@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+
+from sampletones_core.reconstructions.cache import DEFAULT_RECONSTRUCTION_CACHE_SIZE
+
+
+class ReconstructionCacheConfig(BaseModel):
+    """Persisted reconstruction cache preferences.
+
+    When ``enabled``, converting audio that was converted before under the same settings
+    reads the stored reconstruction instead of matching it again. ``size`` caps the disk
+    space, in MiB, the stored reconstructions may occupy; once it is exceeded, the least
+    recently used ones are removed.
+    """
+
+    enabled: bool = Field(
+        default=False,
+        description="Whether finished reconstructions are cached and reused.",
+    )
+    size: int = Field(
+        default=DEFAULT_RECONSTRUCTION_CACHE_SIZE,
+        ge=1,
+        description="Maximum disk space, in MiB, the cached reconstructions may occupy.",
+    )
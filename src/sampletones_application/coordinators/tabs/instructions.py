@@ -18,6 +18,7 @@ from sampletones_application.logic.instruction.library_manager import (
 from sampletones_application.logic.shared.player import PlayerLogic
 from sampletones_application.logic.shared.tree import TreeLogic
 from sampletones_application.parameters.instructions import InstructionsTabParameters
+from sampletones_application.services.library import LibraryLoadService
 from sampletones_application.tags.compose import compose_tag
 from sampletones_application.tags.general import (
     SUF_PANEL_CENTER,
@@ -92,6 +93,7 @@ class InstructionsTabCoordinator:
         session_manager: SessionManager,
         audio_device_manager: AudioDeviceManager,
         library_manager: InstructionsLibraryManager,
+        library_load_service: LibraryLoadService,
         on_audio_state_changed: VoidCallback,
         on_generation_state_changed: VoidCallback,
         is_operation_active: Callable[[], bool],
@@ -123,6 +125,7 @@ class InstructionsTabCoordinator:
         self._library_logic = LibraryLogic(
             config_manager,
             library_manager,
+            library_load_service,
             language_manager=language_manager,
             is_operation_active=is_operation_active,
         )
@@ -212,7 +215,7 @@ class InstructionsTabCoordinator:
         self._instruction_choice_panel.set_collapse_handler(self._on_card_collapse_changed)
         self._instruction_parameters_panel.set_collapse_handler(self._on_card_collapse_changed)
 
-        config_manager.add_config_change_callback(self._library_logic.update_status)
+        config_manager.add_config_change_callback(self._library_logic.handle_config_changed)
 
         self._library_logic.set_callbacks(
             on_apply_library_config=config_manager.apply_library_config,
@@ -462,8 +465,10 @@ class InstructionsTabCoordinator:
         self._instruction_parameters_panel.create_panel(parent)
 
     def initialize(self) -> None:
-        """Populates the library tree once the tab's widgets exist."""
+        """Populates the library tree once the tab's widgets exist, and starts reading the library
+        the current configuration reconstructs with."""
         self._library_logic.refresh_libraries(load_if_needed=False)
+        self._library_logic.preload_config_library()
 
     def ensure_library_loaded(self) -> None:
         """Make sure a library matching the current configuration exists before reconstructing.
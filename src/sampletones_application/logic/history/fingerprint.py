@@ -4,37 +4,48 @@ from typing import Callable, Dict, Iterable, List, Tuple
 from sampletones_core.project import Project
 from sampletones_core.reconstructions import Reconstruction
 
+from .nodes import ProjectNode
+from .store import SnapshotStore
+
 ReconstructionHash = Callable[[Reconstruction], str]
 
 
-def fingerprint_project(
-    project: Project,
+def fingerprint_snapshot(
+    snapshot: ProjectNode,
     *,
     reconstruction_hash: ReconstructionHash,
 ) -> str:
     """Returns a content hash used to verify that a restore reproduces a snapshot.
 
-    The hash covers the full project state; each sample's reconstruction content
-    enters through ``reconstruction_hash``, so the caller decides between a
-    memoized digest (capture, where copy-on-write keeps it valid) and a fresh one
-    (verification, where recomputing from scratch catches any divergence).
+    The snapshot's Merkle digest covers the full project structure; each sample's
+    reconstruction content enters through ``reconstruction_hash``, so the caller
+    decides between a memoized digest (capture, where copy-on-write keeps it valid)
+    and a fresh one (verification, where recomputing from scratch catches any
+    divergence).
     """
-    parts: List[str] = [
-        project.metadata.model_dump_json(),
-        project.info.model_dump_json(),
-        project.settings.model_dump_json(),
-        project.song.model_dump_json(),
-    ]
-    for sample in project.samples:
-        parts.append(sample.id)
-        parts.append(sample.name)
-        parts.append(str(sample.loop))
-        parts.append(reconstruction_hash(sample.reconstruction))
-
+    parts: List[str] = [snapshot.digest]
+    parts.extend(reconstruction_hash(sample.reconstruction) for sample in snapshot.samples)
     combined = "|".join(parts)
     return hashlib.sha256(combined.encode("utf-8")).hexdigest()
 
 
+def fingerprint_project(
+    project: Project,
+    *,
+    reconstruction_hash: ReconstructionHash,
+) -> str:
+    """Fingerprints a live project from scratch.
+
+    The project is captured into a fresh :class:`SnapshotStore`, so every node digest is
+    computed anew and the result matches :func:`fingerprint_snapshot` of any capture of the
+    same state.
+    """
+    return fingerprint_snapshot(
+        SnapshotStore().capture(project),
+        reconstruction_hash=reconstruction_hash,
+    )
+
+
 class ReconstructionHashCache:
     """Memoizes per-reconstruction content hashes by object identity.
 
@@ -44,8 +55,8 @@ class ReconstructionHashCache:
     strong reference to its reconstruction alongside the digest: the reference
     keeps the object alive, so its ``id()`` stays bound to that object for as
     long as the entry exists. :meth:`prune` keeps only entries whose
-    reconstruction still appears in one of the given projects, releasing the rest
-    and bounding the cache by what the history retains.
+    reconstruction is among the given ones, releasing the rest and bounding the
+    cache by what the history retains.
     """
 
     def __init__(self, *, reconstruction_hash: ReconstructionHash) -> None:
@@ -61,6 +72,6 @@ class ReconstructionHashCache:
 
         return cached[1]
 
-    def prune(self, projects: Iterable[Project]) -> None:
-        live = {id(sample.reconstruction) for project in projects for sample in project.samples}
+    def prune(self, reconstructions: Iterable[Reconstruction]) -> None:
+        live = {id(reconstruction) for reconstruction in reconstructions}
         self._hashes = {key: value for key, value in self._hashes.items() if key in live}
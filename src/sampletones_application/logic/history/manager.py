@@ -3,7 +3,6 @@ from datetime import UTC, datetime
 from typing import Iterator, List, Optional, Tuple
 
 from sampletones_application.logic.project.controller import ProjectController
-from sampletones_application.logic.shared.project_source import snapshot_project
 from sampletones_application.view_model.shared.history import HistoryDetail
 from sampletones_shared.types.callback import VoidCallback
 from sampletones_shared.utils.callbacks import CallbackMixin
@@ -11,8 +10,9 @@ from sampletones_shared.utils.serialization import hash_model
 
 from .action import HistoryAction
 from .errors import HistoryIntegrityError, UntrackedMutationError
-from .fingerprint import ReconstructionHashCache, fingerprint_project
+from .fingerprint import ReconstructionHashCache, fingerprint_project, fingerprint_snapshot
 from .snapshot import HistoryEntry
+from .store import SnapshotStore
 from .transaction import CoalesceKey, PendingTransaction
 
 
@@ -22,7 +22,13 @@ class HistoryManager(CallbackMixin):
     The live project always equals a restoration of ``entries[cursor]``. Undo and
     redo move the cursor and reinstall the snapshot there, leaving every stored
     snapshot intact, so any sequence of undos and redos that returns the cursor to
-    an index reproduces that index's exact state by construction.
+    an index reproduces that index's exact state by construction. Snapshots are
+    persistent node trees from one :class:`SnapshotStore`, so entries share every
+    pattern, channel and order row an edit left untouched.
+
+    Two budgets bound the stack: ``budget`` caps the entry count and
+    ``memory_budget`` caps the bytes the retained snapshots occupy. Exceeding
+    either coalesces the oldest entries into the baseline.
 
     Edits are grouped into one entry per gesture by wrapping coordinator intent
     methods in :meth:`transaction`; consecutive gestures on one target coalesce
@@ -37,14 +43,17 @@ class HistoryManager(CallbackMixin):
         controller: ProjectController,
         *,
         budget: int,
+        memory_budget: int,
         strict: bool,
     ) -> None:
         self._controller = controller
         self._budget = budget
+        self._memory_budget = memory_budget
         self._strict = strict
         self._hash_cache: Optional[ReconstructionHashCache] = (
             ReconstructionHashCache(reconstruction_hash=hash_model) if strict else None
         )
+        self._store = SnapshotStore()
         self._entries: List[HistoryEntry] = []
         self._cursor: int = -1
         self._saved_cursor: Optional[int] = None
@@ -58,6 +67,15 @@ class HistoryManager(CallbackMixin):
     def entries(self) -> Tuple[HistoryEntry, ...]:
         return tuple(self._entries)
 
+    @property
+    def retained_bytes(self) -> int:
+        """The estimated memory only the stored snapshots keep alive, shared structure counted once.
+
+        A sample reconstruction counts once the open project no longer holds it, so the project's
+        own samples never crowd its undo steps out of the memory budget.
+        """
+        return self._store.retained_bytes
+
     @property
     def cursor(self) -> int:
         return self._cursor
@@ -97,12 +115,12 @@ class HistoryManager(CallbackMixin):
 
         self._pending = None
         self._last_commit_key = None
+        self._discard_entries(0, len(self._entries))
         if self._controller.is_open:
-            self._entries = [self._capture(HistoryAction.INITIAL, ())]
+            self._append_entry(self._capture(HistoryAction.INITIAL, ()))
             self._cursor = 0
             self._saved_cursor = 0 if not self._controller.is_dirty else None
         else:
-            self._entries = []
             self._cursor = -1
             self._saved_cursor = None
 
@@ -223,13 +241,13 @@ class HistoryManager(CallbackMixin):
         coalesce: Optional[CoalesceKey],
     ) -> None:
         if self._coalesces_with_last(action, coalesce):
-            self._entries[self._cursor] = self._capture(action, detail)
+            self._replace_entry(self._cursor, self._capture(action, detail))
         else:
             if self._saved_cursor is not None and self._saved_cursor > self._cursor:
                 self._saved_cursor = None
 
-            del self._entries[self._cursor + 1 :]
-            self._entries.append(self._capture(action, detail))
+            self._discard_entries(self._cursor + 1, len(self._entries))
+            self._append_entry(self._capture(action, detail))
             self._cursor = len(self._entries) - 1
             self._enforce_budget()
 
@@ -267,36 +285,64 @@ class HistoryManager(CallbackMixin):
     ) -> HistoryEntry:
         """Snapshots the live project, fingerprinting it under strict deployment.
 
-        Capture-time fingerprints reuse the memoized per-reconstruction hashes:
-        copy-on-write keeps a reconstruction's content fixed for the object's
-        lifetime, so the per-gesture cost collapses to hashing the light
-        structure.
+        Capture-time fingerprints read the Merkle digest the store maintains and
+        reuse the memoized per-reconstruction hashes: copy-on-write keeps a
+        reconstruction's content fixed for the object's lifetime, so the
+        per-gesture cost collapses to hashing the nodes the edit replaced.
         """
-        project = self._controller.project
+        snapshot = self._store.capture(self._controller.project)
         fingerprint = (
-            fingerprint_project(
-                project,
+            fingerprint_snapshot(
+                snapshot,
                 reconstruction_hash=self._hash_cache.hash,
             )
             if self._hash_cache is not None
             else None
         )
         return HistoryEntry(
-            project=snapshot_project(project),
+            snapshot=snapshot,
             action=action,
             created=datetime.now(UTC),
             detail=detail,
             fingerprint=fingerprint,
         )
 
+    def _append_entry(self, entry: HistoryEntry) -> None:
+        self._store.retain(entry.snapshot)
+        self._entries.append(entry)
+
+    def _replace_entry(self, index: int, entry: HistoryEntry) -> None:
+        self._store.retain(entry.snapshot)
+        self._store.release(self._entries[index].snapshot)
+        self._entries[index] = entry
+
+    def _discard_entries(self, start: int, stop: int) -> None:
+        for entry in self._entries[start:stop]:
+            self._store.release(entry.snapshot)
+
+        del self._entries[start:stop]
+
     def _enforce_budget(self) -> None:
+        """Coalesces the oldest entries into the baseline until both budgets hold.
+
+        The entry budget evicts the overflow at once; the memory budget then evicts one
+        entry at a time, since each eviction frees only the structure that entry alone
+        retained. The entry under the cursor always stays, so a single oversized state
+        outlives the memory budget.
+        """
         overflow = len(self._entries) - self._budget
         if overflow > 0:
-            del self._entries[:overflow]
-            self._cursor -= overflow
-            if self._saved_cursor is not None:
-                shifted = self._saved_cursor - overflow
-                self._saved_cursor = shifted if shifted >= 0 else None
+            self._evict(overflow)
+
+        while self._cursor > 0 and self._store.retained_bytes > self._memory_budget:
+            self._evict(1)
+
+    def _evict(self, count: int) -> None:
+        self._discard_entries(0, count)
+        self._cursor -= count
+        if self._saved_cursor is not None:
+            shifted = self._saved_cursor - count
+            self._saved_cursor = shifted if shifted >= 0 else None
 
     def _restore(self) -> None:
         entry = self._entries[self._cursor]
@@ -304,7 +350,7 @@ class HistoryManager(CallbackMixin):
         self._restoring = True
         try:
             self._controller.replace_project(
-                snapshot_project(entry.project),
+                self._store.restore(entry.snapshot),
                 clean=self._cursor == self._saved_cursor,
             )
         finally:
@@ -316,7 +362,8 @@ class HistoryManager(CallbackMixin):
     def _verify(self, entry: HistoryEntry) -> None:
         """Checks the restored project against the entry's recorded fingerprint.
 
-        Verification always hashes reconstructions fresh: an in-place mutation of
+        Verification always hashes fresh — the structure through a new store and
+        the reconstructions through their full content: an in-place mutation of
         shared state keeps the object's identity, so a memoized digest would
         reproduce the pre-mutation hash and mask exactly the divergence this
         tripwire exists to catch.
@@ -345,9 +392,9 @@ class HistoryManager(CallbackMixin):
         if self._hash_cache is None:
             return
 
-        projects = [entry.project for entry in self._entries]
-        projects.append(self._controller.project)
-        self._hash_cache.prune(projects)
+        reconstructions = [sample.reconstruction for entry in self._entries for sample in entry.snapshot.samples]
+        reconstructions.extend(sample.reconstruction for sample in self._controller.project.samples)
+        self._hash_cache.prune(reconstructions)
 
     def _notify(self) -> None:
         self.call(self.on_history_changed)
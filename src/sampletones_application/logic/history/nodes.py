@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import Generic, Optional, Tuple, TypeVar, Union
+
+from pydantic import BaseModel
+
+from sampletones_core.constants.enums import GeneratorName
+from sampletones_core.data import Metadata
+from sampletones_core.project.info import ProjectInfo
+from sampletones_core.project.patterns.row import Row
+from sampletones_core.project.settings import ProjectSettings
+from sampletones_core.reconstructions import Reconstruction
+
+FrameEntries = Tuple[Tuple[GeneratorName, Optional[int]], ...]
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@dataclass(frozen=True, slots=True, eq=False, weakref_slot=True)
+class ModelNode(Generic[ModelT]):
+    """A captured copy of one small project model (metadata, info, settings).
+
+    ``model`` is private to the history: a restore hands out a copy of it, so the captured
+    state stays fixed while the live project edits its own instance.
+    """
+
+    model: ModelT
+    digest: str
+    size: int
+
+
+@dataclass(frozen=True, slots=True, eq=False, weakref_slot=True)
+class PatternNode:
+    """One pattern's rows as an immutable tuple of the frozen rows the project holds."""
+
+    name: Optional[str]
+    rows: Tuple[Row, ...]
+    digest: str
+    size: int
+
+
+@dataclass(frozen=True, slots=True, eq=False, weakref_slot=True)
+class ChannelNode:
+    """One channel's pattern pool, each index paired with its shared :class:`PatternNode`."""
+
+    generator: GeneratorName
+    patterns: Tuple[Tuple[int, PatternNode], ...]
+    digest: str
+    size: int
+
+
+@dataclass(frozen=True, slots=True, eq=False, weakref_slot=True)
+class FrameNode:
+    """One order row, mapping every channel to the pattern index it plays."""
+
+    entries: FrameEntries
+    digest: str
+    size: int
+
+
+@dataclass(frozen=True, slots=True, eq=False, weakref_slot=True)
+class SongNode:
+    """The arrangement: the order rows and the four channel pools."""
+
+    rows_per_pattern: int
+    order: Tuple[FrameNode, ...]
+    channels: Tuple[ChannelNode, ...]
+    digest: str
+    size: int
+
+
+@dataclass(frozen=True, slots=True, eq=False, weakref_slot=True)
+class SampleNode:
+    """A sample shell; its reconstruction is shared by reference under copy-on-write."""
+
+    id: str
+    name: str
+    loop: bool
+    reconstruction: Reconstruction
+    digest: str
+    size: int
+
+
+@dataclass(frozen=True, slots=True, eq=False, weakref_slot=True)
+class ProjectNode:
+    """The root of one captured project state.
+
+    ``digest`` covers the whole structure — models, samples shells and song — and leaves the
+    reconstruction content to the fingerprint, which hashes it separately.
+    """
+
+    metadata: ModelNode[Metadata]
+    info: ModelNode[ProjectInfo]
+    settings: ModelNode[ProjectSettings]
+    samples: Tuple[SampleNode, ...]
+    song: SongNode
+    digest: str
+    size: int
+
+
+HistoryNode = Union[
+    ModelNode[Metadata],
+    ModelNode[ProjectInfo],
+    ModelNode[ProjectSettings],
+    PatternNode,
+    ChannelNode,
+    FrameNode,
+    SongNode,
+    SampleNode,
+    ProjectNode,
+]
@@ -3,21 +3,22 @@ from datetime import datetime
 from typing import Optional
 
 from sampletones_application.view_model.shared.history import HistoryDetail
-from sampletones_core.project import Project
 
 from .action import HistoryAction
+from .nodes import ProjectNode
 
 
 @dataclass(frozen=True)
 class HistoryEntry:
     """One committed state in the history stack.
 
-    ``project`` is the captured snapshot restored on undo/redo. ``fingerprint`` is
+    ``snapshot`` is the captured node tree restored on undo/redo; it shares every
+    subtree the entry's edit left untouched with its neighbours. ``fingerprint`` is
     populated only under strict deployment, where it powers restore verification;
     production leaves it ``None`` to avoid the hashing cost on every edit.
     """
 
-    project: Project
+    snapshot: ProjectNode
     action: HistoryAction
     created: datetime
     detail: HistoryDetail = field(default_factory=tuple)
@@ -0,0 +1,346 @@
+import hashlib
+import sys
+from typing import Any, Dict, Final, FrozenSet, Iterator, Optional, Tuple, TypeVar, Union
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+from pydantic import BaseModel
+
+from sampletones_core.constants.enums import GeneratorName
+from sampletones_core.project import Project
+from sampletones_core.project.instruments.sample import Sample
+from sampletones_core.project.patterns.channel import Channel
+from sampletones_core.project.patterns.pattern import Pattern
+from sampletones_core.project.patterns.row import Row
+from sampletones_core.project.song import Song
+from sampletones_core.reconstructions import Reconstruction
+from sampletones_core.structures import IdentifiedCollection
+
+from .nodes import (
+    ChannelNode,
+    FrameEntries,
+    FrameNode,
+    HistoryNode,
+    ModelNode,
+    PatternNode,
+    ProjectNode,
+    SampleNode,
+    SongNode,
+)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+PatternSlot = Tuple[GeneratorName, int]
+CapturedPattern = Tuple[Optional[str], Tuple[Row, ...], PatternNode]
+Retained = Union[HistoryNode, Row, Reconstruction]
+
+DIGEST_SEPARATOR: Final[str] = "|"
+
+
+class SnapshotStore:
+    """Captures projects as persistent, hash-consed node trees that share unchanged structure.
+
+    Every node is immutable and interned by content: a capture resolves each pattern, channel,
+    order row and small model to the node an earlier capture already built for the same content,
+    so consecutive history entries share everything an edit left untouched and each entry owns
+    only the subtrees the edit replaced. Patterns resolve through an identity fast path first:
+    the frozen rows of an unchanged pattern are the very objects the previous capture read from
+    the same slot, so comparing the row tuples settles the common case at C speed, and only a
+    touched pattern pays for content hashing.
+
+    Each node carries a Merkle ``digest`` of its content, so a capture's root digest fingerprints
+    the whole structure while hashing only the new nodes. The interning tables hold their nodes
+    weakly and forget them once no entry retains them; :meth:`retain` and :meth:`release`
+    reference-count what the history keeps, so :attr:`retained_bytes` reports the memory its
+    distinct nodes and rows occupy, together with the arrays of every distinct reconstruction
+    its samples hold, each counted once however many samples and entries share it.
+
+    Snapshots share their reconstructions with the live project, so a reconstruction is only
+    charged once the project last captured or restored no longer holds it: what the open
+    project keeps alive costs the history nothing. Each item is charged the size it had when
+    first retained, and that same size is refunded on release, so a reconstruction edited in
+    between leaves the count exact.
+    """
+
+    def __init__(self) -> None:
+        self._models: WeakValueDictionary[Tuple[str, str], ModelNode[Any]] = WeakValueDictionary()
+        self._patterns: WeakValueDictionary[str, PatternNode] = WeakValueDictionary()
+        self._channels: WeakValueDictionary[Tuple[object, ...], ChannelNode] = WeakValueDictionary()
+        self._frames: WeakValueDictionary[FrameEntries, FrameNode] = WeakValueDictionary()
+        self._songs: WeakValueDictionary[Tuple[object, ...], SongNode] = WeakValueDictionary()
+        self._samples: WeakValueDictionary[Tuple[object, ...], SampleNode] = WeakValueDictionary()
+        self._row_digests: WeakKeyDictionary[Row, str] = WeakKeyDictionary()
+        self._latest_patterns: Dict[PatternSlot, CapturedPattern] = {}
+        self._references: Dict[int, Tuple[Retained, int, int]] = {}
+        self._reconstructions: Dict[int, int] = {}
+        self._live: FrozenSet[int] = frozenset()
+        self._retained_bytes: int = 0
+
+    @property
+    def retained_bytes(self) -> int:
+        """The estimated memory of every distinct node, row and reconstruction only the retained snapshots reach."""
+        detached = sum(size for key, size in self._reconstructions.items() if key not in self._live)
+        return self._retained_bytes + detached
+
+    def capture(self, project: Project) -> ProjectNode:
+        self._live = frozenset(id(sample.reconstruction) for sample in project.samples)
+        samples = tuple(self._sample_node(sample) for sample in project.samples)
+        metadata = self._model_node(project.metadata)
+        info = self._model_node(project.info)
+        settings = self._model_node(project.settings)
+        song = self._song_node(project.song)
+        digest = self._digest(
+            metadata.digest,
+            info.digest,
+            settings.digest,
+            song.digest,
+            *(sample.digest for sample in samples),
+        )
+        return ProjectNode(
+            metadata=metadata,
+            info=info,
+            settings=settings,
+            samples=samples,
+            song=song,
+            digest=digest,
+            size=sys.getsizeof(samples),
+        )
+
+    def restore(self, snapshot: ProjectNode) -> Project:
+        """Builds a live project from a snapshot, leaving the snapshot intact.
+
+        The rebuilt project holds the snapshot's frozen rows and shared reconstructions and fresh
+        copies of everything mutable, so editing it leaves every stored node unchanged. The
+        restored patterns also seed the identity fast path of the next capture.
+        """
+        self._live = frozenset(id(sample.reconstruction) for sample in snapshot.samples)
+        samples = IdentifiedCollection(self._restore_sample(sample) for sample in snapshot.samples)
+        return Project(
+            metadata=snapshot.metadata.model.model_copy(deep=True),
+            info=snapshot.info.model.model_copy(deep=True),
+            settings=snapshot.settings.model.model_copy(deep=True),
+            samples=samples,
+            song=self._restore_song(snapshot.song),
+        )
+
+    def retain(self, snapshot: ProjectNode) -> None:
+        self._acquire(snapshot)
+
+    def release(self, snapshot: ProjectNode) -> None:
+        self._discard(snapshot)
+
+    def _model_node(self, model: ModelT) -> ModelNode[ModelT]:
+        key = (type(model).__name__, model.model_dump_json())
+        node = self._models.get(key)
+        if node is None:
+            copied = model.model_copy(deep=True)
+            node = ModelNode(
+                model=copied,
+                digest=self._digest(*key),
+                size=self._model_footprint(copied),
+            )
+            self._models[key] = node
+
+        return node
+
+    def _sample_node(self, sample: Sample) -> SampleNode:
+        key = (sample.id, sample.name, sample.loop, id(sample.reconstruction))
+        node = self._samples.get(key)
+        if node is None:
+            node = SampleNode(
+                id=sample.id,
+                name=sample.name,
+                loop=sample.loop,
+                reconstruction=sample.reconstruction,
+                digest=self._digest(sample.id, sample.name, str(sample.loop)),
+                size=sys.getsizeof(sample.id) + sys.getsizeof(sample.name),
+            )
+            self._samples[key] = node
+
+        return node
+
+    def _song_node(self, song: Song) -> SongNode:
+        latest: Dict[PatternSlot, CapturedPattern] = {}
+        channels = tuple(self._channel_node(channel, latest) for channel in song.channels.values())
+        self._latest_patterns = latest
+        order = tuple(self._frame_node(frame) for frame in song.order)
+        key = (song.rows_per_pattern, order, channels)
+        node = self._songs.get(key)
+        if node is None:
+            node = SongNode(
+                rows_per_pattern=song.rows_per_pattern,
+                order=order,
+                channels=channels,
+                digest=self._digest(
+                    str(song.rows_per_pattern),
+                    str(len(order)),
+                    *(frame.digest for frame in order),
+                    *(channel.digest for channel in channels),
+                ),
+                size=sys.getsizeof(order) + sys.getsizeof(channels),
+            )
+            self._songs[key] = node
+
+        return node
+
+    def _channel_node(self, channel: Channel, latest: Dict[PatternSlot, CapturedPattern]) -> ChannelNode:
+        patterns = tuple(
+            (index, self._pattern_node(channel.generator, index, pattern, latest))
+            for index, pattern in channel.patterns.items()
+        )
+        key = (channel.generator, patterns)
+        node = self._channels.get(key)
+        if node is None:
+            node = ChannelNode(
+                generator=channel.generator,
+                patterns=patterns,
+                digest=self._digest(
+                    channel.generator.value,
+                    *(f"{index}:{pattern.digest}" for index, pattern in patterns),
+                ),
+                size=sys.getsizeof(patterns) + sum(sys.getsizeof(entry) for entry in patterns),
+            )
+            self._channels[key] = node
+
+        return node
+
+    def _pattern_node(
+        self,
+        generator: GeneratorName,
+        index: int,
+        pattern: Pattern,
+        latest: Dict[PatternSlot, CapturedPattern],
+    ) -> PatternNode:
+        slot = (generator, index)
+        rows = tuple(pattern.rows)
+        previous = self._latest_patterns.get(slot)
+        if previous is not None and previous[0] == pattern.name and previous[1] == rows:
+            latest[slot] = previous
+            return previous[2]
+
+        digest = self._digest(repr(pattern.name), *(self._row_digest(row) for row in rows))
+        node = self._patterns.get(digest)
+        if node is None:
+            node = PatternNode(
+                name=pattern.name,
+                rows=rows,
+                digest=digest,
+                size=sys.getsizeof(rows),
+            )
+            self._patterns[digest] = node
+
+        latest[slot] = (pattern.name, rows, node)
+        return node
+
+    def _frame_node(self, frame: Dict[GeneratorName, Optional[int]]) -> FrameNode:
+        entries: FrameEntries = tuple(frame.items())
+        node = self._frames.get(entries)
+        if node is None:
+            node = FrameNode(
+                entries=entries,
+                digest=self._digest(*(f"{generator.value}:{index}" for generator, index in entries)),
+                size=sys.getsizeof(entries) + sum(sys.getsizeof(entry) for entry in entries),
+            )
+            self._frames[entries] = node
+
+        return node
+
+    def _row_digest(self, row: Row) -> str:
+        digest = self._row_digests.get(row)
+        if digest is None:
+            digest = row.model_dump_json()
+            self._row_digests[row] = digest
+
+        return digest
+
+    def _restore_song(self, snapshot: SongNode) -> Song:
+        latest: Dict[PatternSlot, CapturedPattern] = {}
+        channels: Dict[GeneratorName, Channel] = {}
+        for channel in snapshot.channels:
+            patterns: Dict[int, Pattern] = {}
+            for index, pattern in channel.patterns:
+                patterns[index] = Pattern(name=pattern.name, rows=list(pattern.rows))
+                latest[(channel.generator, index)] = (pattern.name, pattern.rows, pattern)
+
+            channels[channel.generator] = Channel(generator=channel.generator, patterns=patterns)
+
+        self._latest_patterns = latest
+        return Song(
+            rows_per_pattern=snapshot.rows_per_pattern,
+            order=[dict(frame.entries) for frame in snapshot.order],
+            channels=channels,
+        )
+
+    @staticmethod
+    def _restore_sample(snapshot: SampleNode) -> Sample:
+        sample = Sample(snapshot.name, snapshot.reconstruction, loop=snapshot.loop)
+        sample.id = snapshot.id
+        return sample
+
+    def _acquire(self, item: Retained) -> None:
+        key = id(item)
+        reference = self._references.get(key)
+        if reference is not None:
+            _, count, size = reference
+            self._references[key] = (item, count + 1, size)
+            return
+
+        size = self._size(item)
+        self._references[key] = (item, 1, size)
+        if isinstance(item, Reconstruction):
+            self._reconstructions[key] = size
+        else:
+            self._retained_bytes += size
+        for child in self._children(item):
+            self._acquire(child)
+
+    def _discard(self, item: Retained) -> None:
+        key = id(item)
+        _, count, size = self._references[key]
+        if count > 1:
+            self._references[key] = (item, count - 1, size)
+            return
+
+        del self._references[key]
+        if isinstance(item, Reconstruction):
+            del self._reconstructions[key]
+        else:
+            self._retained_bytes -= size
+        for child in self._children(item):
+            self._discard(child)
+
+    @classmethod
+    def _size(cls, item: Retained) -> int:
+        if isinstance(item, Row):
+            return cls._model_footprint(item)
+        if isinstance(item, Reconstruction):
+            return item.nbytes
+
+        return item.size
+
+    @staticmethod
+    def _children(item: Retained) -> Iterator[Retained]:
+        match item:
+            case ProjectNode():
+                yield item.metadata
+                yield item.info
+                yield item.settings
+                yield from item.samples
+                yield item.song
+            case SampleNode():
+                yield item.reconstruction
+            case SongNode():
+                yield from item.order
+                yield from item.channels
+            case ChannelNode():
+                for _, pattern in item.patterns:
+                    yield pattern
+            case PatternNode():
+                yield from item.rows
+
+    @staticmethod
+    def _model_footprint(model: BaseModel) -> int:
+        fields = model.__dict__
+        return sys.getsizeof(model) + sys.getsizeof(fields) + sum(sys.getsizeof(value) for value in fields.values())
+
+    @staticmethod
+    def _digest(*parts: str) -> str:
+        return hashlib.sha256(DIGEST_SEPARATOR.join(parts).encode("utf-8")).hexdigest()
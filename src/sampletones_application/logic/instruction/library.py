@@ -1,12 +1,25 @@
 import threading
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Set, Tuple
 
 from sampletones_application.categories.manager import LanguageManager
 from sampletones_application.config.managers.config import ConfigManager
 from sampletones_application.logic.instruction.library_manager import (
     InstructionsLibraryManager,
 )
+from sampletones_application.logic.instruction.protocol import LibraryLoaderProtocol
+from sampletones_application.services.library.result import (
+    LibraryHeaderRead,
+    LibraryLoadError,
+    LibraryLoadResult,
+    LibraryLoadSuperseded,
+    LoadedLibrary,
+)
+from sampletones_application.services.result import (
+    ServiceIntermediate,
+    ServiceProgress,
+    ServiceSuccess,
+)
 from sampletones_application.view_model.instruction.library import (
     LibraryPanelViewModel,
 )
@@ -51,6 +64,7 @@ class LibraryLogic(CallbackMixin):
         self,
         config_manager: ConfigManager,
         library_manager: InstructionsLibraryManager,
+        library_loader: LibraryLoaderProtocol,
         *,
         language_manager: LanguageManager,
         is_operation_active: Callable[[], bool],
@@ -58,7 +72,11 @@ class LibraryLogic(CallbackMixin):
         self._language_manager = language_manager
         self._config_manager = config_manager
         self._library_manager = library_manager
+        self._library_loader = library_loader
         self._is_operation_active = is_operation_active
+        self._requested_loads: Set[InstructionLibraryKey] = set()
+        self._load_progress: Dict[InstructionLibraryKey, Tuple[int, int]] = {}
+        self._pending_instruction: Optional[InstructionUnion] = None
         self._eta_estimator: Optional[ETAEstimator] = None
         self._status_lock = threading.Lock()
 
@@ -87,6 +105,7 @@ class LibraryLogic(CallbackMixin):
             on_generation_error=self._on_generation_error,
             on_generation_cancelled=self._on_generation_cancelled,
         )
+        self._library_loader.subscribe(self._on_load_result)
 
     def configure_lock(
         self,
@@ -144,9 +163,22 @@ class LibraryLogic(CallbackMixin):
         self._library_manager.rebuild_tree()
 
     def refresh_libraries(self, load_if_needed: bool = True) -> None:
+        """Lists the library directory again, redrawing the tree only when what it shows has moved.
+
+        Loaded libraries stay cached across a refresh. The tree is rebuilt when the directory
+        gained or lost a library or the current library changed; otherwise only the status is
+        repainted.
+        """
+        listed = self._library_manager.library_keys
+        current = self.current_library_key
         self._library_manager.set_library_directory(self._config_manager.get_library_directory())
-        self._library_manager.gather_available_libraries()
         self._sync_with_config_key(load_if_needed=load_if_needed)
+
+        unchanged = listed == self._library_manager.library_keys and current == self.current_library_key
+        if unchanged and self.tree.root is not None:
+            self.update_status()
+            return
+
         self.call(self.on_rebuild_tree_needed)
 
     def remove_library(self, library_key: InstructionLibraryKey) -> Path:
@@ -195,9 +227,19 @@ class LibraryLogic(CallbackMixin):
         self.load_instruction(instruction)
 
     def load_instruction(self, instruction: InstructionUnion) -> None:
+        """Shows ``instruction`` from the current library, or once that library has loaded.
+
+        The header a load reads first holds no fragments, so an instruction picked mid-load waits
+        for the whole library rather than for its own item.
+        """
         if self._is_locked:
             return
 
+        library_key = self.current_library_key
+        if library_key is not None and self._library_loader.is_loading(library_key):
+            self._pending_instruction = instruction
+            return
+
         self._do_lock()
         try:
             instruction_data = self._library_manager.load_instruction(instruction)
@@ -237,6 +279,25 @@ class LibraryLogic(CallbackMixin):
     def cancel_generation(self) -> None:
         self._library_manager.cancel_generation()
 
+    def handle_config_changed(self) -> None:
+        self.preload_config_library()
+        self.update_status()
+
+    def preload_config_library(self) -> None:
+        """Starts reading the current configuration's library before anyone asks for it.
+
+        A load the reader is waiting on comes first, so no preload is queued while one runs.
+        """
+        key = self._config_manager.key
+        if self._requested_loads or self._library_loader.is_loading(key):
+            return
+
+        if self._library_manager.is_library_loaded(key) or not self._library_manager.library_exists_for_key(key):
+            return
+
+        logger.info(f"Preloading library: {key}")
+        self._library_loader.load(key, self._library_manager.get_path(key))
+
     def _sync_with_config_key(self, load_if_needed: bool = True) -> None:
         config_key = self._config_manager.key
         matching_key = self._library_manager.sync_with_config_key(config_key)
@@ -253,8 +314,10 @@ class LibraryLogic(CallbackMixin):
         load_if_needed: bool = True,
         apply_config: bool = False,
     ) -> None:
-        if load_if_needed and not self._library_manager.is_library_loaded(library_key):
-            self._load_library(library_key)
+        if load_if_needed:
+            self._library_manager.set_current_library(library_key)
+            if not self._library_manager.is_library_loaded(library_key):
+                self._load_library(library_key)
 
         if apply_config:
             self.call(self.on_apply_library_config, library_key)
@@ -272,89 +335,131 @@ class LibraryLogic(CallbackMixin):
         if self._is_locked:
             return
 
-        self._do_lock()
-        try:
-            self._library_manager.load_library(library_key)
-            logger.info(f"Library loaded: {library_key}")
-        except FileNotFoundError as exception:
-            logger.error_with_traceback(
-                exception,
-                f"Library file not found for key {library_key}",
-            )
-            self.call(
-                self.on_load_file_not_found,
-                self._library_manager.get_path(library_key),
-                self._language_manager["instructions.library.message.status_file_not_found"],
-            )
-        except (IsADirectoryError, PermissionError, OSError) as exception:
-            logger.error_with_traceback(
-                exception,
-                f"Error loading library file for key {library_key}",
-            )
-            self.call(
-                self.on_load_error,
-                exception,
-                self._language_manager["instructions.library.message.status_file_load_error"],
-            )
-        except InvalidMetadataError as exception:
-            logger.error_with_traceback(
-                exception,
-                f"Invalid metadata in library file for key {library_key}",
-            )
-            self.call(
-                self.on_load_error,
-                exception,
-                self._language_manager["global.dialog.message.invalid_metadata_error"],
-            )
-        except InvalidLibraryDataValuesError as exception:
-            logger.error_with_traceback(
-                exception,
-                f"Library data contains invalid values for key {library_key}",
-            )
-            self.call(
-                self.on_load_error,
-                exception,
-                self._language_manager["instructions.library.message.status_invalid_data_values"],
-            )
-        except InvalidLibraryDataError as exception:
-            logger.error_with_traceback(
-                exception,
-                f"Invalid library data file for {library_key}",
-            )
-            self.call(
-                self.on_load_error,
-                exception,
-                self._language_manager["instructions.library.message.status_invalid_data"],
-            )
-        except IncompatibleLibraryDataVersionError as exception:
-            logger.error_with_traceback(
-                exception,
-                f"Incompatible library data version for key {library_key}: "
-                f"{exception.actual_version} != expected {exception.expected_version}",
-            )
-            self.call(
-                self.on_load_error,
-                exception,
-                self._language_manager["instructions.library.template.incompatible_version_template"].format(
-                    exception.actual_version,
-                    exception.expected_version,
-                ),
-            )
-        except DeserializationError as exception:
-            logger.error_with_traceback(
-                exception,
-                f"Deserialization error loading library for key {library_key}",
-            )
-            self.call(
-                self.on_load_error,
-                exception,
-                self._language_manager["instructions.library.message.status_deserialization_error"],
-            )
-        except LoadLibraryError as exception:
-            logger.error_with_traceback(exception, f"Error loading library for key {library_key}")
-            self.call(self.on_load_error, exception, self._msg_load_error)
-        finally:
-            self._do_unlock()
+        self._requested_loads.add(library_key)
+        if not self._library_loader.is_loading(library_key):
+            self._library_loader.load(library_key, self._library_manager.get_path(library_key))
+
+    def _on_load_result(self, result: LibraryLoadResult) -> None:
+        match result:
+            case ServiceIntermediate(data=LibraryHeaderRead(key=key, header=header)):
+                self._load_progress[key] = (0, header.size)
+            case ServiceProgress(completed=completed, total=total, current_item=key) if key is not None:
+                self._load_progress[key] = (completed, total)
+            case ServiceSuccess(value=LoadedLibrary(key=key, data=data)):
+                self._settle_load(key)
+                self._library_manager.store_library(key, data)
+                logger.info(f"Library loaded: {key}")
+                self._show_pending_instruction(key)
+            case LibraryLoadError(key=key, exception=exception):
+                requested = self._settle_load(key)
+                if key == self.current_library_key:
+                    self._pending_instruction = None
+
+                if requested:
+                    self._report_load_error(key, exception)
+                else:
+                    logger.warning(f"Could not preload library {key}: {exception}")
+            case LibraryLoadSuperseded(key=key):
+                self._settle_load(key)
+
+        self.update_status()
+
+    def _settle_load(self, library_key: InstructionLibraryKey) -> bool:
+        """Forgets a finished load's progress, returning whether a reader asked for it."""
+        self._load_progress.pop(library_key, None)
+        requested = library_key in self._requested_loads
+        self._requested_loads.discard(library_key)
+        return requested
+
+    def _show_pending_instruction(self, library_key: InstructionLibraryKey) -> None:
+        instruction = self._pending_instruction
+        if instruction is None or library_key != self.current_library_key:
+            return
+
+        self._pending_instruction = None
+        self.load_instruction(instruction)
+
+    def _report_load_error(self, library_key: InstructionLibraryKey, exception: Exception) -> None:
+        match exception:
+            case FileNotFoundError():
+                logger.error_with_traceback(
+                    exception,
+                    f"Library file not found for key {library_key}",
+                )
+                self.call(
+                    self.on_load_file_not_found,
+                    self._library_manager.get_path(library_key),
+                    self._language_manager["instructions.library.message.status_file_not_found"],
+                )
+            case IsADirectoryError() | PermissionError() | OSError():
+                logger.error_with_traceback(
+                    exception,
+                    f"Error loading library file for key {library_key}",
+                )
+                self.call(
+                    self.on_load_error,
+                    exception,
+                    self._language_manager["instructions.library.message.status_file_load_error"],
+                )
+            case InvalidMetadataError():
+                logger.error_with_traceback(
+                    exception,
+                    f"Invalid metadata in library file for key {library_key}",
+                )
+                self.call(
+                    self.on_load_error,
+                    exception,
+                    self._language_manager["global.dialog.message.invalid_metadata_error"],
+                )
+            case InvalidLibraryDataValuesError():
+                logger.error_with_traceback(
+                    exception,
+                    f"Library data contains invalid values for key {library_key}",
+                )
+                self.call(
+                    self.on_load_error,
+                    exception,
+                    self._language_manager["instructions.library.message.status_invalid_data_values"],
+                )
+            case InvalidLibraryDataError():
+                logger.error_with_traceback(
+                    exception,
+                    f"Invalid library data file for {library_key}",
+                )
+                self.call(
+                    self.on_load_error,
+                    exception,
+                    self._language_manager["instructions.library.message.status_invalid_data"],
+                )
+            case IncompatibleLibraryDataVersionError():
+                logger.error_with_traceback(
+                    exception,
+                    f"Incompatible library data version for key {library_key}: "
+                    f"{exception.actual_version} != expected {exception.expected_version}",
+                )
+                self.call(
+                    self.on_load_error,
+                    exception,
+                    self._language_manager["instructions.library.template.incompatible_version_template"].format(
+                        exception.actual_version,
+                        exception.expected_version,
+                    ),
+                )
+            case DeserializationError():
+                logger.error_with_traceback(
+                    exception,
+                    f"Deserialization error loading library for key {library_key}",
+                )
+                self.call(
+                    self.on_load_error,
+                    exception,
+                    self._language_manager["instructions.library.message.status_deserialization_error"],
+                )
+            case LoadLibraryError():
+                logger.error_with_traceback(exception, f"Error loading library for key {library_key}")
+                self.call(self.on_load_error, exception, self._msg_load_error)
+            case _:
+                raise exception
 
     def _on_generation_start(self) -> None:
         self._do_lock()
@@ -450,6 +555,8 @@ class LibraryLogic(CallbackMixin):
                 status_text = self._language_manager["instructions.library.template.library_loaded_template"].format(
                     library_name
                 )
+            elif self._library_loader.is_loading(key):
+                status_text = self._loading_status(key, library_name)
             elif self._library_manager.library_exists_for_key(key):
                 status_text = self._language_manager["instructions.library.template.library_exists_template"].format(
                     library_name
@@ -471,3 +578,16 @@ class LibraryLogic(CallbackMixin):
             progress_value=progress,
         )
         self.call(self.on_view_changed, view_model)
+
+    def _loading_status(self, key: InstructionLibraryKey, library_name: str) -> str:
+        """Names the library being read, with the instructions decoded once its header is in."""
+        progress = self._load_progress.get(key)
+        if progress is None:
+            return self._language_manager["instructions.library.template.library_loading_template"].format(library_name)
+
+        completed, total = progress
+        return self._language_manager["instructions.library.template.library_loading_progress_template"].format(
+            library_name,
+            completed,
+            total,
+        )
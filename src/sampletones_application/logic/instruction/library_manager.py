@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
 
 from sampletones_application.categories.manager import LanguageManager
 from sampletones_application.config.managers.config import ConfigManager
@@ -12,6 +12,7 @@ from sampletones_core.library import (
     InstructionLibrary,
     InstructionLibraryData,
     InstructionLibraryKey,
+    LibraryPartials,
     create_key_from_filename,
     get_display_name_from_key,
 )
@@ -41,11 +42,13 @@ class InstructionsLibraryManager(CallbackMixin):
         config_manager: ConfigManager,
         *,
         language_manager: LanguageManager,
+        memory_budget: Optional[int] = None,
     ) -> None:
         self._language_manager = language_manager
         self._config_manager = config_manager
+        self._memory_budget = memory_budget
         library_directory = config_manager.get_library_directory()
-        self._library = InstructionLibrary(directory=str(library_directory))
+        self._library = InstructionLibrary(directory=str(library_directory), memory_budget=memory_budget)
         self._library_files: Dict[InstructionLibraryKey, str] = {}
         self._current_library_key: Optional[InstructionLibraryKey] = None
 
@@ -60,7 +63,17 @@ class InstructionsLibraryManager(CallbackMixin):
         self.on_generation_cancelled: Optional[VoidCallback] = None
 
     def set_library_directory(self, directory: Path) -> None:
-        self._library = InstructionLibrary(directory=str(directory))
+        """Points the manager at ``directory`` and lists the libraries it holds.
+
+        The libraries already loaded stay cached while the directory stays the same, so a rescan
+        keeps every library a reader has opened ready to switch back to, as far as the memory
+        budget allows. The current library stays pinned in the new cache.
+        """
+        if to_path(self._library.directory) != to_path(directory):
+            self._library = InstructionLibrary(directory=str(directory), memory_budget=self._memory_budget)
+            if self._current_library_key is not None:
+                self._library.pin(self._current_library_key)
+
         self.gather_available_libraries()
 
     def gather_available_libraries(self) -> Dict[InstructionLibraryKey, str]:
@@ -78,8 +91,7 @@ class InstructionsLibraryManager(CallbackMixin):
 
         removed_libraries = set(self._library_files.keys()) - set(new_library_files.keys())
         for removed_key in removed_libraries:
-            if removed_key in self._library.data:
-                del self._library.data[removed_key]
+            self._library.evict(removed_key)
 
         self._library_files = new_library_files
         return self._library_files
@@ -104,7 +116,7 @@ class InstructionsLibraryManager(CallbackMixin):
         if not self.does_library_exist(library_key):
             return False
 
-        return library_key in self._library.data
+        return library_key in self._library
 
     def does_library_exist(
         self,
@@ -117,23 +129,21 @@ class InstructionsLibraryManager(CallbackMixin):
         filepath = self.get_path(library_key)
         return filepath.exists()
 
-    def load_library(self, library_key: InstructionLibraryKey) -> bool:
-        if self.is_library_loaded(library_key):
-            self._current_library_key = library_key
-            return True
-
-        if library_key not in self._library_files:
-            return False
+    def store_library(
+        self,
+        library_key: InstructionLibraryKey,
+        library_data: InstructionLibraryData,
+    ) -> None:
+        self._library.store(library_key, library_data)
 
-        self._library.load_data(library_key)
-        self._current_library_key = library_key
-        return True
+    def set_current_library(self, library_key: InstructionLibraryKey) -> None:
+        self._select_library(library_key)
 
     def load_library_file(self, path: Path) -> InstructionLibraryKey:
         logger.info(f"Loading library data: {logger.format_path(path)}")
         library_key = create_key_from_filename(path)
         self._library.load_data(library_key)
-        self._current_library_key = library_key
+        self._select_library(library_key)
         logger.info(f"Library data: {logger.format_path(path)} loaded successfully")
         return library_key
 
@@ -144,7 +154,7 @@ class InstructionsLibraryManager(CallbackMixin):
         if not self._current_library_key or not self.is_library_loaded(self._current_library_key):
             return None
 
-        data = self._library.data[self._current_library_key]
+        data = self._library[self._current_library_key]
         fragment = data[instruction]
         library_config = data.config
         instruction_data = InstructionPanelData(
@@ -164,7 +174,7 @@ class InstructionsLibraryManager(CallbackMixin):
         config_key: InstructionLibraryKey,
     ) -> Optional[InstructionLibraryKey]:
         if self.library_exists_for_key(config_key):
-            self._current_library_key = config_key
+            self._select_library(config_key)
             return config_key
 
         return None
@@ -176,7 +186,11 @@ class InstructionsLibraryManager(CallbackMixin):
         return self.library_exists_for_key(self._config_manager.key)
 
     def generate_library(self, config: Config, window: Window) -> None:
-        self._creator = InstructionsLibraryCreator(config, window)
+        self._creator = InstructionsLibraryCreator(
+            config,
+            window,
+            library_directory=to_path(self._library.directory),
+        )
 
         _primary = self.on_generation_progress
         _extra = self.on_generation_progress_extra
@@ -199,12 +213,12 @@ class InstructionsLibraryManager(CallbackMixin):
 
     def _complete_generation(
         self,
-        result: Tuple[InstructionLibraryKey, InstructionLibraryData],
+        result: Tuple[InstructionLibraryKey, LibraryPartials],
     ) -> None:
-        key, library_data = result
+        key, partials = result
         try:
-            self._library.save_data(key, library_data)
-            self._current_library_key = key
+            self._library.save_partials(key, partials)
+            self._select_library(key)
         except OSError as exception:
             self.call(self.on_generation_error, exception)
             raise
@@ -228,8 +242,28 @@ class InstructionsLibraryManager(CallbackMixin):
     def current_library_key(self) -> Optional[InstructionLibraryKey]:
         return self._current_library_key
 
+    @property
+    def library_keys(self) -> FrozenSet[InstructionLibraryKey]:
+        return frozenset(self._library_files)
+
     def clear_current_library(self) -> None:
-        self._current_library_key = None
+        self._select_library(None)
+
+    def _select_library(self, library_key: Optional[InstructionLibraryKey]) -> None:
+        """Makes ``library_key`` current, moving the cache pin from the previous current library.
+
+        The library on display is pinned, so loading others under the memory budget never
+        evicts it.
+        """
+        if library_key == self._current_library_key:
+            return
+
+        previous_key = self._current_library_key
+        self._current_library_key = library_key
+        if library_key is not None:
+            self._library.pin(library_key)
+        if previous_key is not None:
+            self._library.unpin(previous_key)
 
     @property
     def creator(self) -> Optional[InstructionsLibraryCreator]:
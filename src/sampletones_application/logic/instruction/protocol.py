@@ -0,0 +1,19 @@
+from pathlib import Path
+from typing import Callable, Protocol
+
+from sampletones_application.services.library.result import LibraryLoadResult
+from sampletones_core.library import InstructionLibraryKey
+
+
+class LibraryLoaderProtocol(Protocol):
+    """The slice of the library load service the library logic drives.
+
+    Typing the collaborator structurally keeps the logic layer bound to the service's result
+    contract alone; the composition root supplies the real service.
+    """
+
+    def subscribe(self, handler: Callable[[LibraryLoadResult], None]) -> None: ...
+
+    def load(self, key: InstructionLibraryKey, path: Path) -> bool: ...
+
+    def is_loading(self, key: InstructionLibraryKey) -> bool: ...
@@ -1,5 +1,7 @@
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from anytree import PreOrderIter
 
 from sampletones_application.categories.manager import LanguageManager
 from sampletones_application.config.managers.config import ConfigManager
@@ -20,7 +22,7 @@ from sampletones_application.logic.reconstruction.browser.tree.samples.branch im
     build_sample_branch,
 )
 from sampletones_application.logic.reconstruction.browser.tree.scan import (
-    scan_reconstructions,
+    ReconstructionScanIndex,
 )
 from sampletones_core.structures.tree import FileSystemNode, NodeType, Tree, TreeNode
 
@@ -31,6 +33,11 @@ class BrowserManager:
     A refresh scans the directory, builds the configuration branch and the sample branch from that
     one reading, shapes what came out — empty headings pruned, lone headings folded into the row they
     lead to, siblings ordered — and publishes the result as the tree both browser tabs render.
+
+    The reading goes through a :class:`ReconstructionScanIndex`, so a refresh revisits only the
+    folders whose contents moved, and a refresh that finds the disk as it was keeps the published
+    tree. The rows standing for each path are indexed as the tree is built, so asking for them costs
+    one lookup.
     """
 
     def __init__(
@@ -44,7 +51,10 @@ class BrowserManager:
         self.reconstructions_directory = config_manager.get_reconstructions_directory()
 
         self.tree = Tree()
+        self._index = ReconstructionScanIndex()
         self._scan = ReconstructionScan(entries=())
+        self._labels: Optional[Tuple[str, str, str]] = None
+        self._nodes: Dict[Path, Tuple[FileSystemNode, ...]] = {}
 
     def set_reconstructions_directory(self, directory: Path) -> None:
         self.reconstructions_directory = directory
@@ -53,25 +63,58 @@ class BrowserManager:
     def refresh_tree(self) -> None:
         if not self.reconstructions_directory.is_dir():
             self._scan = ReconstructionScan(entries=())
-            self.tree.set_root(None)
+            self._labels = None
+            self._publish(None)
             return
 
-        self._scan = scan_reconstructions(self.reconstructions_directory)
-        self.tree.set_root(self._build_root(self._scan))
+        scan = self._index.scan(self.reconstructions_directory)
+        labels = self._branch_labels()
+        if scan is self._scan and labels == self._labels and self.tree.root is not None:
+            return
+
+        self._scan = scan
+        self._labels = labels
+        self._publish(self._build_root(scan, labels))
+
+    def _branch_labels(self) -> Tuple[str, str, str]:
+        return (
+            self._language_manager["global.browser.label.root"],
+            self._language_manager["global.browser.label.by_configuration"],
+            self._language_manager["global.browser.label.by_sample"],
+        )
+
+    def _publish(self, root: Optional[TreeNode]) -> None:
+        self.tree.set_root(root)
+        self._nodes = self._index_nodes(root)
+
+    @staticmethod
+    def _index_nodes(root: Optional[TreeNode]) -> Dict[Path, Tuple[FileSystemNode, ...]]:
+        """The rows standing for each path, in reading order, gathered in one pass over the tree."""
+        if root is None:
+            return {}
+
+        nodes: Dict[Path, List[FileSystemNode]] = {}
+        for node in PreOrderIter(root):
+            if isinstance(node, FileSystemNode):
+                nodes.setdefault(node.filepath, []).append(node)
+
+        return {filepath: tuple(found) for filepath, found in nodes.items()}
 
-    def _build_root(self, scan: ReconstructionScan) -> TreeNode:
+    @staticmethod
+    def _build_root(scan: ReconstructionScan, labels: Tuple[str, str, str]) -> TreeNode:
+        root_name, configuration_name, sample_name = labels
         container_root = TreeNode(
-            name=self._language_manager["global.browser.label.root"],
+            name=root_name,
             node_type=NodeType.ROOT,
         )
         build_configuration_branch(
             scan,
-            name=self._language_manager["global.browser.label.by_configuration"],
+            name=configuration_name,
             parent=container_root,
         )
         build_sample_branch(
             scan,
-            name=self._language_manager["global.browser.label.by_sample"],
+            name=sample_name,
             parent=container_root,
         )
 
@@ -90,4 +133,4 @@ class BrowserManager:
         caller acting on the file rather than on one row — repainting a favorite star, for instance —
         asks here once and hands the rows to each browser tab.
         """
-        return self.tree.find_nodes(FileSystemNode, lambda node: node.filepath == filepath)
+        return self._nodes.get(filepath, ())
@@ -1,5 +1,8 @@
+import os
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Final, List, Optional, Tuple
 
 from sampletones_application.logic.reconstruction.browser.tree.entries.directory import (
     DirectoryEntry,
@@ -14,36 +17,129 @@ from sampletones_application.logic.reconstruction.browser.tree.entries.scan impo
 from sampletones_core.reconstructions.converter.paths import ConfigDirectoryFields
 from sampletones_shared.paths.extensions import EXT_FILE_RECONSTRUCTION
 
+MTIME_SETTLE_NS: Final[int] = 2_000_000_000
 
-def scan_reconstructions(directory: Path) -> ReconstructionScan:
-    """Reads a reconstructions directory once, recording its folders and the reconstructions inside.
 
-    Every folder is recorded together with the configuration its name states, and every
-    reconstruction file beneath it. This single reading feeds both browser branches, so the two
-    views agree on what is on disk.
+@dataclass(frozen=True)
+class _Child:
+    path: Path
+    is_directory: bool
+
+
+@dataclass(frozen=True)
+class _Listing:
+    """A folder as it was last read: its modification time, the children worth a row, their records."""
+
+    mtime_ns: int
+    listed_ns: int
+    children: Tuple[_Child, ...]
+    entries: Tuple[ScanEntry, ...]
+
+    def still_holds(self, mtime_ns: int) -> bool:
+        """Whether the folder holds the children it was read with.
+
+        Adding, removing or renaming an entry moves its folder's modification time. A time that
+        stands is trusted only once it has settled before the reading, since a change landing
+        within the clock's granularity of the reading could leave the time where it was.
+        """
+        return mtime_ns == self.mtime_ns and self.mtime_ns < self.listed_ns - MTIME_SETTLE_NS
+
+
+class ReconstructionScanIndex:
+    """Remembers what a reconstructions directory held, so a rescan reads only what has changed.
+
+    Each folder is remembered with the modification time it had when it was listed. A folder whose
+    time still stands keeps its listing, which costs a single stat in place of reading it and asking
+    every entry what it is; its subfolders are visited the same way. A record that comes out as it
+    was is the very record the previous scan made, so a directory that has not changed yields the
+    previous scan itself and a caller compares scans by identity.
     """
-    return ReconstructionScan(entries=_scan_entries(directory))
 
+    def __init__(self) -> None:
+        self._listings: Dict[Path, _Listing] = {}
+        self._directories: Dict[Path, DirectoryEntry] = {}
+        self._scan: Optional[ReconstructionScan] = None
+
+    def scan(self, directory: Path) -> ReconstructionScan:
+        """Reads ``directory`` against what it held at the last scan; see :func:`scan_reconstructions`."""
+        listings: Dict[Path, _Listing] = {}
+        directories: Dict[Path, DirectoryEntry] = {}
+        entries = self._scan_entries(directory, listings, directories)
+        self._listings = listings
+        self._directories = directories
 
-def _scan_entries(directory: Path) -> Tuple[ScanEntry, ...]:
-    entries: List[ScanEntry] = []
-    for path in sorted(directory.iterdir()):
-        entry = _scan_path(path)
-        if entry is not None:
-            entries.append(entry)
+        if self._scan is None or self._scan.entries is not entries:
+            self._scan = ReconstructionScan(entries=entries)
 
-    return tuple(entries)
+        return self._scan
 
+    def _scan_entries(
+        self,
+        directory: Path,
+        listings: Dict[Path, _Listing],
+        directories: Dict[Path, DirectoryEntry],
+    ) -> Tuple[ScanEntry, ...]:
+        mtime_ns = directory.stat().st_mtime_ns
+        previous = self._listings.get(directory)
+        if previous is not None and previous.still_holds(mtime_ns):
+            children, listed_ns = previous.children, previous.listed_ns
+        else:
+            children, listed_ns = _list_children(directory), time.time_ns()
 
-def _scan_path(path: Path) -> Optional[ScanEntry]:
-    if path.is_dir():
-        return DirectoryEntry(
-            path=path,
-            config=ConfigDirectoryFields.from_directory_name(path.name),
-            entries=_scan_entries(path),
+        entries = tuple(self._scan_child(child, listings, directories) for child in children)
+        if previous is not None and previous.entries == entries:
+            entries = previous.entries
+
+        listings[directory] = _Listing(
+            mtime_ns=mtime_ns,
+            listed_ns=listed_ns,
+            children=children,
+            entries=entries,
+        )
+        return entries
+
+    def _scan_child(
+        self,
+        child: _Child,
+        listings: Dict[Path, _Listing],
+        directories: Dict[Path, DirectoryEntry],
+    ) -> ScanEntry:
+        if not child.is_directory:
+            return ReconstructionEntry(path=child.path)
+
+        entries = self._scan_entries(child.path, listings, directories)
+        previous = self._directories.get(child.path)
+        entry = (
+            previous
+            if previous is not None and previous.entries is entries
+            else DirectoryEntry(
+                path=child.path,
+                config=ConfigDirectoryFields.from_directory_name(child.path.name),
+                entries=entries,
+            )
         )
+        directories[child.path] = entry
+        return entry
+
+
+def scan_reconstructions(directory: Path) -> ReconstructionScan:
+    """Reads a reconstructions directory once, recording its folders and the reconstructions inside.
+
+    Every folder is recorded together with the configuration its name states, and every
+    reconstruction file beneath it. This single reading feeds both browser branches, so the two
+    views agree on what is on disk.
+    """
+    return ReconstructionScanIndex().scan(directory)
+
 
-    if path.suffix == EXT_FILE_RECONSTRUCTION:
-        return ReconstructionEntry(path=path)
+def _list_children(directory: Path) -> Tuple[_Child, ...]:
+    """The folders and reconstruction files in ``directory``, sorted, read from one listing."""
+    children: List[_Child] = []
+    with os.scandir(directory) as iterator:
+        for item in iterator:
+            if item.is_dir():
+                children.append(_Child(path=Path(item.path), is_directory=True))
+            elif Path(item.name).suffix == EXT_FILE_RECONSTRUCTION:
+                children.append(_Child(path=Path(item.path), is_directory=False))
 
-    return None
+    return tuple(sorted(children, key=lambda child: child.path))
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, replace
+from functools import cached_property
 from pathlib import Path
 from typing import List, Optional, Self
 
@@ -136,7 +137,15 @@ class ReconstructionData:
             return None
 
     def waveform_data(self) -> WaveformData:
-        """Projects the slice of this data the waveform display renders."""
+        """Projects the slice of this data the waveform display renders.
+
+        The projection is held for the life of this data, so the display summaries the waveform
+        builds on it are built once per reconstruction rather than once per redraw.
+        """
+        return self._waveform_data
+
+    @cached_property
+    def _waveform_data(self) -> WaveformData:
         return WaveformData(
             original_audio=self.original_audio,
             approximation=self.reconstruction.approximation,
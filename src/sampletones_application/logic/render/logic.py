@@ -11,6 +11,7 @@ from sampletones_application.logic.sequencer.playback.synthesizer import (
     SongLength,
 )
 from sampletones_application.logic.shared.project_source import ProjectSnapshot
+from sampletones_application.services.render.plan import RenderPlan
 from sampletones_application.services.render.result import RenderResult, RenderStage
 from sampletones_application.services.result import (
     ServiceCancelled,
@@ -38,6 +39,7 @@ from sampletones_shared.types.callback import PathCallback, VoidCallback
 from sampletones_shared.utils.callbacks import CallbackMixin
 from sampletones_shared.utils.system.paths import get_filename, replace_suffix
 
+from .parallel import PARALLEL_MINIMUM_SECONDS, SegmentSource, plan_parallel_render
 from .protocol import SongRenderServiceProtocol
 
 
@@ -167,12 +169,14 @@ class SongRenderLogic(CallbackMixin):
             logger.warning("The song holds no rows to render")
             return
 
+        source = self._segment_source()
         started = self._service.start(
-            synthesizer=self._build_synthesizer(),
+            synthesizer=self._build_synthesizer(source),
             destination=self._require_destination(),
             spec=self._settings.spec,
             normalize=self._settings.normalize,
             total_samples=length.samples,
+            plan=self._parallel_plan(source, length),
         )
         if not started:
             return
@@ -248,21 +252,38 @@ class SongRenderLogic(CallbackMixin):
         self._progress = progress
         self._emit_view()
 
-    def _build_synthesizer(self) -> RowSynthesizer:
+    def _segment_source(self) -> SegmentSource:
+        """The document a render reads, held still, and the rate the chosen format is written at."""
+        sample_rate = self._settings.spec.sample_rate
+        return SegmentSource(
+            project=ProjectSnapshot.capture(self._project_controller).project,
+            config=self._config_manager.config.with_library(sample_rate=sample_rate),
+            sample_rate=sample_rate,
+        )
+
+    @staticmethod
+    def _build_synthesizer(source: SegmentSource) -> RowSynthesizer:
         """The kernel a render runs on: the engine that plays the song, over a held document.
 
         Every channel sounds and the level stays at unity, since muting and the master gain are
         choices a listener makes about what reaches the speakers, while a render describes the
         document.
         """
-        sample_rate = self._settings.spec.sample_rate
         return RowSynthesizer(
-            ProjectSnapshot.capture(self._project_controller),
-            self._config_manager.config.with_library(sample_rate=sample_rate),
+            ProjectSnapshot(project=source.project),
+            source.config,
             active_channels=lambda: ALL_CHANNELS,
-            sample_rate=lambda: sample_rate,
+            sample_rate=lambda: source.sample_rate,
         )
 
+    @staticmethod
+    def _parallel_plan(source: SegmentSource, length: SongLength) -> Optional[RenderPlan]:
+        """The song split across a process pool, where it runs long enough to repay starting one."""
+        if length.samples < PARALLEL_MINIMUM_SECONDS * source.sample_rate:
+            return None
+
+        return plan_parallel_render(source)
+
     def _length(self) -> SongLength:
         return SongLength.measure(
             self._project_controller.project,
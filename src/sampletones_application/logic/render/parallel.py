@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+
+from sampletones_application.logic.sequencer.playback.synthesizer import (
+    ChannelSegment,
+    RowSynthesizer,
+    plan_channel_segments,
+)
+from sampletones_application.logic.shared.project_source import ProjectSnapshot
+from sampletones_application.services.render.plan import RenderPart, RenderPlan
+from sampletones_core.audio import silence
+from sampletones_core.configs import Config
+from sampletones_core.constants.enums import GeneratorName
+from sampletones_core.project import Project
+
+SEGMENT_MINIMUM_ROWS: Final[int] = 256
+PARALLEL_MINIMUM_SECONDS: Final[float] = 30.0
+
+
+@dataclass(frozen=True)
+class SegmentSource:
+    """What every segment of a parallel render is rendered from.
+
+    Attributes:
+        project: The document as it stood when the render was asked for.
+        config: The configuration the kernel is built from, at the render's rate.
+        sample_rate: The rate the render is written at.
+    """
+
+    project: Project
+    config: Config
+    sample_rate: int
+
+
+def render_channel_segment(source: SegmentSource, segment: ChannelSegment) -> np.ndarray:
+    """One channel's unclipped audio over one segment, as a render from the top produces it.
+
+    A kernel sounding only the segment's channel skips the rows before the segment, which walks
+    the channel's state and the tick clock up to it without rendering, then renders the segment's
+    rows with clipping left to the mix.
+
+    Args:
+        source: What the song is rendered from.
+        segment: The channel and rows to render.
+
+    Returns:
+        np.ndarray: The channel's samples over the segment's rows.
+    """
+    channels = frozenset({segment.generator_name})
+    synthesizer = RowSynthesizer(
+        ProjectSnapshot(project=source.project),
+        source.config,
+        active_channels=lambda: channels,
+        sample_rate=lambda: source.sample_rate,
+        clip=False,
+    )
+    for _ in range(segment.first_row):
+        synthesizer.skip_row()
+
+    chunks = [synthesizer.render_row()[0] for _ in range(segment.rows)]
+    return np.concatenate(chunks) if chunks else silence(0)
+
+
+def plan_parallel_render(source: SegmentSource) -> RenderPlan:
+    """Splits the song into channel segments a pool renders apart.
+
+    Args:
+        source: What the song is rendered from.
+
+    Returns:
+        RenderPlan: Every channel's segments, those opening earlier in the song first, mixed
+            in the order the kernel mixes channels.
+    """
+    mix_order = {generator_name: channel for channel, generator_name in enumerate(GeneratorName.items())}
+    segments = sorted(
+        plan_channel_segments(source.project.song, SEGMENT_MINIMUM_ROWS),
+        key=lambda segment: (segment.first_row, mix_order[segment.generator_name]),
+    )
+    return RenderPlan(
+        renderer=render_channel_segment,
+        source=source,
+        parts=tuple(RenderPart(channel=mix_order[segment.generator_name], task=segment) for segment in segments),
+        channels=len(mix_order),
+        max_workers=source.config.general.max_workers,
+    )
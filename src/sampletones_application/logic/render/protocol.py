@@ -1,7 +1,8 @@
 from pathlib import Path
-from typing import Callable, Protocol
+from typing import Callable, Optional, Protocol
 
 from sampletones_application.logic.sequencer.playback.synthesizer import RowSynthesizer
+from sampletones_application.services.render.plan import RenderPlan
 from sampletones_application.services.render.result import RenderResult
 from sampletones_core.audio.writers import AudioOutputSpec
 
@@ -25,6 +26,7 @@ class SongRenderServiceProtocol(Protocol):
         spec: AudioOutputSpec,
         normalize: bool,
         total_samples: int,
+        plan: Optional[RenderPlan] = None,
     ) -> bool: ...
 
     def cancel(self) -> None: ...
@@ -1,4 +1,4 @@
-from typing import Any, Protocol
+from typing import Any, Optional, Protocol, Sequence
 
 import numpy as np
 
@@ -18,9 +18,10 @@ class ChannelGeneratorProtocol(Protocol):
     pairing is a runtime invariant maintained by ``GENERATOR_CLASSES`` dispatch, which
     lies outside the static type system.
 
-    ``frame_length`` is settable so the synthesiser can give each tick the span its clock
+    ``render_sequence`` renders a run of ticks in one call, giving each the span its clock
     states, which is what keeps a rendered tick lasting ``1 / nes_frequency`` seconds at a
-    sample rate the tick divides unevenly.
+    sample rate the tick divides unevenly. ``frame_length`` is settable to the same end for a
+    tick rendered on its own.
     """
 
     frame_length: int
@@ -33,6 +34,13 @@ class ChannelGeneratorProtocol(Protocol):
         save: bool = False,
     ) -> np.ndarray: ...
 
+    def render_sequence(
+        self,
+        instructions: Sequence[Any],
+        initials: Any = None,
+        frame_lengths: Optional[Sequence[int]] = None,
+    ) -> np.ndarray: ...
+
     def reset(self) -> None: ...
 
     def class_name(self) -> GeneratorClassName: ...
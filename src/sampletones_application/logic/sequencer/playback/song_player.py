@@ -6,6 +6,7 @@ from sampletones_application.logic.project.controller import ProjectController
 from sampletones_application.logic.shared.playback_priority import PlaybackPriority
 from sampletones_application.services.song_player.result import (
     SongPlaybackError,
+    SongPlaybackStatistics,
     SongPlaybackStopped,
     SongPlayerResult,
     SongPositionUpdate,
@@ -13,6 +14,7 @@ from sampletones_application.services.song_player.result import (
 from sampletones_application.view_model.sequencer.song_player import SongPlayerViewModel
 from sampletones_core.audio import AudioDeviceManager
 from sampletones_core.project.song_position import SongPosition
+from sampletones_shared.logger import logger
 from sampletones_shared.utils.callbacks import CallbackMixin
 
 
@@ -198,6 +200,22 @@ class SongPlayerLogic(CallbackMixin):
                 self._awaiting_seek_order = None
                 self.call(self.on_error, error)
                 self._emit_view()
+            case SongPlaybackStatistics() as statistics:
+                self._log_statistics(statistics)
+
+    @staticmethod
+    def _log_statistics(statistics: SongPlaybackStatistics) -> None:
+        """Logs how well the session kept the device fed, as a warning when the audio dropped out."""
+        summary = (
+            f"Song playback: {statistics.underruns} underrun(s), "
+            f"minimum buffer {statistics.minimum_fill_seconds * 1000:.0f} ms, "
+            f"rendered at {statistics.realtime_factor:.1f}x real time, "
+            f"prefetch {statistics.prefetch_seconds * 1000:.0f} ms"
+        )
+        if statistics.underruns:
+            logger.warning(summary)
+        else:
+            logger.info(summary)
 
     def _emit_view(self) -> None:
         self.call(
@@ -3,6 +3,7 @@ from .frames import RowFrames
 from .length import SongLength
 from .modifiers import apply_modifiers
 from .rates import EngineRates
+from .segments import ChannelSegment, plan_channel_segments
 from .state import ChannelState
 from .synthesizer import RowSynthesizer
 from .timing import SongTiming
@@ -10,6 +11,7 @@ from .voice import SampleVoice
 
 __all__ = [
     "ChannelBank",
+    "ChannelSegment",
     "ChannelState",
     "EngineRates",
     "RowFrames",
@@ -18,4 +20,5 @@ __all__ = [
     "SongLength",
     "SongTiming",
     "apply_modifiers",
+    "plan_channel_segments",
 ]
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from sampletones_core.constants.enums import GeneratorName
+from sampletones_core.project.instruments.instrument import Instrument
+from sampletones_core.project.instruments.note_off import NoteOff
+from sampletones_core.project.patterns.row import Row
+from sampletones_core.project.song import Song
+
+
+@dataclass(frozen=True)
+class ChannelSegment:
+    """A run of one channel's rows that renders apart from the rest of the song.
+
+    A channel's rows depend on one another only through what the channel carries, and a row
+    that triggers or cuts a note resets the generator, the one part of that state a kernel cannot
+    recover without rendering. So a segment opens on such a row, and a kernel that skips the rows
+    before it renders the segment exactly as a render from the top would.
+
+    Rows are counted through the song in play order, a pattern's worth per order position.
+
+    Attributes:
+        generator_name: The channel the segment belongs to.
+        first_row: The song row the segment opens on.
+        end_row: The song row after the segment's last.
+    """
+
+    generator_name: GeneratorName
+    first_row: int
+    end_row: int
+
+    @property
+    def rows(self) -> int:
+        return self.end_row - self.first_row
+
+
+def plan_channel_segments(song: Song, minimum_rows: int) -> Tuple[ChannelSegment, ...]:
+    """Splits every channel's rows into segments of at least ``minimum_rows`` where one may open.
+
+    A channel with no row to open a segment on past its first is a single segment spanning the
+    song, so every channel is covered from the first row to the last.
+
+    Args:
+        song: The song to split.
+        minimum_rows: The fewest rows a segment spans before the next may open.
+
+    Returns:
+        Tuple[ChannelSegment, ...]: Each channel's segments in play order, channel by channel.
+    """
+    total_rows = song.order_length() * song.rows_per_pattern
+    segments: List[ChannelSegment] = []
+    for generator_name in GeneratorName.items():
+        first_row = 0
+        for song_row in range(minimum_rows, total_rows):
+            if song_row - first_row < minimum_rows or not _opens_segment(song, generator_name, song_row):
+                continue
+
+            segments.append(ChannelSegment(generator_name, first_row, song_row))
+            first_row = song_row
+
+        segments.append(ChannelSegment(generator_name, first_row, total_rows))
+
+    return tuple(segments)
+
+
+def _opens_segment(song: Song, generator_name: GeneratorName, song_row: int) -> bool:
+    row = _song_row(song, generator_name, song_row)
+    return row is not None and isinstance(row.command, (Instrument, NoteOff))
+
+
+def _song_row(song: Song, generator_name: GeneratorName, song_row: int) -> Optional[Row]:
+    order_position, row_index = divmod(song_row, song.rows_per_pattern)
+    pattern_index = song.order[order_position].get(generator_name)
+    if pattern_index is None:
+        return None
+
+    pattern = song.pattern(generator_name, pattern_index)
+    if pattern is None or row_index >= len(pattern.rows):
+        return None
+
+    return pattern.rows[row_index]
@@ -1,5 +1,5 @@
 from dataclasses import replace
-from typing import Callable, FrozenSet, List, Optional, Tuple
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
 
 import numpy as np
 
@@ -8,18 +8,17 @@ from sampletones_core.audio import clip_audio_inplace, silence
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import GeneratorName
 from sampletones_core.constants.general import MAX_VOLUME
-from sampletones_core.instructions import InstructionUnion
 from sampletones_core.project import Project
 from sampletones_core.project.instruments.instrument import Instrument
 from sampletones_core.project.instruments.note_off import NoteOff
 from sampletones_core.project.patterns.row import Row
 from sampletones_core.project.song import Song
 from sampletones_core.project.song_position import SongPosition
+from sampletones_core.reconstructions import Reconstruction
 from sampletones_core.timing import Groove
 
 from .bank import ChannelBank
 from .frames import RowFrames
-from .modifiers import apply_modifiers
 from .rates import EngineRates
 from .state import ChannelState
 from .timing import SongTiming
@@ -57,6 +56,9 @@ class RowSynthesizer:
     row, so muting or unmuting during playback is heard as the render-ahead buffer drains. A
     silenced channel still takes each row's instrument, transpose, and volume, so unmuting
     resumes on the state the pattern has reached.
+
+    A row's mix is clipped to full scale unless ``clip`` is unset, which is how channels rendered
+    apart are summed into the mix a single kernel would have produced before clipping once.
     """
 
     def __init__(
@@ -66,15 +68,18 @@ class RowSynthesizer:
         *,
         active_channels: Callable[[], FrozenSet[GeneratorName]],
         sample_rate: Callable[[], int],
+        clip: bool = True,
     ) -> None:
         self._project_source = project_source
         self._config = config
         self._active_channels = active_channels
         self._sample_rate = sample_rate
+        self._clip = clip
         self._position = SongPosition()
         self._timing: SongTiming = SongTiming.from_project(project_source.project)
         self._groove: Groove = self._timing.groove()
         self._channels: Optional[ChannelBank] = None
+        self._voices: Dict[Tuple[str, GeneratorName], Tuple[Reconstruction, SampleVoice]] = {}
         self._elapsed_ticks: int = 0
 
     @property
@@ -100,11 +105,30 @@ class RowSynthesizer:
             self._channels.reset()
 
     def render_row(self) -> Tuple[np.ndarray, SongPosition]:
+        return self._play_row(render=True)
+
+    def skip_row(self) -> SongPosition:
+        """Moves through one row as :meth:`render_row` does, leaving its audio unrendered.
+
+        Every channel takes up the row's instrument, transpose and volume and the values its
+        frames write, and the tick clock moves on by the row's ticks, so rendering resumes where
+        rendering from the top would stand. The generators are left where they were: skipping
+        up to a row that triggers or cuts a channel's note is exact for that channel, since the
+        row resets its generator.
+
+        Returns:
+            SongPosition: The position of the skipped row.
+        """
+        _, position = self._play_row(render=False)
+        return position
+
+    def _play_row(self, *, render: bool) -> Tuple[np.ndarray, SongPosition]:
         project = self._project_source.project
         song = project.song
         self._position.wrap_overflow(song.rows_per_pattern)
         channels = self._bank()
         self._ensure_groove(project)
+        self._prune_voices(project)
 
         frames = RowFrames.from_clock(
             channels.clock,
@@ -113,21 +137,20 @@ class RowSynthesizer:
         )
 
         position_before = replace(self._position)
-        finished = self.is_finished
-        mixed = (
-            silence(frames.total)
-            if finished
-            else self._mix_channels(
+        mixed = silence(frames.total)
+        if not self.is_finished:
+            self._mix_channels(
                 project,
                 song,
                 frames,
                 channels,
+                mixed if render else None,
             )
-        )
+            self._advance_position(song)
 
         self._elapsed_ticks += len(frames.lengths)
-        if not finished:
-            self._advance_position(song)
+        if self._clip:
+            clip_audio_inplace(mixed)
 
         return mixed, position_before
 
@@ -174,19 +197,17 @@ class RowSynthesizer:
         song: Song,
         frames: RowFrames,
         channels: ChannelBank,
-    ) -> np.ndarray:
-        mixed = silence(frames.total)
+        mixed: Optional[np.ndarray],
+    ) -> None:
         for generator_name in GeneratorName.items():
-            channel_audio = self._render_channel(
+            self._render_channel(
                 generator_name,
                 project,
                 song,
                 frames,
                 channels,
+                mixed,
             )
-            mixed += channel_audio
-
-        return clip_audio_inplace(mixed)
 
     def _render_channel(
         self,
@@ -195,7 +216,8 @@ class RowSynthesizer:
         song: Song,
         frames: RowFrames,
         channels: ChannelBank,
-    ) -> np.ndarray:
+        mixed: Optional[np.ndarray],
+    ) -> None:
         state = channels.state(generator_name)
 
         row = self._resolve_row(generator_name, song)
@@ -204,14 +226,15 @@ class RowSynthesizer:
 
         sample_id = state.sample_id
         if sample_id is None or generator_name not in self._active_channels():
-            return silence(frames.total)
+            return
 
-        return self._synthesize_ticks(
+        self._synthesize_ticks(
             state,
             sample_id,
             project,
             generator_name,
             frames,
+            mixed,
         )
 
     def _resolve_row(
@@ -257,58 +280,86 @@ class RowSynthesizer:
         project: Project,
         generator_name: GeneratorName,
         frames: RowFrames,
-    ) -> np.ndarray:
+        mixed: Optional[np.ndarray],
+    ) -> None:
+        """Adds the channel's ticks of the row into ``mixed`` with one call to its generator.
+
+        The row's instructions are resolved first: a looping sample wraps around, and one that
+        does not runs out, leaving the row's remaining ticks silent. Those sounding ticks are then
+        rendered as one sequence, each over the span its clock states, exactly as rendering them
+        one at a time would. Without ``mixed`` the row is skipped: the channel takes up what its
+        frames write and nothing is rendered.
+        """
         sample = project.sample(sample_id)
         if sample is None:
-            return silence(frames.total)
+            return
 
         instructions = sample.reconstruction.instructions[generator_name]
         if not instructions:
-            return silence(frames.total)
-
-        voice = SampleVoice.read(sample.reconstruction, generator_name)
-        output = silence(frames.total)
-        silence_frame = silence(frames.longest)
-
-        for tick, frame_length in enumerate(frames.lengths):
-            frame = self._synthesize_tick(
-                state,
-                instructions,
-                silence_frame[:frame_length],
-                sample.loop,
-                frame_length,
-                voice,
-            )
-            output[frames.bounds[tick] : frames.bounds[tick + 1]] = frame
-            state.tick_index += 1
-
-        return output
+            return
 
-    def _synthesize_tick(
-        self,
-        state: ChannelState,
-        instructions: List[InstructionUnion],
-        silence_frame: np.ndarray,
-        loop: bool,
-        frame_length: int,
-        voice: SampleVoice,
-    ) -> np.ndarray:
-        if loop:
-            instruction = instructions[state.tick_index % len(instructions)]
-        elif state.tick_index < len(instructions):
-            instruction = instructions[state.tick_index]
+        ticks = len(frames.lengths)
+        first = state.tick_index
+        state.tick_index += ticks
+        if sample.loop:
+            indices = [(first + tick) % len(instructions) for tick in range(ticks)]
         else:
-            return silence_frame
+            indices = list(range(first, min(first + ticks, len(instructions))))
+
+        if not indices:
+            return
 
-        state.generator.frame_length = frame_length
-        return state.generator(
-            apply_modifiers(
-                voice.sound(instruction, state.feature_values),
+        voice = self._voice(sample.reconstruction, sample_id, generator_name)
+        played = [
+            voice.play(
+                instructions[index],
+                state.feature_values,
                 state.transpose,
                 state.volume,
-            ),
-            save=True,
+            )
+            for index in indices
+        ]
+        if mixed is None:
+            return
+
+        mixed[: frames.bounds[len(played)]] += state.generator.render_sequence(
+            played,
+            frame_lengths=frames.lengths[: len(played)],
         )
 
+    def _voice(
+        self,
+        reconstruction: Reconstruction,
+        sample_id: str,
+        generator_name: GeneratorName,
+    ) -> SampleVoice:
+        """The voice a channel plays a sample through, kept while the sample's reconstruction is.
+
+        A voice remembers what each frame sounded as, so keeping it across rows is what lets a
+        sustained or looping sample read its frames back. Regenerating a sample installs a new
+        reconstruction, which the next row reads a new voice from.
+        """
+        key = (sample_id, generator_name)
+        entry = self._voices.get(key)
+        if entry is None or entry[0] is not reconstruction:
+            entry = (reconstruction, SampleVoice.read(reconstruction, generator_name))
+            self._voices[key] = entry
+
+        return entry[1]
+
+    def _prune_voices(self, project: Project) -> None:
+        """Lets go of the voices whose sample was removed or regenerated since they were read.
+
+        A voice holds its sample's reconstruction, so one kept past the sample would hold the
+        reconstruction the project no longer does for as long as the kernel lives.
+        """
+        stale = [
+            key
+            for key, (reconstruction, _) in self._voices.items()
+            if (sample := project.sample(key[0])) is None or sample.reconstruction is not reconstruction
+        ]
+        for key in stale:
+            del self._voices[key]
+
     def _advance_position(self, song: Song) -> None:
         self._position.advance(song.rows_per_pattern, song.order_length())
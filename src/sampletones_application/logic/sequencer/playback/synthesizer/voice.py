@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Tuple
 
 from sampletones_core.constants.enums import FeatureKey, GeneratorName
@@ -8,6 +8,13 @@ from sampletones_core.exporters import GENERATOR_NAME_TO_EXPORTER_MAP, ExporterT
 from sampletones_core.instructions import InstructionUnion
 from sampletones_core.reconstructions import Reconstruction
 
+from .modifiers import apply_modifiers
+
+FeatureItems = Tuple[Tuple[FeatureKey, int], ...]
+SoundKey = Tuple[InstructionUnion, FeatureItems]
+Sounding = Tuple[InstructionUnion, FeatureItems]
+PlayKey = Tuple[InstructionUnion, int, int]
+
 
 @dataclass(frozen=True)
 class SampleVoice:
@@ -19,6 +26,10 @@ class SampleVoice:
     the value it holds, which is what clearing an envelope in the instruments panel means once the
     sample is played in a song.
 
+    A looping sample sounds the same few frames over and over, so the voice remembers what each
+    frame sounded as for each state of the values the channel holds, and what each sounded frame
+    becomes at each transpose and volume, and reads both back instead of building the frame again.
+
     Attributes:
         exporter: The reading that turns this channel's frames into envelope values and back.
         initial_pitch: Reference pitch the arpeggio values are measured against.
@@ -28,6 +39,8 @@ class SampleVoice:
     exporter: ExporterTypeUnion
     initial_pitch: int
     held_features: Tuple[FeatureKey, ...]
+    _soundings: Dict[SoundKey, Sounding] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _plays: Dict[PlayKey, InstructionUnion] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @classmethod
     def read(
@@ -69,16 +82,56 @@ class SampleVoice:
         Returns:
             InstructionUnion: The frame to sound, before the pattern's transpose and volume.
         """
+        key = (instruction, tuple(feature_values.items()))
+        sounding = self._soundings.get(key)
+        if sounding is None:
+            sounding = self._translate(instruction, feature_values)
+            self._soundings[key] = sounding
+
+        sounded, written = sounding
+        feature_values.update(written)
+        return sounded
+
+    def play(
+        self,
+        instruction: InstructionUnion,
+        feature_values: Dict[FeatureKey, int],
+        transpose: int,
+        volume: int,
+    ) -> InstructionUnion:
+        """The frame the channel sounds at the transpose and volume the pattern has reached.
+
+        Args:
+            instruction: The frame as the sample holds it.
+            feature_values: The values the channel holds, updated with what the instrument writes.
+            transpose: The semitone offset the pattern has reached.
+            volume: The level the pattern has reached.
+
+        Returns:
+            InstructionUnion: The frame :meth:`sound` gives, bent by :func:`apply_modifiers`.
+        """
+        key = (self.sound(instruction, feature_values), transpose, volume)
+        played = self._plays.get(key)
+        if played is None:
+            played = apply_modifiers(*key)
+            self._plays[key] = played
+
+        return played
+
+    def _translate(
+        self,
+        instruction: InstructionUnion,
+        feature_values: Dict[FeatureKey, int],
+    ) -> Sounding:
         stated = self.exporter.feature_values(
             instruction,  # type: ignore[arg-type]
             self.initial_pitch,
         )
-        for feature_key, value in stated.items():
-            if feature_key not in self.held_features:
-                feature_values[feature_key] = value
-
+        written = tuple(
+            (feature_key, value) for feature_key, value in stated.items() if feature_key not in self.held_features
+        )
         sounded: InstructionUnion = self.exporter.instruction_from_values(
-            feature_values,
+            {**feature_values, **dict(written)},
             self.initial_pitch,
         )
-        return sounded
+        return sounded, written
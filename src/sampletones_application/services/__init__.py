@@ -5,6 +5,14 @@ from sampletones_application.services.export.kind import ExportKind
 from sampletones_application.services.export.result import ExportResult
 from sampletones_application.services.export.service import ExportService
 from sampletones_application.services.export.success import ExportSuccess
+from sampletones_application.services.library import (
+    LibraryHeaderRead,
+    LibraryLoadError,
+    LibraryLoadResult,
+    LibraryLoadService,
+    LibraryLoadSuperseded,
+    LoadedLibrary,
+)
 from sampletones_application.services.regeneration import (
     RegeneratedInstrument,
     RegenerationResult,
@@ -35,6 +43,12 @@ __all__ = [
     "ExportResult",
     "ExportService",
     "ExportSuccess",
+    "LibraryHeaderRead",
+    "LibraryLoadError",
+    "LibraryLoadResult",
+    "LibraryLoadService",
+    "LibraryLoadSuperseded",
+    "LoadedLibrary",
     "RegeneratedInstrument",
     "RegenerationResult",
     "RegenerationService",
@@ -13,6 +13,7 @@ from sampletones_application.services.result import (
 )
 from sampletones_core.configs import Config
 from sampletones_core.parallelization import ETAEstimator, TaskProgress, TaskStatus
+from sampletones_core.reconstructions import ReconstructionCache
 from sampletones_core.reconstructions.converter import ReconstructionConverter
 from sampletones_shared.logger import logger
 from sampletones_shared.utils.system.paths import to_path
@@ -25,11 +26,13 @@ class ConversionService(ServiceBase[ConversionResult]):
     This normalises the impedance mismatch between the core converter's ad-hoc
     callback interface and the subscriber model used throughout the application.
     Library-generation progress is forwarded through the same stream so the
-    converter panel has a single unified view.
+    converter panel has a single unified view. Conversions reuse and add to the
+    reconstruction cache the service was given, if any.
     """
 
-    def __init__(self, priority: int = 0) -> None:
+    def __init__(self, priority: int = 0, cache: Optional[ReconstructionCache] = None) -> None:
         super().__init__(priority)
+        self._cache = cache
         self._converter: Optional[ReconstructionConverter] = None
         self._eta_estimator: Optional[ETAEstimator] = None
 
@@ -43,6 +46,7 @@ class ConversionService(ServiceBase[ConversionResult]):
             config=config,
             input_path=input_path,
             is_file=is_file,
+            cache=self._cache,
         )
         self._converter.set_callbacks(
             on_start=self._on_start,
@@ -0,0 +1,17 @@
+from sampletones_application.services.library.result import (
+    LibraryHeaderRead,
+    LibraryLoadError,
+    LibraryLoadResult,
+    LibraryLoadSuperseded,
+    LoadedLibrary,
+)
+from sampletones_application.services.library.service import LibraryLoadService
+
+__all__ = [
+    "LibraryHeaderRead",
+    "LibraryLoadError",
+    "LibraryLoadResult",
+    "LibraryLoadService",
+    "LibraryLoadSuperseded",
+    "LoadedLibrary",
+]
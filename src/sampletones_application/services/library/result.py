@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+
+from sampletones_application.services.result import ServiceIntermediate, ServiceProgress, ServiceSuccess
+from sampletones_core.library import (
+    InstructionLibraryData,
+    InstructionLibraryHeader,
+    InstructionLibraryKey,
+)
+
+
+@dataclass(frozen=True)
+class LibraryHeaderRead:
+    """A library's header, read ahead of its items.
+
+    Attributes:
+        key: The library the header belongs to.
+        header: What the file says about itself.
+    """
+
+    key: InstructionLibraryKey
+    header: InstructionLibraryHeader
+
+
+@dataclass(frozen=True, eq=False)
+class LoadedLibrary:
+    """A library read in full.
+
+    Attributes:
+        key: The library that was loaded.
+        data: The library's items, ready to be cached.
+    """
+
+    key: InstructionLibraryKey
+    data: InstructionLibraryData
+
+
+@dataclass(frozen=True, eq=False)
+class LibraryLoadError:
+    """A failed library load, carrying the exception the error ladder reports.
+
+    Attributes:
+        key: The library that failed to load.
+        exception: The failure raised while reading.
+    """
+
+    key: InstructionLibraryKey
+    exception: Exception
+
+
+@dataclass(frozen=True)
+class LibraryLoadSuperseded:
+    """A queued library load replaced by a newer request before it started; it never runs.
+
+    Attributes:
+        key: The library whose load was dropped.
+    """
+
+    key: InstructionLibraryKey
+
+
+LibraryLoadResult = (
+    ServiceIntermediate[LibraryHeaderRead]
+    | ServiceProgress[InstructionLibraryKey]
+    | ServiceSuccess[LoadedLibrary]
+    | LibraryLoadError
+    | LibraryLoadSuperseded
+)
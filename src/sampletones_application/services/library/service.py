@@ -0,0 +1,108 @@
+import threading
+from pathlib import Path
+from typing import Final, Optional, Set
+
+from sampletones_application.services.base import ServiceBase
+from sampletones_application.services.library.result import (
+    LibraryHeaderRead,
+    LibraryLoadError,
+    LibraryLoadResult,
+    LibraryLoadSuperseded,
+    LoadedLibrary,
+)
+from sampletones_application.services.result import (
+    ServiceIntermediate,
+    ServiceProgress,
+    ServiceSuccess,
+)
+from sampletones_application.utils.parallelization.coalescing import LatestWinsExecutor
+from sampletones_application.utils.parallelization.thread import (
+    BackgroundWorkCancelled,
+    SingleThreadExecutor,
+)
+from sampletones_core.library import InstructionLibraryData, InstructionLibraryKey
+
+LOAD_PROGRESS_STEPS: Final[int] = 100
+
+
+class LibraryLoadService(ServiceBase[LibraryLoadResult]):
+    """Reads instruction libraries from disk on a background thread.
+
+    A load first reads the file's header, which costs a few hundred bytes and is emitted as an
+    intermediate result, so a subscriber can name the library and its size while the items are
+    still being decoded. The header carries no instruction data: the items follow with a
+    progress report per hundredth of the file, and only the decoded library, which closes the
+    load, can show one. The service caches nothing: the subscriber owns the loaded data and
+    decides which library is current.
+
+    Requests run on a :class:`LatestWinsExecutor`, so a load waiting behind the running one is
+    replaced by a newer request, while the running load always completes. A replaced load
+    emits :class:`LibraryLoadSuperseded`, so every request ends in exactly one outcome. A key
+    counts as loading from its request until its outcome has been delivered on the main
+    thread, so a caller checking :meth:`is_loading` never asks for the same file twice.
+    """
+
+    def __init__(self, priority: int = 0) -> None:
+        super().__init__(priority)
+        self._executor = LatestWinsExecutor()
+        self._lock = threading.Lock()
+        self._queued: Optional[InstructionLibraryKey] = None
+        self._in_flight: Set[InstructionLibraryKey] = set()
+        self.subscribe(self._settle)
+
+    def load(self, key: InstructionLibraryKey, path: Path) -> bool:
+        with self._lock:
+            self._queued = key
+
+        return self._executor.submit(lambda: self._run(key, path), on_superseded=lambda: self._supersede(key))
+
+    def is_loading(self, key: InstructionLibraryKey) -> bool:
+        with self._lock:
+            return key == self._queued or key in self._in_flight
+
+    def is_running(self) -> bool:
+        return self._executor.is_running
+
+    def _run(self, key: InstructionLibraryKey, path: Path) -> None:
+        with self._lock:
+            if self._queued == key:
+                self._queued = None
+            self._in_flight.add(key)
+
+        try:
+            header = InstructionLibraryData.read_header(path)
+            self._emit(ServiceIntermediate(data=LibraryHeaderRead(key=key, header=header)))
+            data = InstructionLibraryData.load_incrementally(
+                path,
+                on_progress=lambda completed, total: self._report(key, completed, total),
+            )
+            self._emit(ServiceSuccess(value=LoadedLibrary(key=key, data=data)))
+        except BackgroundWorkCancelled:
+            with self._lock:
+                self._in_flight.discard(key)
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            self._emit(LibraryLoadError(key=key, exception=exception))
+
+    def _supersede(self, key: InstructionLibraryKey) -> None:
+        """Reports a queued load dropped for a newer request, unless that request is for the same key."""
+        with self._lock:
+            if self._queued == key:
+                return
+
+        self._emit(LibraryLoadSuperseded(key=key))
+
+    def _report(self, key: InstructionLibraryKey, completed: int, total: int) -> None:
+        """Reports the items decoded each time another hundredth of the library is in, unwinding
+        the load once shutdown has been requested."""
+        if SingleThreadExecutor.is_shutting_down():
+            raise BackgroundWorkCancelled()
+
+        if completed * LOAD_PROGRESS_STEPS // total != (completed - 1) * LOAD_PROGRESS_STEPS // total:
+            self._emit(ServiceProgress(completed=completed, total=total, current_item=key))
+
+    def _settle(self, result: LibraryLoadResult) -> None:
+        """Retires a key once its outcome reaches the main thread, ahead of every other subscriber."""
+        match result:
+            case ServiceSuccess(value=LoadedLibrary(key=key)) | LibraryLoadError(key=key):
+                with self._lock:
+                    self._in_flight.discard(key)
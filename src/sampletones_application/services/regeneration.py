@@ -40,7 +40,8 @@ class RegenerationService(ServiceBase[RegenerationResult]):
     The result is a fresh reconstruction carrying the updated generator data; the
     source reconstruction is left intact. Producing a new object lets callers swap
     the edited reconstruction in while any history snapshot that shares the prior
-    object stays valid.
+    object stays valid. The new object shares every untouched channel with the source,
+    so an edit costs what the edited channel costs.
 
     Requests are serialized on a :class:`LatestWinsExecutor`: while a job runs, further
     requests coalesce to the latest one, so a continuous stream of edits collapses to a
@@ -103,8 +104,7 @@ class RegenerationService(ServiceBase[RegenerationResult]):
             generator = generator_class(reconstruction.config, generator_name)
             audio = self._render(generator, instructions)
 
-            updated = reconstruction.model_copy(deep=True)
-            updated.update_generator_data(
+            updated = reconstruction.with_generator_data(
                 generator_name,
                 instructions,
                 audio,
@@ -133,9 +133,4 @@ class RegenerationService(ServiceBase[RegenerationResult]):
         An instrument whose every dimension is left to the channel describes no frame, and
         sounds as the silence of an empty waveform.
         """
-        if not instructions:
-            return np.zeros(0, dtype=np.float32)
-
-        return np.concatenate(
-            [generator(instruction, save=True) for instruction in instructions],  # type: ignore[arg-type]
-        )
+        return generator.render_sequence(instructions)  # type: ignore[arg-type]
@@ -1,3 +1,5 @@
+from sampletones_application.services.render.mixer import PartMixer
+from sampletones_application.services.render.plan import RenderPart, RenderPlan
 from sampletones_application.services.render.result import RenderResult, RenderStage
 from sampletones_application.services.render.service import SongRenderService
 from sampletones_application.services.render.sink import (
@@ -10,6 +12,9 @@ from sampletones_application.services.render.sink import (
 __all__ = [
     "DirectRenderSink",
     "NormalizingRenderSink",
+    "PartMixer",
+    "RenderPart",
+    "RenderPlan",
     "RenderResult",
     "RenderSink",
     "RenderStage",
@@ -3,3 +3,4 @@ from typing import Final
 PROGRESS_STEPS: Final[int] = 200
 ENCODE_BLOCK_SAMPLES: Final[int] = 1 << 16
 SCRATCH_SUFFIX: Final[str] = ".scratch"
+PART_POLL_SECONDS: Final[float] = 0.1
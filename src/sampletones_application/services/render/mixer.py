@@ -0,0 +1,47 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from sampletones_application.services.render.plan import RenderPlan
+from sampletones_core.audio import clip_audio_inplace
+
+
+class PartMixer:
+    """Mixes a plan's parts as they arrive, releasing the song from its start onwards.
+
+    Parts finish in whatever order the pool reaches them. A channel's audio stands up to the end
+    of its earliest part not yet in, so the mix stands up to the earliest of those ends across
+    the channels; :meth:`drain` releases that stretch and keeps the rest waiting.
+    """
+
+    def __init__(self, plan: RenderPlan) -> None:
+        self._channels = plan.channels
+        self._part_channels = [part.channel for part in plan.parts]
+        self._queues: List[List[int]] = [
+            [index for index, part in enumerate(plan.parts) if part.channel == channel]
+            for channel in range(plan.channels)
+        ]
+        self._arrived: Dict[int, np.ndarray] = {}
+        self._pending: List[List[np.ndarray]] = [[] for _ in range(plan.channels)]
+
+    def add(self, index: int, audio: np.ndarray) -> None:
+        """Takes the audio of the part at ``index`` in the plan."""
+        self._arrived[index] = audio
+        queue = self._queues[self._part_channels[index]]
+        pending = self._pending[self._part_channels[index]]
+        while queue and queue[0] in self._arrived:
+            pending.append(self._arrived.pop(queue.pop(0)))
+
+    def drain(self) -> Optional[np.ndarray]:
+        """The mixed and clipped stretch every channel has reached, or ``None`` before any has."""
+        available = min(sum(len(chunk) for chunk in pending) for pending in self._pending)
+        if available == 0:
+            return None
+
+        mixed = np.zeros(available, dtype=np.float32)
+        for channel in range(self._channels):
+            audio = np.concatenate(self._pending[channel])
+            mixed += audio[:available]
+            self._pending[channel] = [audio[available:]] if len(audio) > available else []
+
+        return clip_audio_inplace(mixed)
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Tuple
+
+import numpy as np
+
+from sampletones_core.constants.algorithm import MAX_WORKERS
+
+PartRenderer = Callable[[Any, Any], np.ndarray]
+
+
+@dataclass(frozen=True)
+class RenderPart:
+    """One piece of a song rendered on its own.
+
+    Attributes:
+        channel: The mix position of the channel the part belongs to.
+        task: What the plan's renderer is handed to render the part.
+    """
+
+    channel: int
+    task: Any
+
+
+@dataclass(frozen=True)
+class RenderPlan:
+    """A song split into parts a pool renders apart and the render mixes back in order.
+
+    Each channel's parts follow one another through the song, so joining them end to end gives
+    the channel's unclipped audio. The channels are summed in their mix order and clipped, which
+    is the mix a single kernel produces. The renderer and the source travel to every worker once;
+    a part carries only its task.
+
+    Attributes:
+        renderer: A module-level function rendering ``task`` of ``source`` to audio.
+        source: What every part is rendered from.
+        parts: The parts, each channel's in play order.
+        channels: How many channels the mix sums.
+        max_workers: The most worker processes the pool may start.
+    """
+
+    renderer: PartRenderer
+    source: Any
+    parts: Tuple[RenderPart, ...]
+    channels: int
+    max_workers: int = MAX_WORKERS
@@ -1,8 +1,18 @@
+import multiprocessing
+import os
 import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from functools import partial
 from pathlib import Path
+from typing import Any, Dict, Optional, Set
+
+import numpy as np
+from pebble import ProcessPool
 
 from sampletones_application.services.base import ServiceBase
+from sampletones_application.services.render.constants import PART_POLL_SECONDS
+from sampletones_application.services.render.mixer import PartMixer
+from sampletones_application.services.render.plan import PartRenderer, RenderPlan
 from sampletones_application.services.render.progress import StageProgress
 from sampletones_application.services.render.result import RenderResult, RenderStage
 from sampletones_application.services.render.sink import (
@@ -31,9 +41,14 @@ class SongRenderService(ServiceBase[RenderResult]):
     written back at the level the whole render turned out to reach — so the service reports one
     pass or two without knowing which format waits on the other side.
 
-    A render is one at a time. Cancelling is honoured between rows and between encoded blocks,
-    and the file a cancelled or failed run was writing is removed, so a result names a path only
-    where a finished file stands.
+    A render handed a :class:`RenderPlan` renders the plan's parts in a process pool instead,
+    one worker per core up to the plan's ``max_workers``, and writes the mix to the sink in order
+    as the parts that open the song come in, so the file is the one the row-by-row render writes.
+    With a single worker to give it, a plan is set aside for the row-by-row render.
+
+    A render is one at a time. Cancelling is honoured between rows, between finished parts and
+    between encoded blocks, and the file a cancelled or failed run was writing is removed, so a
+    result names a path only where a finished file stands.
     """
 
     def __init__(self, priority: int = 0) -> None:
@@ -50,6 +65,7 @@ class SongRenderService(ServiceBase[RenderResult]):
         spec: AudioOutputSpec,
         normalize: bool,
         total_samples: int,
+        plan: Optional[RenderPlan] = None,
     ) -> bool:
         """Begins a render on the worker thread; reports whether it took the request.
 
@@ -59,6 +75,7 @@ class SongRenderService(ServiceBase[RenderResult]):
             spec: The format, rate, and quality it is written at.
             normalize: Whether the render is scaled so its loudest sample reaches full scale.
             total_samples: The samples the whole song holds, which the passes are measured against.
+            plan: The song split into parts to render in parallel, in place of ``synthesizer``.
 
         Returns:
             bool: Whether a render started; a request arriving while one runs is declined.
@@ -71,7 +88,7 @@ class SongRenderService(ServiceBase[RenderResult]):
         self._running.set()
         sink = build_render_sink(destination, spec, normalize=normalize)
         started = self._executor.execute(
-            partial(self._run, synthesizer, sink, total_samples),
+            partial(self._run, synthesizer, sink, total_samples, plan),
             wait=False,
         )
         if not started:
@@ -99,10 +116,11 @@ class SongRenderService(ServiceBase[RenderResult]):
         synthesizer: RowSynthesizerProtocol,
         sink: RenderSink,
         total_samples: int,
+        plan: Optional[RenderPlan],
     ) -> None:
         try:
             self._emit(ServiceStarted(total=total_samples))
-            self._report_outcome(sink, self._render(synthesizer, sink, total_samples))
+            self._report_outcome(sink, self._render(synthesizer, sink, total_samples, plan))
         except Exception as exception:  # pylint: disable=broad-exception-caught
             logger.error_with_traceback(exception, f"{self.class_name}: failed to render to {sink.destination}")
             sink.discard()
@@ -115,9 +133,15 @@ class SongRenderService(ServiceBase[RenderResult]):
         synthesizer: RowSynthesizerProtocol,
         sink: RenderSink,
         total_samples: int,
+        plan: Optional[RenderPlan],
     ) -> bool:
         with sink:
-            if not self._synthesize(synthesizer, sink, total_samples):
+            synthesized = (
+                self._synthesize_parts(plan, sink, total_samples)
+                if plan is not None and self._pool_size(plan) > 1
+                else self._synthesize(synthesizer, sink, total_samples)
+            )
+            if not synthesized:
                 return False
 
             return sink.finish(self._encode_reporter(total_samples))
@@ -149,6 +173,56 @@ class SongRenderService(ServiceBase[RenderResult]):
 
         return not self._cancel_event.is_set()
 
+    def _synthesize_parts(
+        self,
+        plan: RenderPlan,
+        sink: RenderSink,
+        total_samples: int,
+    ) -> bool:
+        """Renders the plan's parts in a process pool, writing the mix as it stands from the top.
+
+        Parts are scheduled in plan order, so those opening the song finish first and the sink
+        receives the song without waiting on its end. A stop request is looked at whenever a part
+        finishes and at a short interval between, and stops the pool outright.
+        """
+        progress = StageProgress(RenderStage.SYNTHESIS, total_samples, emit=self._emit)
+        mixer = PartMixer(plan)
+        context = multiprocessing.get_context("spawn")
+        pool = ProcessPool(
+            max_workers=self._pool_size(plan),
+            context=context,
+            initializer=_initialize_worker,
+            initargs=(plan.renderer, plan.source),
+        )
+        try:
+            futures: Dict[Future[np.ndarray], int] = {
+                pool.schedule(_render_part, args=(part.task,)): index for index, part in enumerate(plan.parts)
+            }
+            waiting: Set[Future[np.ndarray]] = set(futures)
+            rendered = 0
+            while waiting:
+                if self._cancel_event.is_set():
+                    return False
+
+                done, waiting = wait(waiting, timeout=PART_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                for future in done:
+                    mixer.add(futures[future], future.result())
+
+                chunk = mixer.drain()
+                if chunk is not None:
+                    sink.write(chunk)
+                    rendered = min(total_samples, rendered + len(chunk))
+                    progress.advance(rendered)
+
+            return not self._cancel_event.is_set()
+        finally:
+            pool.stop()  # type: ignore[no-untyped-call]
+            pool.join()
+
+    def _pool_size(self, plan: RenderPlan) -> int:
+        """The workers a plan keeps busy: one per part, as far as the processors and the cap allow."""
+        return min(plan.max_workers, os.cpu_count() or 1, len(plan.parts))
+
     def _encode_reporter(self, total_samples: int) -> EncodeReporter:
         progress = StageProgress(RenderStage.ENCODING, total_samples, emit=self._emit)
         return partial(self._report_encoded, progress)
@@ -165,3 +239,17 @@ class SongRenderService(ServiceBase[RenderResult]):
 
         logger.info(f"Rendered the song to: {logger.format_path(sink.destination)}")
         self._emit(ServiceSuccess(value=sink.destination))
+
+
+_worker_source: Dict[str, Any] = {}
+
+
+def _initialize_worker(renderer: PartRenderer, source: Any) -> None:
+    """Keeps what every part of a plan is rendered from, once per worker process."""
+    _worker_source["renderer"] = renderer
+    _worker_source["source"] = source
+
+
+def _render_part(task: Any) -> np.ndarray:
+    audio: np.ndarray = _worker_source["renderer"](_worker_source["source"], task)
+    return audio
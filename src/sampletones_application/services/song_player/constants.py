@@ -1,5 +1,8 @@
 from typing import Final
 
 PREFETCH_SECONDS: Final[float] = 0.25
+PREFETCH_MAX_SECONDS: Final[float] = 2.0
+PREFETCH_GROWTH: Final[float] = 1.5
+RING_POLL_TIMEOUT: Final[float] = 0.005
 STOP_POLL_TIMEOUT: Final[float] = 0.05
 STOP_JOIN_TIMEOUT: Final[float] = 2.0
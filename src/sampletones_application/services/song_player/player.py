@@ -1,14 +1,16 @@
 import threading
-from collections import deque
-from dataclasses import dataclass
-from typing import Callable, Deque, Optional, Tuple
+import time
+from typing import Callable, Dict, Optional, Tuple
 
 import numpy as np
 import pyaudio
 
 from sampletones_application.services.base import ServiceBase
 from sampletones_application.services.song_player.constants import (
+    PREFETCH_GROWTH,
+    PREFETCH_MAX_SECONDS,
     PREFETCH_SECONDS,
+    RING_POLL_TIMEOUT,
     STOP_JOIN_TIMEOUT,
     STOP_POLL_TIMEOUT,
 )
@@ -18,32 +20,31 @@ from sampletones_application.services.song_player.result import (
     SongPlayerResult,
     SongPositionUpdate,
 )
+from sampletones_application.services.song_player.ring import SampleRing
+from sampletones_application.services.song_player.telemetry import PlaybackTelemetry
 from sampletones_application.services.synthesis.protocol import RowSynthesizerProtocol
 from sampletones_core.audio import AudioDeviceManager, clip_audio_inplace
-from sampletones_core.constants.audio import DEFAULT_BUFFER_SIZE
 from sampletones_core.project.song_position import SongPosition
 from sampletones_shared.constants.audio import UNITY_GAIN
 from sampletones_shared.logger import logger
 
 
-@dataclass(frozen=True)
-class _RenderedRow:
-    chunk: np.ndarray
-    position: SongPosition
-
-
 class SongPlayerService(ServiceBase[SongPlayerResult]):
-    """Streams a song to the audio device through a render-ahead prefetch buffer.
-
-    A synthesis thread renders rows into a buffer bounded by ``PREFETCH_SECONDS`` of
-    look-ahead audio; a writer thread drains that buffer to the device with blocking
-    ``stream.write()`` calls that pace playback at the audio clock. Keeping synthesis
-    off the writer thread lets the buffer absorb synthesis and scheduling jitter, so the
-    device stays fed and playback runs continuously.
-
-    Each row's position is emitted as the writer hands that row to the device, so the
-    reported playhead tracks the audio the listener is hearing. The caller receives
-    ``SongPositionUpdate`` per row and ``SongPlaybackStopped`` when the song ends.
+    """Streams a song to the audio device through a render-ahead ring buffer.
+
+    A synthesis thread renders rows into a preallocated :class:`SampleRing` until it holds the
+    prefetch depth of look-ahead audio. The device pulls its buffers from the ring through a
+    callback-mode stream, so the audio clock paces playback and the callback never waits on the
+    renderer: a buffer the ring cannot cover is padded with silence and counted as an underrun.
+    Every underrun deepens the prefetch, up to ``PREFETCH_MAX_SECONDS``, so a machine that
+    cannot keep up trades latency for continuity on its own. A stream thread opens the stream
+    once the ring is primed, holds it while the song plays and closes it, which keeps the
+    stream owned by one thread as the device requires.
+
+    Each row's position is emitted once the callback has handed the whole row to the device,
+    so the reported playhead tracks the audio the listener is hearing. The caller receives
+    ``SongPositionUpdate`` per row, ``SongPlaybackStatistics`` when the session ends, and
+    ``SongPlaybackStopped`` when the song ends.
     """
 
     def __init__(
@@ -62,19 +63,21 @@ class SongPlayerService(ServiceBase[SongPlayerResult]):
         self._master_gain = master_gain
         self._stop_event = threading.Event()
         self._resume_event = threading.Event()
+        self._rendered_event = threading.Event()
+        self._drained_event = threading.Event()
         self._render_thread: Optional[threading.Thread] = None
-        self._write_thread: Optional[threading.Thread] = None
+        self._stream_thread: Optional[threading.Thread] = None
 
-        self._buffer: Deque[Optional[_RenderedRow]] = deque()
-        self._buffer_condition = threading.Condition()
-        self._queued_samples: int = 0
+        self._ring = SampleRing(0)
+        self._block = np.zeros(0, dtype=np.float32)
+        self._telemetry = PlaybackTelemetry()
+        self._sample_rate: int = 0
         self._prefetch_samples: int = 0
-        self._write_block_frames: int = DEFAULT_BUFFER_SIZE
         self._playback_error: Optional[Exception] = None
 
     @property
     def alive(self) -> bool:
-        return self._write_thread is not None and self._write_thread.is_alive()
+        return self._stream_thread is not None and self._stream_thread.is_alive()
 
     @property
     def is_playing(self) -> bool:
@@ -92,19 +95,12 @@ class SongPlayerService(ServiceBase[SongPlayerResult]):
     ) -> None:
         self.stop()
         if self.alive:
-            logger.error(f"{self.class_name}: the previous writer still holds the output; start ignored")
+            logger.error(f"{self.class_name}: the previous stream thread still holds the output; start ignored")
             return
 
         self._synthesizer.set_position(order_position, row_index)
         self._synthesizer.reset()
-        self._playback_error = None
-        self._prefetch_samples = max(
-            1,
-            round(
-                PREFETCH_SECONDS * self._audio_device_manager.sample_rate,
-            ),
-        )
-        self._write_block_frames = self._audio_device_manager.buffer_size
+        self._prepare_session(self._audio_device_manager.sample_rate)
         self._stop_event.clear()
         self._resume_event.set()
         self._render_thread = threading.Thread(
@@ -112,21 +108,19 @@ class SongPlayerService(ServiceBase[SongPlayerResult]):
             daemon=True,
             name="SongPlayerRenderWorker",
         )
-        self._write_thread = threading.Thread(
-            target=self._write_loop,
+        self._stream_thread = threading.Thread(
+            target=self._stream_loop,
             daemon=True,
-            name="SongPlayerWriteWorker",
+            name="SongPlayerStreamWorker",
         )
         self._render_thread.start()
-        self._write_thread.start()
+        self._stream_thread.start()
 
     def stop(self) -> None:
         self._stop_event.set()
         self._resume_event.set()
-        self._wake_buffer()
         self._render_thread = self._join_worker(self._render_thread)
-        self._write_thread = self._join_worker(self._write_thread)
-        self._clear_buffer()
+        self._stream_thread = self._join_worker(self._stream_thread)
 
     def pause(self) -> None:
         self._resume_event.clear()
@@ -139,7 +133,7 @@ class SongPlayerService(ServiceBase[SongPlayerResult]):
 
         This keeps the synthesiser's state (where ``start`` resets it), so voices sounding at the
         moment of the move carry over to the new order — the playhead jumps while the audio plays on.
-        Rows already buffered ahead play out first, so the jump lands within one look-ahead window.
+        Rows already in the ring play out first, so the jump lands within one look-ahead window.
         """
         if not self.alive:
             return
@@ -161,9 +155,9 @@ class SongPlayerService(ServiceBase[SongPlayerResult]):
     def _join_worker(self, thread: Optional[threading.Thread]) -> Optional[threading.Thread]:
         """Joins one worker; keeps the thread when it outlives the stop deadline.
 
-        Keeping a surviving writer is what makes ``alive`` report the truth: the thread still
-        holds the output stream, so callers waiting on quiescence — the audio device before it
-        tears the backend down — can see that the stream is still outstanding.
+        Keeping a surviving stream thread is what makes ``alive`` report the truth: the thread
+        still holds the output stream, so callers waiting on quiescence — the audio device before
+        it tears the backend down — can see that the stream is still outstanding.
         """
         if thread is None:
             return None
@@ -175,40 +169,104 @@ class SongPlayerService(ServiceBase[SongPlayerResult]):
 
         return None
 
+    def _prepare_session(self, sample_rate: int) -> None:
+        """Resets the ring, the counters and the prefetch depth for a new session.
+
+        The ring is allocated for the deepest prefetch once per sample rate and reused after,
+        so a session never allocates audio storage while it plays.
+        """
+        capacity = max(1, round(PREFETCH_MAX_SECONDS * sample_rate))
+        if self._ring.capacity != capacity:
+            self._ring = SampleRing(capacity)
+
+        self._ring.clear()
+        self._telemetry = PlaybackTelemetry()
+        self._sample_rate = sample_rate
+        self._prefetch_samples = min(capacity, max(1, round(PREFETCH_SECONDS * sample_rate)))
+        self._playback_error = None
+        self._rendered_event.clear()
+        self._drained_event.clear()
+
     def _render_loop(self) -> None:
-        """Renders rows into the prefetch buffer until the song ends or a stop is requested.
+        """Renders rows into the ring until the song ends or a stop is requested.
 
-        Wraps synthesis failures into ``_playback_error`` and closes the buffer with an
-        end marker so the writer thread reports the terminal result through ``CallbackQueue``,
-        keeping every result on the service's single result channel.
+        Wraps synthesis failures into ``_playback_error`` and closes the song early, so the
+        stream thread reports the terminal result once the ring drains, keeping every result on
+        the service's single result channel.
         """
         try:
             while not self._stop_event.is_set():
                 if self._synthesizer.is_finished and not self._loop_to_start():
-                    self._enqueue_end()
-                    return
+                    break
 
+                started = time.perf_counter()
                 chunk, position = self._synthesizer.render_row()
-                self._enqueue_row(_RenderedRow(chunk=chunk, position=position))
+                self._telemetry.record_render(len(chunk), time.perf_counter() - started)
+                if not self._push_row(chunk, position):
+                    return
         except Exception as exception:  # pylint: disable=broad-exception-caught
             logger.error_with_traceback(exception, f"{self.class_name}: synthesis error")
             self._playback_error = exception
-            self._enqueue_end()
 
-    def _write_loop(self) -> None:
+        self._rendered_event.set()
+
+    def _push_row(self, chunk: np.ndarray, position: SongPosition) -> bool:
+        """Writes one rendered row into the ring once its fill falls below the prefetch depth.
+
+        Bounding the ring by queued audio duration holds a constant real-time cushion whatever
+        the row length, so short high-tempo rows stay as well-buffered as long ones while the
+        render-ahead latency stays bounded. A row longer than the free space is written as room
+        frees up. Reports whether the row went in whole, which a stop prevents.
+        """
+        while self._ring.fill >= self._prefetch_samples:
+            if self._stop_event.wait(RING_POLL_TIMEOUT):
+                return False
+
+        written = self._ring.write(chunk)
+        while written < len(chunk):
+            if self._stop_event.wait(RING_POLL_TIMEOUT):
+                return False
+
+            written += self._ring.write(chunk[written:])
+
+        self._ring.mark(position)
+        return True
+
+    def _stream_loop(self) -> None:
+        """Holds the callback-mode stream from a primed ring until the song drains or a stop.
+
+        The session's statistics are emitted once the stream is closed, and the terminal result
+        follows when the song ran out rather than being stopped.
+        """
+        if not self._await_prefetch():
+            return
+
         stream = self._open_stream()
         if stream is None:
             return
 
         try:
-            self._drain_to_stream(stream)
-        except Exception as exception:  # pylint: disable=broad-exception-caught
-            logger.error_with_traceback(exception, f"{self.class_name}: playback error")
-            self._playback_error = exception
-            self._emit_terminal()
+            while not self._stop_event.is_set() and not self._drained_event.is_set():
+                self._drained_event.wait(STOP_POLL_TIMEOUT)
         finally:
             self._audio_device_manager.close_output_stream(stream)
 
+        self._emit(self._telemetry.summarize(self._sample_rate, self._prefetch_samples))
+        if self._drained_event.is_set() and not self._stop_event.is_set():
+            self._emit_terminal()
+
+    def _await_prefetch(self) -> bool:
+        """Waits for the ring to hold the prefetch depth, or the whole song if shorter.
+
+        Opening the stream on a primed ring keeps the first buffers from counting as underruns.
+        Reports whether playback should go on, which a stop prevents.
+        """
+        while self._ring.fill < self._prefetch_samples and not self._rendered_event.is_set():
+            if self._stop_event.wait(RING_POLL_TIMEOUT):
+                return False
+
+        return not self._stop_event.is_set()
+
     def _open_stream(self) -> Optional[pyaudio.Stream]:
         try:
             sample_rate = self._audio_device_manager.sample_rate
@@ -216,6 +274,7 @@ class SongPlayerService(ServiceBase[SongPlayerResult]):
                 sample_rate=sample_rate,
                 buffer_size=self._audio_device_manager.buffer_size,
                 release=self.stop,
+                stream_callback=self._fill_buffer,
             )
             logger.debug(f"{self.class_name}: audio stream opened at {sample_rate} Hz")
             return stream
@@ -223,58 +282,68 @@ class SongPlayerService(ServiceBase[SongPlayerResult]):
             logger.error(f"{self.class_name}: failed to open audio stream: {exception}")
             self._emit(SongPlaybackStopped())
             self._stop_event.set()
-            self._wake_buffer()
             return None
 
-    def _drain_to_stream(self, stream: pyaudio.Stream) -> None:
-        while not self._stop_event.is_set():
-            self._resume_event.wait()
-            if self._stop_event.is_set():
-                return
-
-            popped, row = self._dequeue()
-            if not popped or self._stop_event.is_set():
-                return
+    def _fill_buffer(
+        self,
+        _in_data: Optional[bytes],
+        frame_count: int,
+        _time_info: Dict[str, float],
+        _status: int,
+    ) -> Tuple[bytes, int]:
+        """Supplies one device buffer from the ring; called on the backend's audio thread.
+
+        A paused stream plays silence without consuming the ring. A failure ends the stream and
+        is reported by the stream thread as a playback error.
+        """
+        try:
+            return self._read_block(frame_count)
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            logger.error_with_traceback(exception, f"{self.class_name}: playback error")
+            self._playback_error = exception
+            self._drained_event.set()
+            return bytes(frame_count * self._block.itemsize), pyaudio.paComplete
 
-            if row is None:
-                self._emit_terminal()
-                return
+    def _read_block(self, frame_count: int) -> Tuple[bytes, int]:
+        if len(self._block) != frame_count:
+            self._block = np.zeros(frame_count, dtype=np.float32)
 
-            self._play_row(stream, row)
+        block = self._block
+        if self._stop_event.is_set():
+            block.fill(0.0)
+            return block.tobytes(), pyaudio.paComplete
 
-    def _play_row(self, stream: pyaudio.Stream, row: _RenderedRow) -> None:
-        """Hands one row to the device, reporting its position once the whole row is written.
+        if not self._resume_event.is_set():
+            self._telemetry.settle()
+            block.fill(0.0)
+            return block.tobytes(), pyaudio.paContinue
 
-        A row cut short by a stop reports no position, so the playhead reflects the audio the
-        device actually received.
-        """
-        if len(row.chunk) and not self._write_chunk(stream, self._scale_to_gain(row.chunk)):
-            return
+        rendered = self._rendered_event.is_set()
+        if not rendered and self._telemetry.record_request(self._ring.fill, frame_count):
+            self._deepen_prefetch()
 
-        self._emit(SongPositionUpdate(position=row.position))
+        count = self._ring.read_into(block)
+        block[count:] = 0.0
+        for position in self._ring.pop_played():
+            self._emit(SongPositionUpdate(position=position))
 
-    def _write_chunk(self, stream: pyaudio.Stream, chunk: np.ndarray) -> bool:
-        """Writes one row to the device in buffer-sized blocks; reports whether it completed.
+        if rendered and self._ring.fill == 0:
+            self._drained_event.set()
+            return self._scale_to_gain(block).tobytes(), pyaudio.paComplete
 
-        Each block is a separate blocking write, so a stop reached mid-row is honoured within
-        roughly one buffer period rather than at the next row boundary. That bounds how long the
-        writer holds its stream open after a stop, which is what keeps the audio backend safe to
-        tear down on demand.
-        """
-        for offset in range(0, len(chunk), self._write_block_frames):
-            if self._stop_event.is_set():
-                return False
+        return self._scale_to_gain(block).tobytes(), pyaudio.paContinue
 
-            stream.write(chunk[offset : offset + self._write_block_frames].tobytes())
-
-        return True
+    def _deepen_prefetch(self) -> None:
+        """Grows the prefetch depth after an underrun, up to what the ring holds."""
+        deeper = min(self._ring.capacity, round(self._prefetch_samples * PREFETCH_GROWTH))
+        self._prefetch_samples = max(self._prefetch_samples, deeper)
 
     def _scale_to_gain(self, chunk: np.ndarray) -> np.ndarray:
-        """Scales one row by the live master gain, clipped to the output stream's range.
+        """Scales one buffer by the live master gain, clipped to the output stream's range.
 
-        The gain is read per row so a slider change is heard on the next row handed to the
-        device rather than after the render-ahead buffer drains. Clipping holds a boost above
-        unity within the float stream's [-1, 1] range, so the drive into the clip is the
+        The gain is read per device buffer so a slider change is heard on the next buffer the
+        device plays rather than after the render-ahead buffer drains. Clipping holds a boost
+        above unity within the float stream's [-1, 1] range, so the drive into the clip is the
         audible cost of the boost.
         """
         gain = self._master_gain()
@@ -290,56 +359,6 @@ class SongPlayerService(ServiceBase[SongPlayerResult]):
         else:
             self._emit(SongPlaybackStopped())
 
-    def _enqueue_row(self, row: _RenderedRow) -> None:
-        """Appends a rendered row once the buffered look-ahead falls below the target.
-
-        Bounding the buffer by queued audio duration holds a constant real-time cushion
-        whatever the row length, so short high-tempo rows stay as well-buffered as long ones
-        while the render-ahead latency stays bounded.
-        """
-        with self._buffer_condition:
-            while not self._stop_event.is_set() and self._queued_samples >= self._prefetch_samples:
-                self._buffer_condition.wait(timeout=STOP_POLL_TIMEOUT)
-
-            if self._stop_event.is_set():
-                return
-
-            self._buffer.append(row)
-            self._queued_samples += len(row.chunk)
-            self._buffer_condition.notify_all()
-
-    def _enqueue_end(self) -> None:
-        with self._buffer_condition:
-            if self._stop_event.is_set():
-                return
-
-            self._buffer.append(None)
-            self._buffer_condition.notify_all()
-
-    def _dequeue(self) -> Tuple[bool, Optional[_RenderedRow]]:
-        with self._buffer_condition:
-            while not self._stop_event.is_set() and not self._buffer:
-                self._buffer_condition.wait(timeout=STOP_POLL_TIMEOUT)
-
-            if not self._buffer:
-                return False, None
-
-            row = self._buffer.popleft()
-            if row is not None:
-                self._queued_samples -= len(row.chunk)
-                self._buffer_condition.notify_all()
-
-            return True, row
-
-    def _wake_buffer(self) -> None:
-        with self._buffer_condition:
-            self._buffer_condition.notify_all()
-
-    def _clear_buffer(self) -> None:
-        with self._buffer_condition:
-            self._buffer.clear()
-            self._queued_samples = 0
-
     def _loop_to_start(self) -> bool:
         """Wraps the playhead back to the song start when looping is on; reports whether it looped.
 
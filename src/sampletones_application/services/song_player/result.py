@@ -18,4 +18,21 @@ class SongPlaybackError:
     error: Exception
 
 
-SongPlayerResult = SongPositionUpdate | SongPlaybackStopped | SongPlaybackError
+@dataclass(frozen=True)
+class SongPlaybackStatistics:
+    """How well a playback session kept the device fed, emitted once the session ends.
+
+    Attributes:
+        underruns: How many times the device asked for audio the render-ahead buffer lacked.
+        minimum_fill_seconds: The least audio the buffer held when the device asked for more.
+        realtime_factor: Seconds of audio rendered per second spent rendering.
+        prefetch_seconds: The render-ahead depth the session ended at, grown by underruns.
+    """
+
+    underruns: int
+    minimum_fill_seconds: float
+    realtime_factor: float
+    prefetch_seconds: float
+
+
+SongPlayerResult = SongPositionUpdate | SongPlaybackStopped | SongPlaybackError | SongPlaybackStatistics
@@ -0,0 +1,83 @@
+from collections import deque
+from typing import Deque, List, Tuple
+
+import numpy as np
+
+from sampletones_core.project.song_position import SongPosition
+
+
+class SampleRing:
+    """A preallocated ring of audio frames passed from one producer thread to one consumer.
+
+    The producer alone advances the write counter and the consumer alone advances the read
+    counter, and each side copies its frames before moving its own counter, so neither side
+    waits on a lock: the audio callback reading the ring never blocks behind the renderer.
+    The counters grow without wrapping; their difference is the fill.
+
+    Each row's position travels beside the frames as a marker at the frame count where the row
+    ends, so the consumer can tell which rows it has wholly handed on.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._samples = np.zeros(capacity, dtype=np.float32)
+        self._written: int = 0
+        self._read: int = 0
+        self._markers: Deque[Tuple[int, SongPosition]] = deque()
+
+    @property
+    def capacity(self) -> int:
+        return len(self._samples)
+
+    @property
+    def fill(self) -> int:
+        return self._written - self._read
+
+    @property
+    def free(self) -> int:
+        return self.capacity - self.fill
+
+    def write(self, chunk: np.ndarray) -> int:
+        """Copies as much of ``chunk`` as fits; producer side.
+
+        Returns:
+            int: The number of leading frames of ``chunk`` written.
+        """
+        count = min(len(chunk), self.free)
+        start = self._written % self.capacity
+        first = min(count, self.capacity - start)
+        self._samples[start : start + first] = chunk[:first]
+        self._samples[: count - first] = chunk[first:count]
+        self._written += count
+        return count
+
+    def mark(self, position: SongPosition) -> None:
+        """Marks the frames written so far as the end of the row at ``position``; producer side."""
+        self._markers.append((self._written, position))
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Copies up to ``len(out)`` frames into ``out``; consumer side.
+
+        Returns:
+            int: The number of leading frames of ``out`` filled.
+        """
+        count = min(len(out), self.fill)
+        start = self._read % self.capacity
+        first = min(count, self.capacity - start)
+        out[:first] = self._samples[start : start + first]
+        out[first:count] = self._samples[: count - first]
+        self._read += count
+        return count
+
+    def pop_played(self) -> List[SongPosition]:
+        """The positions of the rows read in full since the last call, in play order; consumer side."""
+        played: List[SongPosition] = []
+        while self._markers and self._markers[0][0] <= self._read:
+            played.append(self._markers.popleft()[1])
+
+        return played
+
+    def clear(self) -> None:
+        """Empties the ring; only while neither side is running."""
+        self._written = 0
+        self._read = 0
+        self._markers.clear()
@@ -0,0 +1,56 @@
+from typing import Optional
+
+from sampletones_application.services.song_player.result import SongPlaybackStatistics
+
+
+class PlaybackTelemetry:
+    """Counters describing how well one playback session kept the device fed.
+
+    The renderer records the time each row took to render and the audio callback records the
+    ring's fill each time the device asks for frames, together with every underrun: a request
+    the ring could not cover in full while the song was still being rendered. A starved stretch
+    of consecutive requests counts as one underrun.
+    """
+
+    def __init__(self) -> None:
+        self.underruns: int = 0
+        self.minimum_fill: Optional[int] = None
+        self.rendered_frames: int = 0
+        self.render_seconds: float = 0.0
+        self._starved: bool = False
+
+    def record_render(self, frames: int, seconds: float) -> None:
+        self.rendered_frames += frames
+        self.render_seconds += seconds
+
+    def record_request(self, fill: int, requested: int) -> bool:
+        """Records the fill the device found; reports whether the request starts an underrun."""
+        if self.minimum_fill is None or fill < self.minimum_fill:
+            self.minimum_fill = fill
+
+        starved = fill < requested
+        started = starved and not self._starved
+        self._starved = starved
+        if started:
+            self.underruns += 1
+
+        return started
+
+    def settle(self) -> None:
+        """Forgets a starved stretch, such as one ended by a pause, without counting a new one."""
+        self._starved = False
+
+    def realtime_factor(self, sample_rate: int) -> float:
+        """How many seconds of audio rendered per second spent rendering; zero before any render."""
+        if self.render_seconds <= 0.0:
+            return 0.0
+
+        return self.rendered_frames / sample_rate / self.render_seconds
+
+    def summarize(self, sample_rate: int, prefetch_samples: int) -> SongPlaybackStatistics:
+        return SongPlaybackStatistics(
+            underruns=self.underruns,
+            minimum_fill_seconds=(self.minimum_fill or 0) / sample_rate,
+            realtime_factor=self.realtime_factor(sample_rate),
+            prefetch_seconds=prefetch_samples / sample_rate,
+        )
@@ -1,28 +1,32 @@
 from dataclasses import dataclass
+from typing import Tuple
 
 import numpy as np
 
 from sampletones_application.ui.elements.graphs.layers.layer import Layer
 from sampletones_application.utils.palette.colors.base import BaseColor
-from sampletones_core.audio import minmax_decimate
+from sampletones_core.audio import MinMaxPyramid
 
 
 @dataclass(frozen=True)
 class ArrayLayer(Layer):
-    data: np.ndarray
+    """A waveform drawn from its min-max pyramid, at the level the visible span calls for.
+
+    ``x_data`` and ``y_data`` hold the whole waveform; :meth:`window` summarises any part of it
+    at no more than ``max_display_points`` buckets, scaled by ``scale``.
+    """
+
+    data: MinMaxPyramid
     name: str
     color: BaseColor
     max_display_points: int
+    scale: float = 1.0
 
     def __post_init__(self) -> None:
-        y_data = self.data.astype(np.float32)
-        length = y_data.shape[0]
-
-        assert y_data.ndim == 1, "ArrayLayer data must be a 1D numpy array"
-        if length > self.max_display_points:
-            x_data, y_data = minmax_decimate(y_data, num_buckets=self.max_display_points)
-        else:
-            x_data = np.arange(y_data.shape[0], dtype=np.float32)
-
+        x_data, y_data = self.window(0, len(self.data))
         object.__setattr__(self, "x_data", x_data)
         object.__setattr__(self, "y_data", y_data)
+
+    def window(self, start: float, end: float) -> Tuple[np.ndarray, np.ndarray]:
+        x_data, y_data = self.data.window(start, end, num_buckets=self.max_display_points)
+        return x_data, y_data * np.float32(self.scale)
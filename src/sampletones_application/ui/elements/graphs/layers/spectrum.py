@@ -6,7 +6,7 @@ import numpy as np
 from sampletones_application.ui.elements.graphs.layers.layer import Layer
 from sampletones_application.utils.palette.colors.base import BaseColor
 from sampletones_core.library import InstructionLibraryFragment
-from sampletones_core.structures.histogram import Histogram
+from sampletones_core.structures.histogram import HistogramArray
 
 
 @dataclass(frozen=True)
@@ -17,7 +17,7 @@ class SpectrumLayer(Layer):
     color_bright: BaseColor
     max_display_bins: int
 
-    spectrum: Histogram = field(init=False)
+    spectrum: HistogramArray = field(init=False)
     frequencies: np.ndarray = field(init=False)
     bandwidths: np.ndarray = field(init=False)
     brightness: np.ndarray = field(init=False)
@@ -26,7 +26,7 @@ class SpectrumLayer(Layer):
         spectrum = self.data.feature
         n_bins = min(len(spectrum), self.max_display_bins)
         if n_bins < len(spectrum):
-            spectrum = Histogram(edges=spectrum.edges[: n_bins + 1], values=spectrum.values[:n_bins])
+            spectrum = spectrum[:n_bins]
 
         values = spectrum.values / np.max(spectrum.values)
         frequencies = (spectrum.edges[:-1] + spectrum.edges[1:]) / 2
@@ -32,6 +32,7 @@ from sampletones_application.utils.palette.colors.base import BaseColor
 from sampletones_application.utils.palette.colors.faded import FadedColor
 from sampletones_application.utils.palette.colors.grayscale import GrayscaleColor
 from sampletones_application.view_model.shared.waveform_data import WaveformData
+from sampletones_core.audio import MinMaxPyramid
 from sampletones_core.constants.enums import AudioSourceType, GeneratorName
 from sampletones_core.library import InstructionLibraryFragment
 from sampletones_shared.types.application import Sender
@@ -80,6 +81,7 @@ class GUIWaveformGraph(GUIGraph[Union[ArrayLayer, InstructionLayer]]):
 
         self.current_data: Optional[Union[InstructionLibraryFragment[Any], WaveformData]] = None
         self.current_position: int = 0
+        self._visible_window: Optional[Tuple[float, float]] = None
 
         _min_x = layout.graph.min_x
         _max_x = layout.graph.max_x
@@ -149,6 +151,39 @@ class GUIWaveformGraph(GUIGraph[Union[ArrayLayer, InstructionLayer]]):
             if self._reconstruction_dimmed
             else self._language_manager["global.graph.message.waveform_navigation"]
         )
+        self._follow_visible_window()
+
+    def _follow_visible_window(self) -> None:
+        """Redraws the array layers at the level the visible span calls for once the view moves.
+
+        Zoom and pan act under the pointer, and the hover handler runs every frame the plot is
+        hovered, so it reads the x-axis limits there and re-slices each layer's pyramid whenever
+        they change. A redraw costs the points on screen, whatever the length of the waveform.
+        """
+        if not dpg.does_item_exist(self.x_axis_tag):
+            return
+
+        x_min, x_max = dpg.get_axis_limits(self.x_axis_tag)
+        if (x_min, x_max) == self._visible_window:
+            return
+
+        self._visible_window = (x_min, x_max)
+        for layer in self.layers.values():
+            series_tag = self._series_tag(layer.name)
+            if isinstance(layer, ArrayLayer) and dpg.does_item_exist(series_tag):
+                x_data, y_data = layer.window(x_min, x_max)
+                dpg.configure_item(series_tag, x=x_data, y=y_data)
+
+    def _series_points(self, layer: Union[ArrayLayer, InstructionLayer]) -> Tuple[np.ndarray, np.ndarray]:
+        """The points a layer's series draws: the visible window where the view has moved in."""
+        if isinstance(layer, ArrayLayer) and self._visible_window is not None:
+            return layer.window(*self._visible_window)
+
+        return layer.x_data, layer.y_data
+
+    def clear_layers(self) -> None:
+        self._visible_window = None
+        super().clear_layers()
 
     def _set_overlay_rectangle(self, x_start: float = 0.0, x_end: float = 0.0) -> None:
         _min_y = self._layout.graph.min_y
@@ -192,25 +227,22 @@ class GUIWaveformGraph(GUIGraph[Union[ArrayLayer, InstructionLayer]]):
         self,
         waveform_data: WaveformData,
         selected_generators: Optional[List[GeneratorName]] = None,
-    ) -> Tuple[Optional[np.ndarray], np.ndarray, float]:
+    ) -> Tuple[Optional[MinMaxPyramid], MinMaxPyramid, float]:
+        """The pyramids the two layers draw from, and the scale the original is drawn at.
+
+        Under autoscale the original is drawn at the reconstruction's level, undoing the
+        coefficient it was fitted with; the scale applies to the points a window yields, so the
+        pyramid kept with the data serves either setting.
+        """
         if selected_generators is None:
             selected_generators = list(waveform_data.approximations.keys())
 
-        original_audio = waveform_data.original_audio
-        approximation = waveform_data.partials(selected_generators)
-        full_approximation = waveform_data.approximation
-
-        if not self.reconstruction_autoscale or original_audio is None:
-            return original_audio, approximation, 1.0
-
-        original_audio = original_audio / waveform_data.coefficient
-
-        coefficient = max(
-            np.max(np.abs(full_approximation)),
-            np.max(np.abs(original_audio)),
-        )
+        original_pyramid = waveform_data.original_pyramid()
+        approximation_pyramid = waveform_data.partials_pyramid(selected_generators)
+        if not self.reconstruction_autoscale or original_pyramid is None:
+            return original_pyramid, approximation_pyramid, 1.0
 
-        return original_audio, approximation, coefficient
+        return original_pyramid, approximation_pyramid, 1.0 / waveform_data.coefficient
 
     def _display_layers(
         self,
@@ -223,15 +255,15 @@ class GUIWaveformGraph(GUIGraph[Union[ArrayLayer, InstructionLayer]]):
         present, so a detached reconstruction or one whose source file is missing shows the
         approximation on its own.
         """
-        original_audio, approximation_data, _ = self._extract_reconstruction_layer_data(
+        original_pyramid, approximation_pyramid, original_scale = self._extract_reconstruction_layer_data(
             waveform_data,
             selected_generators,
         )
-        reconstruction_layer = self.reconstruction_layer(approximation_data)
-        if original_audio is None:
+        reconstruction_layer = self.reconstruction_layer(approximation_pyramid)
+        if original_pyramid is None:
             return [reconstruction_layer]
 
-        sample_layer = self.sample_layer(original_audio)
+        sample_layer = self.sample_layer(original_pyramid, scale=original_scale)
         return self._ordered_layers(sample_layer, reconstruction_layer)
 
     def update_waveform_data(
@@ -281,7 +313,7 @@ class GUIWaveformGraph(GUIGraph[Union[ArrayLayer, InstructionLayer]]):
         if dpg.does_item_exist(series_tag):
             self._bind_series_theme(series_tag, layer)
 
-    def reconstruction_layer(self, data: np.ndarray) -> ArrayLayer:
+    def reconstruction_layer(self, data: MinMaxPyramid) -> ArrayLayer:
         return ArrayLayer(
             data=data,
             name=self._lbl_waveform_reconstruction,
@@ -289,12 +321,13 @@ class GUIWaveformGraph(GUIGraph[Union[ArrayLayer, InstructionLayer]]):
             max_display_points=self._layout.waveform.max_display_points,
         )
 
-    def sample_layer(self, data: np.ndarray) -> ArrayLayer:
+    def sample_layer(self, data: MinMaxPyramid, scale: float = 1.0) -> ArrayLayer:
         return ArrayLayer(
             data=data,
             name=self._lbl_waveform_original,
             color=self._layout.colors.waveform_sample,
             max_display_points=self._layout.waveform.max_display_points,
+            scale=scale,
         )
 
     def _ordered_layers(
@@ -403,16 +436,17 @@ class GUIWaveformGraph(GUIGraph[Union[ArrayLayer, InstructionLayer]]):
         layer: Union[ArrayLayer, InstructionLayer],
     ) -> None:
         """Refreshes the points of an existing series, or creates it on the y-axis when new."""
+        x_data, y_data = self._series_points(layer)
         if dpg.does_item_exist(series_tag):
             dpg.configure_item(
                 series_tag,
-                x=layer.x_data,
-                y=layer.y_data,
+                x=x_data,
+                y=y_data,
             )
         else:
             dpg.add_line_series(
-                layer.x_data.tolist(),
-                layer.y_data.tolist(),
+                x_data.tolist(),
+                y_data.tolist(),
                 label=layer.name,
                 parent=self.y_axis_tag,
                 tag=series_tag,
@@ -182,8 +182,8 @@ class GUIAudioSettingsWindow(GUIDialogWindow):
     def _on_master_gain_changed(self, _sender: Sender, app_data: float) -> None:
         """Applies the slider's gain live and repaints the decibel readout.
 
-        The gain is pushed straight to the callback so the change is heard on the next row the
-        player writes rather than after the render-ahead buffer drains.
+        The gain is pushed straight to the callback so the change is heard on the next buffer the
+        device plays rather than after the render-ahead buffer drains.
         """
         gain = float(app_data)
         self._master_gain = gain
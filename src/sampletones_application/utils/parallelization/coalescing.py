@@ -1,5 +1,5 @@
 import threading
-from typing import Optional
+from typing import Optional, Tuple
 
 from sampletones_application.utils.parallelization.thread import SingleThreadExecutor
 from sampletones_shared.types.callback import VoidCallback
@@ -23,7 +23,7 @@ class LatestWinsExecutor:
     def __init__(self) -> None:
         self._executor = SingleThreadExecutor()
         self._lock = threading.Lock()
-        self._pending: Optional[VoidCallback] = None
+        self._pending: Optional[Tuple[VoidCallback, Optional[VoidCallback]]] = None
         self._running: bool = False
 
     @property
@@ -31,20 +31,26 @@ class LatestWinsExecutor:
         with self._lock:
             return self._running
 
-    def submit(self, task: VoidCallback) -> bool:
+    def submit(self, task: VoidCallback, on_superseded: Optional[VoidCallback] = None) -> bool:
         """Queues ``task`` as the latest work, launching the worker when the queue is idle.
 
         Returns whether the queue is being served: a task accepted into a running or freshly
         launched queue returns ``True``; ``False`` reports that the worker failed to launch,
-        which a caller may surface.
+        which a caller may surface. A task replaced before it started never runs; its
+        ``on_superseded`` is called instead, on the submitting thread, so a caller tracking
+        what it queued can let go of it.
         """
         with self._lock:
-            self._pending = task
-            if self._running:
-                return True
-
+            superseded = self._pending
+            self._pending = (task, on_superseded)
+            running = self._running
             self._running = True
 
+        if superseded is not None and superseded[1] is not None:
+            superseded[1]()
+        if running:
+            return True
+
         launched = self._executor.execute(self._drain, wait=True)
         if not launched:
             with self._lock:
@@ -62,10 +68,11 @@ class LatestWinsExecutor:
         """
         while True:
             with self._lock:
-                task = self._pending
+                pending = self._pending
                 self._pending = None
-                if task is None:
+                if pending is None:
                     self._running = False
                     return
 
+            task, _ = pending
             task()
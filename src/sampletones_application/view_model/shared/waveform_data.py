@@ -1,10 +1,13 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
+from sampletones_core.audio import MinMaxPyramid
 from sampletones_core.constants.enums import GeneratorName
 
+PyramidKey = Optional[Tuple[GeneratorName, ...]]
+
 
 @dataclass(frozen=True)
 class WaveformData:
@@ -14,6 +17,8 @@ class WaveformData:
     coefficient: float
     frame_length: int
 
+    _pyramids: Dict[PyramidKey, MinMaxPyramid] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     def partials(self, generator_names: List[GeneratorName]) -> np.ndarray:
         """Sums the selected generators' approximations, silent when none apply.
 
@@ -34,3 +39,21 @@ class WaveformData:
 
         partials: np.ndarray = np.sum(selected_approximations, axis=0)
         return partials
+
+    def original_pyramid(self) -> Optional[MinMaxPyramid]:
+        """The display summary of the original audio, built on first use and kept with the data."""
+        if self.original_audio is None:
+            return None
+
+        if None not in self._pyramids:
+            self._pyramids[None] = MinMaxPyramid.build(self.original_audio)
+
+        return self._pyramids[None]
+
+    def partials_pyramid(self, generator_names: List[GeneratorName]) -> MinMaxPyramid:
+        """The display summary of the selected generators' partials, kept per selection."""
+        key = tuple(generator_names)
+        if key not in self._pyramids:
+            self._pyramids[key] = MinMaxPyramid.build(self.partials(generator_names))
+
+        return self._pyramids[key]
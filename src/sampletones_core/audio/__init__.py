@@ -1,6 +1,6 @@
 from .device import AudioDevice, CurrentDevice
-from .io import load_audio, read_wave, write_wave
-from .manager import CHANNELS, FORMAT, AudioDeviceManager
+from .io import condition_audio, decode_audio, load_audio, read_wave, write_wave
+from .manager import CHANNELS, FORMAT, AudioDeviceManager, OutputStreamCallback
 from .processing import (
     active_frame_level,
     amplitude_to_decibels,
@@ -14,6 +14,7 @@ from .processing import (
     silence,
     to_mono,
 )
+from .pyramid import MinMaxPyramid
 from .validation import (
     validate_audio_array,
     validate_buffer_size,
@@ -26,10 +27,14 @@ __all__ = [
     "AudioDevice",
     "AudioDeviceManager",
     "CurrentDevice",
+    "MinMaxPyramid",
+    "OutputStreamCallback",
     "active_frame_level",
     "amplitude_to_decibels",
     "clip_audio",
     "clip_audio_inplace",
+    "condition_audio",
+    "decode_audio",
     "interpolate",
     "load_audio",
     "minmax_decimate",
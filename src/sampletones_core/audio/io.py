@@ -2,7 +2,6 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 import numpy as np
-from scipy.io import wavfile
 from soundfile import read as sf_read
 
 from sampletones_core.constants.algorithm import QUANTIZATION_LEVELS
@@ -30,6 +29,8 @@ def write_wave(path: Pathlike, sample_rate: int, audio: np.ndarray) -> None:
         TypeError: If sample_rate is not an integer or audio is not a numpy array.
         ValueError: If sample_rate is not in allowed sample rates or audio has invalid dimensions.
     """
+    from scipy.io import wavfile
+
     validate_sample_rate(sample_rate)
     validate_audio_array(audio, allowed_dims=(1, 2))
     audio = clip_audio(audio)
@@ -101,12 +102,72 @@ def load_audio(
     if target_sample_rate is not None:
         validate_sample_rate(target_sample_rate)
 
+    audio, sample_rate = decode_audio(path, normalize=normalize)
+    return condition_audio(
+        audio,
+        sample_rate,
+        target_sample_rate=target_sample_rate,
+        quantize=quantize,
+        quantization_levels=quantization_levels,
+    )
+
+
+def decode_audio(path: Pathlike, *, normalize: bool = True) -> Tuple[np.ndarray, int]:
+    """
+    Read an audio file as mono at its own sample rate, the steps of `load_audio` that
+    precede resampling.
+
+    Reconstructing one file at several sample rates decodes it once and conditions the
+    result for each rate with `condition_audio`.
+
+    Args:
+        path: Path to the audio file to read.
+        normalize: Whether to normalize audio to peak amplitude of 1.0.
+
+    Returns:
+        Tuple of (audio_array, sample_rate) where audio_array is mono.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        IsADirectoryError: If the path points to a directory instead of a file.
+    """
     audio, sample_rate = read_wave(path)
     audio = to_mono(audio)
 
     if normalize:
         audio = normalize_audio(audio)
 
+    return audio, sample_rate
+
+
+def condition_audio(
+    audio: np.ndarray,
+    sample_rate: int,
+    *,
+    target_sample_rate: Optional[int] = None,
+    quantize: bool = True,
+    quantization_levels: int = QUANTIZATION_LEVELS,
+) -> np.ndarray:
+    """
+    Resample and quantize audio decoded by `decode_audio`, the steps of `load_audio` that
+    follow it. The input array is left unchanged.
+
+    Args:
+        audio: Mono audio as `decode_audio` returns it.
+        sample_rate: The sample rate of ``audio`` in Hz.
+        target_sample_rate: Target sample rate in Hz. If None, keeps ``sample_rate``.
+        quantize: Whether to quantize audio to discrete levels.
+        quantization_levels: Number of amplitude levels used when quantization is enabled.
+
+    Returns:
+        Processed mono audio array.
+
+    Raises:
+        ValueError: If target_sample_rate is not in allowed sample rates.
+    """
+    if target_sample_rate is not None:
+        validate_sample_rate(target_sample_rate)
+
     target_sample_rate = target_sample_rate or sample_rate
     audio = resample(
         audio,
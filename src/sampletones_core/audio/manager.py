@@ -3,7 +3,7 @@ import os
 import sys
 import threading
 from pathlib import Path
-from typing import Any, Callable, Dict, Generator, List, Optional, cast
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, cast
 
 import numpy as np
 import pyaudio
@@ -28,6 +28,7 @@ CHANNELS = 1
 FORMAT = pyaudio.paFloat32
 
 OnPlaybackErrorCallback = Callable[[PlaybackError], None]
+OutputStreamCallback = Callable[[Optional[bytes], int, Dict[str, float], int], Tuple[bytes, int]]
 
 
 @contextlib.contextmanager
@@ -765,20 +766,25 @@ class AudioDeviceManager(CallbackMixin):
         sample_rate: int,
         buffer_size: int,
         release: VoidCallback,
+        stream_callback: Optional[OutputStreamCallback] = None,
     ) -> pyaudio.Stream:
-        """Open a blocking output stream for caller-managed streaming playback.
+        """Open an output stream for caller-managed streaming playback.
 
-        The caller drives the stream from a thread of its own and hands it back through
+        The stream is blocking, written by the caller, unless ``stream_callback`` is given, in
+        which case the backend pulls every buffer from the callback on its own thread. Either
+        way the caller owns the stream from a thread of its own and hands it back through
         ``close_output_stream`` once that thread finishes. Until then the manager counts the
         stream as outstanding and calls ``release`` whenever it needs the backend free, so a
-        stream is torn down by the thread that writes to it. Any buffer playback owned by this
+        stream is torn down by the thread that owns it. Any buffer playback owned by this
         manager is stopped first, since the output device allows only a single open stream at a
         time.
 
         Args:
             sample_rate: Sample rate in Hz.
             buffer_size: Frames per buffer (controls write granularity).
-            release: Winds the caller's writing down; returns once the stream is handed back.
+            release: Winds the caller's playback down; returns once the stream is handed back.
+            stream_callback: Supplies each buffer of a callback-mode stream, in PyAudio's
+                callback signature.
 
         Raises:
             PlaybackError: If PyAudio is not initialized.
@@ -794,6 +800,7 @@ class AudioDeviceManager(CallbackMixin):
             output=True,
             output_device_index=self._device_index,
             frames_per_buffer=buffer_size,
+            stream_callback=stream_callback,
         )
         with self._lock:
             self._stream_owners[stream] = release
@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from typing import Callable, List, Self, Tuple
+
+import numpy as np
+
+from .validation import validate_audio_array
+
+
+@dataclass(frozen=True)
+class MinMaxPyramid:
+    """
+    Min-max summaries of an audio array at every power-of-two bucket width.
+
+    Level ``k`` holds the minimum and maximum of each run of ``2 ** (k + 1)`` samples, built
+    pairwise from the level below, so the pyramid costs about as much as the array itself and
+    any window of the array is summarised at a bounded number of points by slicing one level.
+    The last bucket of a level covers whatever samples remain.
+
+    Attributes:
+        audio: The summarised array, read directly where a window is short enough.
+        minimums: Each level's bucket minimums, finest first.
+        maximums: Each level's bucket maximums, finest first.
+    """
+
+    audio: np.ndarray
+    minimums: Tuple[np.ndarray, ...]
+    maximums: Tuple[np.ndarray, ...]
+
+    @classmethod
+    def build(cls, audio: np.ndarray) -> Self:
+        """
+        Build the pyramid of an audio array.
+
+        Args:
+            audio: Audio array to summarise.
+
+        Returns:
+            The pyramid over a float32 copy of the audio.
+
+        Raises:
+            TypeError: If audio is not a numpy array.
+            ValueError: If audio is not 1-dimensional.
+        """
+        validate_audio_array(audio)
+        samples = audio.astype(np.float32)
+
+        minimums: List[np.ndarray] = []
+        maximums: List[np.ndarray] = []
+        lows = highs = samples
+        while len(lows) > 1:
+            lows = _pairwise(np.minimum, lows)
+            highs = _pairwise(np.maximum, highs)
+            minimums.append(lows)
+            maximums.append(highs)
+
+        return cls(audio=samples, minimums=tuple(minimums), maximums=tuple(maximums))
+
+    def __len__(self) -> int:
+        return len(self.audio)
+
+    def window(
+        self,
+        start: float,
+        end: float,
+        *,
+        num_buckets: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Summarise the samples from ``start`` to ``end`` for display.
+
+        A window of at most ``num_buckets`` samples is returned as it stands. A longer one is
+        read from the finest level whose buckets covering the window number at most
+        ``num_buckets``, laid out as :func:`minmax_decimate` lays out its buckets: each bucket's
+        first sample index twice, against its minimum and its maximum. The cost follows
+        ``num_buckets``, not the length of the array.
+
+        Args:
+            start: First sample of the window, clamped to the array.
+            end: Sample after the window, clamped to the array.
+            num_buckets: Most buckets the window is summarised at.
+
+        Returns:
+            Tuple of (x_coordinates, y_values).
+
+        Raises:
+            ValueError: If num_buckets is not positive.
+        """
+        if num_buckets <= 0:
+            raise ValueError("num_buckets must be a positive integer")
+
+        length = len(self.audio)
+        first = int(np.clip(np.floor(start), 0, length))
+        last = int(np.clip(np.ceil(end), first, length))
+        if last - first <= num_buckets:
+            return np.arange(first, last, dtype=np.float64), self.audio[first:last]
+
+        level = 0
+        while level < len(self.minimums) - 1 and _buckets(first, last, 2 << level) > num_buckets:
+            level += 1
+
+        width = 2 << level
+        buckets = slice(first // width, -(-last // width))
+        starts = np.arange(buckets.start, buckets.stop, dtype=np.float64) * width
+
+        y_values = np.empty(2 * len(starts), dtype=np.float32)
+        y_values[0::2] = self.minimums[level][buckets]
+        y_values[1::2] = self.maximums[level][buckets]
+
+        return np.repeat(starts, 2), y_values
+
+
+def _buckets(first: int, last: int, width: int) -> int:
+    return -(-last // width) - first // width
+
+
+def _pairwise(reduce: Callable[[np.ndarray, np.ndarray], np.ndarray], values: np.ndarray) -> np.ndarray:
+    even = len(values) - len(values) % 2
+    paired = reduce(values[0:even:2], values[1:even:2])
+    if even < len(values):
+        paired = np.append(paired, values[-1])
+
+    return paired
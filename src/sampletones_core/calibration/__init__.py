@@ -7,16 +7,20 @@ from .referee.auditory import MultiResolutionAuditoryReferee
 from .referee.factory import build_referees
 from .referee.protocol import Referee
 from .referee.zimtohrli import ZimtohrliReferee, find_zimtohrli
-from .report import write_csv, write_markdown
+from .report import append_csv, read_csv, write_csv, write_markdown
 from .runner import (
+    CalibrationPair,
     CalibrationRow,
     CalibrationVariant,
     build_variants,
     ensure_library,
+    evaluate_pair,
     evaluate_variants,
+    plan_pairs,
 )
 
 __all__ = [
+    "CalibrationPair",
     "CalibrationRow",
     "CalibrationVariant",
     "CorpusConfig",
@@ -25,12 +29,16 @@ __all__ = [
     "Referee",
     "RefereeConfig",
     "ZimtohrliReferee",
+    "append_csv",
     "build_corpus",
     "build_referees",
     "build_variants",
     "ensure_library",
+    "evaluate_pair",
     "evaluate_variants",
     "find_zimtohrli",
+    "plan_pairs",
+    "read_csv",
     "write_corpus",
     "write_csv",
     "write_markdown",
@@ -1,13 +1,34 @@
-from typing import Dict, Final, List
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Final, List, Sequence, Tuple
 
 import numpy as np
-from scipy.signal import stft
 
 from sampletones_core.calibration.config.referee import RefereeConfig
 
 ERB_RATE_SCALE: Final[float] = 21.4
 ERB_RATE_FACTOR: Final[float] = 4.37e-3
 
+BAND_MATRIX_CACHE_SIZE: Final[int] = 32
+REFERENCE_CACHE_SIZE: Final[int] = 64
+REFERENCE_DIGEST_SIZE: Final[int] = 16
+
+
+@dataclass(frozen=True)
+class ReferenceBands:
+    """
+    A reference signal's log band energies at one resolution, with the floor they were taken at.
+
+    Attributes:
+        bands: Floored band energies in dB, bands by frames.
+        floor: Energy floor added to every band of the reference and of each estimate.
+    """
+
+    bands: np.ndarray
+    floor: float
+
 
 class MultiResolutionAuditoryReferee:
     """
@@ -21,14 +42,20 @@ class MultiResolutionAuditoryReferee:
     reference's loudest band, so the score reflects audible content, holds steady
     under a common gain, and saturates for bands one side leaves silent. Lower
     scores mean closer reconstructions; identical signals score zero.
+
+    A sweep scores the same reference against many estimates, so the reference's
+    band energies are kept per signal content and resolution for the most recent
+    references, and the band matrices are shared by every referee with the same
+    rate and tuning.
     """
 
     def __init__(self, sample_rate: int, *, config: RefereeConfig) -> None:
         self.sample_rate = sample_rate
         self.config = config
         self._band_matrices: Dict[int, np.ndarray] = {
-            window_size: self._band_matrix(sample_rate, window_size, config) for window_size in config.window_sizes
+            window_size: erb_band_matrix(sample_rate, window_size, config) for window_size in config.window_sizes
         }
+        self._references: OrderedDict[bytes, Tuple[ReferenceBands, ...]] = OrderedDict()
 
     @property
     def name(self) -> str:
@@ -48,26 +75,74 @@ class MultiResolutionAuditoryReferee:
         Raises:
             ValueError: If the signals differ in length.
         """
-        if reference.shape != estimate.shape:
-            raise ValueError(f"signal shapes differ: {reference.shape} vs {estimate.shape}")
+        return self.score_many(reference, [estimate])[0]
+
+    def score_many(self, reference: np.ndarray, estimates: Sequence[np.ndarray]) -> List[float]:
+        """
+        Score several estimates against one reference at once.
+
+        The reference is analysed once, or not at all when it was scored recently,
+        and the estimates share each resolution's STFT.
+
+        Args:
+            reference: Reference waveform.
+            estimates: Waveforms under evaluation, each of the reference's length.
+
+        Returns:
+            The score of each estimate, in order.
+
+        Raises:
+            ValueError: If an estimate differs in length from the reference.
+        """
+        for estimate in estimates:
+            if reference.shape != estimate.shape:
+                raise ValueError(f"signal shapes differ: {reference.shape} vs {estimate.shape}")
+
+        if not estimates:
+            return []
+
+        stacked = np.stack([np.asarray(estimate, dtype=np.float64) for estimate in estimates])
+        distances = np.empty((len(estimates), len(self._band_matrices)))
+        for index, ((window_size, band_matrix), reference_bands) in enumerate(
+            zip(self._band_matrices.items(), self._reference_bands(reference))
+        ):
+            estimate_bands = 10.0 * np.log10(
+                self._band_energy(stacked, window_size, band_matrix) + reference_bands.floor
+            )
+            distances[:, index] = np.mean(np.abs(reference_bands.bands - estimate_bands), axis=(-2, -1))
+
+        return [float(score) for score in np.mean(distances, axis=1)]
 
-        distances: List[float] = []
+    def _reference_bands(self, reference: np.ndarray) -> Tuple[ReferenceBands, ...]:
+        """The reference's floored log band energies per resolution, analysed on first sight."""
+        audio = np.ascontiguousarray(reference, dtype=np.float64)
+        digest = hashlib.blake2b(audio.tobytes(), digest_size=REFERENCE_DIGEST_SIZE).digest()
+        cached = self._references.get(digest)
+        if cached is not None:
+            self._references.move_to_end(digest)
+            return cached
+
+        analysed: List[ReferenceBands] = []
         for window_size, band_matrix in self._band_matrices.items():
-            reference_energy = self._band_energy(reference, window_size, band_matrix)
-            estimate_energy = self._band_energy(estimate, window_size, band_matrix)
-            floor = max(float(np.max(reference_energy)), self.config.energy_floor) * 10.0 ** (
+            energy = self._band_energy(audio, window_size, band_matrix)
+            floor = max(float(np.max(energy)), self.config.energy_floor) * 10.0 ** (
                 -self.config.audibility_range_decibels / 10.0
             )
-            reference_bands = 10.0 * np.log10(reference_energy + floor)
-            estimate_bands = 10.0 * np.log10(estimate_energy + floor)
-            distances.append(float(np.mean(np.abs(reference_bands - estimate_bands))))
+            analysed.append(ReferenceBands(bands=10.0 * np.log10(energy + floor), floor=floor))
+
+        bands = tuple(analysed)
+        self._references[digest] = bands
+        if len(self._references) > REFERENCE_CACHE_SIZE:
+            self._references.popitem(last=False)
 
-        return float(np.mean(distances))
+        return bands
 
     def _band_energy(self, audio: np.ndarray, window_size: int, band_matrix: np.ndarray) -> np.ndarray:
+        from scipy.signal import stft
+
         hop = window_size // self.config.hop_divisor
         _, _, spectrum = stft(
-            audio.astype(np.float64),
+            audio.astype(np.float64, copy=False),
             fs=self.sample_rate,
             nperseg=window_size,
             noverlap=window_size - hop,
@@ -76,29 +151,40 @@ class MultiResolutionAuditoryReferee:
         band_energy: np.ndarray = band_matrix @ energy
         return band_energy
 
-    @classmethod
-    def _band_matrix(cls, sample_rate: int, window_size: int, config: RefereeConfig) -> np.ndarray:
-        """
-        Rectangular aggregation matrix from STFT bins onto ERB-spaced bands.
 
-        Band edges are uniform on the ERB-rate axis between the low-frequency bound and
-        the Nyquist frequency; each STFT bin contributes its full energy to the band
-        containing its center, and bins below the low-frequency bound join the first band.
-        """
-        frequencies = np.fft.rfftfreq(window_size, 1.0 / sample_rate)
-        nyquist = sample_rate / 2.0
-        edges_rate = np.linspace(
-            cls._erb_rate(np.array([config.low_frequency]))[0],
-            cls._erb_rate(np.array([nyquist]))[0],
-            config.band_count + 1,
-        )
-        bin_rates = cls._erb_rate(frequencies)
-        band_indices = np.clip(np.searchsorted(edges_rate, bin_rates, side="right") - 1, 0, config.band_count - 1)
+@lru_cache(maxsize=BAND_MATRIX_CACHE_SIZE)
+def erb_band_matrix(sample_rate: int, window_size: int, config: RefereeConfig) -> np.ndarray:
+    """
+    Rectangular aggregation matrix from STFT bins onto ERB-spaced bands.
+
+    Band edges are uniform on the ERB-rate axis between the low-frequency bound and
+    the Nyquist frequency; each STFT bin contributes its full energy to the band
+    containing its center, and bins below the low-frequency bound join the first band.
+    The matrix is cached per arguments and returned read-only.
 
-        matrix = np.zeros((config.band_count, frequencies.shape[0]))
-        matrix[band_indices, np.arange(frequencies.shape[0])] = 1.0
-        return matrix
+    Args:
+        sample_rate: Sampling rate of the analysed signals in Hz.
+        window_size: STFT window size in samples.
+        config: Referee tuning supplying the band count and the low-frequency bound.
 
-    @staticmethod
-    def _erb_rate(frequencies: np.ndarray) -> np.ndarray:
-        return ERB_RATE_SCALE * np.log10(1.0 + ERB_RATE_FACTOR * frequencies)
+    Returns:
+        A band-count by bin-count matrix of zeros and ones.
+    """
+    frequencies = np.fft.rfftfreq(window_size, 1.0 / sample_rate)
+    nyquist = sample_rate / 2.0
+    edges_rate = np.linspace(
+        _erb_rate(np.array([config.low_frequency]))[0],
+        _erb_rate(np.array([nyquist]))[0],
+        config.band_count + 1,
+    )
+    bin_rates = _erb_rate(frequencies)
+    band_indices = np.clip(np.searchsorted(edges_rate, bin_rates, side="right") - 1, 0, config.band_count - 1)
+
+    matrix = np.zeros((config.band_count, frequencies.shape[0]))
+    matrix[band_indices, np.arange(frequencies.shape[0])] = 1.0
+    matrix.setflags(write=False)
+    return matrix
+
+
+def _erb_rate(frequencies: np.ndarray) -> np.ndarray:
+    return ERB_RATE_SCALE * np.log10(1.0 + ERB_RATE_FACTOR * frequencies)
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import List, Protocol, Sequence
 
 import numpy as np
 
@@ -10,3 +10,5 @@ class Referee(Protocol):
     def name(self) -> str: ...
 
     def score(self, reference: np.ndarray, estimate: np.ndarray) -> float: ...
+
+    def score_many(self, reference: np.ndarray, estimates: Sequence[np.ndarray]) -> List[float]: ...
@@ -2,7 +2,7 @@ import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Final, Optional
+from typing import Final, List, Optional, Sequence
 
 import numpy as np
 
@@ -46,6 +46,9 @@ class ZimtohrliReferee:
 
         return float(values[-1])
 
+    def score_many(self, reference: np.ndarray, estimates: Sequence[np.ndarray]) -> List[float]:
+        return [self.score(reference, estimate) for estimate in estimates]
+
     @staticmethod
     def _is_float(token: str) -> bool:
         try:
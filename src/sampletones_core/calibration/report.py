@@ -1,12 +1,14 @@
 import csv
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Final, Iterable, List, Tuple
 
 import numpy as np
 
 from .runner import CalibrationRow
 
+CSV_HEADER: Final[List[str]] = ["variant", "item", "category", "referee", "score"]
+
 
 def write_csv(rows: List[CalibrationRow], path: Path) -> None:
     """
@@ -18,21 +20,67 @@ def write_csv(rows: List[CalibrationRow], path: Path) -> None:
     """
     with path.open("w", newline="") as handle:
         writer = csv.writer(handle)
-        writer.writerow(["variant", "item", "category", "referee", "score"])
-        for row in rows:
-            writer.writerow([row.variant, row.item, row.category, row.referee, f"{row.score:.6f}"])
+        writer.writerow(CSV_HEADER)
+        writer.writerows(_csv_cells(row) for row in rows)
+
+
+def append_csv(rows: List[CalibrationRow], path: Path) -> None:
+    """
+    Append calibration rows to a CSV report, starting it when absent.
+
+    The rows are flushed before returning, so a sweep interrupted afterwards keeps
+    them and can resume from what the report holds.
+
+    Args:
+        rows: Scored rows from the runner.
+        path: Target CSV path.
+    """
+    is_new = not path.exists() or path.stat().st_size == 0
+    with path.open("a", newline="") as handle:
+        writer = csv.writer(handle)
+        if is_new:
+            writer.writerow(CSV_HEADER)
+        writer.writerows(_csv_cells(row) for row in rows)
+
+
+def read_csv(path: Path) -> List[CalibrationRow]:
+    """
+    Read the rows of a CSV report, as written by `write_csv` or `append_csv`.
+
+    Args:
+        path: CSV report path; a missing report holds no rows.
+
+    Returns:
+        The rows in file order.
+    """
+    if not path.exists():
+        return []
+
+    with path.open(newline="") as handle:
+        return [
+            CalibrationRow(
+                variant=record["variant"],
+                item=record["item"],
+                category=record["category"],
+                referee=record["referee"],
+                score=float(record["score"]),
+            )
+            for record in csv.DictReader(handle)
+        ]
 
 
 def write_markdown(rows: List[CalibrationRow], path: Path) -> None:
     """
     Write a per-referee pivot of mean scores: one row per variant, one column per
     category, with the overall mean last. Lower scores mean closer reconstructions.
+    Rows marking an unavailable reconstruction carry no score and are left out.
 
     Args:
-        rows: Scored rows from the runner.
+        rows: Rows from the runner.
         path: Target markdown path.
     """
     lines: List[str] = ["# Calibration report", ""]
+    rows = [row for row in rows if row.is_scored]
 
     for referee in _ordered(row.referee for row in rows):
         referee_rows = [row for row in rows if row.referee == referee]
@@ -54,6 +102,10 @@ def write_markdown(rows: List[CalibrationRow], path: Path) -> None:
     path.write_text("\n".join(lines))
 
 
+def _csv_cells(row: CalibrationRow) -> List[str]:
+    return [row.variant, row.item, row.category, row.referee, f"{row.score:.6f}"]
+
+
 def _mean_scores(rows: List[CalibrationRow]) -> Dict[Tuple[str, str], float]:
     scores: Dict[Tuple[str, str], List[float]] = defaultdict(list)
     for row in rows:
@@ -1,13 +1,28 @@
+import multiprocessing
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (
+    AbstractSet,
+    Callable,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import numpy as np
+from pebble import ProcessPool
 
+from sampletones_core.audio import load_audio
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import SpectrumMethod
 from sampletones_core.fft import Window
-from sampletones_core.library import InstructionLibrary
+from sampletones_core.library import InstructionLibrary, InstructionLibraryKey
 from sampletones_core.reconstructions import Reconstructor
 from sampletones_core.scripts.library import generate_library
 from sampletones_shared.logger import logger
@@ -15,6 +30,9 @@ from sampletones_shared.logger import logger
 from .corpus.item import CorpusItem
 from .referee.protocol import Referee
 
+AUDIO_CACHE_SIZE: Final[int] = 64
+UNAVAILABLE_REFEREE: Final[str] = "unavailable"
+
 
 @dataclass(frozen=True)
 class CalibrationVariant:
@@ -22,6 +40,14 @@ class CalibrationVariant:
     config: Config
 
 
+@dataclass(frozen=True)
+class CalibrationPair:
+    variant: CalibrationVariant
+    item: str
+    category: str
+    path: Path
+
+
 @dataclass(frozen=True)
 class CalibrationRow:
     variant: str
@@ -30,6 +56,11 @@ class CalibrationRow:
     referee: str
     score: float
 
+    @property
+    def is_scored(self) -> bool:
+        """Whether the row holds a referee's score rather than marking an unavailable reconstruction."""
+        return self.referee != UNAVAILABLE_REFEREE
+
 
 def build_variants(
     base: Config,
@@ -113,55 +144,258 @@ def ensure_library(config: Config) -> None:
     generate_library(config)
 
 
+def plan_pairs(
+    variants: List[CalibrationVariant],
+    items: List[CorpusItem],
+    item_paths: Dict[str, Path],
+    completed: AbstractSet[Tuple[str, str]] = frozenset(),
+) -> List[CalibrationPair]:
+    """
+    Order the (variant, item) pairs of a sweep for evaluation.
+
+    Variants sharing an instruction library are placed next to each other, so a worker
+    moving from one to the next finds the library already loaded; each variant's items
+    follow in corpus order.
+
+    Args:
+        variants: Labeled configurations to evaluate.
+        items: Corpus items, carrying the category used in reports.
+        item_paths: Written WAV path per corpus item name.
+        completed: (variant label, item name) pairs already recorded, left out.
+
+    Returns:
+        The pairs still to evaluate.
+    """
+    groups: Dict[InstructionLibraryKey, List[CalibrationVariant]] = defaultdict(list)
+    for variant in variants:
+        groups[InstructionLibraryKey.create(variant.config.library, Window.from_config(variant.config))].append(variant)
+
+    return [
+        CalibrationPair(variant=variant, item=item.name, category=item.category, path=item_paths[item.name])
+        for group in groups.values()
+        for variant in group
+        for item in items
+        if (variant.label, item.name) not in completed
+    ]
+
+
+def evaluate_pair(pair: CalibrationPair, referees: Sequence[Referee]) -> List[CalibrationRow]:
+    """
+    Reconstruct one corpus item under one variant and score the result.
+
+    Every referee scores the approximation against the preprocessed original, both on
+    the common scale set by the working-level coefficient. The libraries, the variant's
+    reconstructor and the preprocessed audio are cached by the calling process, so
+    consecutive pairs of one variant, or of variants sharing a library, reuse them.
+
+    Args:
+        pair: The variant and the corpus item to evaluate.
+        referees: Referees scoring the reconstruction.
+
+    Returns:
+        One row per referee, or none when the reconstruction is unavailable.
+    """
+    reconstructor = _PROCESS_CACHE.reconstructor(pair.variant)
+    general = pair.variant.config.general
+    audio = prepared_audio(
+        pair.path,
+        pair.variant.config.library.sample_rate,
+        general.normalize,
+        general.quantize,
+        general.quantization_levels,
+    )
+    reconstruction = reconstructor.reconstruct_audio(audio, pair.path)
+    if reconstruction is None:
+        return []
+
+    reference = audio / reconstruction.coefficient
+    estimate = np.asarray(reconstruction.approximation, dtype=np.float64)
+    length = min(reference.shape[0], estimate.shape[0])
+
+    return [
+        CalibrationRow(
+            variant=pair.variant.label,
+            item=pair.item,
+            category=pair.category,
+            referee=referee.name,
+            score=referee.score(reference[:length], estimate[:length]),
+        )
+        for referee in referees
+    ]
+
+
+@lru_cache(maxsize=AUDIO_CACHE_SIZE)
+def prepared_audio(
+    path: Path,
+    sample_rate: int,
+    normalize: bool,
+    quantize: bool,
+    quantization_levels: int,
+) -> np.ndarray:
+    """
+    Decode, resample and precondition a corpus file, once per process and settings.
+
+    Every variant of a sweep reconstructs the same corpus, and the variants differ in
+    what they match against rather than in how the audio is prepared, so the prepared
+    audio is shared between them. The array is returned read-only.
+
+    Args:
+        path: The corpus WAV file.
+        sample_rate: The library sample rate the audio is resampled to.
+        normalize: Whether the audio is normalized.
+        quantize: Whether the audio is quantized.
+        quantization_levels: The quantization levels when quantizing.
+
+    Returns:
+        The prepared audio, as `Reconstructor.load_audio` returns it.
+    """
+    audio = load_audio(
+        path,
+        target_sample_rate=sample_rate,
+        normalize=normalize,
+        quantize=quantize,
+        quantization_levels=quantization_levels,
+    )
+    audio.setflags(write=False)
+    return audio
+
+
 def evaluate_variants(
     variants: List[CalibrationVariant],
     items: List[CorpusItem],
     item_paths: Dict[str, Path],
     referees: List[Referee],
+    *,
+    max_workers: int = 1,
+    completed: AbstractSet[Tuple[str, str]] = frozenset(),
+    on_rows: Optional[Callable[[List[CalibrationRow]], None]] = None,
 ) -> List[CalibrationRow]:
     """
     Reconstruct the corpus under every variant and score the results.
 
-    Each corpus item is reconstructed with the variant's configuration and every
-    referee scores the approximation against the preprocessed original, both on the
-    common scale set by the working-level coefficient.
+    Missing libraries are generated first. The pairs are then evaluated in
+    `plan_pairs` order, in this process or across a pool of `max_workers`
+    processes, and each pair's rows are handed to `on_rows` as soon as they are in,
+    in that order, so a caller can persist a sweep as it goes and resume it later
+    by passing the pairs it already holds as `completed`. A pair whose reconstruction
+    is unavailable is handed over as a single unscored row under `UNAVAILABLE_REFEREE`,
+    so a resumed sweep does not evaluate it again.
 
     Args:
         variants: Labeled configurations to evaluate.
         items: Corpus items, carrying the category used in reports.
         item_paths: Written WAV path per corpus item name.
         referees: Referees scoring each reconstruction.
+        max_workers: Processes evaluating pairs at once; 1 evaluates in this process.
+        completed: (variant label, item name) pairs already recorded, skipped.
+        on_rows: Receives the rows of each evaluated pair.
 
     Returns:
-        One row per (variant, item, referee).
+        One row per evaluated (variant, item, referee).
     """
+    for config in _distinct_library_configs(variants):
+        ensure_library(config)
+
+    pairs = plan_pairs(variants, items, item_paths, completed)
+    if len(completed):
+        logger.info(f"Resuming: {len(completed)} pairs already recorded, {len(pairs)} to go")
+
     rows: List[CalibrationRow] = []
-    for variant in variants:
-        ensure_library(variant.config)
-        reconstructor = Reconstructor(variant.config)
-        for item in items:
-            path = item_paths[item.name]
-            reconstruction = reconstructor(path)
-            if reconstruction is None:
-                logger.info(f"[{variant.label}] {item.name}: reconstruction unavailable")
-                continue
-
-            reference = reconstructor.load_audio(path) / reconstruction.coefficient
-            estimate = np.asarray(reconstruction.approximation, dtype=np.float64)
-            length = min(reference.shape[0], estimate.shape[0])
-
-            for referee in referees:
-                score = referee.score(reference[:length], estimate[:length])
-                rows.append(
-                    CalibrationRow(
-                        variant=variant.label,
-                        item=item.name,
-                        category=item.category,
-                        referee=referee.name,
-                        score=score,
-                    )
-                )
+    for pair, pair_rows in zip(pairs, _evaluate_pairs(pairs, referees, max_workers, chunksize=max(1, len(items)))):
+        if not pair_rows:
+            logger.info(f"[{pair.variant.label}] {pair.item}: reconstruction unavailable")
+            if on_rows is not None:
+                on_rows([_unavailable_row(pair)])
+            continue
+
+        rows.extend(pair_rows)
+        if on_rows is not None:
+            on_rows(pair_rows)
 
-            logger.info(f"[{variant.label}] {item.name}: scored")
+        logger.info(f"[{pair.variant.label}] {pair.item}: scored")
 
     return rows
+
+
+def _unavailable_row(pair: CalibrationPair) -> CalibrationRow:
+    return CalibrationRow(
+        variant=pair.variant.label,
+        item=pair.item,
+        category=pair.category,
+        referee=UNAVAILABLE_REFEREE,
+        score=float("nan"),
+    )
+
+
+def _evaluate_pairs(
+    pairs: List[CalibrationPair],
+    referees: List[Referee],
+    max_workers: int,
+    chunksize: int,
+) -> Iterator[List[CalibrationRow]]:
+    if max_workers <= 1 or len(pairs) <= 1:
+        yield from map(partial(evaluate_pair, referees=referees), pairs)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPool(
+        max_workers=min(max_workers, len(pairs)),
+        context=context,
+        initializer=_install_referees,
+        initargs=(referees,),
+    ) as pool:
+        future = pool.map(_evaluate_installed_pair, pairs, chunksize=chunksize)
+        try:
+            yield from future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+
+def _install_referees(referees: Sequence[Referee]) -> None:
+    """Hands a worker process the referees once, so their reference caches outlive every chunk."""
+    _PROCESS_CACHE.referees = list(referees)
+
+
+def _evaluate_installed_pair(pair: CalibrationPair) -> List[CalibrationRow]:
+    return evaluate_pair(pair, _PROCESS_CACHE.referees)
+
+
+def _distinct_library_configs(variants: List[CalibrationVariant]) -> List[Config]:
+    configs: Dict[InstructionLibraryKey, Config] = {}
+    for variant in variants:
+        key = InstructionLibraryKey.create(variant.config.library, Window.from_config(variant.config))
+        configs.setdefault(key, variant.config)
+
+    return list(configs.values())
+
+
+class _ProcessCache:
+    """
+    What one process keeps between the pairs it evaluates.
+
+    Reconstructors draw from one library cache per directory, so a variant sharing its
+    library with the previous one skips loading the file, and the current variant's
+    reconstructor is kept while the process works through the variant's items. A pool
+    worker also keeps the referees it was started with: a chunk carries one variant's
+    items, so referees sent with each chunk would start every variant with an empty
+    reference cache.
+    """
+
+    def __init__(self) -> None:
+        self.libraries: Dict[str, InstructionLibrary] = {}
+        self.current: Optional[Tuple[str, Reconstructor]] = None
+        self.referees: List[Referee] = []
+
+    def reconstructor(self, variant: CalibrationVariant) -> Reconstructor:
+        if self.current is not None and self.current[0] == variant.label:
+            return self.current[1]
+
+        directory = str(variant.config.general.library_directory)
+        library = self.libraries.setdefault(directory, InstructionLibrary(directory=directory))
+        reconstructor = Reconstructor(variant.config, library)
+        self.current = (variant.label, reconstructor)
+        return reconstructor
+
+
+_PROCESS_CACHE: Final[_ProcessCache] = _ProcessCache()
@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Self
 
-from pydantic import AliasChoices, ConfigDict, Field
+from pydantic import AliasChoices, ConfigDict, Field, model_validator
 
 from sampletones_core.constants.algorithm import (
     DECODER_TOP_K,
@@ -14,6 +14,11 @@ from sampletones_core.constants.algorithm import (
     PHASE_ALIGNER,
     RESET_PHASE,
     SELECTOR,
+    SHORTLIST_MARGIN,
+    SHORTLIST_MAX_K,
+    SHORTLIST_MIN_K,
+    SHORTLIST_MODE,
+    SILENCE_FLOOR,
     SPECTRAL_DISTANCE,
     SPECTRAL_LOSS_WEIGHT,
     TEMPORAL_LEVEL_FLOOR,
@@ -28,6 +33,7 @@ from sampletones_core.constants.enums import (
     GeneratorName,
     PhaseAlignerName,
     SelectorName,
+    ShortlistMode,
     SpectralDistance,
 )
 from sampletones_core.data import DataModel
@@ -62,10 +68,22 @@ class DecoderConfig(DataModel):
 
     selector: SelectorName = Field(default=SELECTOR)
     top_k: int = Field(default=DECODER_TOP_K, ge=1)
+    shortlist: ShortlistMode = Field(default=SHORTLIST_MODE)
+    shortlist_margin: float = Field(default=SHORTLIST_MARGIN, ge=0.0)
+    min_top_k: int = Field(default=SHORTLIST_MIN_K, ge=1)
+    max_top_k: int = Field(default=SHORTLIST_MAX_K, ge=1)
     pitch_weight: float = Field(default=TRANSITION_PITCH_WEIGHT, ge=0.0)
     volume_weight: float = Field(default=TRANSITION_VOLUME_WEIGHT, ge=0.0)
     timbre_weight: float = Field(default=TRANSITION_TIMBRE_WEIGHT, ge=0.0)
     on_off_weight: float = Field(default=TRANSITION_ON_OFF_WEIGHT, ge=0.0)
+    silence_floor: float = Field(default=SILENCE_FLOOR, ge=0.0, lt=1.0)
+
+    @model_validator(mode="after")
+    def _validate_shortlist_bounds(self) -> Self:
+        if self.min_top_k > self.max_top_k:
+            raise ValueError(f"min_top_k ({self.min_top_k}) exceeds max_top_k ({self.max_top_k})")
+
+        return self
 
 
 class GenerationConfig(DataModel):
@@ -1,6 +1,6 @@
 from typing import Final
 
-from .enums import PhaseAlignerName, SelectorName, SpectralDistance
+from .enums import PhaseAlignerName, SelectorName, ShortlistMode, SpectralDistance
 from .general import MAX_VOLUME, MIN_VOLUME
 
 # Matching floors
@@ -36,6 +36,7 @@ PHASE_ALIGNER: Final[PhaseAlignerName] = PhaseAlignerName.CROSS_CORRELATION
 
 RESET_PHASE: Final[bool] = False
 FINAL_REGENERATION: Final[bool] = True
+RENDER_BLOCK_FRAMES: Final[int] = 256
 SPECTRAL_LOSS_WEIGHT: Final[float] = 0.80
 TEMPORAL_LOSS_WEIGHT: Final[float] = 0.20
 
@@ -47,10 +48,15 @@ PERCEPTUAL_EXPONENT: Final[float] = 1.0
 
 SELECTOR: Final[SelectorName] = SelectorName.VITERBI
 DECODER_TOP_K: Final[int] = 8
+SHORTLIST_MODE: Final[ShortlistMode] = ShortlistMode.FIXED
+SHORTLIST_MARGIN: Final[float] = 0.25
+SHORTLIST_MIN_K: Final[int] = 1
+SHORTLIST_MAX_K: Final[int] = 16
 TRANSITION_PITCH_WEIGHT: Final[float] = 0.03
 TRANSITION_VOLUME_WEIGHT: Final[float] = 0.02
 TRANSITION_TIMBRE_WEIGHT: Final[float] = 0.10
 TRANSITION_ON_OFF_WEIGHT: Final[float] = 0.20
+SILENCE_FLOOR: Final[float] = 1e-3
 
 # Mixer drive
 
@@ -73,6 +73,11 @@ class SelectorName(StrEnum):
     VITERBI = "viterbi"
 
 
+class ShortlistMode(StrEnum):
+    FIXED = "fixed"
+    ADAPTIVE = "adaptive"
+
+
 class SpectrumMethod(StrEnum):
     FFT = "fft"
     LOG_SPACED_FFT = "logfft"
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Self, Type
+from typing import Self, Tuple, Type
 
 from pydantic import ConfigDict, Field
 
@@ -37,12 +37,14 @@ class MetadataContract:
 
     A format states its contract once and holds every file it opens against it, so a file written
     by another application or at another data version is refused with an error naming the format
-    that refused it.
+    that refused it. Versions the format still reads after a layout change are listed as readable,
+    so files written before it keep opening while new files are written at the expected version.
     """
 
     label: str
     expected_version: str
     error: Type[IncompatibleVersionError]
+    readable_versions: Tuple[str, ...] = ()
 
     def validate(self, metadata: Metadata, actual_version: str) -> None:
         """Holds what a file states about itself against the build reading it.
@@ -54,13 +56,16 @@ class MetadataContract:
         Raises:
             InvalidMetadataError: If the metadata names an application other than SampleToNES.
             IncompatibleVersionError: Of this contract's type, if the file's version departs from
-                the one this build accepts.
+                the one this build accepts and from every version it still reads.
         """
         if metadata.application_name != SAMPLETONES_NAME:
             raise InvalidMetadataError(
                 f"Metadata application name mismatch: expected {SAMPLETONES_NAME}, got {metadata.application_name}."
             )
 
+        if any(compare_versions(actual_version, version) == 0 for version in self.readable_versions):
+            return
+
         if compare_versions(actual_version, self.expected_version) != 0:
             raise self.error(
                 f"{self.label} version mismatch: expected {self.expected_version}, got {actual_version}.",
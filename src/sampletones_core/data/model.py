@@ -19,7 +19,7 @@ from typing import (
 
 import msgpack
 import numpy as np
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from sampletones_shared.array import to_numpy
 from sampletones_shared.exceptions import (
@@ -63,6 +63,8 @@ def _optional_inner_annotation(annotation: Any) -> Optional[Any]:
 
 
 class DataModel(BaseModel, ABC):
+    model_config = ConfigDict(defer_build=True)
+
     def serialize(self) -> bytes:
         return bytes(msgpack.packb(self.serialize_inner(), use_bin_type=True))
 
@@ -233,6 +235,9 @@ class DataModel(BaseModel, ABC):
         if all(isinstance(model, DataModel) for model in collection):
             return [model.serialize_inner() for model in collection]
 
+        if all(isinstance(value, (bool, *NumericClasses)) for value in collection):
+            return [value.item() if isinstance(value, np.generic) else value for value in collection]
+
         raise SerializationError(
             f"Unsupported list element type {type(collection[0])} or mixed types for field '{field_name}'"
         )
@@ -266,6 +271,9 @@ class DataModel(BaseModel, ABC):
         if issubclass(element_class, (str, StrEnum)):
             return [cls._deserialize_string(item, element_class) for item in raw_list]
 
+        if issubclass(element_class, (int, float, bool)):
+            return [element_class(item) for item in raw_list]
+
         raise DeserializationError(f"Unsupported vector element type: {element_class} for field '{field_name}'")
 
     def _pack_array(self, array: Array, field_name: str) -> bytes:
@@ -7,12 +7,14 @@ from sampletones_core.constants.enums import FeatureKey
 from sampletones_core.features import CHANNEL_FEATURE_DEFAULTS
 from sampletones_core.generators import GeneratorTypeUnion
 from sampletones_core.instructions import (
+    InstructionArray,
     InstructionFields,
+    InstructionStream,
     InstructionT,
     InstructionTypeUnion,
 )
 from sampletones_core.types.feature import FeatureMap
-from sampletones_shared.utils.arrays import hold, trim
+from sampletones_shared.utils.arrays import hold_span, trim
 
 from .feature import Features
 
@@ -28,14 +30,15 @@ class Exporter(ABC, Generic[InstructionT]):
     row of feature values becomes an instruction.
 
     `to_features` runs the instructions-to-features direction, and `from_features` runs
-    the reverse.
+    the reverse. Both work on whole columns of an :class:`InstructionArray`; a list of
+    instructions is accepted wherever a stream is read and packed into one first.
     """
 
     _ATTRIBUTE_MAP: ClassVar[Dict[FeatureKey, InstructionFields]]
 
     def to_features(
         self,
-        instructions: List[InstructionT],
+        instructions: InstructionStream[InstructionT],
         initial_pitch: int,
         held_features: Iterable[FeatureKey],
     ) -> Features:
@@ -88,7 +91,7 @@ class Exporter(ABC, Generic[InstructionT]):
 
     @classmethod
     @abstractmethod
-    def get_feature_map(cls, instructions: List[InstructionT], initial_pitch: int) -> FeatureMap:
+    def get_feature_map(cls, instructions: InstructionStream[InstructionT], initial_pitch: int) -> FeatureMap:
         """Extracts the raw per-dimension feature arrays from an instruction sequence.
 
         Args:
@@ -101,7 +104,7 @@ class Exporter(ABC, Generic[InstructionT]):
 
     @classmethod
     @abstractmethod
-    def derive_initial_pitch(cls, instructions: List[InstructionT]) -> int:
+    def derive_initial_pitch(cls, instructions: InstructionStream[InstructionT]) -> int:
         """Chooses the reference pitch an instruction sequence's arpeggio is measured against.
 
         The reference is chosen once, when a reconstruction is built, and stored alongside
@@ -133,33 +136,36 @@ class Exporter(ABC, Generic[InstructionT]):
         Returns:
             List[InstructionT]: The reconstructed per-frame instructions.
         """
-        initial_pitch = features.initial_pitch
+        return cls.array_from_features(features).to_instructions()  # type: ignore[return-value]
+
+    @classmethod
+    def array_from_features(cls, features: Features) -> InstructionArray:
+        """Rebuilds the instruction stream from a :class:`Features` as an :class:`InstructionArray`.
+
+        This is `from_features` column by column: each envelope is extended to the
+        sequence's length by holding its final value, and the stream is assembled from the
+        resulting columns at once.
+
+        Args:
+            features: The envelope representation of a channel.
+
+        Returns:
+            InstructionArray: The reconstructed stream.
+        """
         envelopes: Dict[FeatureKey, np.ndarray] = {
             key: cast(np.ndarray, value)
             for key, value in features.feature_map.items()
             if key != FeatureKey.INITIAL_PITCH and value is not None
         }
-        max_length = max((len(array) for array in envelopes.values()), default=0)
-
-        instructions: List[InstructionT] = []
-        for index in range(max_length):
-            instruction_dictionary: Dict[str, Union[bool, int]] = {}
-            for key, array in envelopes.items():
-                attribute = cls._remap_feature_key(key)
-                if not attribute:
-                    continue
-
-                instruction_dictionary[attribute] = int(
-                    hold(
-                        array,
-                        index,
-                        default=CHANNEL_FEATURE_DEFAULTS[key],
-                    )
-                )
+        length = max((len(array) for array in envelopes.values()), default=0)
 
-            instructions.append(cls._features_dictionary_to_instruction(instruction_dictionary, initial_pitch))
+        columns: Dict[str, np.ndarray] = {}
+        for key, array in envelopes.items():
+            attribute = cls._remap_feature_key(key)
+            if attribute:
+                columns[attribute] = hold_span(array, length, default=CHANNEL_FEATURE_DEFAULTS[key]).astype(np.int64)
 
-        return instructions
+        return cls._columns_to_array(columns, features.initial_pitch, length)
 
     @classmethod
     def feature_values(
@@ -236,6 +242,35 @@ class Exporter(ABC, Generic[InstructionT]):
             InstructionT: The instruction for that frame.
         """
 
+    @classmethod
+    @abstractmethod
+    def _columns_to_array(
+        cls,
+        columns: Dict[str, np.ndarray],
+        initial_pitch: int,
+        length: int,
+    ) -> InstructionArray:
+        """Builds a stream from whole columns of feature values.
+
+        The column-wide form of `_features_dictionary_to_instruction`: every frame of the
+        result is the instruction that method builds from the same row.
+
+        Args:
+            columns: The per-attribute values, one column per attribute.
+            initial_pitch: The sequence's reference pitch, added back to a relative pitch.
+            length: The number of frames.
+
+        Returns:
+            InstructionArray: The stream those columns describe.
+        """
+
+    @staticmethod
+    def _infer_on_column(columns: Dict[str, np.ndarray], length: int) -> np.ndarray:
+        if "volume" in columns:
+            return np.asarray(columns["volume"] > 0)
+
+        return np.ones(length, dtype=np.bool_)
+
     @staticmethod
     def _infer_instruction_on(dictionary: Dict[str, Union[bool, int]]) -> bool:
         if "on" in dictionary:
@@ -4,11 +4,19 @@ import numpy as np
 
 from sampletones_core.constants.enums import FeatureKey
 from sampletones_core.constants.general import NUM_PERIODS
+from sampletones_core.exporters.implementation.utils import (
+    first_on,
+    hold_on,
+    sounding_volumes,
+)
 from sampletones_core.generators import GeneratorTypeUnion, NoiseGenerator
 from sampletones_core.instructions import (
+    InstructionArray,
     InstructionFields,
+    InstructionStream,
     InstructionTypeUnion,
     NoiseInstruction,
+    as_instruction_array,
 )
 from sampletones_core.types.feature import FeatureMap
 
@@ -23,61 +31,48 @@ class NoiseExporter(Exporter[NoiseInstruction]):
     }
 
     @classmethod
-    def extract_data(cls, instructions: List[NoiseInstruction]) -> Tuple[int, List[int], List[int], List[int]]:
-        initial_period = None
-
-        period = 0
-        volume = 0
-        duty_cycle = 0
-
-        periods: List[int] = []
-        volumes: List[int] = []
-        duty_cycles: List[int] = []
-
-        for instruction in instructions:
-            if instruction.on:
-                if initial_period is None:
-                    initial_period = instruction.period
-                    periods = [initial_period for _ in range(len(periods))]
-
-                period = instruction.period
-                volume = instruction.volume
-                duty_cycle = instruction.short
-            else:
-                volume = 0
-
-            periods.append(period)
-            volumes.append(volume)
-            duty_cycles.append(duty_cycle)
-
-        if volume > 0:
-            volumes.append(0)
-
-        initial_period = initial_period if initial_period is not None else 0
+    def extract_columns(
+        cls,
+        instructions: InstructionStream[NoiseInstruction],
+    ) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+        array = as_instruction_array(NoiseInstruction.class_name(), instructions)
+        on = array.column("on")
+        initial_period = first_on(on, array.column("period"), default=0)
+        periods = hold_on(on, array.column("period"), default=initial_period)
+        volumes = sounding_volumes(on, array.column("volume"))
+        duty_cycles = hold_on(on, array.column("short"), default=False)
         return initial_period, periods, volumes, duty_cycles
 
+    @classmethod
+    def extract_data(
+        cls,
+        instructions: InstructionStream[NoiseInstruction],
+    ) -> Tuple[int, List[int], List[int], List[int]]:
+        initial_period, periods, volumes, duty_cycles = cls.extract_columns(instructions)
+        return initial_period, periods.tolist(), volumes.tolist(), duty_cycles.tolist()
+
     @classmethod
     def derive_initial_pitch(
         cls,
-        instructions: List[NoiseInstruction],
+        instructions: InstructionStream[NoiseInstruction],
     ) -> int:
-        initial_period, _, _, _ = cls.extract_data(instructions)
+        initial_period, _, _, _ = cls.extract_columns(instructions)
         return initial_period
 
     @classmethod
     def get_feature_map(
         cls,
-        instructions: List[NoiseInstruction],
+        instructions: InstructionStream[NoiseInstruction],
         initial_pitch: int,
     ) -> FeatureMap:
-        _, periods, volumes, duty_cycles = cls.extract_data(instructions)
-        arpeggio = (np.array(periods) - initial_pitch) % NUM_PERIODS
+        _, periods, volumes, duty_cycles = cls.extract_columns(instructions)
+        arpeggio = (periods.astype(np.int16) - initial_pitch) % NUM_PERIODS
 
         return {
             FeatureKey.INITIAL_PITCH: initial_pitch,
-            FeatureKey.VOLUME: np.array(volumes).astype(np.int8),
+            FeatureKey.VOLUME: volumes,
             FeatureKey.ARPEGGIO: arpeggio.astype(np.int8),
-            FeatureKey.DUTY_CYCLE: np.array(duty_cycles).astype(np.int8),
+            FeatureKey.DUTY_CYCLE: duty_cycles.astype(np.int8),
         }
 
     @classmethod
@@ -93,6 +88,23 @@ class NoiseExporter(Exporter[NoiseInstruction]):
             short=bool(dictionary[cls._ATTRIBUTE_MAP[FeatureKey.DUTY_CYCLE]]),
         )
 
+    @classmethod
+    def _columns_to_array(
+        cls,
+        columns: Dict[str, np.ndarray],
+        initial_pitch: int,
+        length: int,
+    ) -> InstructionArray:
+        return InstructionArray.from_columns(
+            NoiseInstruction.class_name(),
+            {
+                "on": cls._infer_on_column(columns, length),
+                "period": (initial_pitch + columns[cls._ATTRIBUTE_MAP[FeatureKey.ARPEGGIO]]) % NUM_PERIODS,
+                "volume": columns[cls._ATTRIBUTE_MAP[FeatureKey.VOLUME]],
+                "short": columns[cls._ATTRIBUTE_MAP[FeatureKey.DUTY_CYCLE]].astype(np.bool_),
+            },
+        )
+
     @classmethod
     def get_instruction_type(cls) -> InstructionTypeUnion:
         return NoiseInstruction
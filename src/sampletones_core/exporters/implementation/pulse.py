@@ -3,13 +3,21 @@ from typing import ClassVar, Dict, List, Tuple, Union
 import numpy as np
 
 from sampletones_core.constants.enums import FeatureKey
-from sampletones_core.constants.general import MIN_PITCH
-from sampletones_core.exporters.implementation.utils import center_pitch
+from sampletones_core.constants.general import MAX_PITCH, MIN_PITCH
+from sampletones_core.exporters.implementation.utils import (
+    center_pitch,
+    first_on,
+    hold_on,
+    sounding_volumes,
+)
 from sampletones_core.generators import GeneratorTypeUnion, PulseGenerator
 from sampletones_core.instructions import (
+    InstructionArray,
     InstructionFields,
+    InstructionStream,
     InstructionTypeUnion,
     PulseInstruction,
+    as_instruction_array,
 )
 from sampletones_core.types.feature import FeatureMap
 from sampletones_core.utils.frequencies import is_pitch_valid
@@ -25,58 +33,45 @@ class PulseExporter(Exporter[PulseInstruction]):
     }
 
     @classmethod
-    def extract_data(cls, instructions: List[PulseInstruction]) -> Tuple[int, List[int], List[int], List[int]]:
-        initial_pitch = None
-
-        pitch = MIN_PITCH
-        volume = 0
-        duty_cycle = 0
-
-        pitches: List[int] = []
-        volumes: List[int] = []
-        duty_cycles: List[int] = []
-
-        for instruction in instructions:
-            if instruction.on:
-                if initial_pitch is None:
-                    initial_pitch = instruction.pitch
-                    pitches = [initial_pitch for _ in range(len(pitches))]
-
-                pitch = instruction.pitch
-                volume = instruction.volume
-                duty_cycle = instruction.duty_cycle
-            else:
-                volume = 0
-
-            pitches.append(pitch)
-            volumes.append(volume)
-            duty_cycles.append(duty_cycle)
-
-        if volume > 0:
-            volumes.append(0)
-
-        initial_pitch = initial_pitch if initial_pitch is not None else MIN_PITCH
+    def extract_columns(
+        cls,
+        instructions: InstructionStream[PulseInstruction],
+    ) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+        array = as_instruction_array(PulseInstruction.class_name(), instructions)
+        on = array.column("on")
+        initial_pitch = first_on(on, array.column("pitch"), default=MIN_PITCH)
+        pitches = hold_on(on, array.column("pitch"), default=initial_pitch)
+        volumes = sounding_volumes(on, array.column("volume"))
+        duty_cycles = hold_on(on, array.column("duty_cycle"), default=0)
         return initial_pitch, pitches, volumes, duty_cycles
 
     @classmethod
-    def derive_initial_pitch(cls, instructions: List[PulseInstruction]) -> int:
-        first_pitch, pitches, _, _ = cls.extract_data(instructions)
+    def extract_data(
+        cls,
+        instructions: InstructionStream[PulseInstruction],
+    ) -> Tuple[int, List[int], List[int], List[int]]:
+        initial_pitch, pitches, volumes, duty_cycles = cls.extract_columns(instructions)
+        return initial_pitch, pitches.tolist(), volumes.tolist(), duty_cycles.tolist()
+
+    @classmethod
+    def derive_initial_pitch(cls, instructions: InstructionStream[PulseInstruction]) -> int:
+        first_pitch, pitches, _, _ = cls.extract_columns(instructions)
         return center_pitch(first_pitch, pitches)
 
     @classmethod
     def get_feature_map(
         cls,
-        instructions: List[PulseInstruction],
+        instructions: InstructionStream[PulseInstruction],
         initial_pitch: int,
     ) -> FeatureMap:
-        _, pitches, volumes, duty_cycles = cls.extract_data(instructions)
-        arpeggio = np.array(pitches) - initial_pitch
+        _, pitches, volumes, duty_cycles = cls.extract_columns(instructions)
+        arpeggio = pitches.astype(np.int16) - initial_pitch
 
         return {
             FeatureKey.INITIAL_PITCH: initial_pitch,
-            FeatureKey.VOLUME: np.array(volumes).astype(np.int8),
+            FeatureKey.VOLUME: volumes,
             FeatureKey.ARPEGGIO: arpeggio.astype(np.int8),
-            FeatureKey.DUTY_CYCLE: np.array(duty_cycles).astype(np.int8),
+            FeatureKey.DUTY_CYCLE: duty_cycles.astype(np.int8),
         }
 
     @classmethod
@@ -96,6 +91,25 @@ class PulseExporter(Exporter[PulseInstruction]):
             duty_cycle=int(dictionary[cls._ATTRIBUTE_MAP[FeatureKey.DUTY_CYCLE]]),
         )
 
+    @classmethod
+    def _columns_to_array(
+        cls,
+        columns: Dict[str, np.ndarray],
+        initial_pitch: int,
+        length: int,
+    ) -> InstructionArray:
+        pitch = initial_pitch + columns[cls._ATTRIBUTE_MAP[FeatureKey.ARPEGGIO]]
+        valid = (pitch >= MIN_PITCH) & (pitch <= MAX_PITCH)
+        return InstructionArray.from_columns(
+            PulseInstruction.class_name(),
+            {
+                "on": valid & cls._infer_on_column(columns, length),
+                "pitch": np.where(valid, pitch, MIN_PITCH),
+                "volume": np.where(valid, columns[cls._ATTRIBUTE_MAP[FeatureKey.VOLUME]], 0),
+                "duty_cycle": np.where(valid, columns[cls._ATTRIBUTE_MAP[FeatureKey.DUTY_CYCLE]], 0),
+            },
+        )
+
     @classmethod
     def get_instruction_type(cls) -> InstructionTypeUnion:
         return PulseInstruction
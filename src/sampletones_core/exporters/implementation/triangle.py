@@ -3,13 +3,21 @@ from typing import ClassVar, Dict, List, Tuple, Union
 import numpy as np
 
 from sampletones_core.constants.enums import FeatureKey
-from sampletones_core.constants.general import MAX_VOLUME, MIN_PITCH
-from sampletones_core.exporters.implementation.utils import center_pitch
+from sampletones_core.constants.general import MAX_PITCH, MAX_VOLUME, MIN_PITCH
+from sampletones_core.exporters.implementation.utils import (
+    center_pitch,
+    first_on,
+    hold_on,
+    sounding_volumes,
+)
 from sampletones_core.generators import GeneratorTypeUnion, TriangleGenerator
 from sampletones_core.instructions import (
+    InstructionArray,
     InstructionFields,
+    InstructionStream,
     InstructionTypeUnion,
     TriangleInstruction,
+    as_instruction_array,
 )
 from sampletones_core.types.feature import FeatureMap
 from sampletones_core.utils.frequencies import is_pitch_valid
@@ -24,55 +32,45 @@ class TriangleExporter(Exporter[TriangleInstruction]):
     }
 
     @classmethod
-    def extract_data(cls, instructions: List[TriangleInstruction]) -> Tuple[int, List[int], List[int]]:
-        initial_pitch = None
-
-        pitch = MIN_PITCH
-        volume = 0
-
-        pitches: List[int] = []
-        volumes: List[int] = []
-
-        for instruction in instructions:
-            if instruction.on:
-                if initial_pitch is None:
-                    initial_pitch = instruction.pitch
-                    pitches = [initial_pitch for _ in range(len(pitches))]
-
-                pitch = instruction.pitch
-                volume = MAX_VOLUME
-            else:
-                volume = 0
-
-            pitches.append(pitch)
-            volumes.append(volume)
-
-        if volume > 0:
-            volumes.append(0)
-
-        initial_pitch = initial_pitch if initial_pitch is not None else MIN_PITCH
+    def extract_columns(
+        cls,
+        instructions: InstructionStream[TriangleInstruction],
+    ) -> Tuple[int, np.ndarray, np.ndarray]:
+        array = as_instruction_array(TriangleInstruction.class_name(), instructions)
+        on = array.column("on")
+        initial_pitch = first_on(on, array.column("pitch"), default=MIN_PITCH)
+        pitches = hold_on(on, array.column("pitch"), default=initial_pitch)
+        volumes = sounding_volumes(on, MAX_VOLUME)
         return initial_pitch, pitches, volumes
 
+    @classmethod
+    def extract_data(
+        cls,
+        instructions: InstructionStream[TriangleInstruction],
+    ) -> Tuple[int, List[int], List[int]]:
+        initial_pitch, pitches, volumes = cls.extract_columns(instructions)
+        return initial_pitch, pitches.tolist(), volumes.tolist()
+
     @classmethod
     def derive_initial_pitch(
         cls,
-        instructions: List[TriangleInstruction],
+        instructions: InstructionStream[TriangleInstruction],
     ) -> int:
-        first_pitch, pitches, _ = cls.extract_data(instructions)
+        first_pitch, pitches, _ = cls.extract_columns(instructions)
         return center_pitch(first_pitch, pitches)
 
     @classmethod
     def get_feature_map(
         cls,
-        instructions: List[TriangleInstruction],
+        instructions: InstructionStream[TriangleInstruction],
         initial_pitch: int,
     ) -> FeatureMap:
-        _, pitches, volumes = cls.extract_data(instructions)
-        arpeggio = np.array(pitches) - initial_pitch
+        _, pitches, volumes = cls.extract_columns(instructions)
+        arpeggio = pitches.astype(np.int16) - initial_pitch
 
         return {
             FeatureKey.INITIAL_PITCH: initial_pitch,
-            FeatureKey.VOLUME: np.array(volumes).astype(np.int8),
+            FeatureKey.VOLUME: volumes,
             FeatureKey.ARPEGGIO: arpeggio.astype(np.int8),
         }
 
@@ -91,6 +89,23 @@ class TriangleExporter(Exporter[TriangleInstruction]):
             pitch=pitch,
         )
 
+    @classmethod
+    def _columns_to_array(
+        cls,
+        columns: Dict[str, np.ndarray],
+        initial_pitch: int,
+        length: int,
+    ) -> InstructionArray:
+        pitch = initial_pitch + columns[cls._ATTRIBUTE_MAP[FeatureKey.ARPEGGIO]]
+        valid = (pitch >= MIN_PITCH) & (pitch <= MAX_PITCH)
+        return InstructionArray.from_columns(
+            TriangleInstruction.class_name(),
+            {
+                "on": valid & cls._infer_on_column(columns, length),
+                "pitch": np.where(valid, pitch, MIN_PITCH),
+            },
+        )
+
     @classmethod
     def get_instruction_type(cls) -> InstructionTypeUnion:
         return TriangleInstruction
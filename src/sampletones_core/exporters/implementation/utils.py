@@ -1,11 +1,11 @@
-from typing import List
+from typing import Sequence, Union
 
 import numpy as np
 
 
 def center_pitch(
     initial_pitch: int,
-    pitches: List[int],
+    pitches: Union[Sequence[int], np.ndarray],
 ) -> int:
     """
     Picks the pitch at the midpoint of a contour's range.
@@ -21,12 +21,77 @@ def center_pitch(
     Returns:
         The center pitch: ``initial_pitch`` plus the midpoint of the offsets' range.
     """
-    if not pitches:
+    if len(pitches) == 0:
         return initial_pitch
 
-    differences = [pitch - initial_pitch for pitch in pitches]
-    array = np.array(differences, dtype=np.int8)
+    array = (np.asarray(pitches, dtype=np.int16) - initial_pitch).astype(np.int8)
     max_value = np.max(array)
     min_value = np.min(array)
     mean_value = (max_value + min_value) // 2
     return int(initial_pitch + mean_value)
+
+
+def first_on(on: np.ndarray, values: np.ndarray, default: int) -> int:
+    """
+    The value a column carries at the first frame that sounds.
+
+    Args:
+        on: Per-frame flags, true where the channel sounds.
+        values: The column to read.
+        default: The value returned when no frame sounds.
+
+    Returns:
+        The value at the first sounding frame, or ``default``.
+    """
+    indices = np.flatnonzero(on)
+    if not indices.size:
+        return default
+
+    return int(values[indices[0]])
+
+
+def hold_on(on: np.ndarray, values: np.ndarray, default: Union[bool, int]) -> np.ndarray:
+    """
+    Holds a column at the value of the last frame that sounded.
+
+    A silent frame does not restate the channel's pitch or timbre, so the channel keeps what
+    it last sounded with; frames before the first sounding one read ``default``. This is
+    the column-wide form of walking the frames and updating only on sounding ones.
+
+    Args:
+        on: Per-frame flags, true where the channel sounds.
+        values: The column to hold.
+        default: The value of frames before the first sounding one.
+
+    Returns:
+        The held column, in the dtype of ``values``.
+
+    Examples:
+        >>> hold_on(np.array([False, True, False, True]), np.array([9, 2, 9, 5]), 0).tolist()
+        [0, 2, 2, 5]
+    """
+    indices = np.where(on, np.arange(len(on)), -1)
+    np.maximum.accumulate(indices, out=indices)
+    held = values[np.maximum(indices, 0)] if len(values) else values
+    return np.where(indices >= 0, held, default).astype(values.dtype)
+
+
+def sounding_volumes(on: np.ndarray, volumes: Union[np.ndarray, int]) -> np.ndarray:
+    """
+    The volume envelope of a column of frames: the frame's volume where it sounds, zero elsewhere.
+
+    An envelope ending on an audible frame is closed with a trailing zero so the note stops
+    where the sequence does.
+
+    Args:
+        on: Per-frame flags, true where the channel sounds.
+        volumes: The per-frame volumes, or one volume every sounding frame plays at.
+
+    Returns:
+        The volume envelope.
+    """
+    envelope = np.where(on, volumes, 0).astype(np.int8)
+    if envelope.size and envelope[-1] > 0:
+        envelope = np.append(envelope, np.int8(0))
+
+    return envelope
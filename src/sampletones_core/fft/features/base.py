@@ -6,7 +6,7 @@ from typing import List
 import numpy as np
 
 from sampletones_core.configs import Config
-from sampletones_core.structures.histogram import Histogram
+from sampletones_core.structures.histogram import HistogramArray
 
 from ..fragment.fragment import Fragment
 from ..transformer import FFTTransformer
@@ -88,11 +88,11 @@ class FeatureExtractor(ABC):
         self,
         audio: np.ndarray,
         windowed_frames: List[np.ndarray],
-    ) -> List[Histogram]:
+    ) -> List[HistogramArray]:
         """Per-frame features; `windowed_frames` are the frame-centered analysis windows."""
 
     @abstractmethod
-    def reference_feature(self, sample: CyclicArray) -> Histogram:
+    def reference_feature(self, sample: CyclicArray) -> HistogramArray:
         """Steady-state feature of a stationary, periodic candidate sample."""
 
     @abstractmethod
@@ -101,5 +101,5 @@ class FeatureExtractor(ABC):
         target: Fragment,
         approximation: Fragment,
         windowed_audio: np.ndarray,
-    ) -> Histogram:
+    ) -> HistogramArray:
         """Feature of the residual, given the already-differenced window."""
@@ -8,7 +8,7 @@ from sampletones_core.constants.spectrum import (
     CQT_REFERENCE_COLUMNS,
     CQT_REFERENCE_CONTEXT_FACTOR,
 )
-from sampletones_core.structures.histogram import Histogram
+from sampletones_core.structures.histogram import HistogramArray
 
 from ..fragment.fragment import Fragment
 from ..spectrum.cqt import calculate_cqt_spectrum_columns
@@ -24,17 +24,17 @@ class CQTFeatureExtractor(FeatureExtractor):
     and `windowed_frames` supplies the frame count.
     """
 
-    def _frame_features(self, audio: np.ndarray, windowed_frames: List[np.ndarray]) -> List[Histogram]:
+    def _frame_features(self, audio: np.ndarray, windowed_frames: List[np.ndarray]) -> List[HistogramArray]:
         spectra = calculate_cqt_spectrum_columns(audio, self.sample_rate, self.window.frame_length)
         return [self.transformer.forward(spectrum) for spectrum in spectra[: len(windowed_frames)]]
 
-    def reference_feature(self, sample: CyclicArray) -> Histogram:
+    def reference_feature(self, sample: CyclicArray) -> HistogramArray:
         buffer = sample.get_fragment(0, CQT_REFERENCE_CONTEXT_FACTOR * self.window.size)
         spectra = calculate_cqt_spectrum_columns(buffer, self.sample_rate, self.window.frame_length)
         start = max(0, (len(spectra) - CQT_REFERENCE_COLUMNS) // 2)
         interior = spectra[start : start + CQT_REFERENCE_COLUMNS]
         mean_values = np.mean([histogram.values for histogram in interior], axis=0)
-        spectrum = Histogram(edges=interior[0].edges, values=mean_values.astype(np.float32))
+        spectrum = HistogramArray(interior[0].bins, mean_values.astype(np.float32))
         return self.transformer.forward(spectrum)
 
     def _residual_feature(
@@ -42,5 +42,5 @@ class CQTFeatureExtractor(FeatureExtractor):
         target: Fragment,
         approximation: Fragment,
         windowed_audio: np.ndarray,
-    ) -> Histogram:
+    ) -> HistogramArray:
         return self.transformer.subtract(target.feature, approximation.feature)
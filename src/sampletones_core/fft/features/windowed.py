@@ -5,7 +5,7 @@ from typing import List
 import numpy as np
 
 from sampletones_core.constants.algorithm import LIBRARY_PHASES_PER_SAMPLE
-from sampletones_core.structures.histogram import Histogram
+from sampletones_core.structures.histogram import HistogramArray
 
 from ..fragment.fragment import Fragment
 from ..window.cyclic import CyclicArray
@@ -21,11 +21,11 @@ class WindowedFeatureExtractor(FeatureExtractor):
     so one class serves both.)
     """
 
-    def _frame_features(self, audio: np.ndarray, windowed_frames: List[np.ndarray]) -> List[Histogram]:
+    def _frame_features(self, audio: np.ndarray, windowed_frames: List[np.ndarray]) -> List[HistogramArray]:
         return [self._windowed_feature(windowed_audio) for windowed_audio in windowed_frames]
 
-    def reference_feature(self, sample: CyclicArray) -> Histogram:
-        features: List[Histogram] = []
+    def reference_feature(self, sample: CyclicArray) -> HistogramArray:
+        features: List[HistogramArray] = []
         for phase_id in range(LIBRARY_PHASES_PER_SAMPLE):
             phase = phase_id / LIBRARY_PHASES_PER_SAMPLE
             windowed_audio = sample.get_windowed_fragment(phase, self.window)
@@ -38,13 +38,13 @@ class WindowedFeatureExtractor(FeatureExtractor):
         target: Fragment,
         approximation: Fragment,
         windowed_audio: np.ndarray,
-    ) -> Histogram:
+    ) -> HistogramArray:
         if self.config.generation.calculation.fast_difference:
             return self.transformer.subtract(target.feature, approximation.feature)
 
         return self._windowed_feature(windowed_audio)
 
-    def _windowed_feature(self, windowed_audio: np.ndarray) -> Histogram:
+    def _windowed_feature(self, windowed_audio: np.ndarray) -> HistogramArray:
         """
         Feature of one analysis window, normalized by the envelope energy gain.
 
@@ -1,7 +1,6 @@
 from typing import Final, Optional, Tuple, cast
 
 import numpy as np
-from scipy.fft import rfft, rfftfreq
 
 from sampletones_core.constants.spectrum import ERB_FREQUENCY_FACTOR, ERB_MINIMUM_BANDWIDTH
 
@@ -32,6 +31,8 @@ def calculate_fft(audio: np.ndarray, fft_size: Optional[int] = None) -> np.ndarr
         >>> fft_result.shape
         (512,)
     """
+    from scipy.fft import rfft
+
     fft_size = audio.shape[0] if fft_size is None else fft_size
     array = cast(np.ndarray, rfft(audio, fft_size))
     return array[1:]
@@ -62,6 +63,8 @@ def calculate_fft_frequencies(fragment_length: int, sample_rate: int) -> np.ndar
         >>> float(freqs[-1])
         22050.0
     """
+    from scipy.fft import rfftfreq
+
     frequencies: np.ndarray = rfftfreq(fragment_length, 1.0 / sample_rate)
     return frequencies
 
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import List, Self
 
 from sampletones_core.configs import Config
-from sampletones_core.structures.histogram import Histogram
+from sampletones_core.structures.histogram import HistogramArray
 from sampletones_shared.array import xp
 from sampletones_shared.types.array import Array, get_array_module
 
@@ -18,7 +18,7 @@ class Fragment:
     """
 
     audio: Array
-    feature: Histogram
+    feature: HistogramArray
     windowed_audio: Array
     config: Config
 
@@ -53,10 +53,7 @@ class Fragment:
         )
         assert all(ndim == 2 for ndim in dimensions), "All concatenated arrays must be 2-dimensional"
 
-        feature: Histogram = Histogram(
-            edges=first_fragment.feature.edges,
-            values=concatenated_feature,
-        )
+        feature = HistogramArray(first_fragment.feature.bins, concatenated_feature)
 
         return cls(
             audio=concatenated_audio,
@@ -90,3 +87,7 @@ class Fragment:
     @property
     def ndim(self) -> int:
         return int(self.audio.ndim)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.audio.nbytes + self.windowed_audio.nbytes + self.feature.values.nbytes)
@@ -7,7 +7,7 @@ from sampletones_core.constants.spectrum import (
     BINS_PER_OCTAVE,
     CQT_CUTOFF_FREQUENCY,
 )
-from sampletones_core.structures.histogram import Histogram
+from sampletones_core.structures.histogram import BinEdges, HistogramArray
 
 from ..cqt.frequencies import calculate_cqt_frequencies, convert_midpoints_to_edges
 from ..cqt.normalization import normalize_cqt_energy
@@ -21,7 +21,7 @@ def calculate_cqt_spectrum(
     cutoff: float = CQT_CUTOFF_FREQUENCY,
     bins_per_octave: int = BINS_PER_OCTAVE,
     n_bins: Optional[int] = None,
-) -> Histogram:
+) -> HistogramArray:
     """
     Calculate the Constant-Q Transform (CQT) spectrum of a wave.
 
@@ -37,7 +37,7 @@ def calculate_cqt_spectrum(
         n_bins: Number of CQT bins. If None, automatically calculated to reach Nyquist.
 
     Returns:
-        Histogram with log-spaced frequency edges and normalized CQT energy values.
+        HistogramArray with log-spaced frequency edges and normalized CQT energy values.
 
     Raises:
         TypeError: If `audio` is not a numeric numpy array.
@@ -62,7 +62,7 @@ def calculate_cqt_spectrum(
     energy: np.ndarray = np.mean(np.square(np.abs(cqt)), axis=1)
     energy_scaled = normalize_cqt_energy(energy, frequencies, sample_rate, bins_per_octave)
     bands: np.ndarray = convert_midpoints_to_edges(frequencies)
-    return Histogram(edges=bands.astype(np.float32), values=energy_scaled.astype(np.float32))
+    return HistogramArray.create(bands.astype(np.float32), energy_scaled.astype(np.float32))
 
 
 def calculate_cqt_spectrum_columns(
@@ -72,7 +72,7 @@ def calculate_cqt_spectrum_columns(
     cutoff: float = CQT_CUTOFF_FREQUENCY,
     bins_per_octave: int = BINS_PER_OCTAVE,
     n_bins: Optional[int] = None,
-) -> List[Histogram]:
+) -> List[HistogramArray]:
     """
     Compute one CQT power-spectrum histogram per frame of a whole signal.
 
@@ -94,7 +94,7 @@ def calculate_cqt_spectrum_columns(
         n_bins: Number of CQT bins. If None, automatically calculated to reach Nyquist.
 
     Returns:
-        One Histogram per frame, all sharing the same log-spaced edges.
+        One histogram per frame, all sharing the same log-spaced edges.
 
     Raises:
         TypeError: If `audio` is not a numeric numpy array.
@@ -107,8 +107,5 @@ def calculate_cqt_spectrum_columns(
     frequencies = calculate_cqt_frequencies(n_bins, cutoff, bins_per_octave)
     energy: np.ndarray = np.square(np.abs(cqt))
     energy_scaled = normalize_cqt_energy(energy, frequencies, sample_rate, bins_per_octave)
-    edges: np.ndarray = convert_midpoints_to_edges(frequencies).astype(np.float32)
-    return [
-        Histogram(edges=edges, values=energy_scaled[:, frame].astype(np.float32))
-        for frame in range(energy_scaled.shape[1])
-    ]
+    bins = BinEdges.intern(convert_midpoints_to_edges(frequencies).astype(np.float32))
+    return [HistogramArray(bins, energy_scaled[:, frame].astype(np.float32)) for frame in range(energy_scaled.shape[1])]
@@ -7,7 +7,7 @@ from sampletones_core.constants.spectrum import (
     BINS_PER_OCTAVE,
     CQT_CUTOFF_FREQUENCY,
 )
-from sampletones_core.structures.histogram import Histogram
+from sampletones_core.structures.histogram import HistogramArray
 
 from ..fft import calculate_fft, calculate_fft_frequencies
 from ..utils import to_resolution_floored_log_bands
@@ -17,7 +17,7 @@ def calculate_fft_spectrum(
     audio: np.ndarray,
     sample_rate: int,
     fft_size: Optional[int] = None,
-) -> Histogram:
+) -> HistogramArray:
     """
     Calculate the one-sided power spectrum of a wave using FFT.
 
@@ -34,14 +34,14 @@ def calculate_fft_spectrum(
         fft_size: FFT size. If None, uses the length of the audio array.
 
     Returns:
-        Histogram with frequency edges and power spectrum values.
+        HistogramArray with frequency edges and power spectrum values.
     """
     validate_audio_array(audio)
     fft_size = fft_size or len(audio)
     fft: np.ndarray = calculate_fft(audio, fft_size)
     energy: np.ndarray = 2.0 * np.square(np.abs(fft) / fft_size)
     bands: np.ndarray = calculate_fft_frequencies(fft_size, sample_rate)
-    return Histogram(edges=bands.astype(np.float32), values=energy.astype(np.float32))
+    return HistogramArray.create(bands.astype(np.float32), energy.astype(np.float32))
 
 
 def calculate_log_spaced_fft_spectrum(
@@ -50,7 +50,7 @@ def calculate_log_spaced_fft_spectrum(
     fft_size: Optional[int] = None,
     cutoff: float = CQT_CUTOFF_FREQUENCY,
     bins_per_octave: int = BINS_PER_OCTAVE,
-) -> Histogram:
+) -> HistogramArray:
     """
     Calculate the power spectrum with logarithmically-spaced frequency bins.
 
@@ -67,12 +67,12 @@ def calculate_log_spaced_fft_spectrum(
         bins_per_octave: Number of bins per octave in the logarithmic region.
 
     Returns:
-        Histogram with resolution-floored log-spaced edges and rebinned power values.
+        HistogramArray with resolution-floored log-spaced edges and rebinned power values.
 
     Raises:
         TypeError: If fft_config or sampling have incorrect types.
     """
     fft_size = fft_size or len(audio)
-    spectrum: Histogram = calculate_fft_spectrum(audio, sample_rate, fft_size)
+    spectrum: HistogramArray = calculate_fft_spectrum(audio, sample_rate, fft_size)
     log_bands: np.ndarray = to_resolution_floored_log_bands(spectrum.edges, cutoff, bins_per_octave)
     return spectrum.rebin(log_bands)
@@ -6,7 +6,7 @@ from sampletones_core.constants.spectrum import (
     BINS_PER_OCTAVE,
     CQT_CUTOFF_FREQUENCY,
 )
-from sampletones_core.structures.histogram import Histogram
+from sampletones_core.structures.histogram import HistogramArray
 
 from .cqt import calculate_cqt_spectrum
 from .fft import calculate_fft_spectrum, calculate_log_spaced_fft_spectrum
@@ -21,7 +21,7 @@ def calculate_spectrum(
     cutoff: float = CQT_CUTOFF_FREQUENCY,
     bins_per_octave: int = BINS_PER_OCTAVE,
     n_bins: Optional[int] = None,
-) -> Histogram:
+) -> HistogramArray:
     """
     Compute the spectrum of the given audio data, for given FFT size and sample rate,
     depending on the selected spectrum calculation method.
@@ -36,13 +36,13 @@ def calculate_spectrum(
         n_bins: Number of constant-Q components. Only used by the constant-Q method.
 
     Returns:
-        Histogram: Computed spectrum.
+        HistogramArray: Computed spectrum.
 
     Raises:
         ValueError: If an unsupported spectrum method is provided.
     """
     method = SpectrumMethod(method)
-    spectrum: Histogram
+    spectrum: HistogramArray
     match method:
         case SpectrumMethod.FFT:
             spectrum = calculate_fft_spectrum(
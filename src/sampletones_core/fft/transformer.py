@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from typing import List, Optional, Self, Sequence, Union, overload
+from typing import List, Optional, Self, Sequence, Type, Union, cast, overload
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 from sampletones_core.constants.algorithm import MAX_TRANSFORMATION_GAMMA, SPECTRUM_FLOOR
 from sampletones_core.constants.audio import MAX_SAMPLE_RATE, MIN_SAMPLE_RATE
-from sampletones_core.structures.histogram import Histogram
+from sampletones_core.structures.histogram import Histogram, HistogramArray, HistogramClasses, HistogramT
 from sampletones_shared.types.array import (
     Array,
     ArrayOrNumeric,
@@ -50,6 +50,9 @@ class FFTTransformer(BaseModel):
 
     The spectrum must be non-negative to ensure the Yeo-Johnson transform remains real-valued.
     This is enforced during spectrum calculation.
+
+    Spectra are calculated as lean `HistogramArray`s; every operation also accepts validated
+    `Histogram` models and returns the type it was given.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True, use_enum_values=True)
@@ -112,7 +115,7 @@ class FFTTransformer(BaseModel):
         audio: np.ndarray,
         sample_rate: int,
         fft_size: Optional[int] = None,
-    ) -> Histogram:
+    ) -> HistogramArray:
         """
         Calculate the FFT spectrum from audio, based on the provided spectrum method.
 
@@ -127,7 +130,7 @@ class FFTTransformer(BaseModel):
         Raises:
             ValueError: If the calculated spectrum contains negative values.
         """
-        spectrum: Histogram = calculate_spectrum(self.spectrum_method, audio, sample_rate, fft_size)
+        spectrum: HistogramArray = calculate_spectrum(self.spectrum_method, audio, sample_rate, fft_size)
         if not np.all(spectrum.values >= 0):
             raise ValueError("FFT spectrum contains negative values")
 
@@ -138,7 +141,7 @@ class FFTTransformer(BaseModel):
         audio: np.ndarray,
         sample_rate: int,
         fft_size: Optional[int] = None,
-    ) -> Histogram:
+    ) -> HistogramArray:
         """
         Calculate FFT features from audio, based on the provided spectrum method.
         Applies the forward transformation to the base spectrum.
@@ -160,16 +163,16 @@ class FFTTransformer(BaseModel):
         Raises:
             ValueError: If the calculated spectrum contains negative values.
         """
-        spectrum: Histogram = self.calculate_spectrum(audio, sample_rate, fft_size)
+        spectrum: HistogramArray = self.calculate_spectrum(audio, sample_rate, fft_size)
         return self.forward(spectrum)
 
     @overload
-    def forward(self, spectrum: Histogram) -> Histogram: ...
+    def forward(self, spectrum: HistogramT) -> HistogramT: ...
 
     @overload
     def forward(self, spectrum: ArrayOrNumeric) -> ArrayOrNumeric: ...
 
-    def forward(self, spectrum: Union[ArrayOrNumeric, Histogram]) -> Union[ArrayOrNumeric, Histogram]:
+    def forward(self, spectrum: Union[ArrayOrNumeric, HistogramT]) -> Union[ArrayOrNumeric, HistogramT]:
         """
         Apply the forward `x ↦ x ^ a` transformation on a spectrum/array/scalar.
 
@@ -182,7 +185,7 @@ class FFTTransformer(BaseModel):
         Raises:
             TypeError: If the input is not a Histogram or Array/Numeric instance.
         """
-        if isinstance(spectrum, Histogram):
+        if isinstance(spectrum, HistogramClasses):
             return spectrum.apply_with(self.transformation.forward)
 
         if isinstance(spectrum, ArrayOrScalarClasses):
@@ -191,12 +194,12 @@ class FFTTransformer(BaseModel):
         raise TypeError("Input must be a Histogram or Array/Numeric instance")
 
     @overload
-    def backward(self, feature: Histogram) -> Histogram: ...
+    def backward(self, feature: HistogramT) -> HistogramT: ...
 
     @overload
     def backward(self, feature: ArrayOrNumeric) -> ArrayOrNumeric: ...
 
-    def backward(self, feature: Union[ArrayOrNumeric, Histogram]) -> Union[ArrayOrNumeric, Histogram]:
+    def backward(self, feature: Union[ArrayOrNumeric, HistogramT]) -> Union[ArrayOrNumeric, HistogramT]:
         """
         Apply the backward `x ↦ x ^ (1 / a)` transformation on an FFT feature/array/scalar.
         The feature is expected to be of the form `spectrum ^ a`.
@@ -210,7 +213,7 @@ class FFTTransformer(BaseModel):
         Raises:
             TypeError: If the input is not a Histogram or Array/Numeric instance.
         """
-        if isinstance(feature, Histogram):
+        if isinstance(feature, HistogramClasses):
             return feature.apply_with(self.transformation.backward)
 
         if isinstance(feature, ArrayOrScalarClasses):
@@ -240,8 +243,8 @@ class FFTTransformer(BaseModel):
     def apply(
         self,
         operation: MultaryTransformation[ArrayOrNumeric],
-        *features: Histogram,
-    ) -> Histogram:
+        *features: HistogramT,
+    ) -> HistogramT:
         """
         Apply an operation on an FFT feature with transformations.
 
@@ -257,17 +260,15 @@ class FFTTransformer(BaseModel):
         Raises:
             TypeError: If any of the features is not a Histogram.
         """
-        if not all(isinstance(feature, Histogram) for feature in features):
-            raise TypeError("All features must be Histogram instances")
-
+        histogram_class = _histogram_class(features)
         function = self.transformation.compose_function(operation)
-        return Histogram.apply(function, *features)
+        return histogram_class.apply(function, *features)
 
     def reduce(
         self,
         operation: MultaryTransformation[ArrayOrNumeric],
-        *features: Histogram,
-    ) -> Histogram:
+        *features: HistogramT,
+    ) -> HistogramT:
         """
         Reduce multiple FFT features with an operation and transformations.
 
@@ -283,13 +284,11 @@ class FFTTransformer(BaseModel):
         Raises:
             TypeError: If any of the features is not a Histogram.
         """
-        if not all(isinstance(feature, Histogram) for feature in features):
-            raise TypeError("All features must be Histogram instances")
-
+        histogram_class = _histogram_class(features)
         function = self.transformation.compose_function(operation)
-        return Histogram.reduce(function, *features)
+        return histogram_class.reduce(function, *features)
 
-    def to_features(self, features_or_scalars: Sequence[Union[Numeric, Histogram]]) -> List[Histogram]:
+    def to_features(self, features_or_scalars: Sequence[Union[Numeric, HistogramT]]) -> List[HistogramT]:
         """
         Convert a list of features/scalars to FFT features.
 
@@ -306,19 +305,26 @@ class FFTTransformer(BaseModel):
             TypeError: If any of the features is neither a Histogram nor a numeric scalar.
             ValueError: If Histogram features have inconsistent edges.
         """
-        histograms: List[Histogram] = [feature for feature in features_or_scalars if isinstance(feature, Histogram)]
+        histograms = cast(
+            List[HistogramT],
+            [feature for feature in features_or_scalars if isinstance(feature, HistogramClasses)],
+        )
         if not histograms:
             raise TypeError("At least one feature must be a Histogram instance")
 
-        if any(not isinstance(feature, (Histogram, *NumericClasses)) for feature in features_or_scalars):
+        if any(not isinstance(feature, (*HistogramClasses, *NumericClasses)) for feature in features_or_scalars):
             raise TypeError("All features must be Histogram instances or numeric scalars")
 
         edges: Array = histograms[0].edges
         if not all(np.array_equal(histogram.edges, edges) for histogram in histograms):
             raise ValueError("All Histogram features must have the same edges")
 
-        features: List[Histogram] = [
-            (self.forward(Histogram.from_constant(feature, edges)) if isinstance(feature, NumericClasses) else feature)
+        features: List[HistogramT] = [
+            (
+                self.forward(type(histograms[0]).from_constant(feature, edges))
+                if isinstance(feature, NumericClasses)
+                else feature
+            )
             for feature in features_or_scalars
         ]
 
@@ -326,8 +332,8 @@ class FFTTransformer(BaseModel):
 
     def add(
         self,
-        *features_or_scalars: Union[Numeric, Histogram],
-    ) -> Histogram:
+        *features_or_scalars: Union[Numeric, HistogramT],
+    ) -> HistogramT:
         """
         A wrapper for binary addition of FFT features/scalars with transformations.
 
@@ -345,14 +351,22 @@ class FFTTransformer(BaseModel):
             TypeError: If there are no histograms in the input.
             TypeError: If any of the features is neither a Histogram nor a numeric scalar.
         """
-        features: List[Histogram] = self.to_features(features_or_scalars)
+        features: List[HistogramT] = self.to_features(features_or_scalars)
         return self.reduce(lambda feature1, feature2: feature1 + feature2, *features)
 
+    @overload
+    def subtract(
+        self, feature_or_scalar1: HistogramT, feature_or_scalar2: Union[Numeric, HistogramT]
+    ) -> HistogramT: ...
+
+    @overload
+    def subtract(self, feature_or_scalar1: Numeric, feature_or_scalar2: HistogramT) -> HistogramT: ...
+
     def subtract(
         self,
-        feature_or_scalar1: Union[Numeric, Histogram],
-        feature_or_scalar2: Union[Numeric, Histogram],
-    ) -> Histogram:
+        feature_or_scalar1: Union[Numeric, HistogramT],
+        feature_or_scalar2: Union[Numeric, HistogramT],
+    ) -> HistogramT:
         """
         A wrapper for binary subtraction of two FFT features with transformations.
 
@@ -372,14 +386,15 @@ class FFTTransformer(BaseModel):
         Raises:
             TypeError: If any of the features is neither a Histogram nor a numeric scalar.
         """
-        feature1, feature2 = self.to_features((feature_or_scalar1, feature_or_scalar2))
+        features: List[HistogramT] = self.to_features((feature_or_scalar1, feature_or_scalar2))
+        feature1, feature2 = features
         return self.apply(
             lambda feature1, feature2: np.abs(feature1 - feature2),
             feature1,
             feature2,
         )
 
-    def multiply(self, *features_or_scalars: Union[Numeric, Histogram]) -> Histogram:
+    def multiply(self, *features_or_scalars: Union[Numeric, HistogramT]) -> HistogramT:
         """
         Multiply an FFT feature by another features/scalars with transformations.
 
@@ -397,14 +412,20 @@ class FFTTransformer(BaseModel):
             TypeError: If there are no histograms in the input.
             TypeError: If any of the features is neither a Histogram nor a numeric scalar.
         """
-        features: List[Histogram] = self.to_features(features_or_scalars)
+        features: List[HistogramT] = self.to_features(features_or_scalars)
         return self.reduce(lambda feature1, feature2: feature1 * feature2, *features)
 
+    @overload
+    def divide(self, feature_or_scalar1: HistogramT, feature_or_scalar2: Union[Numeric, HistogramT]) -> HistogramT: ...
+
+    @overload
+    def divide(self, feature_or_scalar1: Numeric, feature_or_scalar2: HistogramT) -> HistogramT: ...
+
     def divide(
         self,
-        feature_or_scalar1: Union[Numeric, Histogram],
-        feature_or_scalar2: Union[Numeric, Histogram],
-    ) -> Histogram:
+        feature_or_scalar1: Union[Numeric, HistogramT],
+        feature_or_scalar2: Union[Numeric, HistogramT],
+    ) -> HistogramT:
         """
         Divide an FFT feature by another feature with transformations.
 
@@ -420,13 +441,14 @@ class FFTTransformer(BaseModel):
         Raises:
             TypeError: If any of the features is neither a Histogram nor a numeric scalar.
         """
-        feature1, feature2 = self.to_features((feature_or_scalar1, feature_or_scalar2))
+        features: List[HistogramT] = self.to_features((feature_or_scalar1, feature_or_scalar2))
+        feature1, feature2 = features
         return self.apply(lambda feature1, feature2: feature1 / feature2, feature1, feature2)
 
     def mean(
         self,
-        features: Sequence[Histogram],
-    ) -> Histogram:
+        features: Sequence[HistogramT],
+    ) -> HistogramT:
         """
         Calculate the mean of multiple FFT features with transformations.
 
@@ -450,3 +472,14 @@ class FFTTransformer(BaseModel):
 
         divisor = self.forward(len(features))
         return self.reduce(np.add, *features).apply_with(lambda x: np.divide(x, divisor, out=x, casting="unsafe"))
+
+
+def _histogram_class(features: Sequence[HistogramT]) -> Type[HistogramT]:
+    if not all(isinstance(feature, HistogramClasses) for feature in features):
+        raise TypeError("All features must be Histogram instances")
+
+    classes = {type(feature) for feature in features}
+    if len(classes) > 1:
+        raise TypeError("All features must be of the same histogram type")
+
+    return classes.pop() if classes else Histogram  # type: ignore[return-value]
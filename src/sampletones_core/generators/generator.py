@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, Tuple
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 from sampletones_core.configs import Config
-from sampletones_core.constants.algorithm import MIN_SAMPLE_LENGTH
+from sampletones_core.constants.algorithm import MIN_SAMPLE_LENGTH, RENDER_BLOCK_FRAMES
 from sampletones_core.constants.enums import GeneratorClassName
 from sampletones_core.fft import CyclicArray
 from sampletones_core.instructions import InstructionT, InstructionTypeUnion
@@ -25,6 +25,7 @@ class Generator(ABC, Generic[InstructionT, TimerT]):
     Calling the generator with an instruction renders one frame of audio, and
     `save_state` carries oscillator continuity from one frame into the next, so a held
     note stays phase-continuous across frames until `reset` clears that history.
+    `render_sequence` renders a whole instruction stream the same way in one pass.
     """
 
     def __init__(self, config: Config, name: str) -> None:
@@ -73,6 +74,97 @@ class Generator(ABC, Generic[InstructionT, TimerT]):
                 frame.
         """
 
+    def render_sequence(
+        self,
+        instructions: Sequence[InstructionT],
+        initials: Initials = None,
+        frame_lengths: Optional[Sequence[int]] = None,
+    ) -> np.ndarray:
+        """Renders an instruction stream, one frame per instruction, into one waveform.
+
+        The output matches calling the generator with ``save=True`` once per instruction and
+        concatenating the frames, and the generator ends in the state those calls leave. The
+        oscillator state each frame opens at follows from the previous frame's end through a
+        scalar recurrence; the samples themselves are computed for a block of frames at a time
+        into one preallocated buffer, so a stream costs a handful of array operations instead
+        of one call per frame.
+
+        Args:
+            instructions: The commands describing each frame, in order.
+            initials: Oscillator state the first frame resumes from. When given, every frame
+                resumes from where the previous one ended, as passing ``initials`` taken from
+                the generator before each call does; ``None`` lets the timer's own phase rules
+                apply.
+            frame_lengths: The samples each frame spans, as setting ``frame_length`` before
+                each call does; ``None`` gives every frame the generator's ``frame_length``.
+
+        Returns:
+            np.ndarray: The frames' float32 samples back to back; silent instructions yield
+                zero frames.
+
+        Raises:
+            TypeError: If an instruction is not of the generator's instruction type.
+            ValueError: If ``frame_lengths`` does not give one positive length per instruction.
+        """
+        instruction_type = self.get_instruction_type()
+        if not all(isinstance(instruction, instruction_type) for instruction in instructions):
+            raise TypeError(f"instructions must be instances of {instruction_type.__name__}")
+
+        lengths = np.full(len(instructions), self.frame_length, dtype=np.int64)
+        if frame_lengths is not None:
+            if len(frame_lengths) != len(instructions) or any(length < 1 for length in frame_lengths):
+                raise ValueError("frame_lengths must give one positive length per instruction")
+
+            lengths[:] = frame_lengths
+
+        self.validate(initials)
+        if initials is not None:
+            self.timer.set(initials)
+
+        width = int(lengths.max(initial=self.frame_length))
+        frames = np.zeros((len(instructions), width), dtype=np.float32)
+        playing = [index for index, instruction in enumerate(instructions) if instruction.on]
+        for start in range(0, len(playing), RENDER_BLOCK_FRAMES):
+            block = playing[start : start + RENDER_BLOCK_FRAMES]
+            block_lengths = lengths[block]
+            frames[block, : block_lengths.max()] = self.render_frames(
+                [instructions[index] for index in block],
+                block_lengths,
+                continuous=initials is not None,
+            )
+
+        if playing:
+            last_instruction = instructions[playing[-1]]
+            state = self.timer.get()
+            self.set_timer(last_instruction)
+            self.timer.set(state)
+            self.previous_instruction = last_instruction
+
+        if frame_lengths is None:
+            return frames.reshape(-1)
+
+        return frames[np.arange(width) < lengths[:, None]]
+
+    @abstractmethod
+    def render_frames(
+        self,
+        instructions: Sequence[InstructionT],
+        frame_lengths: np.ndarray,
+        continuous: bool,
+    ) -> np.ndarray:
+        """Renders consecutive sounding frames, one row per instruction.
+
+        Args:
+            instructions: Sounding commands, each opening where the previous one ended.
+            frame_lengths: The samples each frame spans.
+            continuous: Whether the oscillator state carries across frames even where the
+                timer would reset its phase on a new setting.
+
+        Returns:
+            np.ndarray: A ``(len(instructions), max(frame_lengths))`` float32 array of shaped
+                frames, each row valid up to its own length.
+        """
+
     def generate(
         self,
         instruction: InstructionT,
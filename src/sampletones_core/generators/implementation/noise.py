@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence
 
 import numpy as np
 
@@ -60,6 +60,24 @@ class NoiseGenerator(Generator[NoiseInstruction, LFSRTimer]):
             self.timer.short = False
             self.timer.period = 0
 
+    def render_frames(
+        self,
+        instructions: Sequence[NoiseInstruction],
+        frame_lengths: np.ndarray,
+        continuous: bool,
+    ) -> np.ndarray:
+        shorts = np.array([instruction.short for instruction in instructions], dtype=bool)
+        clocks_per_sample = np.array(
+            [self.timer.calculate_clocks_per_sample(instruction.period) for instruction in instructions]
+        )
+        output = self.timer.generate_sequence(shorts, clocks_per_sample, frame_lengths, continuous)
+        volumes = np.array(
+            [np.float32(MIXER_NOISE * float(instruction.volume) / float(MAX_VOLUME)) for instruction in instructions],
+            dtype=np.float32,
+        )
+        frames: np.ndarray = volumes[:, None] * output
+        return frames
+
     def apply(self, output: np.ndarray, instruction: NoiseInstruction) -> np.ndarray:
         volume = np.float32(MIXER_NOISE * float(instruction.volume) / float(MAX_VOLUME))
         return volume * output
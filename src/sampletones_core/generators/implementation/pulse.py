@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence
 
 import numpy as np
 
@@ -60,6 +60,24 @@ class PulseGenerator(Generator[PulseInstruction, PhaseTimer]):
         else:
             self.timer.frequency = 0.0
 
+    def render_frames(
+        self,
+        instructions: Sequence[PulseInstruction],
+        frame_lengths: np.ndarray,
+        continuous: bool,
+    ) -> np.ndarray:
+        timer_ticks = np.array(
+            [self.timer.frequency_to_timer_ticks(self.get_frequency(instruction.pitch)) for instruction in instructions]
+        )
+        output = self.timer.generate_sequence(timer_ticks, frame_lengths, continuous)
+        duty_cycles = np.array([DUTY_CYCLES[instruction.duty_cycle] for instruction in instructions])
+        volumes = np.array(
+            [np.float32(MIXER_PULSE * instruction.volume / MAX_VOLUME) for instruction in instructions],
+            dtype=np.float32,
+        )
+        frames: np.ndarray = np.where(output < duty_cycles[:, None], volumes[:, None], -volumes[:, None])
+        return frames
+
     def apply(self, output: np.ndarray, instruction: PulseInstruction) -> np.ndarray:
         duty_cycle = DUTY_CYCLES[instruction.duty_cycle]
         output = np.where(output < duty_cycle, 1.0, -1.0).astype(np.float32)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Sequence
 
 import numpy as np
 
@@ -62,8 +62,28 @@ class TriangleGenerator(Generator[TriangleInstruction, PhaseTimer]):
         else:
             self.timer.frequency = 0.0
 
+    def render_frames(
+        self,
+        instructions: Sequence[TriangleInstruction],
+        frame_lengths: np.ndarray,
+        continuous: bool,
+    ) -> np.ndarray:
+        timer_ticks = np.array(
+            [self.timer.frequency_to_timer_ticks(self.get_frequency(instruction.pitch)) for instruction in instructions]
+        )
+        return self.shape(self.timer.generate_sequence(timer_ticks, frame_lengths, continuous))
+
     def apply(self, output: np.ndarray, instruction: TriangleInstruction) -> np.ndarray:
-        triangle = 1.0 - np.round(np.abs(((output + TRIANGLE_OFFSET) % 1.0) - 0.5) * 30.0) / 7.5
+        return self.shape(output)
+
+    @staticmethod
+    def shape(output: np.ndarray) -> np.ndarray:
+        """Folds the timer phase into the channel's 32-step triangle at its mixer level.
+
+        The shifted phase is positive, so subtracting its floor is the exact ``% 1.0``.
+        """
+        shifted = output + TRIANGLE_OFFSET
+        triangle = 1.0 - np.round(np.abs(shifted - np.floor(shifted) - 0.5) * 30.0) / 7.5
         return (triangle * MIXER_TRIANGLE).astype(np.float32)
 
     def get_possible_instructions(self) -> List[TriangleInstruction]:
@@ -1,3 +1,4 @@
+from .array import InstructionArray, InstructionStream, as_instruction_array, instruction_dtype
 from .data import InstructionData
 from .implementation.noise import NoiseInstruction
 from .implementation.pulse import PulseInstruction
@@ -16,14 +17,18 @@ from .utils import get_instruction_by_type
 __all__ = [
     "INSTRUCTION_CLASS_MAP",
     "Instruction",
+    "InstructionArray",
     "InstructionClass",
     "InstructionData",
     "InstructionFields",
+    "InstructionStream",
     "InstructionT",
     "InstructionTypeUnion",
     "InstructionUnion",
     "NoiseInstruction",
     "PulseInstruction",
     "TriangleInstruction",
+    "as_instruction_array",
     "get_instruction_by_type",
+    "instruction_dtype",
 ]
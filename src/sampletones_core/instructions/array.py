@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union, overload
+
+import numpy as np
+
+from sampletones_core.constants.enums import InstructionClassName
+from sampletones_shared.exceptions import DeserializationError
+from sampletones_shared.types.data import SerializedData
+
+from .maps import INSTRUCTION_CLASS_MAP
+from .types import InstructionT, InstructionTypeUnion, InstructionUnion
+
+_FIELD_DTYPES: Dict[Any, type] = {
+    bool: np.bool_,
+    int: np.int8,
+}
+
+
+@cache
+def instruction_dtype(instruction_class: InstructionClassName) -> np.dtype:
+    """
+    The structured dtype one frame of an instruction type occupies.
+
+    Fields follow the declaration order of the instruction model, each in the narrowest type
+    that holds its range: a flag takes a byte, and every register value fits a signed byte.
+
+    Args:
+        instruction_class: The instruction type.
+
+    Returns:
+        The structured dtype with one named field per instruction field.
+    """
+    instruction_type = INSTRUCTION_CLASS_MAP[instruction_class]
+    return np.dtype(
+        [(name, _FIELD_DTYPES[field_info.annotation]) for name, field_info in instruction_type.model_fields.items()]
+    )
+
+
+@cache
+def _field_bounds(instruction_class: InstructionClassName) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+    instruction_type = INSTRUCTION_CLASS_MAP[instruction_class]
+    bounds: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+    for name, field_info in instruction_type.model_fields.items():
+        lower = next((item.ge for item in field_info.metadata if hasattr(item, "ge")), None)
+        upper = next((item.le for item in field_info.metadata if hasattr(item, "le")), None)
+        if lower is not None or upper is not None:
+            bounds[name] = (lower, upper)
+
+    return bounds
+
+
+@dataclass(frozen=True, eq=False)
+class InstructionArray:
+    """
+    A channel's per-frame instructions held as one structured array.
+
+    Each row is one frame and each named column one instruction field, so a stream of any
+    length is a single contiguous buffer of a few bytes per frame instead of one model per
+    frame. Columns are read and transformed whole, the buffer packs and unpacks without
+    copying, and the list of instruction models stays available through `to_instructions`,
+    indexing, and iteration for code that works frame by frame.
+
+    The array is read-only: a stream is a stored value, and an edit builds a new one.
+
+    Attributes:
+        instruction_class: The instruction type every row describes.
+        values: The structured array, one row per frame.
+    """
+
+    instruction_class: InstructionClassName
+    values: np.ndarray
+
+    def __post_init__(self) -> None:
+        dtype = instruction_dtype(self.instruction_class)
+        if self.values.dtype != dtype:
+            raise TypeError(f"Expected values of dtype {dtype} for {self.instruction_class}, got {self.values.dtype}")
+
+        if self.values.ndim != 1:
+            raise ValueError(f"Instruction values must be 1-dimensional, got {self.values.ndim} dimensions")
+
+        values = np.ascontiguousarray(self.values)
+        values.flags.writeable = False
+        object.__setattr__(self, "values", values)
+
+    @property
+    def instruction_type(self) -> InstructionTypeUnion:
+        return INSTRUCTION_CLASS_MAP[self.instruction_class]
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.values.nbytes)
+
+    @classmethod
+    def empty(cls, instruction_class: InstructionClassName) -> InstructionArray:
+        return cls(instruction_class, np.zeros(0, dtype=instruction_dtype(instruction_class)))
+
+    @classmethod
+    def from_instructions(
+        cls,
+        instruction_class: InstructionClassName,
+        instructions: Iterable[InstructionUnion],
+    ) -> InstructionArray:
+        """
+        Packs instruction models into their columnar form.
+
+        Args:
+            instruction_class: The instruction type of the stream.
+            instructions: The per-frame instructions, all of that type.
+
+        Returns:
+            The stream as an instruction array.
+
+        Raises:
+            TypeError: If an instruction is of another type.
+        """
+        instruction_type = INSTRUCTION_CLASS_MAP[instruction_class]
+        dtype = instruction_dtype(instruction_class)
+        names = dtype.names or ()
+        rows: List[Tuple[Any, ...]] = []
+        for instruction in instructions:
+            if not isinstance(instruction, instruction_type):
+                raise TypeError(
+                    f"Instruction type {type(instruction).__name__} does not match stream type {instruction_class}"
+                )
+
+            rows.append(tuple(getattr(instruction, name) for name in names))
+
+        return cls(instruction_class, np.array(rows, dtype=dtype))
+
+    @classmethod
+    def from_columns(
+        cls,
+        instruction_class: InstructionClassName,
+        columns: Mapping[str, np.ndarray],
+    ) -> InstructionArray:
+        """
+        Assembles a stream from whole columns, validating each against its field's range.
+
+        This is the vectorized counterpart of building one validated model per frame, so a
+        column out of range is refused as the model would refuse its frame.
+
+        Args:
+            instruction_class: The instruction type of the stream.
+            columns: One equal-length array per instruction field.
+
+        Returns:
+            The stream as an instruction array.
+
+        Raises:
+            ValueError: If a field is missing, the columns differ in length, or a value
+                falls outside its field's range.
+        """
+        dtype = instruction_dtype(instruction_class)
+        names = dtype.names or ()
+        missing = [name for name in names if name not in columns]
+        if missing:
+            raise ValueError(f"Missing columns {missing} for {instruction_class}")
+
+        lengths = {len(columns[name]) for name in names}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns for {instruction_class} differ in length: {sorted(lengths)}")
+
+        for name, (lower, upper) in _field_bounds(instruction_class).items():
+            column = np.asarray(columns[name])
+            if column.size and (
+                (lower is not None and column.min() < lower) or (upper is not None and column.max() > upper)
+            ):
+                raise ValueError(f"Column '{name}' of {instruction_class} falls outside [{lower}, {upper}]")
+
+        values = np.empty(lengths.pop() if lengths else 0, dtype=dtype)
+        for name in names:
+            values[name] = columns[name]
+
+        return cls(instruction_class, values)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.values[name]
+
+    def to_instructions(self) -> List[InstructionUnion]:
+        """
+        The stream as a list of instruction models, the compatibility view of the array.
+
+        Returns:
+            One instruction per frame.
+        """
+        instruction_type = self.instruction_type
+        names = self.values.dtype.names or ()
+        return [instruction_type.model_construct(**dict(zip(names, row))) for row in self.values.tolist()]
+
+    def pack(self) -> SerializedData:
+        """
+        The stream in its stored form: the instruction type and the raw row buffer.
+
+        The buffer is a view of the array's memory, so packing copies nothing until the
+        serializer writes it out.
+        """
+        return {
+            "instruction_class": str(self.instruction_class),
+            "values": memoryview(self.values.view(np.uint8)),
+        }
+
+    @classmethod
+    def unpack(cls, raw: SerializedData) -> InstructionArray:
+        """
+        Reads a stream back from its stored form, viewing the buffer in place.
+
+        Args:
+            raw: The stored form written by `pack`.
+
+        Returns:
+            The stream as an instruction array.
+
+        Raises:
+            DeserializationError: If the instruction type is unknown or the buffer does not
+                hold a whole number of rows.
+        """
+        try:
+            instruction_class = InstructionClassName(raw["instruction_class"])
+        except (KeyError, ValueError) as exception:
+            raise DeserializationError(f"Invalid instruction stream type: {exception}") from exception
+
+        buffer = raw.get("values", b"")
+        dtype = instruction_dtype(instruction_class)
+        if len(buffer) % dtype.itemsize:
+            raise DeserializationError(
+                f"Instruction stream of {len(buffer)} bytes does not hold whole {instruction_class} rows"
+            )
+
+        return cls(instruction_class, np.frombuffer(buffer, dtype=dtype))
+
+    def validate(self) -> None:
+        """
+        Checks every column against its field's range.
+
+        Raises:
+            ValueError: If a value falls outside its field's range.
+        """
+        names = self.values.dtype.names or ()
+        InstructionArray.from_columns(self.instruction_class, {name: self.values[name] for name in names})
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[InstructionUnion]:
+        return iter(self.to_instructions())
+
+    @overload
+    def __getitem__(self, index: int) -> InstructionUnion: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> InstructionArray: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[InstructionUnion, InstructionArray]:
+        if isinstance(index, slice):
+            return InstructionArray(self.instruction_class, self.values[index])
+
+        row = self.values[index]
+        names = self.values.dtype.names or ()
+        return self.instruction_type.model_construct(**{name: row[name].item() for name in names})
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, InstructionArray):
+            return NotImplemented
+
+        return self.instruction_class == other.instruction_class and np.array_equal(self.values, other.values)
+
+    def __hash__(self) -> int:
+        return hash((self.instruction_class, self.values.tobytes()))
+
+
+InstructionStream = Union[InstructionArray, Sequence[InstructionT]]
+
+
+def as_instruction_array(
+    instruction_class: InstructionClassName,
+    instructions: InstructionStream[Any],
+) -> InstructionArray:
+    """
+    Reads a stream given either as an instruction array or as a list of instruction models.
+
+    Args:
+        instruction_class: The instruction type a list is packed as.
+        instructions: The stream in either form.
+
+    Returns:
+        The stream as an instruction array; an array passes through unchanged.
+    """
+    if isinstance(instructions, InstructionArray):
+        return instructions
+
+    return InstructionArray.from_instructions(instruction_class, instructions)
@@ -1,14 +1,18 @@
 from .data import InstructionLibraryData
 from .filename.utils import create_key_from_filename, get_display_name_from_key
 from .fragment import InstructionLibraryFragment
+from .header import InstructionLibraryHeader
 from .key import InstructionLibraryKey
 from .library import InstructionLibrary
+from .partials import LibraryPartials
 
 __all__ = [
     "InstructionLibrary",
     "InstructionLibraryData",
     "InstructionLibraryFragment",
+    "InstructionLibraryHeader",
     "InstructionLibraryKey",
+    "LibraryPartials",
     "create_key_from_filename",
     "get_display_name_from_key",
 ]
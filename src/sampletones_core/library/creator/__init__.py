@@ -2,6 +2,7 @@ from .creation import (
     generate_instruction,
     generate_instruction_batch,
     generate_instructions,
+    generate_partial_task,
     generate_single_instruction_task,
 )
 from .creator import InstructionsLibraryCreator
@@ -11,5 +12,6 @@ __all__ = [
     "generate_instruction",
     "generate_instruction_batch",
     "generate_instructions",
+    "generate_partial_task",
     "generate_single_instruction_task",
 ]
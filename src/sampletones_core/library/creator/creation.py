@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
 
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import GeneratorClassName
@@ -8,6 +9,10 @@ from sampletones_core.generators import GeneratorUnion, get_generators_map
 from sampletones_core.generators.maps import GENERATOR_CLASS_MAP
 from sampletones_core.instructions import InstructionUnion
 from sampletones_core.library import InstructionLibraryFragment
+from sampletones_core.library.item import LibraryItem
+from sampletones_core.library.partials import write_partial
+
+PartialTask = Tuple[Tuple[GeneratorClassName, Sequence[InstructionUnion]], Config, Window, Path]
 
 
 def generate_instruction(
@@ -59,3 +64,22 @@ def generate_single_instruction_task(
         extractor,
     )
     return instruction, fragment
+
+
+def generate_partial_task(task: PartialTask) -> Tuple[Path, int]:
+    """Generates a chunk of one generator's instructions into a partial, one fragment at a time.
+
+    Returns the partial's path and the number of instructions it holds, rather than the
+    fragments, so the fragments never leave the worker.
+    """
+    (generator_class_name, instructions), config, window, path = task
+    generator = GENERATOR_CLASS_MAP[generator_class_name](config, generator_class_name)
+    extractor = get_feature_extractor(config, window)
+    items = (
+        LibraryItem.create(
+            instruction=instruction,
+            fragment=InstructionLibraryFragment.create(generator, instruction, extractor),
+        )
+        for instruction in instructions
+    )
+    return path, write_partial(path, items)
@@ -1,4 +1,5 @@
-from typing import Any, Callable, Dict, List, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import GeneratorClassName
@@ -9,26 +10,52 @@ from sampletones_core.parallelization import TaskProcessor
 from sampletones_shared.logger import LoggerProtocol
 from sampletones_shared.logger import logger as default_logger
 
-from ..data import InstructionLibraryData
-from ..fragment import InstructionLibraryFragment
 from ..key import InstructionLibraryKey
-from .creation import generate_single_instruction_task
+from ..partials import (
+    PARTIAL_CHUNK_SIZE,
+    LibraryPartials,
+    get_partial_filename,
+    get_partials_directory,
+    remove_temporary_partials,
+)
+from .creation import PartialTask, generate_partial_task
 
 
-class InstructionsLibraryCreator(TaskProcessor[Tuple[InstructionLibraryKey, InstructionLibraryData]]):
+class InstructionsLibraryCreator(TaskProcessor[Tuple[InstructionLibraryKey, LibraryPartials]]):
+    """
+    Generates the instruction library of a configuration, checkpointed so an interrupted run resumes.
+
+    Each generator's instructions are split into chunks, and each chunk is one task: a worker
+    generates its fragments and writes them to a partial in a directory beside the library file.
+    The partials of chunks finished by an earlier, interrupted run are kept, so only the rest is
+    generated again, and no fragment is held in this process. The result is the key and the
+    partials, which :meth:`InstructionLibrary.save_partials` streams into the library file.
+    """
+
     def __init__(
         self,
         config: Config,
         window: Window,
         logger: LoggerProtocol = default_logger,
+        *,
+        library_directory: Optional[Path] = None,
+        chunk_size: int = PARTIAL_CHUNK_SIZE,
     ) -> None:
         super().__init__(max_workers=config.general.max_workers, logger=logger)
         self.config = config.model_copy()
         self.window: Window = window
+        self.chunk_size: int = chunk_size
         self.instructions: List[Tuple[GeneratorClassName, InstructionUnion]] = []
 
+        self.key: InstructionLibraryKey = InstructionLibraryKey.create(self.config.library, window)
+        directory = library_directory if library_directory is not None else self.config.library_directory
+        self.partials_directory: Path = get_partials_directory(directory / self.key.filename)
+        self.partial_paths: List[Path] = []
+
         self.total_instructions = 0
         self.completed_instructions = 0
+        self.resumed_instructions = 0
+        self._generated_instructions = 0
 
     def start(self) -> None:
         if self.running:
@@ -37,38 +64,60 @@ class InstructionsLibraryCreator(TaskProcessor[Tuple[InstructionLibraryKey, Inst
 
         super().start()
 
-    def _create_tasks(
-        self,
-    ) -> List[Tuple[Tuple[GeneratorClassName, InstructionUnion], Config, Window]]:
+    def _create_tasks(self) -> List[PartialTask]:
         generators: Dict[GeneratorClassName, GeneratorUnion] = get_generators_map(self.config)
 
-        self.instructions = [
-            (generator.class_name(), instruction)
-            for generator in generators.values()
-            for instruction in generator.get_possible_instructions()
-        ]
+        self.partials_directory.mkdir(parents=True, exist_ok=True)
+        remove_temporary_partials(self.partials_directory)
 
-        return [(instruction_pair, self.config, self.window) for instruction_pair in self.instructions]
+        self.instructions = []
+        self.partial_paths = []
+        self.resumed_instructions = 0
+        self._generated_instructions = 0
 
-    def _get_task_function(
-        self,
-    ) -> Callable[
-        [Tuple[Tuple[GeneratorClassName, InstructionUnion], Config, Window]],
-        Tuple[InstructionUnion, InstructionLibraryFragment[Any]],
-    ]:
-        return generate_single_instruction_task
+        tasks: List[PartialTask] = []
+        for generator in generators.values():
+            generator_class_name = generator.class_name()
+            instructions = generator.get_possible_instructions()
+            self.instructions.extend((generator_class_name, instruction) for instruction in instructions)
+            for start in range(0, len(instructions), self.chunk_size):
+                chunk = instructions[start : start + self.chunk_size]
+                path = self.partials_directory / get_partial_filename(generator_class_name, start, len(chunk))
+                self.partial_paths.append(path)
+                if path.exists():
+                    self.resumed_instructions += len(chunk)
+                    continue
+
+                tasks.append(((generator_class_name, chunk), self.config, self.window, path))
+
+        if self.resumed_instructions:
+            self.logger.info(
+                f"Resuming library generation: {self.resumed_instructions} of "
+                f"{len(self.instructions)} instructions already generated"
+            )
+
+        return tasks
+
+    def _get_task_function(self) -> Callable[[PartialTask], Tuple[Path, int]]:
+        return generate_partial_task
+
+    def _on_result(self, result: Any) -> None:
+        _, size = result
+        self._generated_instructions += size
 
     def _process_results(
         self,
         results: List[Any],
-    ) -> Tuple[InstructionLibraryKey, InstructionLibraryData]:
-        data: Dict[InstructionUnion, InstructionLibraryFragment[Any]] = dict(results)
-        library_data = InstructionLibraryData.create(self.config, data)
-
-        key = InstructionLibraryKey.create(self.config.library, self.window)
-        return key, library_data
+    ) -> Tuple[InstructionLibraryKey, LibraryPartials]:
+        partials = LibraryPartials(
+            config=self.config.library,
+            directory=self.partials_directory,
+            paths=tuple(self.partial_paths),
+            size=len(self.instructions),
+        )
+        return self.key, partials
 
     def _notify_progress(self) -> None:
         self.total_instructions = len(self.instructions)
-        self.completed_instructions = self.completed_tasks
+        self.completed_instructions = self.resumed_instructions + self._generated_instructions
         super()._notify_progress()
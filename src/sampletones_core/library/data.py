@@ -1,9 +1,25 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, Final, KeysView, List, Self, Union, ValuesView
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterator,
+    KeysView,
+    List,
+    Optional,
+    Self,
+    Tuple,
+    Union,
+    ValuesView,
+    get_args,
+)
 
+import msgpack
 from pydantic import ConfigDict, Field, ValidationError
 
 from sampletones_core.configs import Config, InstructionsLibraryConfig
@@ -18,12 +34,18 @@ from sampletones_shared.exceptions import (
     SampleToNESError,
     UnhandledLibraryError,
 )
+from sampletones_shared.types.data import SerializedData
 from sampletones_shared.types.path import Pathlike
 from sampletones_shared.utils.serialization import load_binary
 
 from .fragment import InstructionLibraryFragment
+from .header import InstructionLibraryHeader
 from .item import LibraryItem
 
+LibraryLoadProgress = Callable[[int, int], None]
+
+ITEMS_FIELD: Final[str] = "items"
+
 LIBRARY_DATA_CONTRACT: Final[MetadataContract] = MetadataContract(
     label="Library data",
     expected_version=SAMPLETONES_LIBRARY_DATA_VERSION,
@@ -65,6 +87,11 @@ class InstructionLibraryData(DataModel):
 
         return subdata
 
+    @cached_property
+    def nbytes(self) -> int:
+        """The bytes held by the arrays of every fragment in the library."""
+        return sum(item.fragment.nbytes for item in self.items)
+
     def __getitem__(self, key: InstructionUnion) -> InstructionLibraryFragment[Any]:
         return self.data[key]
 
@@ -115,23 +142,117 @@ class InstructionLibraryData(DataModel):
     def load(cls, path: Pathlike, fast: bool = True) -> InstructionLibraryData:
         binary = load_binary(path)
 
-        try:
+        with _translating_errors(path):
             return InstructionLibraryData.deserialize(
                 binary,
                 validation=cls.validate_metadata,
                 fast=fast,
             )
-        except (ValidationError, TypeError) as exception:
-            raise InvalidLibraryDataValuesError(
-                f'Failed to deserialize LibraryData from "{Path(path)}" due to validation error: {exception}',
-                exception,
-            ) from exception
-        except SampleToNESError:
-            raise
-        except Exception as exception:
-            raise UnhandledLibraryError(
-                f'Unhandled library error while loading "{Path(path)}": {exception}'
-            ) from exception
+
+    @classmethod
+    def read_header(cls, path: Pathlike) -> InstructionLibraryHeader:
+        """
+        Read a library file's metadata, configuration and size without decoding its items.
+
+        Args:
+            path: Path to the library file.
+
+        Returns:
+            InstructionLibraryHeader: The header, with the metadata validated.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            LoadLibraryError: If the header cannot be read or fails validation.
+        """
+        fields, size = cls._read_stream(path, items=None)
+        return InstructionLibraryHeader(metadata=fields["metadata"], config=fields["config"], size=size)
+
+    @classmethod
+    def load_incrementally(
+        cls,
+        path: Pathlike,
+        on_progress: Optional[LibraryLoadProgress] = None,
+        fast: bool = True,
+    ) -> InstructionLibraryData:
+        """
+        Load a library file item by item, reporting how far the load has come.
+
+        The file is streamed rather than read whole, so a malformed or foreign header is refused
+        before any item is decoded and only one item's raw form is held at a time. An exception
+        raised by ``on_progress`` propagates unchanged, which lets a caller abandon the load.
+
+        Args:
+            path: Path to the library file.
+            on_progress: Called with the items decoded so far and the items in the file.
+            fast: Whether to construct the models without validation.
+
+        Returns:
+            InstructionLibraryData: The library, equal to what :meth:`load` returns.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            LoadLibraryError: If the file cannot be decoded or fails validation.
+        """
+        items: List[LibraryItem[InstructionUnion]] = []
+        fields, _ = cls._read_stream(path, items=items, on_progress=on_progress, fast=fast)
+        return cls._construct(fast=fast, **fields, items=items)
+
+    @classmethod
+    def _read_stream(
+        cls,
+        path: Pathlike,
+        items: Optional[List[LibraryItem[InstructionUnion]]],
+        on_progress: Optional[LibraryLoadProgress] = None,
+        fast: bool = True,
+    ) -> Tuple[SerializedData, int]:
+        """Decodes the fields around the items, and the items into ``items`` unless it is ``None``."""
+        item_class = get_args(cls.model_fields[ITEMS_FIELD].annotation)[0]
+        header_names = cls.model_fields.keys() - {ITEMS_FIELD}
+        fields: SerializedData = {}
+        size = 0
+        with open(path, "rb") as file:
+            unpacker = msgpack.Unpacker(file, raw=False)
+            with _translating_errors(path):
+                entries = unpacker.read_map_header()
+
+            for _ in range(entries):
+                with _translating_errors(path):
+                    name = unpacker.unpack()
+                    if name != ITEMS_FIELD:
+                        raw = unpacker.unpack()
+                        if name in cls.model_fields:
+                            fields[name] = cls._unpack_field(name, raw, fast)
+                        continue
+
+                    size = unpacker.read_array_header()
+
+                if items is None:
+                    if header_names <= fields.keys():
+                        break
+
+                    with _translating_errors(path):
+                        for _ in range(size):
+                            unpacker.skip()
+                    continue
+
+                for index in range(size):
+                    with _translating_errors(path):
+                        item = item_class.deserialize_inner(unpacker.unpack(), cls.validate_metadata, fast=fast)
+                    items.append(item)
+                    if on_progress is not None:
+                        on_progress(index + 1, size)
+
+            with _translating_errors(path):
+                for name in header_names - fields.keys():
+                    fields[name] = cls._unpack_field(name, None, fast)
+
+        return fields, size
+
+    @classmethod
+    def _unpack_field(cls, name: str, raw: Any, fast: bool) -> Any:
+        value = cls._unpack_value(raw, cls.model_fields[name].annotation, name, cls.validate_metadata, fast)
+        cls.validate_metadata(value)
+        return value
 
     @staticmethod
     def validate_metadata(metadata: Metadata) -> None:
@@ -139,3 +260,18 @@ class InstructionLibraryData(DataModel):
             return
 
         LIBRARY_DATA_CONTRACT.validate(metadata, metadata.library_data_version)
+
+
+@contextmanager
+def _translating_errors(path: Pathlike) -> Iterator[None]:
+    try:
+        yield
+    except (ValidationError, TypeError) as exception:
+        raise InvalidLibraryDataValuesError(
+            f'Failed to deserialize LibraryData from "{Path(path)}" due to validation error: {exception}',
+            exception,
+        ) from exception
+    except SampleToNESError:
+        raise
+    except Exception as exception:
+        raise UnhandledLibraryError(f'Unhandled library error while loading "{Path(path)}": {exception}') from exception
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from functools import cached_property
-from typing import Any, Generic, Self
+from typing import Any, Generic, Optional, Self
 
 import numpy as np
-from pydantic import ConfigDict
+from pydantic import ConfigDict, field_serializer
 
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import GeneratorClassName
@@ -17,13 +17,15 @@ from sampletones_core.generators import (
     Generator,
 )
 from sampletones_core.instructions import InstructionData, InstructionT
-from sampletones_core.structures.histogram import Histogram
-from sampletones_shared.exceptions import InstructionTypeMismatchError
+from sampletones_core.structures.histogram import HistogramArray
+from sampletones_shared.exceptions import DeserializationError, InstructionTypeMismatchError
+from sampletones_shared.types.callback import Callback
 from sampletones_shared.types.data import (
     Initials,
     ReducedObject,
     SerializedData,
 )
+from sampletones_shared.utils.serialization import serialize_array
 
 
 def _instruction_library_fragment(
@@ -38,12 +40,46 @@ class InstructionLibraryFragment(DataModel, Generic[InstructionT]):
     generator_class: GeneratorClassName
     instruction_data: InstructionData[InstructionT]
     sample: CyclicArray
-    feature: Histogram
+    feature: HistogramArray
     frequency: float
 
     def __reduce__(self) -> ReducedObject:
         return (_instruction_library_fragment, (dict(self),))
 
+    @field_serializer("feature")
+    def _serialize_feature(self, feature: HistogramArray) -> SerializedData:
+        return {
+            "edges": serialize_array(feature.edges),
+            "values": serialize_array(feature.values),
+        }
+
+    def _pack_value(self, value: Any, annotation: Any, field_name: str) -> Any:
+        if annotation is HistogramArray:
+            return value.pack()
+
+        return super()._pack_value(value, annotation, field_name)
+
+    @classmethod
+    def _unpack_value(
+        cls,
+        raw: Any,
+        annotation: Any,
+        field_name: str,
+        validation: Optional[Callback] = None,
+        fast: bool = True,
+    ) -> Any:
+        if annotation is not HistogramArray:
+            return super()._unpack_value(raw, annotation, field_name, validation, fast)
+
+        if not isinstance(raw, dict):
+            raise DeserializationError(f"Expected a packed histogram for '{field_name}'")
+
+        feature = HistogramArray.unpack(raw)
+        if not fast:
+            feature.validate()
+
+        return feature
+
     @classmethod
     def create(
         cls,
@@ -52,7 +88,7 @@ class InstructionLibraryFragment(DataModel, Generic[InstructionT]):
         extractor: FeatureExtractor,
     ) -> Self:
         sample: CyclicArray = generator.generate_sample(instruction)
-        feature: Histogram = extractor.reference_feature(sample)
+        feature = extractor.reference_feature(sample)
 
         return cls(
             generator_class=generator.class_name(),
@@ -98,6 +134,11 @@ class InstructionLibraryFragment(DataModel, Generic[InstructionT]):
     def data(self) -> np.ndarray:
         return self.sample.array
 
+    @property
+    def nbytes(self) -> int:
+        """The bytes held by the fragment's sample and feature values; the feature edges are shared."""
+        return int(self.sample.array.nbytes + self.feature.values.nbytes)
+
     @property
     def empty(self) -> bool:
         return self.sample.length == 0
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+from sampletones_core.configs import InstructionsLibraryConfig
+from sampletones_core.data import Metadata
+
+
+@dataclass(frozen=True)
+class InstructionLibraryHeader:
+    """
+    What a library file says about itself ahead of its items.
+
+    Reading the header costs a few hundred bytes of the file, so a caller can validate a library
+    and tell how many instructions it holds before it pays for the items themselves.
+
+    Attributes:
+        metadata: The metadata the library was written with, already validated.
+        config: The configuration the library was generated under.
+        size: The number of instructions the library holds.
+    """
+
+    metadata: Metadata
+    config: InstructionsLibraryConfig
+    size: int
@@ -1,17 +1,29 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, ItemsView, KeysView, Optional, Self, Union, ValuesView
-
-from pydantic import BaseModel, ConfigDict, Field
+from typing import (
+    Dict,
+    ItemsView,
+    Iterator,
+    KeysView,
+    Optional,
+    Self,
+    Union,
+    ValuesView,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from sampletones_core.configs import Config
 from sampletones_core.fft import Window
+from sampletones_shared.constants.memory import BYTES_PER_MEBIBYTE
 from sampletones_shared.logger import logger
 from sampletones_shared.paths.user import LIBRARY_DIRECTORY
 
 from .data import InstructionLibraryData
 from .key import InstructionLibraryKey
+from .partials import LibraryPartials
 
 
 class InstructionLibrary(BaseModel):
@@ -25,9 +37,16 @@ class InstructionLibrary(BaseModel):
     the in-memory cache, loaded from disk on first use, and a saved library is written
     back under the library directory.
 
+    With a memory budget, the cache holds at most that many bytes of fragment arrays:
+    admitting a library evicts the least recently used ones until the rest fit. A pinned
+    key is never evicted, and neither is the library just admitted, so a single library
+    larger than the budget still loads.
+
     Attributes:
         directory: Root directory holding the library files.
-        data: The in-memory cache of loaded libraries, keyed by configuration.
+        memory_budget: Most bytes the cached libraries may occupy; unbounded when ``None``.
+        data: The in-memory cache of loaded libraries, keyed by configuration, least
+            recently used first.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -37,14 +56,26 @@ class InstructionLibrary(BaseModel):
         description="Root directory holding the instruction library files.",
         frozen=True,
     )
+    memory_budget: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Most bytes the cached libraries may occupy; unbounded when None.",
+        frozen=True,
+    )
     data: Dict[InstructionLibraryKey, InstructionLibraryData] = Field(
         default_factory=dict,
         description="Cached instruction library data, keyed by configuration.",
     )
 
+    _pins: Dict[InstructionLibraryKey, int] = PrivateAttr(default_factory=dict)
+
     def __getitem__(self, key: InstructionLibraryKey) -> InstructionLibraryData:
+        self.touch(key)
         return self.data[key]
 
+    def __contains__(self, key: object) -> bool:
+        return key in self.data
+
     @classmethod
     def from_config(cls, config: Config) -> Self:
         """Builds a library rooted at the directory named in the configuration.
@@ -88,7 +119,7 @@ class InstructionLibrary(BaseModel):
 
         key = self.create_key(config, window)
         if key in self.data:
-            return self.data[key]
+            return self[key]
 
         if self.exists(key):
             self.load_data(key)
@@ -113,6 +144,76 @@ class InstructionLibrary(BaseModel):
 
         return self.get_path(key).exists()
 
+    def store(self, key: InstructionLibraryKey, library_data: InstructionLibraryData) -> None:
+        """Caches a library as the most recently used, evicting older ones past the budget.
+
+        Args:
+            key: The key identifying the library.
+            library_data: The library to cache.
+        """
+        self.data.pop(key, None)
+        self.data[key] = library_data
+        self._evict(keep=key)
+
+    def touch(self, key: InstructionLibraryKey) -> None:
+        """Marks a cached library as the most recently used; an uncached key is ignored."""
+        if key in self.data:
+            self.data[key] = self.data.pop(key)
+
+    def evict(self, key: InstructionLibraryKey) -> bool:
+        """Drops a cached library unless it is pinned; an uncached key is ignored.
+
+        Args:
+            key: The key identifying the library.
+
+        Returns:
+            bool: Whether the library was dropped.
+        """
+        if key in self._pins or self.data.pop(key, None) is None:
+            return False
+
+        logger.info(f"Evicted library {key.filename}")
+        return True
+
+    def pin(self, key: InstructionLibraryKey) -> None:
+        """Protects a key from eviction until it is unpinned as many times as it was pinned.
+
+        A key may be pinned before its library is cached, which protects the library from
+        the moment it arrives.
+        """
+        self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, key: InstructionLibraryKey) -> None:
+        """Releases one pin on a key, evicting past the budget once nothing pins it."""
+        count = self._pins.get(key, 0) - 1
+        if count > 0:
+            self._pins[key] = count
+            return
+
+        self._pins.pop(key, None)
+        self._evict()
+
+    def is_pinned(self, key: InstructionLibraryKey) -> bool:
+        return key in self._pins
+
+    @contextmanager
+    def pinned(self, key: InstructionLibraryKey) -> Iterator[None]:
+        """Pins a key for the duration of the block.
+
+        Args:
+            key: The key to protect from eviction.
+        """
+        self.pin(key)
+        try:
+            yield
+        finally:
+            self.unpin(key)
+
+    @property
+    def nbytes(self) -> int:
+        """The bytes held by the arrays of every cached library."""
+        return sum(library_data.nbytes for library_data in self.data.values())
+
     def purge(self) -> None:
         """Empties the in-memory cache, so the next request reloads from disk."""
         self.data.clear()
@@ -146,9 +247,24 @@ class InstructionLibrary(BaseModel):
         """
         path = self.get_path(key)
         path.parent.mkdir(parents=True, exist_ok=True)
-        self.data[key] = library_data
+        self.store(key, library_data)
         library_data.save(path)
 
+    def save_partials(self, key: InstructionLibraryKey, partials: LibraryPartials) -> None:
+        """Writes a generated library to its file on disk by streaming its partials.
+
+        The library is never held in memory whole, so it is not cached; a cached library of the
+        same key is dropped, and the new one is loaded from its file when it is next requested.
+
+        Args:
+            key: The key identifying the library.
+            partials: The partials the library was generated into.
+        """
+        path = self.get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partials.assemble(path)
+        self.data.pop(key, None)
+
     def load_data(self, key: InstructionLibraryKey) -> None:
         """Loads a library from its file on disk into the cache.
 
@@ -157,4 +273,27 @@ class InstructionLibrary(BaseModel):
         """
         path = self.get_path(key)
         library_data = InstructionLibraryData.load(path)
-        self.data[key] = library_data
+        self.store(key, library_data)
+
+    def _evict(self, keep: Optional[InstructionLibraryKey] = None) -> None:
+        """Drops the least recently used unpinned libraries until the cache fits its budget.
+
+        Args:
+            keep: A key spared regardless of the budget, the library just admitted.
+        """
+        if self.memory_budget is None:
+            return
+
+        total = self.nbytes
+        for key in list(self.data):
+            if total <= self.memory_budget:
+                break
+            if key == keep or key in self._pins:
+                continue
+
+            library_data = self.data.pop(key)
+            total -= library_data.nbytes
+            logger.info(
+                f"Evicted library {key.filename} ({library_data.nbytes / BYTES_PER_MEBIBYTE:.1f} MiB) "
+                f"to keep the cache within {self.memory_budget / BYTES_PER_MEBIBYTE:.1f} MiB"
+            )
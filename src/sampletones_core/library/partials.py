@@ -0,0 +1,130 @@
+import os
+import shutil
+import tempfile
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final, Iterable, Tuple
+
+import msgpack
+
+from sampletones_core.configs import InstructionsLibraryConfig
+from sampletones_core.constants.enums import GeneratorClassName
+from sampletones_shared.application import SAMPLETONES_LIBRARY_DATA_VERSION
+from sampletones_shared.paths.extensions import EXT_FILE_LIBRARY_PARTIAL
+
+from .data import ITEMS_FIELD, InstructionLibraryData
+from .item import LibraryItem
+
+PARTIAL_CHUNK_SIZE: Final[int] = 64
+PARTIALS_DIRECTORY_SUFFIX: Final[str] = ".partial"
+TEMPORARY_SUFFIX: Final[str] = ".tmp"
+
+
+def get_partials_directory(library_path: Path) -> Path:
+    """The directory holding the partials of the library to be written to ``library_path``.
+
+    The directory sits beside the library file and is named after it and the library data
+    version, so partials are only ever resumed into the library and the format they were
+    written for.
+    """
+    name = f"{library_path.stem}_v{SAMPLETONES_LIBRARY_DATA_VERSION}{PARTIALS_DIRECTORY_SUFFIX}"
+    return library_path.with_name(name)
+
+
+def get_partial_filename(generator_class_name: GeneratorClassName, start: int, size: int) -> str:
+    """The name of the partial holding ``size`` instructions of a generator from index ``start`` on."""
+    return f"{generator_class_name}_{start:05d}_{size:05d}{EXT_FILE_LIBRARY_PARTIAL}"
+
+
+def write_partial(path: Path, items: Iterable[LibraryItem[Any]]) -> int:
+    """
+    Write library items to a partial, one after another as they are produced.
+
+    The partial holds the items packed exactly as a library file packs them, back to back, so
+    a library is assembled by copying partials into it verbatim. The items are written to a
+    temporary file moved into place once all of them are, so an existing partial is complete.
+
+    Args:
+        path: Path to the partial.
+        items: The items to write, consumed one at a time.
+
+    Returns:
+        int: The number of items written.
+    """
+    packer = msgpack.Packer(use_bin_type=True)
+    size = 0
+    handle, temporary = tempfile.mkstemp(dir=path.parent, suffix=TEMPORARY_SUFFIX)
+    try:
+        with os.fdopen(handle, "wb") as file:
+            for item in items:
+                file.write(packer.pack(item.serialize_inner()))
+                size += 1
+        os.replace(temporary, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(temporary)
+        raise
+
+    return size
+
+
+def remove_temporary_partials(directory: Path) -> None:
+    """Remove the temporary files an interrupted build left behind in a partials directory."""
+    for temporary in directory.glob(f"*{TEMPORARY_SUFFIX}"):
+        with suppress(OSError):
+            temporary.unlink()
+
+
+@dataclass(frozen=True)
+class LibraryPartials:
+    """
+    A generated library, held on disk as the partials its chunks of instructions were written to.
+
+    Attributes:
+        config: The configuration the library was generated under.
+        directory: The directory holding the partials, removed once they are assembled.
+        paths: The partials, in the order their items appear in the library.
+        size: The number of instructions across every partial.
+    """
+
+    config: InstructionsLibraryConfig
+    directory: Path
+    paths: Tuple[Path, ...]
+    size: int
+
+    def assemble(self, path: Path) -> None:
+        """
+        Write the library file by streaming the partials into it, then remove the partials.
+
+        The file is laid out as :meth:`InstructionLibraryData.save` lays it out, the fields around
+        the items packed as usual and the items copied from the partials in order, so at most a
+        buffer of one partial is held in memory. The file is written to a temporary file moved
+        into place once complete; the partials are kept if writing fails, so it can be retried.
+
+        Args:
+            path: Path to the library file.
+        """
+        fields = InstructionLibraryData(config=self.config, items=[]).serialize_inner()
+        packer = msgpack.Packer(use_bin_type=True)
+        handle, temporary = tempfile.mkstemp(dir=path.parent, suffix=TEMPORARY_SUFFIX)
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(packer.pack_map_header(len(fields)))
+                for name, value in fields.items():
+                    file.write(packer.pack(name))
+                    if name != ITEMS_FIELD:
+                        file.write(packer.pack(value))
+                        continue
+
+                    file.write(packer.pack_array_header(self.size))
+                    for partial in self.paths:
+                        with open(partial, "rb") as source:
+                            shutil.copyfileobj(source, file)
+            os.replace(temporary, path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(temporary)
+            raise
+
+        shutil.rmtree(self.directory, ignore_errors=True)
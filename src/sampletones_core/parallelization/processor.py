@@ -2,9 +2,7 @@ import multiprocessing
 import threading
 from abc import ABC, abstractmethod
 from concurrent.futures._base import CancelledError
-from typing import Any, Callable, Final, Generic, List, Optional, TypeVar, Union
-
-from pebble import ProcessMapFuture, ProcessPool
+from typing import TYPE_CHECKING, Any, Callable, Final, Generic, List, Optional, TypeVar, Union
 
 from sampletones_core.constants.algorithm import MAX_WORKERS
 from sampletones_core.parallelization.task import (
@@ -16,6 +14,9 @@ from sampletones_shared.logger import logger as default_logger
 from sampletones_shared.types.callback import Callback, VoidCallback
 from sampletones_shared.utils.callbacks import CallbackMixin
 
+if TYPE_CHECKING:
+    from pebble import ProcessMapFuture, ProcessPool
+
 T = TypeVar("T")
 
 CANCEL_TIMEOUT: Final[float] = 5.0
@@ -29,8 +30,8 @@ class TaskProcessor(ABC, CallbackMixin, Generic[T]):
         logger: LoggerProtocol = default_logger,
     ) -> None:
         self.max_workers: int = max_workers or MAX_WORKERS
-        self.pool: Optional[ProcessPool] = None
-        self.future: Optional[ProcessMapFuture] = None
+        self.pool: Optional["ProcessPool"] = None
+        self.future: Optional["ProcessMapFuture"] = None
         self.monitor_thread: Optional[threading.Thread] = None
         self.logger = logger
 
@@ -128,6 +129,9 @@ class TaskProcessor(ABC, CallbackMixin, Generic[T]):
     @abstractmethod
     def _process_results(self, results: List[T]) -> Any: ...
 
+    def _on_result(self, result: Any) -> None:
+        """Handles one task's result on the monitor thread as it arrives, in task order."""
+
     def _reset_status(self) -> None:
         self.status = TaskStatus.PENDING
         self.running = False
@@ -151,6 +155,8 @@ class TaskProcessor(ABC, CallbackMixin, Generic[T]):
         self.logger.info("Starting processing tasks...")
         self._notify_progress()
 
+        from pebble import ProcessPool
+
         workers = self.max_workers
         context = multiprocessing.get_context("spawn")
         self.pool = ProcessPool(max_workers=workers, context=context)
@@ -171,6 +177,7 @@ class TaskProcessor(ABC, CallbackMixin, Generic[T]):
 
                 result = next(iterator)
                 results.append(result)
+                self._on_result(result)
                 self.completed_tasks += 1
                 self._notify_progress()
         except StopIteration:
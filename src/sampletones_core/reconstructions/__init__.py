@@ -1,5 +1,7 @@
+from .cache import ReconstructionCache, reconstruction_config_hash
 from .criterion import Criterion
 from .reconstruction.reconstruction import Reconstruction
+from .reconstructor.analysis import SharedAnalysis
 from .reconstructor.approximation import ApproximationData
 from .reconstructor.candidates import CandidateProvider
 from .reconstructor.phase import (
@@ -7,7 +9,13 @@ from .reconstructor.phase import (
     PhaseAligner,
     SlidingRmsePhaseAligner,
 )
-from .reconstructor.reconstructor import Reconstructor
+from .reconstructor.profile import (
+    ProfileCounter,
+    ProfileStage,
+    ReconstructionProfile,
+    format_profiles,
+)
+from .reconstructor.reconstructor import Reconstructor, reconstruct_shared
 from .reconstructor.scorer import Scorer
 from .reconstructor.selector import GreedySelector, Selector, ViterbiSelector
 from .reconstructor.state import (
@@ -24,12 +32,20 @@ __all__ = [
     "FragmentReconstructionState",
     "GreedySelector",
     "PhaseAligner",
+    "ProfileCounter",
+    "ProfileStage",
     "Reconstruction",
+    "ReconstructionCache",
+    "ReconstructionProfile",
     "ReconstructionState",
     "Reconstructor",
     "ReconstructorWorker",
     "Scorer",
     "Selector",
+    "SharedAnalysis",
     "SlidingRmsePhaseAligner",
     "ViterbiSelector",
+    "format_profiles",
+    "reconstruct_shared",
+    "reconstruction_config_hash",
 ]
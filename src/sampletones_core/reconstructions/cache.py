@@ -0,0 +1,190 @@
+import hashlib
+import os
+import tempfile
+import threading
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Final, FrozenSet, List, Optional, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+from sampletones_core.configs import Config
+from sampletones_shared.application import SAMPLETONES_VERSION
+from sampletones_shared.constants.memory import BYTES_PER_MEBIBYTE
+from sampletones_shared.exceptions import SampleToNESError
+from sampletones_shared.logger import logger
+from sampletones_shared.paths.extensions import EXT_FILE_RECONSTRUCTION
+from sampletones_shared.paths.user import RECONSTRUCTION_CACHE_DIRECTORY
+from sampletones_shared.utils.serialization import calculate_hash, dump
+
+from .reconstruction.reconstruction import Reconstruction
+
+DEFAULT_RECONSTRUCTION_CACHE_SIZE: Final[int] = 1024
+EVICTION_TARGET: Final[float] = 0.75
+RUNTIME_FIELDS: Final[FrozenSet[str]] = frozenset({"max_workers", "library_directory", "reconstructions_directory"})
+
+_usage: Dict[Path, int] = {}
+_usage_lock = threading.Lock()
+
+
+def reconstruction_config_hash(config: Config) -> str:
+    """
+    Hash of the configuration settings a reconstruction depends on.
+
+    Worker counts and directories leave the result unchanged, so they are left out.
+
+    Args:
+        config: The reconstruction configuration.
+
+    Returns:
+        Hexadecimal hash of the library, generation and general settings.
+    """
+    settings = [
+        config.library.model_dump(mode="json"),
+        config.generation.model_dump(mode="json"),
+        config.general.model_dump(mode="json", exclude=set(RUNTIME_FIELDS)),
+    ]
+    return calculate_hash(dump(settings))
+
+
+@dataclass(frozen=True)
+class ReconstructionCache:
+    """
+    Content-addressed store of finished reconstructions on local disk.
+
+    An entry is keyed by the decoded, preconditioned audio, the configuration settings the
+    result depends on, and the application version, so converting the same sound again
+    under the same settings reads the stored reconstruction instead of matching it anew,
+    whatever file it came from. Entries are written atomically and may be shared by
+    several processes. Each read refreshes an entry's modification time, and once the
+    entries exceed ``max_bytes`` the least recently used are removed until they fill
+    ``EVICTION_TARGET`` of it.
+
+    The directory is scanned once per process and the bytes written since are counted in
+    memory, so a write only scans the directory again when the count crosses ``max_bytes``.
+    Entries written by another process are seen at that scan.
+
+    Attributes:
+        directory: Where the entries are kept.
+        max_bytes: Most bytes the entries may occupy.
+    """
+
+    directory: Path = RECONSTRUCTION_CACHE_DIRECTORY
+    max_bytes: int = DEFAULT_RECONSTRUCTION_CACHE_SIZE * BYTES_PER_MEBIBYTE
+
+    def key(self, audio: np.ndarray, config: Config) -> str:
+        """
+        Cache key of prepared audio reconstructed under a configuration.
+
+        Args:
+            audio: The prepared audio, as `Reconstructor.load_audio` returns it.
+            config: The reconstruction configuration.
+
+        Returns:
+            Hexadecimal key of the entry.
+        """
+        samples = np.ascontiguousarray(audio)
+        digest = hashlib.sha256()
+        digest.update(f"{samples.dtype.str}{samples.shape}".encode("utf-8"))
+        digest.update(samples.tobytes())
+        return calculate_hash(dump([digest.hexdigest(), reconstruction_config_hash(config), SAMPLETONES_VERSION]))
+
+    def get(self, key: str, config: Config, path: Path) -> Optional[Reconstruction]:
+        """
+        Read a stored reconstruction, attributed to the file and configuration asking for it.
+
+        Args:
+            key: The entry's key.
+            config: The configuration the caller reconstructs under.
+            path: The audio file the caller reconstructs.
+
+        Returns:
+            A fresh copy of the stored reconstruction, or None when there is no usable entry.
+        """
+        entry = self._entry_path(key)
+        try:
+            reconstruction = Reconstruction.load(entry)
+        except FileNotFoundError:
+            return None
+        except SampleToNESError as exception:
+            logger.warning(f"Discarding unreadable cached reconstruction {entry.name}: {exception}")
+            with suppress(OSError):
+                entry.unlink()
+            return None
+
+        with suppress(OSError):
+            os.utime(entry)
+
+        return reconstruction.model_copy(update={"id": uuid4().hex, "audio_filepath": path, "config": config})
+
+    def put(self, key: str, reconstruction: Reconstruction) -> None:
+        """
+        Store a reconstruction and trim the cache to its size cap.
+
+        Args:
+            key: The entry's key.
+            reconstruction: The reconstruction to store.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = self._entry_path(key)
+        replaced = 0
+        with suppress(OSError):
+            replaced = entry.stat().st_size
+
+        data = reconstruction.serialize()
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(data)
+            os.replace(temporary, entry)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(temporary)
+            raise
+
+        with _usage_lock:
+            total = _usage.get(self.directory)
+            if total is not None:
+                total += len(data) - replaced
+                _usage[self.directory] = total
+
+        if total is None or total > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Scan the entries and, past ``max_bytes``, remove the least recently used down to the target."""
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+        if total > self.max_bytes:
+            target = int(self.max_bytes * EVICTION_TARGET)
+            for _, entry, size in sorted(entries):
+                if total <= target:
+                    break
+
+                with suppress(OSError):
+                    entry.unlink()
+                total -= size
+
+        with _usage_lock:
+            _usage[self.directory] = total
+
+    @property
+    def nbytes(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def _entries(self) -> List[Tuple[int, Path, int]]:
+        if not self.directory.exists():
+            return []
+
+        entries: List[Tuple[int, Path, int]] = []
+        for entry in self.directory.glob(f"*{EXT_FILE_RECONSTRUCTION}"):
+            with suppress(OSError):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, entry, stat.st_size))
+
+        return entries
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}{EXT_FILE_RECONSTRUCTION}"
@@ -1,5 +1,12 @@
-from .conversion import reconstruct_file
+from .conversion import reconstruct_file, reconstruct_file_recorded, reconstruct_file_shared
 from .converter import ReconstructionConverter
+from .manifest import (
+    MANIFEST_FILENAME,
+    ConversionOutcome,
+    ConversionStatus,
+    ManifestEntry,
+    ReconstructionManifest,
+)
 from .paths.fields import ConfigDirectoryFields
 from .paths.utils import (
     filter_files,
@@ -7,13 +14,22 @@ from .paths.utils import (
     get_output_path,
     get_relative_path,
 )
+from .shared import SharedReconstructionConverter
 
 __all__ = [
+    "MANIFEST_FILENAME",
     "ConfigDirectoryFields",
+    "ConversionOutcome",
+    "ConversionStatus",
+    "ManifestEntry",
     "ReconstructionConverter",
+    "ReconstructionManifest",
+    "SharedReconstructionConverter",
     "filter_files",
     "get_audio_files",
     "get_output_path",
     "get_relative_path",
     "reconstruct_file",
+    "reconstruct_file_recorded",
+    "reconstruct_file_shared",
 ]
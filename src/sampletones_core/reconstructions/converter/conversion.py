@@ -1,15 +1,98 @@
 import gc
+import time
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Sequence, Tuple
 
 from sampletones_shared.exceptions import UnsupportedAudioFormatError
 from sampletones_shared.logger import logger
 
-from ..reconstructor.reconstructor import Reconstructor
+from ..reconstructor.profile import ReconstructionProfile
+from ..reconstructor.reconstructor import Reconstructor, reconstruct_shared
+from .manifest import ConversionOutcome, ConversionStatus
 
 
 def reconstruct_file(arguments: Tuple[Reconstructor, Path, Path]) -> Path:
     reconstructor, input_path, output_path = arguments
+    try:
+        _reconstruct(reconstructor, input_path, output_path)
+    except UnsupportedAudioFormatError:
+        logger.warning(f"Skipping file due to unsupported audio format: {input_path}")
+
+    return output_path
+
+
+def reconstruct_file_recorded(arguments: Tuple[Reconstructor, Path, Path]) -> ConversionOutcome:
+    """
+    Reconstruct one file of a batch and report how it went rather than raising.
+
+    A failing file is reported with its error so the batch carries on and a later run
+    can retry it; only an interrupt propagates. A reconstructed file carries the
+    reconstructor's profile of the run.
+
+    Args:
+        arguments: The reconstructor, the input file and the output path.
+
+    Returns:
+        The file's outcome with the time spent on it.
+    """
+    reconstructor, input_path, output_path = arguments
+    start = time.perf_counter()
+    profile: Optional[ReconstructionProfile] = None
+    try:
+        _reconstruct(reconstructor, input_path, output_path)
+        status, error, profile = ConversionStatus.COMPLETED, None, reconstructor.profile
+    except UnsupportedAudioFormatError:
+        logger.warning(f"Skipping file due to unsupported audio format: {input_path}")
+        status, error = ConversionStatus.UNSUPPORTED, None
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        logger.error_with_traceback(exception, f"Failed to reconstruct {input_path}: {exception}")
+        status, error = ConversionStatus.FAILED, f"{type(exception).__name__}: {exception}"
+
+    return ConversionOutcome(
+        input_path=input_path,
+        output_path=output_path,
+        status=status,
+        seconds=time.perf_counter() - start,
+        error=error,
+        profile=profile,
+    )
+
+
+def reconstruct_file_shared(
+    arguments: Tuple[Sequence[Reconstructor], Path, Sequence[Path]],
+) -> Tuple[Path, ...]:
+    """
+    Reconstruct one file of a batch under several configurations, sharing its analysis.
+
+    Args:
+        arguments: The reconstructors, one per configuration, the input file, and the
+            output path of each reconstructor, in the same order.
+
+    Returns:
+        The output paths.
+    """
+    reconstructors, input_path, output_paths = arguments
+    for output_path in output_paths:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        reconstructions = reconstruct_shared(reconstructors, input_path)
+        for reconstruction, output_path in zip(reconstructions, output_paths):
+            if reconstruction is not None:
+                reconstruction.save(output_path)
+        del reconstructions
+    except UnsupportedAudioFormatError:
+        logger.warning(f"Skipping file due to unsupported audio format: {input_path}")
+    except KeyboardInterrupt:
+        logger.info("Reconstruction interrupted by user.")
+        raise
+    finally:
+        gc.collect()
+
+    return tuple(output_paths)
+
+
+def _reconstruct(reconstructor: Reconstructor, input_path: Path, output_path: Path) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     reconstruction = None
     try:
@@ -20,9 +103,5 @@ def reconstruct_file(arguments: Tuple[Reconstructor, Path, Path]) -> Path:
     except KeyboardInterrupt:
         logger.info("Reconstruction interrupted by user.")
         raise
-    except UnsupportedAudioFormatError:
-        logger.warning(f"Skipping file due to unsupported audio format: {input_path}")
     finally:
         gc.collect()
-
-    return output_path
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from sampletones_core.configs import Config
 from sampletones_core.parallelization import TaskProcessor
@@ -7,8 +7,16 @@ from sampletones_shared.exceptions import NoFilesToProcessError
 from sampletones_shared.logger import LoggerProtocol
 from sampletones_shared.logger import logger as default_logger
 
+from ..cache import ReconstructionCache, reconstruction_config_hash
+from ..reconstructor.profile import ReconstructionProfile
 from ..reconstructor.reconstructor import Reconstructor
-from .conversion import reconstruct_file
+from .conversion import reconstruct_file, reconstruct_file_recorded
+from .manifest import (
+    ConversionOutcome,
+    ConversionStatus,
+    ReconstructionManifest,
+    manifest_key,
+)
 from .paths import (
     filter_files,
     get_audio_files,
@@ -18,20 +26,44 @@ from .paths import (
 
 
 class ReconstructionConverter(TaskProcessor[Path]):
+    """Reconstructs a file, or every audio file under a directory, on a process pool.
+
+    Given a :class:`ReconstructionCache`, every worker reads a sound converted before under
+    the same settings from the cache instead of reconstructing it again.
+
+    A directory batch can keep a manifest in its output directory: each finished file is
+    recorded with its fingerprint, the configuration hash and the time it took, and a failing
+    file is recorded rather than stopping the batch. Resuming consults the manifest in place of
+    the output files, so only files that are new, changed, failed, or were reconstructed under
+    another configuration run again. The workers hand back each file's
+    :class:`ReconstructionProfile`, collected in :attr:`profiles` by input path.
+    """
+
     def __init__(
         self,
         config: Config,
         input_path: Path,
         is_file: bool,
         logger: LoggerProtocol = default_logger,
+        *,
+        manifest: bool = False,
+        resume: bool = False,
+        cache: Optional[ReconstructionCache] = None,
     ) -> None:
         super().__init__(max_workers=config.general.max_workers, logger=logger)
         self.config = config.model_copy()
         self.input_path: Path = input_path
         self.is_file: bool = is_file
         self.audio_files: List[Path] = []
+        self.use_manifest: bool = (manifest or resume) and not is_file
+        self.resume: bool = resume and not is_file
+        self.manifest: Optional[ReconstructionManifest] = None
+        self.skipped_files: int = 0
+        self.cache: Optional[ReconstructionCache] = cache
+        self.profiles: Dict[Path, ReconstructionProfile] = {}
 
         self.current_file: Optional[str] = None
+        self._config_hash: str = reconstruction_config_hash(self.config)
 
     def start(self) -> None:
         if self.running:
@@ -41,29 +73,64 @@ class ReconstructionConverter(TaskProcessor[Path]):
         super().start()
 
     def _create_tasks(self) -> List[Any]:
-        reconstructor = Reconstructor(self.config)
+        self.profiles.clear()
+        reconstructor = Reconstructor(self.config, cache=self.cache)
         output_path = get_output_path(self.config, self.input_path)
 
         if self.is_file:
             return [(reconstructor, self.input_path, output_path)]
 
-        self.audio_files = get_audio_files(self.input_path)
-        self.audio_files = filter_files(self.audio_files, self.input_path, output_path)
+        audio_files = get_audio_files(self.input_path)
+        if self.use_manifest:
+            self.manifest = ReconstructionManifest.for_output(output_path)
+
+        if self.resume:
+            self.audio_files = self._pending_files(audio_files, output_path)
+        else:
+            self.audio_files = filter_files(audio_files, self.input_path, output_path)
 
+        self.skipped_files = len(audio_files) - len(self.audio_files)
         arguments: List[Tuple[Reconstructor, Path, Path]] = []
         for audio_file in self.audio_files:
             target_path = get_relative_path(self.input_path, audio_file, output_path)
             arguments.append((reconstructor, audio_file, target_path))
 
-        if not arguments:
+        if not arguments and not (self.resume and audio_files):
             raise NoFilesToProcessError(f"No audio files found in {self.input_path}")
 
         return arguments
 
+    def _pending_files(self, audio_files: List[Path], output_path: Path) -> List[Path]:
+        assert self.manifest is not None, "Resuming requires a manifest"
+        return [
+            audio_file
+            for audio_file in audio_files
+            if not self.manifest.is_current(
+                audio_file,
+                manifest_key(self.input_path, audio_file),
+                get_relative_path(self.input_path, audio_file, output_path),
+                self._config_hash,
+            )
+        ]
+
     def _get_task_function(
         self,
-    ) -> Callable[[Tuple[Reconstructor, Path, Path]], Path]:
-        return reconstruct_file
+    ) -> Callable[[Tuple[Reconstructor, Path, Path]], Union[Path, ConversionOutcome]]:
+        return reconstruct_file_recorded if self.use_manifest else reconstruct_file
+
+    def _on_result(self, result: Union[Path, ConversionOutcome]) -> None:
+        if not isinstance(result, ConversionOutcome):
+            return
+
+        if result.profile is not None:
+            self.profiles[result.input_path] = result.profile
+
+        if self.manifest is None:
+            return
+
+        self.manifest.record(result, manifest_key(self.input_path, result.input_path), self._config_hash)
+        if result.status == ConversionStatus.FAILED:
+            self.logger.warning(f"Reconstruction of {result.input_path} failed: {result.error}")
 
     def _process_results(self, results: List[Path]) -> Path:
         if self.is_file:
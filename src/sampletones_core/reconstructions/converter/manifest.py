@@ -0,0 +1,215 @@
+import hashlib
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Dict, Final, List, Optional, Self
+
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from sampletones_shared.logger import logger
+from sampletones_shared.utils.serialization import HASH_LENGTH
+
+from ..reconstructor.profile import ReconstructionProfile
+
+MANIFEST_FILENAME: Final[str] = "manifest.jsonl"
+CONTENT_HASH_CHUNK_SIZE: Final[int] = 1 << 20
+
+
+class ConversionStatus(StrEnum):
+    COMPLETED = "completed"
+    UNSUPPORTED = "unsupported"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ConversionOutcome:
+    """
+    What reconstructing one file of a batch came to, as a worker reports it.
+
+    Attributes:
+        input_path: The audio file reconstructed.
+        output_path: Where the reconstruction was written.
+        status: Whether the file was reconstructed, unreadable, or failed.
+        seconds: Time the worker spent on the file.
+        error: The failure, when the file failed.
+        profile: Where the reconstruction spent its time, when the file was reconstructed.
+    """
+
+    input_path: Path
+    output_path: Path
+    status: ConversionStatus
+    seconds: float
+    error: Optional[str] = None
+    profile: Optional[ReconstructionProfile] = None
+
+
+class FileFingerprint(BaseModel):
+    """
+    Identity of an input file's contents.
+
+    Attributes:
+        size: File size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+        content_hash: Hash of the file's bytes.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    size: int
+    mtime_ns: int
+    content_hash: str
+
+
+class ManifestEntry(BaseModel):
+    """
+    One line of a batch manifest: what became of an input file under a configuration.
+
+    Attributes:
+        input: The input path relative to the batch's input directory, in POSIX form.
+        fingerprint: The input's identity when it was reconstructed.
+        config_hash: Hash of the configuration settings the reconstruction depends on.
+        status: Whether the file was reconstructed, unreadable, or failed.
+        seconds: Time the worker spent on the file.
+        error: The failure, when the file failed.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    input: str
+    fingerprint: FileFingerprint
+    config_hash: str
+    status: ConversionStatus
+    seconds: float
+    error: Optional[str] = None
+
+
+class ReconstructionManifest:
+    """
+    Append-only record of a batch reconstruction, kept as JSON lines in the output directory.
+
+    Every finished file appends an entry, so an interrupted batch loses at most the files
+    in flight. On loading, the last entry of each input wins and a truncated last line is
+    ignored. A file is current when its latest entry completed (or found the format
+    unsupported) under the same configuration hash, its fingerprint still matches, and its
+    reconstruction is still on disk. Fingerprints reuse the recorded content hash while a
+    file's size and modification time are unchanged, so checking an unchanged tree reads
+    no audio.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: Dict[str, ManifestEntry] = {}
+        self._fingerprints: Dict[Path, FileFingerprint] = {}
+
+    @classmethod
+    def for_output(cls, output_directory: Path) -> Self:
+        manifest = cls(output_directory / MANIFEST_FILENAME)
+        manifest.load()
+        return manifest
+
+    def load(self) -> None:
+        self._entries.clear()
+        if not self.path.exists():
+            return
+
+        with self.path.open("r", encoding="utf-8") as file:
+            for number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    entry = ManifestEntry.model_validate_json(line)
+                except ValidationError:
+                    logger.warning(f"Ignoring malformed line {number} of {self.path}")
+                    continue
+
+                self._entries[entry.input] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[ManifestEntry]:
+        return self._entries.get(key)
+
+    def fingerprint(self, input_path: Path, key: str) -> FileFingerprint:
+        """
+        Fingerprint an input file, hashing its contents only when its size or modification time changed.
+
+        Args:
+            input_path: The input file.
+            key: The file's manifest key.
+
+        Returns:
+            The file's fingerprint.
+        """
+        cached = self._fingerprints.get(input_path)
+        if cached is not None:
+            return cached
+
+        stat = input_path.stat()
+        entry = self._entries.get(key)
+        if entry is not None and (entry.fingerprint.size, entry.fingerprint.mtime_ns) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            content_hash = entry.fingerprint.content_hash
+        else:
+            content_hash = hash_file(input_path)
+
+        fingerprint = FileFingerprint(size=stat.st_size, mtime_ns=stat.st_mtime_ns, content_hash=content_hash)
+        self._fingerprints[input_path] = fingerprint
+        return fingerprint
+
+    def is_current(self, input_path: Path, key: str, output_path: Path, config_hash: str) -> bool:
+        entry = self._entries.get(key)
+        if entry is None or entry.config_hash != config_hash or entry.status == ConversionStatus.FAILED:
+            return False
+
+        if entry.status == ConversionStatus.COMPLETED and not output_path.exists():
+            return False
+
+        fingerprint = self.fingerprint(input_path, key)
+        return fingerprint.content_hash == entry.fingerprint.content_hash
+
+    def record(self, outcome: ConversionOutcome, key: str, config_hash: str) -> ManifestEntry:
+        """
+        Append the outcome of one file to the manifest.
+
+        Args:
+            outcome: What reconstructing the file came to.
+            key: The file's manifest key.
+            config_hash: Hash of the configuration the file was reconstructed under.
+
+        Returns:
+            The entry written.
+        """
+        entry = ManifestEntry(
+            input=key,
+            fingerprint=self.fingerprint(outcome.input_path, key),
+            config_hash=config_hash,
+            status=outcome.status,
+            seconds=outcome.seconds,
+            error=outcome.error,
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(entry.model_dump_json() + "\n")
+
+        self._entries[key] = entry
+        return entry
+
+    def failed(self) -> List[ManifestEntry]:
+        return [entry for entry in self._entries.values() if entry.status == ConversionStatus.FAILED]
+
+
+def manifest_key(base_directory: Path, input_path: Path) -> str:
+    return input_path.relative_to(base_directory).as_posix()
+
+
+def hash_file(path: Path, length: int = HASH_LENGTH) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(CONTENT_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+
+    return digest.hexdigest()[:length]
@@ -0,0 +1,99 @@
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from sampletones_core.configs import Config
+from sampletones_core.parallelization import TaskProcessor
+from sampletones_shared.exceptions import NoFilesToProcessError
+from sampletones_shared.logger import LoggerProtocol
+from sampletones_shared.logger import logger as default_logger
+
+from ..cache import ReconstructionCache
+from ..reconstructor.reconstructor import Reconstructor
+from .conversion import reconstruct_file_shared
+from .paths import get_audio_files, get_output_path, get_relative_path
+
+SharedConversionTask = Tuple[Tuple[Reconstructor, ...], Path, Tuple[Path, ...]]
+
+
+class SharedReconstructionConverter(TaskProcessor[Path]):
+    """Reconstructs a file, or every audio file under a directory, under several configurations.
+
+    Each file is one task: a worker decodes it once and runs every configuration over it
+    through :func:`reconstruct_shared`, so the stages the configurations agree on are
+    computed once per file rather than once per configuration. Every configuration writes
+    to its own configuration directory, as a run under that configuration alone would, and
+    a file is only reconstructed under the configurations whose output is missing.
+    """
+
+    def __init__(
+        self,
+        configs: Sequence[Config],
+        input_path: Path,
+        is_file: bool,
+        logger: LoggerProtocol = default_logger,
+        *,
+        cache: Optional[ReconstructionCache] = None,
+    ) -> None:
+        if not configs:
+            raise ValueError("At least one configuration is required")
+
+        super().__init__(max_workers=configs[0].general.max_workers, logger=logger)
+        self.configs: List[Config] = [config.model_copy() for config in configs]
+        self.input_path: Path = input_path
+        self.is_file: bool = is_file
+        self.audio_files: List[Path] = []
+        self.skipped_files: int = 0
+        self.cache: Optional[ReconstructionCache] = cache
+
+        self.current_file: Optional[str] = None
+
+    def start(self) -> None:
+        if self.running:
+            self.logger.warning("Reconstruction is already running")
+            return
+
+        super().start()
+
+    def _create_tasks(self) -> List[Any]:
+        output_paths = [get_output_path(config, self.input_path) for config in self.configs]
+        if len(set(output_paths)) < len(output_paths):
+            raise ValueError("Two of the configurations write their reconstructions to the same directory")
+
+        reconstructors = [Reconstructor(config, cache=self.cache) for config in self.configs]
+        if self.is_file:
+            return [(tuple(reconstructors), self.input_path, tuple(output_paths))]
+
+        audio_files = get_audio_files(self.input_path)
+        tasks: List[SharedConversionTask] = []
+        self.audio_files = []
+        for audio_file in audio_files:
+            pending_reconstructors: List[Reconstructor] = []
+            target_paths: List[Path] = []
+            for reconstructor, output_path in zip(reconstructors, output_paths):
+                target_path = get_relative_path(self.input_path, audio_file, output_path)
+                if not target_path.exists():
+                    pending_reconstructors.append(reconstructor)
+                    target_paths.append(target_path)
+
+            if pending_reconstructors:
+                self.audio_files.append(audio_file)
+                tasks.append((tuple(pending_reconstructors), audio_file, tuple(target_paths)))
+
+        self.skipped_files = len(audio_files) - len(self.audio_files)
+        if not audio_files:
+            raise NoFilesToProcessError(f"No audio files found in {self.input_path}")
+
+        return tasks
+
+    def _get_task_function(self) -> Callable[[SharedConversionTask], Tuple[Path, ...]]:
+        return reconstruct_file_shared
+
+    def _process_results(self, results: List[Any]) -> Path:
+        return self.input_path
+
+    def _notify_progress(self) -> None:
+        if self.completed_tasks > 0 and self.completed_tasks <= len(self.audio_files):
+            self.current_file = str(self.audio_files[self.completed_tasks - 1])
+            self.current_item = self.current_file
+
+        super()._notify_progress()
@@ -3,7 +3,7 @@ from typing import Tuple, Union
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import SpectralDistance
 from sampletones_core.fft import Window
-from sampletones_core.structures.histogram import Histogram
+from sampletones_core.structures.histogram import HistogramClasses, HistogramLike
 from sampletones_shared.array import xp
 
 from .spectral import calculate_spectral_loss
@@ -34,8 +34,8 @@ class Criterion:
 
     def spectral_loss(
         self,
-        feature: Union[xp.ndarray, Histogram],
-        approximation_feature: Union[xp.ndarray, Histogram],
+        feature: Union[xp.ndarray, HistogramLike],
+        approximation_feature: Union[xp.ndarray, HistogramLike],
     ) -> xp.ndarray:
         """
         Weighted spectral distance between the target feature and candidate features.
@@ -88,8 +88,8 @@ class Criterion:
         return self.alpha * spectral_loss + self.beta * temporal_loss
 
 
-def _feature_values(feature: Union[xp.ndarray, Histogram]) -> xp.ndarray:
-    if isinstance(feature, Histogram):
+def _feature_values(feature: Union[xp.ndarray, HistogramLike]) -> xp.ndarray:
+    if isinstance(feature, HistogramClasses):
         return feature.values
 
     return feature
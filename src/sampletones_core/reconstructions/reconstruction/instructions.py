@@ -1,13 +1,28 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+from typing import Any, Iterable, List, Optional, Sequence, Union
 
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, field_serializer
 
-from sampletones_core.constants.enums import FeatureKey, GeneratorName
+from sampletones_core.constants.enums import FeatureKey, GeneratorName, InstructionClassName
 from sampletones_core.data import DataModel
 from sampletones_core.features import resting_held_features, resting_reference
-from sampletones_core.instructions import InstructionData, InstructionUnion
+from sampletones_core.generators.maps import GENERATOR_CLASSES, GENERATOR_TO_INSTRUCTION_MAP
+from sampletones_core.instructions import (
+    InstructionArray,
+    InstructionData,
+    InstructionUnion,
+    as_instruction_array,
+)
+from sampletones_shared.exceptions import DeserializationError
+from sampletones_shared.types.callback import Callback
+from sampletones_shared.types.data import SerializedData
+from sampletones_shared.utils.serialization import serialize_array
+
+
+def generator_instruction_class(generator_name: GeneratorName) -> InstructionClassName:
+    """The instruction type a channel's stream carries."""
+    return GENERATOR_TO_INSTRUCTION_MAP[GENERATOR_CLASSES[generator_name]].class_name()
 
 
 class InstructionsItem(DataModel):
@@ -17,9 +32,9 @@ class InstructionsItem(DataModel):
         ...,
         description="Name of the generator",
     )
-    instructions: List[InstructionData[InstructionUnion]] = Field(
+    instructions: InstructionArray = Field(
         ...,
-        description="List of instruction data for the generator",
+        description="Per-frame instructions for the generator, one row per frame",
     )
     initial_pitch: int = Field(
         ...,
@@ -34,19 +49,13 @@ class InstructionsItem(DataModel):
     def create(
         cls,
         generator_name: GeneratorName,
-        instructions: List[InstructionUnion],
+        instructions: Union[InstructionArray, Sequence[InstructionUnion]],
         initial_pitch: int,
         held_features: Iterable[FeatureKey],
     ) -> InstructionsItem:
         return InstructionsItem(
             generator_name=generator_name,
-            instructions=[
-                InstructionData(
-                    instruction_class=instruction.class_name(),
-                    instruction=instruction,
-                )
-                for instruction in instructions
-            ],
+            instructions=as_instruction_array(generator_instruction_class(generator_name), instructions),
             initial_pitch=initial_pitch,
             held_features=list(held_features),
         )
@@ -73,3 +82,68 @@ class InstructionsItem(DataModel):
             initial_pitch=resting_reference(generator_name),
             held_features=resting_held_features(generator_name),
         )
+
+    @field_serializer("instructions")
+    def _serialize_instructions(
+        self,
+        instructions: InstructionArray,
+        _info: Any,
+    ) -> SerializedData:
+        return {
+            "instruction_class": str(instructions.instruction_class),
+            **serialize_array(instructions.values),
+        }
+
+    def _pack_value(self, value: Any, annotation: Any, field_name: str) -> Any:
+        if annotation is InstructionArray:
+            return value.pack()
+
+        return super()._pack_value(value, annotation, field_name)
+
+    @classmethod
+    def _unpack_value(
+        cls,
+        raw: Any,
+        annotation: Any,
+        field_name: str,
+        validation: Optional[Callback] = None,
+        fast: bool = True,
+    ) -> Any:
+        if annotation is not InstructionArray:
+            return super()._unpack_value(raw, annotation, field_name, validation, fast)
+
+        if not isinstance(raw, dict):
+            raise DeserializationError(f"Expected a packed instruction stream for '{field_name}'")
+
+        instructions = InstructionArray.unpack(raw)
+        if not fast:
+            instructions.validate()
+
+        return instructions
+
+    @classmethod
+    def deserialize_inner(
+        cls,
+        data: SerializedData,
+        validation: Optional[Callback] = None,
+        fast: bool = True,
+    ) -> InstructionsItem:
+        raw = data.get("instructions")
+        if isinstance(raw, list):
+            data = {**data, "instructions": cls._pack_legacy_instructions(data, raw, validation, fast)}
+
+        return super().deserialize_inner(data, validation, fast)
+
+    @staticmethod
+    def _pack_legacy_instructions(
+        data: SerializedData,
+        raw: List[SerializedData],
+        validation: Optional[Callback],
+        fast: bool,
+    ) -> SerializedData:
+        """Reads a stream stored one tagged instruction per frame, as files before the columnar layout did."""
+        generator_name = GeneratorName(DataModel._deserialize_string(data["generator_name"], str))
+        instructions: List[InstructionUnion] = [
+            InstructionData.deserialize_inner(item, validation, fast).instruction for item in raw
+        ]
+        return InstructionArray.from_instructions(generator_instruction_class(generator_name), instructions).pack()
@@ -18,21 +18,23 @@ from typing import (
 from uuid import uuid4
 
 import numpy as np
-from pydantic import ConfigDict, Field, ValidationError, field_serializer
+from pydantic import ConfigDict, Field, PrivateAttr, ValidationError, field_serializer
 
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import FeatureKey, GeneratorName
 from sampletones_core.data import DataModel, Metadata, MetadataContract
 from sampletones_core.exporters import (
-    GENERATOR_NAME_TO_EXPORTER_MAP,
     INSTRUCTION_TO_EXPORTER_MAP,
     ExporterTypeUnion,
     ExporterUnion,
     Features,
 )
 from sampletones_core.generators.maps import GENERATOR_CLASSES
-from sampletones_core.instructions import InstructionUnion
-from sampletones_shared.application import SAMPLETONES_RECONSTRUCTION_DATA_VERSION
+from sampletones_core.instructions import InstructionArray, InstructionUnion
+from sampletones_shared.application import (
+    SAMPLETONES_RECONSTRUCTION_DATA_VERSION,
+    SAMPLETONES_RECONSTRUCTION_READABLE_VERSIONS,
+)
 from sampletones_shared.exceptions import (
     IncompatibleReconstructionVersionError,
     InvalidReconstructionValuesError,
@@ -48,12 +50,14 @@ from sampletones_shared.utils.serialization import load_binary, serialize_array
 
 from ..reconstructor.state import ReconstructionState
 from .approximations import ApproximationsItem
-from .instructions import InstructionsItem
+from .instructions import InstructionsItem, generator_instruction_class
 
+REMIX_REBUILD_INTERVAL: Final[int] = 64
 RECONSTRUCTION_DATA_CONTRACT: Final[MetadataContract] = MetadataContract(
     label="Reconstruction data",
     expected_version=SAMPLETONES_RECONSTRUCTION_DATA_VERSION,
     error=IncompatibleReconstructionVersionError,
+    readable_versions=SAMPLETONES_RECONSTRUCTION_READABLE_VERSIONS,
 )
 
 
@@ -93,11 +97,34 @@ class Reconstruction(DataModel):
         ...,
         description="Normalization coefficient used during reconstruction",
     )
+    shortlist_sizes: List[int] = Field(
+        default_factory=list,
+        description="Channel searches per number of candidates phase-aligned, indexed by that number",
+    )
+    silent_frames: int = Field(
+        default=0,
+        description="Frames every channel was switched off on as silence, without a search",
+    )
+    skipped_searches: int = Field(
+        default=0,
+        description="Channel searches skipped because the frame or the residual left was silent",
+    )
+
+    _remixes: int = PrivateAttr(default=0)
 
     @cached_property
     def approximations(self) -> Dict[GeneratorName, np.ndarray]:
         return {item.generator_name: item.approximation for item in self.approximations_data}
 
+    @cached_property
+    def nbytes(self) -> int:
+        """The bytes held by the reconstruction's audio and instruction arrays."""
+        return (
+            int(self.approximation.nbytes)
+            + sum(int(item.approximation.nbytes) for item in self.approximations_data)
+            + sum(item.instructions.nbytes for item in self.instructions_data)
+        )
+
     @cached_property
     def streams(self) -> Dict[GeneratorName, InstructionsItem]:
         """The instruction stream each channel carries, in channel order.
@@ -115,10 +142,7 @@ class Reconstruction(DataModel):
 
     @cached_property
     def instructions(self) -> Dict[GeneratorName, List[InstructionUnion]]:
-        return {
-            generator_name: [instruction.instruction for instruction in item.instructions]
-            for generator_name, item in self.streams.items()
-        }
+        return {generator_name: item.instructions.to_instructions() for generator_name, item in self.streams.items()}
 
     @cached_property
     def initial_pitches(self) -> Dict[GeneratorName, int]:
@@ -143,36 +167,12 @@ class Reconstruction(DataModel):
         play: the rest stand by, exporting nothing and costing nothing, while describing a
         frame is what puts one in play.
         """
-        return tuple(generator_name for generator_name, item in self.streams.items() if item.instructions)
+        return tuple(generator_name for generator_name, item in self.streams.items() if len(item.instructions))
 
     @staticmethod
-    def _get_exporter_class(instruction: InstructionUnion) -> ExporterTypeUnion:
-        return INSTRUCTION_TO_EXPORTER_MAP[type(instruction)]
-
-    @classmethod
-    def _exporter_class(
-        cls,
-        generator_name: GeneratorName,
-        instructions: List[InstructionUnion],
-    ) -> ExporterTypeUnion:
-        """The exporter a channel's stream is read through.
-
-        The instruction type names the exporter wherever the stream describes a frame; a
-        channel standing by takes the exporter its generator name pairs with.
-        """
-        if not instructions:
-            return GENERATOR_NAME_TO_EXPORTER_MAP[generator_name]
-
-        return cls._get_exporter_class(instructions[0])
-
-    @classmethod
-    def _derive_initial_pitch(cls, instructions: List[InstructionUnion]) -> int:
-        """Chooses the reference pitch the arpeggio envelope of a channel in play is measured against.
-
-        The instruction type selects the exporter, matching how `export` resolves one.
-        """
-        exporter_class = cls._get_exporter_class(instructions[0])
-        return exporter_class.derive_initial_pitch(instructions)  # type: ignore[arg-type]
+    def _exporter_class(item: InstructionsItem) -> ExporterTypeUnion:
+        """The exporter a channel's stream is read through, named by the stream's instruction type."""
+        return INSTRUCTION_TO_EXPORTER_MAP[item.instructions.instruction_type]
 
     @classmethod
     def create(
@@ -183,6 +183,9 @@ class Reconstruction(DataModel):
         config: Config,
         coefficient: float,
         audio_filepath: Path,
+        shortlist_sizes: Sequence[int] = (),
+        silent_frames: int = 0,
+        skipped_searches: int = 0,
     ) -> Self:
         approximation = np.nan_to_num(approximation, nan=0.0)
         approximations_data: List[ApproximationsItem] = [
@@ -196,16 +199,20 @@ class Reconstruction(DataModel):
 
         instructions_data: List[InstructionsItem] = []
         for generator_name in GeneratorName.items():
-            channel_instructions = list(instructions.get(generator_name, ()))
+            channel_instructions = InstructionArray.from_instructions(
+                generator_instruction_class(generator_name),
+                instructions.get(generator_name, ()),
+            )
             if not channel_instructions:
                 instructions_data.append(InstructionsItem.resting(generator_name))
                 continue
 
+            exporter_class = INSTRUCTION_TO_EXPORTER_MAP[channel_instructions.instruction_type]
             instructions_data.append(
                 InstructionsItem.create(
                     generator_name=generator_name,
                     instructions=channel_instructions,
-                    initial_pitch=cls._derive_initial_pitch(channel_instructions),
+                    initial_pitch=exporter_class.derive_initial_pitch(channel_instructions),
                     held_features=(),
                 )
             )
@@ -218,6 +225,9 @@ class Reconstruction(DataModel):
             config=config,
             coefficient=coefficient,
             audio_filepath=audio_filepath,
+            shortlist_sizes=list(shortlist_sizes),
+            silent_frames=silent_frames,
+            skipped_searches=skipped_searches,
         )
 
     @classmethod
@@ -227,6 +237,9 @@ class Reconstruction(DataModel):
         config: Config,
         coefficient: float,
         path: Path,
+        shortlist_sizes: Sequence[int] = (),
+        silent_frames: int = 0,
+        skipped_searches: int = 0,
     ) -> Optional[Self]:
         if any(len(approximation) == 0 for approximation in state.approximations.values()):
             logger.warning(f"Reconstruction for file: {path} is empty")
@@ -242,6 +255,9 @@ class Reconstruction(DataModel):
             config=config,
             coefficient=coefficient,
             audio_filepath=path,
+            shortlist_sizes=shortlist_sizes,
+            silent_frames=silent_frames,
+            skipped_searches=skipped_searches,
         )
 
     def update_generator_data(
@@ -263,17 +279,87 @@ class Reconstruction(DataModel):
         cleared of every frame stands by and stays editable. Its rendered audio lasts as
         long as it carries samples, which keeps silence out of the stored waveforms.
         """
-        partial_approximation = np.trim_zeros(partial_approximation, trim="b")
-        rendered = {name: audio for name, audio in self.approximations.items() if name != generator_name}
-        if partial_approximation.size:
-            rendered[generator_name] = partial_approximation
+        remixes = self._next_remixes()
+        update = self._generator_data_update(
+            generator_name,
+            instructions,
+            partial_approximation,
+            initial_pitch,
+            held_features,
+        )
+        for field_name, value in update.items():
+            setattr(self, field_name, value)
 
-        max_length = max(
-            (len(np.trim_zeros(audio, trim="b")) for audio in rendered.values()),
-            default=0,
+        self._remixes = remixes
+        self._invalidate_derived_caches(self)
+
+    def with_generator_data(
+        self,
+        generator_name: GeneratorName,
+        instructions: List[InstructionUnion],
+        partial_approximation: np.ndarray,
+        initial_pitch: int,
+        held_features: Iterable[FeatureKey],
+    ) -> Reconstruction:
+        """Returns a copy carrying one generator's new data, leaving this reconstruction intact.
+
+        The copy is shallow: every other channel's approximation and instruction items are
+        the very objects this reconstruction holds, and only the edited channel's items and
+        the mixed approximation are new. Both objects stay immutable in content, so a history
+        snapshot sharing this reconstruction keeps reading what it captured. The copy applies
+        the edit to itself, so it carries on this reconstruction's count of incremental remixes.
+        """
+        updated: Reconstruction = self.model_copy()
+        updated.update_generator_data(
+            generator_name,
+            instructions,
+            partial_approximation,
+            initial_pitch,
+            held_features,
         )
+        return updated
 
-        self.approximations_data = self._build_approximations_data(rendered, max_length)
+    def _generator_data_update(
+        self,
+        generator_name: GeneratorName,
+        instructions: List[InstructionUnion],
+        partial_approximation: np.ndarray,
+        initial_pitch: int,
+        held_features: Iterable[FeatureKey],
+    ) -> Dict[str, Any]:
+        """Computes the fields one generator's edit replaces, sharing everything else.
+
+        The mix is updated incrementally: the channel's previous audio is subtracted and the
+        new audio added, so the work follows the edited channel rather than the channel count.
+        Every ``REMIX_REBUILD_INTERVAL`` edits the mix is summed from the channels afresh
+        instead, so the rounding of a long run of edits never builds up. The other channels'
+        items are reused as they are unless the shared length changes, which only reads their
+        tails past the edited channel's new end.
+        """
+        partial_approximation = np.trim_zeros(partial_approximation, trim="b")
+        previous = self.approximations.get(generator_name)
+        others = [item for item in self.approximations_data if item.generator_name != generator_name]
+        length = self._shared_length(
+            [item.approximation for item in others],
+            len(partial_approximation),
+        )
+
+        items = {
+            item.generator_name: (
+                item
+                if len(item.approximation) == length
+                else ApproximationsItem(
+                    generator_name=item.generator_name,
+                    approximation=pad(item.approximation, 0, length),
+                )
+            )
+            for item in others
+        }
+        if partial_approximation.size:
+            items[generator_name] = ApproximationsItem(
+                generator_name=generator_name,
+                approximation=pad(partial_approximation, 0, length),
+            )
 
         streams = dict(self.streams)
         streams[generator_name] = InstructionsItem.create(
@@ -282,9 +368,54 @@ class Reconstruction(DataModel):
             initial_pitch=initial_pitch,
             held_features=held_features,
         )
-        self.instructions_data = [streams[name] for name in GeneratorName.items()]
-        self._invalidate_derived_caches(self)
-        self.approximation = self._sum_approximations([item.approximation for item in self.approximations_data])
+
+        approximations_data = [items[name] for name in GeneratorName.items() if name in items]
+        approximation = (
+            self._remix(previous, partial_approximation, length)
+            if self._next_remixes()
+            else self._sum_approximations([item.approximation for item in approximations_data])
+        )
+        return {
+            "approximations_data": approximations_data,
+            "instructions_data": [streams[name] for name in GeneratorName.items()],
+            "approximation": approximation,
+        }
+
+    def _next_remixes(self) -> int:
+        """The edits the mix will have taken incrementally after the next, since it was last summed."""
+        return (self._remixes + 1) % REMIX_REBUILD_INTERVAL
+
+    def _remix(
+        self,
+        previous: Optional[np.ndarray],
+        replacement: np.ndarray,
+        length: int,
+    ) -> np.ndarray:
+        """Swaps one channel's contribution to the mixed approximation for ``replacement``.
+
+        The swap is carried out in double precision and rounded once, so an edit adds a single
+        rounding to the mix rather than one per operation.
+        """
+        mixed: np.ndarray = pad(self.approximation.astype(np.float64), 0, length)
+        if previous is not None:
+            overlap = min(len(previous), length)
+            mixed[:overlap] -= previous[:overlap]
+
+        mixed[: len(replacement)] += replacement
+        return mixed.astype(np.float32)
+
+    @staticmethod
+    def _shared_length(others: Sequence[np.ndarray], length: int) -> int:
+        """The length every channel is padded to: the longest audio without its trailing silence.
+
+        Only the samples past ``length`` can extend it, so each other channel is read from there.
+        """
+        for audio in others:
+            tail = np.flatnonzero(audio[length:])
+            if tail.size:
+                length += int(tail[-1]) + 1
+
+        return length
 
     def get_generator_instructions(
         self,
@@ -334,9 +465,7 @@ class Reconstruction(DataModel):
                 config,
                 generator_name.value,
             )
-            rendered[generator_name] = np.concatenate(
-                [generator(instruction, save=True) for instruction in instructions]  # type: ignore[arg-type]
-            )
+            rendered[generator_name] = generator.render_sequence(instructions)  # type: ignore[arg-type]
 
         max_length = max((len(audio) for audio in rendered.values()), default=0)
         approximations_data = self._build_approximations_data(
@@ -396,6 +525,7 @@ class Reconstruction(DataModel):
         reconstruction.__dict__.pop("initial_pitches", None)
         reconstruction.__dict__.pop("held_features", None)
         reconstruction.__dict__.pop("playing_generators", None)
+        reconstruction.__dict__.pop("nbytes", None)
 
     @classmethod
     def load(cls, path: Pathlike, fast: bool = True) -> Reconstruction:
@@ -407,6 +537,17 @@ class Reconstruction(DataModel):
             fast=fast,
         )
 
+    @classmethod
+    def deserialize_inner(
+        cls,
+        data: SerializedData,
+        validation: Optional[Callback] = None,
+        fast: bool = True,
+    ) -> Self:
+        """Reads a reconstruction, taking the skipped work of files written before it was recorded as none."""
+        data = {"silent_frames": 0, "skipped_searches": 0, **data}
+        return super().deserialize_inner(data, validation, fast)
+
     @classmethod
     def deserialize_data(
         cls,
@@ -439,24 +580,6 @@ class Reconstruction(DataModel):
             metadata.reconstruction_data_version,
         )
 
-    def _validate_instructions(
-        self,
-        exporter: ExporterUnion,
-        instructions: List[InstructionUnion],
-    ) -> None:
-        first_instruction: InstructionUnion = instructions[0]
-        exporter_class = self._get_exporter_class(instructions[0])
-        exporter_instruction_type = exporter.get_instruction_type()
-        for instruction in instructions:
-            if not isinstance(instruction, type(first_instruction)):
-                raise TypeError(f"All instructions must be of the same type for exporter {exporter_class.__name__}")
-
-            if not isinstance(instruction, exporter_instruction_type):
-                raise TypeError(
-                    f"Instruction type {type(instruction).__name__} is not compatible "
-                    f"with exporter {exporter_class.__name__}"
-                )
-
     def export(self) -> Dict[GeneratorName, Features]:
         """The envelopes each channel exports, one entry per channel the reconstruction holds.
 
@@ -467,15 +590,10 @@ class Reconstruction(DataModel):
             Dict[GeneratorName, Features]: The envelope representation of each channel.
         """
         features: Dict[GeneratorName, Features] = {}
-        for name in GeneratorName.items():
-            instructions = self.instructions[name]
-            exporter_class = self._exporter_class(name, instructions)
-            exporter: ExporterUnion = exporter_class()
-            if instructions:
-                self._validate_instructions(exporter, instructions)
-
+        for name, item in self.streams.items():
+            exporter: ExporterUnion = self._exporter_class(item)()
             features[name] = exporter.to_features(
-                instructions,  # type: ignore[arg-type]
+                item.instructions,
                 self.initial_pitches[name],
                 self.held_features[name],
             )
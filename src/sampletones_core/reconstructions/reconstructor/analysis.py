@@ -0,0 +1,120 @@
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+
+from sampletones_core.audio import condition_audio, decode_audio
+from sampletones_core.configs import Config
+from sampletones_core.fft import FragmentedAudio, Window
+
+PreprocessingKey = Tuple[int, bool, bool, int]
+FeatureKey = Tuple[PreprocessingKey, float, Hashable, Hashable]
+
+
+def preprocessing_key(config: Config) -> PreprocessingKey:
+    """The settings that decide the audio `Reconstructor.load_audio` prepares from a file."""
+    general = config.general
+    return (
+        config.library.sample_rate,
+        general.normalize,
+        general.quantize,
+        general.quantization_levels,
+    )
+
+
+def feature_key(config: Config, coefficient: float) -> FeatureKey:
+    """
+    The settings that decide the fragments framed from prepared audio scaled by ``coefficient``.
+
+    The analysis window and the spectral features follow from the library settings and the
+    calculation settings alone, which are also what fragments are checked against whenever
+    two of them are combined, so configurations agreeing on these frame the audio alike.
+    """
+    return (
+        preprocessing_key(config),
+        coefficient,
+        config.library,
+        config.generation.calculation,
+    )
+
+
+class SharedAnalysis:
+    """
+    The analysis of one audio file, shared by its reconstructions under several configurations.
+
+    Each stage is computed the first time a configuration asks for it and handed to every
+    later configuration agreeing on the settings it depends on: the file is decoded once per
+    normalization setting, prepared once per sample rate and quantization, and framed once
+    per library and calculation settings at a given working level. The stages that differ,
+    such as framing at another NES frequency, are computed again for the configurations that
+    need them. The arrays handed out are read-only, as they are shared.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self._decoded: Dict[bool, Tuple[np.ndarray, int]] = {}
+        self._prepared: Dict[PreprocessingKey, np.ndarray] = {}
+        self._fragments: Dict[FeatureKey, FragmentedAudio] = {}
+
+    def prepared_audio(self, config: Config) -> np.ndarray:
+        """
+        The file's audio prepared as `Reconstructor.load_audio` prepares it for ``config``.
+
+        Args:
+            config: The configuration to prepare the audio for.
+
+        Returns:
+            The prepared audio, read-only.
+        """
+        key = preprocessing_key(config)
+        audio = self._prepared.get(key)
+        if audio is None:
+            decoded, sample_rate = self._decode(config.general.normalize)
+            audio = condition_audio(
+                decoded,
+                sample_rate,
+                target_sample_rate=config.library.sample_rate,
+                quantize=config.general.quantize,
+                quantization_levels=config.general.quantization_levels,
+            )
+            audio.setflags(write=False)
+            self._prepared[key] = audio
+
+        return audio
+
+    def fragmented_audio(
+        self,
+        audio: np.ndarray,
+        coefficient: float,
+        config: Config,
+        window: Window,
+    ) -> FragmentedAudio:
+        """
+        The prepared audio scaled by ``coefficient`` and framed as ``config`` frames it.
+
+        Args:
+            audio: The audio `prepared_audio` returned for ``config``.
+            coefficient: The working-level coefficient the audio is divided by.
+            config: The configuration to frame the audio for.
+            window: The analysis window of ``config``.
+
+        Returns:
+            The framed audio, shared with every configuration agreeing on the feature key.
+        """
+        key = feature_key(config, coefficient)
+        fragmented_audio = self._fragments.get(key)
+        if fragmented_audio is None:
+            fragmented_audio = FragmentedAudio.create(audio / coefficient, config, window)
+            self._fragments[key] = fragmented_audio
+
+        return fragmented_audio
+
+    def _decode(self, normalize: bool) -> Tuple[np.ndarray, int]:
+        decoded = self._decoded.get(normalize)
+        if decoded is None:
+            decoded = decode_audio(self.path, normalize=normalize)
+            decoded[0].setflags(write=False)
+            self._decoded[normalize] = decoded
+
+        return decoded
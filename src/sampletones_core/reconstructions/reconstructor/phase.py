@@ -3,7 +3,6 @@ from typing import Dict, Type
 
 import numpy as np
 from numpy.lib.stride_tricks import sliding_window_view
-from scipy.signal import fftconvolve
 
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import PhaseAlignerName
@@ -23,8 +22,21 @@ class PhaseAligner(ABC):
         self.window = window
         self.library_data = library_data
 
+    def align(self, fragment: Fragment, instruction: InstructionUnion) -> Fragment:
+        return self.at_shift(instruction, self.shift(fragment, instruction))
+
+    def at_shift(self, instruction: InstructionUnion, shift: int) -> Fragment:
+        """
+        The candidate at a given cyclic shift, scaled by the drive it competes at.
+
+        A shift found by `shift` rebuilds exactly the fragment `align` returned, so a caller
+        can keep the shift alone and render the candidate again when it needs the audio.
+        """
+        library_fragment = self.library_data[instruction]
+        return library_fragment.get_fragment(shift, self.config, self.window) * self.config.generation.drive
+
     @abstractmethod
-    def align(self, fragment: Fragment, instruction: InstructionUnion) -> Fragment: ...
+    def shift(self, fragment: Fragment, instruction: InstructionUnion) -> int: ...
 
 
 class SlidingRmsePhaseAligner(PhaseAligner):
@@ -34,7 +46,7 @@ class SlidingRmsePhaseAligner(PhaseAligner):
     scaled by the drive to match the amplitude the candidate competes at.
     """
 
-    def align(self, fragment: Fragment, instruction: InstructionUnion) -> Fragment:
+    def shift(self, fragment: Fragment, instruction: InstructionUnion) -> int:
         drive = self.config.generation.drive
         library_fragment = self.library_data[instruction]
         array = library_fragment.sample.get_fragment(length=2 * library_fragment.sample.length)
@@ -43,8 +55,7 @@ class SlidingRmsePhaseAligner(PhaseAligner):
         remainder = fragment.audio - drive * windows
 
         rmse = np.sqrt((remainder**2).mean(axis=1))
-        best_shift = int(np.argmin(rmse))
-        return library_fragment.get_fragment(best_shift, self.config, self.window) * drive
+        return int(np.argmin(rmse))
 
 
 class CrossCorrelationPhaseAligner(PhaseAligner):
@@ -57,18 +68,35 @@ class CrossCorrelationPhaseAligner(PhaseAligner):
     scaled by the drive to match the amplitude the candidate competes at.
     """
 
-    def align(self, fragment: Fragment, instruction: InstructionUnion) -> Fragment:
+    def shift(self, fragment: Fragment, instruction: InstructionUnion) -> int:
         drive = self.config.generation.drive
         library_fragment = self.library_data[instruction]
         frame_length = self.config.library.frame_length
         array = library_fragment.sample.get_fragment(length=2 * library_fragment.sample.length)
         target = np.asarray(fragment.audio, dtype=np.float64)
 
-        correlation = fftconvolve(array.astype(np.float64), target[::-1], mode="valid")
+        correlation = self._sliding_correlation(array.astype(np.float64), target)
         window_energy = self._sliding_energy(array, frame_length)
         cost = drive * window_energy - 2.0 * correlation
-        best_shift = int(np.argmin(cost))
-        return library_fragment.get_fragment(best_shift, self.config, self.window) * drive
+        return int(np.argmin(cost))
+
+    @staticmethod
+    def _sliding_correlation(array: np.ndarray, target: np.ndarray) -> np.ndarray:
+        """
+        The dot product of the target with every window of the array, through one real FFT.
+
+        Computes what `scipy.signal.fftconvolve(array, target[::-1], mode="valid")` does, on
+        the same padded transform length, so the shifts found are unchanged; calling
+        `scipy.fft` directly spares every process aligning phases the import of
+        `scipy.signal`.
+        """
+        from scipy.fft import irfft, next_fast_len, rfft
+
+        length = len(array) + len(target) - 1
+        size = next_fast_len(length, True)
+        full = irfft(rfft(array, size) * rfft(target[::-1], size), size)
+        correlation: np.ndarray = full[len(target) - 1 : len(array)]
+        return correlation
 
     @staticmethod
     def _sliding_energy(array: np.ndarray, frame_length: int) -> np.ndarray:
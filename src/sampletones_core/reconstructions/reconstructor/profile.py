@@ -0,0 +1,145 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Dict, Final, Iterable, Iterator, List, Mapping, Self
+
+PROFILE_TOTAL_LABEL: Final[str] = "total"
+PROFILE_OTHER_LABEL: Final[str] = "other"
+
+
+class ProfileStage(StrEnum):
+    LOAD_AUDIO = "load_audio"
+    FEATURES = "features"
+    SCORING = "scoring"
+    ALIGNMENT = "alignment"
+    DECODING = "decoding"
+    REGENERATION = "regeneration"
+
+
+class ProfileCounter(StrEnum):
+    FRAMES = "frames"
+    CANDIDATES_SCORED = "candidates_scored"
+    ALIGNMENTS = "alignments"
+    BYTES_ALLOCATED = "bytes_allocated"
+    GPU_TRANSFERS = "gpu_transfers"
+    SILENT_FRAMES = "silent_frames"
+    SKIPPED_SEARCHES = "skipped_searches"
+    CACHE_HITS = "cache_hits"
+
+
+@dataclass
+class ReconstructionProfile:
+    """
+    Where one reconstruction spent its time, and how much work each stage did.
+
+    Stages accumulate wall-clock seconds across every time they are entered, so a stage
+    entered per frame or per candidate reports its total; stages do not nest, and the time
+    no stage claims is reported as ``other``. Counters tally the frames analysed, the
+    candidates scored and phase-aligned, the frames and channel searches skipped as
+    silence, the bytes of the arrays the stages produce, and the transfers to and from
+    the GPU. The shortlist sizes tally how many candidates each channel search went on
+    to phase-align. Profiles are plain data, so a worker process can hand its profile
+    back with its result, and profiles of several files merge into an aggregate.
+
+    Attributes:
+        stages: Seconds spent per stage.
+        counters: Work done per counter.
+        shortlist_sizes: Channel searches per number of candidates shortlisted.
+        elapsed: Wall-clock seconds of the whole reconstruction, once finished.
+    """
+
+    stages: Dict[ProfileStage, float] = field(default_factory=dict)
+    counters: Dict[ProfileCounter, int] = field(default_factory=dict)
+    shortlist_sizes: Dict[int, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+    _started: float = field(default_factory=time.perf_counter, repr=False, compare=False)
+
+    @contextmanager
+    def stage(self, stage: ProfileStage) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[stage] = self.stages.get(stage, 0.0) + time.perf_counter() - start
+
+    def count(self, counter: ProfileCounter, amount: int = 1) -> None:
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def count_shortlist(self, size: int) -> None:
+        self.shortlist_sizes[size] = self.shortlist_sizes.get(size, 0) + 1
+
+    def finish(self) -> None:
+        """Stop the wall clock started when the profile was created."""
+        self.elapsed = time.perf_counter() - self._started
+
+    @property
+    def other(self) -> float:
+        return max(self.elapsed - sum(self.stages.values()), 0.0)
+
+    @property
+    def shortlist_histogram(self) -> List[int]:
+        """Channel searches per shortlist size, as a list indexed by the size."""
+        if not self.shortlist_sizes:
+            return []
+
+        histogram = [0] * (max(self.shortlist_sizes) + 1)
+        for size, searches in self.shortlist_sizes.items():
+            histogram[size] = searches
+
+        return histogram
+
+    def merge(self, other: Self) -> None:
+        for stage, seconds in other.stages.items():
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+        for counter, amount in other.counters.items():
+            self.count(counter, amount)
+
+        for size, searches in other.shortlist_sizes.items():
+            self.shortlist_sizes[size] = self.shortlist_sizes.get(size, 0) + searches
+
+        self.elapsed += other.elapsed
+
+    @classmethod
+    def aggregate(cls, profiles: Iterable[Self]) -> Self:
+        total = cls()
+        for profile in profiles:
+            total.merge(profile)
+
+        return total
+
+
+def format_profiles(profiles: Mapping[str, ReconstructionProfile]) -> str:
+    """
+    Render profiles as a plain-text table, one row per file and an aggregate row.
+
+    Args:
+        profiles: Profile per file label, in display order.
+
+    Returns:
+        The table, stage seconds first, then the counters.
+    """
+    columns: List[str] = [stage.value for stage in ProfileStage] + [PROFILE_OTHER_LABEL, PROFILE_TOTAL_LABEL]
+    columns += [counter.value for counter in ProfileCounter]
+
+    rows = [_profile_row(label, profile) for label, profile in profiles.items()]
+    if len(profiles) > 1:
+        rows.append(_profile_row(PROFILE_TOTAL_LABEL, ReconstructionProfile.aggregate(profiles.values())))
+
+    header = ["file", *columns]
+    widths = [max(len(row[index]) for row in [header, *rows]) for index in range(len(header))]
+    lines = [_table_line(header, widths), _table_line(["-" * width for width in widths], widths)]
+    lines += [_table_line(row, widths) for row in rows]
+    return "\n".join(lines)
+
+
+def _profile_row(label: str, profile: ReconstructionProfile) -> List[str]:
+    seconds = [profile.stages.get(stage, 0.0) for stage in ProfileStage] + [profile.other, profile.elapsed]
+    counters = [profile.counters.get(counter, 0) for counter in ProfileCounter]
+    return [label, *(f"{value:.3f}" for value in seconds), *(str(value) for value in counters)]
+
+
+def _table_line(cells: List[str], widths: List[int]) -> str:
+    first, *rest = cells
+    return "  ".join([first.ljust(widths[0]), *(cell.rjust(width) for cell, width in zip(rest, widths[1:]))])
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 
@@ -18,8 +18,11 @@ from sampletones_shared.exceptions import NoLibraryDataError
 from sampletones_shared.types.path import Pathlike
 from sampletones_shared.utils.system.paths import to_path
 
+from ..cache import ReconstructionCache
 from ..reconstruction.reconstruction import Reconstruction
+from .analysis import SharedAnalysis
 from .approximation import ApproximationData
+from .profile import ProfileCounter, ProfileStage, ReconstructionProfile
 from .state import ReconstructionState
 from .worker import ReconstructorWorker
 
@@ -56,6 +59,38 @@ def reconstruct(
     return worker(fragmented_audio, fragments_ids)
 
 
+def reconstruct_shared(
+    reconstructors: Sequence["Reconstructor"],
+    path: Path,
+) -> List[Optional[Reconstruction]]:
+    """Reconstructs one audio file with each of several reconstructors, sharing their analysis.
+
+    The file is decoded once, prepared once per sample rate and quantization, and framed once
+    per library and calculation settings. Configurations that differ only in how frames are
+    matched pay for little more than the matching itself, and configurations at other NES
+    frequencies but one sample rate still share the decoded, resampled audio. Each reconstructor's
+    profile covers its own run, so a stage another reconstructor already computed shows the little
+    time taken to reuse it.
+
+    Args:
+        reconstructors: The reconstructors to run, one per configuration.
+        path: Path to the audio file to reconstruct.
+
+    Returns:
+        List[Optional[Reconstruction]]: One reconstruction per reconstructor, in order.
+    """
+    analysis = SharedAnalysis(path)
+    reconstructions: List[Optional[Reconstruction]] = []
+    for reconstructor in reconstructors:
+        profile = ReconstructionProfile()
+        with profile.stage(ProfileStage.LOAD_AUDIO):
+            audio = analysis.prepared_audio(reconstructor.config)
+
+        reconstructions.append(reconstructor.reconstruct_audio(audio, path, profile, analysis))
+
+    return reconstructions
+
+
 class Reconstructor:
     """
     Turns an audio file into a :class:`Reconstruction` of NES instructions.
@@ -66,13 +101,17 @@ class Reconstructor:
     with an audio path to run the whole pipeline.
 
     The matching algorithm — framing, candidate scoring, and instruction selection — is
-    described in ``docs/concepts/reconstruction.md``.
+    described in ``docs/concepts/reconstruction.md``. With a :class:`ReconstructionCache`,
+    audio reconstructed before under the same settings is read back from the cache.
+    Every run leaves a :class:`ReconstructionProfile` of its stage timings and work
+    counters in :attr:`profile`.
     """
 
     def __init__(
         self,
         config: Config,
         library: Optional[InstructionLibrary] = None,
+        cache: Optional[ReconstructionCache] = None,
     ) -> None:
         """Builds a reconstructor for a configuration and loads its library.
 
@@ -81,12 +120,16 @@ class Reconstructor:
                 matching settings.
             library: The instruction library to match against; a default library rooted
                 at the configured directory is used when omitted.
+            cache: Finished reconstructions to reuse and add to; nothing is cached when
+                omitted.
 
         Raises:
             NoLibraryDataError: If no library exists for the configuration and window.
         """
         self.config: Config = config
+        self.cache: Optional[ReconstructionCache] = cache
         self.state: ReconstructionState = ReconstructionState.create([])
+        self.profile: ReconstructionProfile = ReconstructionProfile()
 
         generator_names = self.config.generation.generators
         self.generators = get_generators_by_names(config, generator_names)
@@ -113,13 +156,105 @@ class Reconstructor:
             raise TypeError("Input must be a path to an audio file")
 
         path = to_path(path)
-        audio = self.load_audio(path)
+        profile = ReconstructionProfile()
+        with profile.stage(ProfileStage.LOAD_AUDIO):
+            audio = self.load_audio(path)
+
+        return self.reconstruct_audio(audio, path, profile)
+
+    @classmethod
+    def reconstruct_many(
+        cls,
+        path: Pathlike,
+        configs: Sequence[Config],
+        library: Optional[InstructionLibrary] = None,
+        cache: Optional[ReconstructionCache] = None,
+    ) -> List[Optional[Reconstruction]]:
+        """Reconstructs an audio file under each of several configurations.
+
+        Builds a reconstructor per configuration and runs them through
+        :func:`reconstruct_shared`, so the stages the configurations agree on are
+        computed once.
+
+        Args:
+            path: Path to the audio file to reconstruct.
+            configs: The configurations to reconstruct the file under.
+            library: The instruction library every reconstructor matches against; a
+                default library rooted at each configured directory is used when omitted.
+            cache: Finished reconstructions to reuse and add to.
+
+        Returns:
+            List[Optional[Reconstruction]]: One reconstruction per configuration, in order.
+        """
+        reconstructors = [cls(config, library=library, cache=cache) for config in configs]
+        return reconstruct_shared(reconstructors, to_path(path))
+
+    def reconstruct_audio(
+        self,
+        audio: np.ndarray,
+        path: Path,
+        profile: Optional[ReconstructionProfile] = None,
+        analysis: Optional[SharedAnalysis] = None,
+    ) -> Optional[Reconstruction]:
+        """Reconstructs audio already prepared by :meth:`load_audio`.
+
+        Lets a caller that reconstructs the same file under several configurations load
+        and precondition it once. A cached reconstruction of the same audio and settings is
+        returned without matching, and a fresh one is added to the cache.
+
+        Args:
+            audio: The prepared audio, as :meth:`load_audio` returns it.
+            path: The file the audio came from, recorded in the reconstruction.
+            profile: The profile to record the run in, such as one already timing the
+                audio's loading; a fresh one is started when omitted.
+            analysis: The analysis of the file shared with its reconstructions under other
+                configurations, reusing the fragments one of them framed alike; the audio
+                is framed here when omitted.
+
+        Returns:
+            Optional[Reconstruction]: The reconstruction built from the audio.
+        """
+        self.profile = profile if profile is not None else ReconstructionProfile()
+        key: Optional[str] = None
+        if self.cache is not None:
+            key = self.cache.key(audio, self.config)
+            cached = self.cache.get(key, self.config, path)
+            if cached is not None:
+                self.profile.count(ProfileCounter.CACHE_HITS)
+                self.profile.finish()
+                return cached
+
         self.reset_generators()
         self.state = ReconstructionState.create(list(self.generators.keys()))
-        coefficient = self.get_coefficient(audio)
-        fragmented_audio = self.get_fragments(audio / coefficient)
+        with self.profile.stage(ProfileStage.FEATURES):
+            coefficient = self.get_coefficient(audio)
+            if analysis is None:
+                fragmented_audio = self.get_fragments(audio / coefficient)
+            else:
+                fragmented_audio = analysis.fragmented_audio(audio, coefficient, self.config, self.window)
+
+        self.profile.count(ProfileCounter.FRAMES, len(fragmented_audio))
+        self.profile.count(
+            ProfileCounter.BYTES_ALLOCATED,
+            sum(fragment.nbytes for fragment in fragmented_audio.fragments),
+        )
         self.reconstruct(fragmented_audio)
-        return Reconstruction.from_state(self.state, self.config, coefficient, path)
+        with self.profile.stage(ProfileStage.REGENERATION):
+            reconstruction = Reconstruction.from_state(
+                self.state,
+                self.config,
+                coefficient,
+                path,
+                shortlist_sizes=self.profile.shortlist_histogram,
+                silent_frames=self.profile.counters.get(ProfileCounter.SILENT_FRAMES, 0),
+                skipped_searches=self.profile.counters.get(ProfileCounter.SKIPPED_SEARCHES, 0),
+            )
+
+        if self.cache is not None and key is not None and reconstruction is not None:
+            self.cache.put(key, reconstruction)
+
+        self.profile.finish()
+        return reconstruction
 
     def load_audio(self, path: Path) -> np.ndarray:
         """Loads and preconditions the audio at ``path`` for reconstruction.
@@ -195,16 +330,25 @@ class Reconstructor:
             generators=self.generators,
             library_data=self.library_data,
             signal_length=fragmented_audio.audio.shape[0],
+            profile=self.profile,
         )
 
         results = worker(fragmented_audio, fragments_ids)
+        streams: Dict[GeneratorName, List[ApproximationData]] = {name: [] for name in self.generators}
         for fragment_approximations in results.values():
             for fragment_approximation in fragment_approximations.values():
-                self.update_state(fragment_approximation)
+                streams[fragment_approximation.generator_name].append(fragment_approximation)
+
+        with self.profile.stage(ProfileStage.REGENERATION):
+            for stream in streams.values():
+                self.update_state(stream)
 
     def load_library(self, library: Optional[InstructionLibrary] = None) -> InstructionLibraryData:
         """Loads and filters the instruction library for the enabled generators.
 
+        The library's key stays pinned while it is read, so a shared, budgeted library
+        cannot evict the data being filtered.
+
         Args:
             library: The library to draw from; a default library rooted at the
                 configured directory is used when omitted.
@@ -217,47 +361,53 @@ class Reconstructor:
             NoLibraryDataError: If no library exists for the configuration and window.
         """
         library = library or InstructionLibrary(directory=self.config.general.library_directory)
-        library_data = library.get(self.config, self.window)
         key = library.create_key(self.config, self.window)
-        if not library_data:
-            raise NoLibraryDataError(
-                f"No library data found for the given configuration and window: {library.get_path(key)}"
-            )
+        with library.pinned(key):
+            library_data = library.get(self.config, self.window)
+            if not library_data:
+                raise NoLibraryDataError(
+                    f"No library data found for the given configuration and window: {library.get_path(key)}"
+                )
 
-        return InstructionLibraryData.create(
-            config=self.config,
-            data=library_data.filter(
-                tuple(generator.class_name() for generator in self.generators.values()),
-            ),
-        )
+            return InstructionLibraryData.create(
+                config=self.config,
+                data=library_data.filter(
+                    tuple(generator.class_name() for generator in self.generators.values()),
+                ),
+            )
 
-    def update_state(self, fragment_approximation: ApproximationData) -> None:
-        """Appends one fragment's chosen approximation to the reconstruction state.
+    def update_state(self, fragment_approximations: Sequence[ApproximationData]) -> None:
+        """Appends one generator's consecutive fragment approximations to the reconstruction state.
 
-        Regenerates the approximation from its instruction when final regeneration is
-        enabled, otherwise reuses the stored approximation, scaling either by the
+        Regenerates the approximations from their instructions when final regeneration is
+        enabled, rendering the whole stream in one pass that resumes from the generator's
+        current state, otherwise reuses the stored approximations, scaling either by the
         configured drive.
 
         Args:
-            fragment_approximation: The chosen approximation for one fragment and
-                generator.
+            fragment_approximations: The chosen approximations of one generator, one per
+                fragment, in fragment order.
         """
-        generator: GeneratorUnion = self.generators[fragment_approximation.generator_name]
+        if not fragment_approximations:
+            return
+
+        drive = self.config.generation.drive
         if self.config.generation.final_regeneration:
-            instruction = fragment_approximation.instruction
-            initials = generator.initials
-            approximation = (
-                generator(
-                    instruction,  # type: ignore[arg-type]
-                    initials=initials,
-                    save=True,
-                )
-                * self.config.generation.drive
+            generator: GeneratorUnion = self.generators[fragment_approximations[0].generator_name]
+            instructions = [fragment_approximation.instruction for fragment_approximation in fragment_approximations]
+            audio = generator.render_sequence(
+                instructions,  # type: ignore[arg-type]
+                initials=generator.initials,
             )
+            approximations = np.split(audio * drive, len(fragment_approximations))
+            self.profile.count(ProfileCounter.BYTES_ALLOCATED, int(audio.nbytes))
         else:
-            approximation = fragment_approximation.approximation.audio * self.config.generation.drive
+            approximations = [
+                fragment_approximation.approximation.audio * drive for fragment_approximation in fragment_approximations
+            ]
 
-        self.state.append(fragment_approximation, approximation)
+        for fragment_approximation, approximation in zip(fragment_approximations, approximations):
+            self.state.append(fragment_approximation, approximation)
 
     def reset_generators(self) -> None:
         """Resets every generator so the next reconstruction starts fresh."""
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import numpy as np
 
 from sampletones_core.configs import Config
@@ -5,6 +7,7 @@ from sampletones_core.fft import Fragment, Window
 from sampletones_shared.array import CUPY_AVAILABLE, to_numpy, xp
 
 from ..criterion import Criterion
+from .profile import ProfileCounter, ReconstructionProfile
 
 
 class Scorer:
@@ -15,10 +18,19 @@ class Scorer:
     spectral term, producing the shortlist. `aligned_cost` completes the criterion
     for one shortlisted candidate, evaluating the temporal term on the candidate's
     phase-aligned waveform so it reflects the waveform shape at its best phase alignment.
+    Both stages tally the candidates they score, and the arrays sent to and fetched from
+    the GPU, in the given profile.
     """
 
-    def __init__(self, config: Config, window: Window, signal_length: int) -> None:
+    def __init__(
+        self,
+        config: Config,
+        window: Window,
+        signal_length: int,
+        profile: Optional[ReconstructionProfile] = None,
+    ) -> None:
         self.criterion = Criterion(config, window, signal_length)
+        self.profile = profile if profile is not None else ReconstructionProfile()
 
     def spectral_costs(self, target: Fragment, candidates: Fragment) -> np.ndarray:
         """
@@ -43,6 +55,10 @@ class Scorer:
                 target_gpu.feature,
                 candidates.feature,
             )
+            self.profile.count(ProfileCounter.CANDIDATES_SCORED, int(errors.shape[0]))
+            self.profile.count(ProfileCounter.BYTES_ALLOCATED, int(errors.nbytes))
+            if CUPY_AVAILABLE:
+                self.profile.count(ProfileCounter.GPU_TRANSFERS, 4)
             return to_numpy(errors)
         finally:
             del errors, target_gpu
@@ -75,6 +91,8 @@ class Scorer:
             xp.asarray(approximation.audio),
         )
         combined = self.criterion.combine_losses(spectral_cost, temporal)
+        if CUPY_AVAILABLE:
+            self.profile.count(ProfileCounter.GPU_TRANSFERS, 3)
         return float(to_numpy(combined)[0])
 
     @staticmethod
@@ -91,3 +109,26 @@ class Scorer:
         count = min(k, int(costs.shape[0]))
         partitioned = np.argpartition(costs, count - 1)[:count]
         return partitioned[np.argsort(costs[partitioned])]
+
+    @staticmethod
+    def within_margin(costs: np.ndarray, margin: float, min_k: int, max_k: int) -> np.ndarray:
+        """The indices of the costs within a relative margin of the best, ordered best first.
+
+        A candidate is kept while its cost is at most ``(1 + margin)`` times the best
+        one, so a frame with one decisive winner keeps few candidates and an ambiguous
+        frame keeps many. However many fall within the margin, at least ``min_k`` and at
+        most ``max_k`` are kept.
+
+        Args:
+            costs: One non-negative cost per candidate.
+            margin: How far above the best cost, relative to it, a candidate may lie.
+            min_k: The fewest candidates to keep; clamped to the number available.
+            max_k: The most candidates to keep.
+
+        Returns:
+            np.ndarray: The selected indices, sorted by ascending cost.
+        """
+        ranked = Scorer.top_k(costs, max_k)
+        ranked_costs = costs[ranked]
+        within = int(np.count_nonzero(ranked_costs <= ranked_costs[0] * (1.0 + margin)))
+        return ranked[: max(within, min(min_k, ranked.shape[0]))]
@@ -4,7 +4,7 @@ from sampletones_core.constants.enums import SelectorName
 
 from .base import ScoredCandidate, Selector
 from .greedy import GreedySelector
-from .viterbi import ViterbiSelector
+from .viterbi import LatticeState, ViterbiSelector
 
 SELECTORS: Dict[SelectorName, Type[Selector]] = {
     SelectorName.GREEDY: GreedySelector,
@@ -14,6 +14,7 @@ SELECTORS: Dict[SelectorName, Type[Selector]] = {
 __all__ = [
     "SELECTORS",
     "GreedySelector",
+    "LatticeState",
     "ScoredCandidate",
     "Selector",
     "ViterbiSelector",
@@ -1,12 +1,15 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from sampletones_core.configs import Config
-from sampletones_core.constants.enums import GeneratorClassName, GeneratorName
+from sampletones_core.constants.enums import GeneratorClassName, GeneratorName, ShortlistMode
 from sampletones_core.fft import Fragment, FragmentedAudio, Window
 from sampletones_core.fft.features import FeatureExtractor
 from sampletones_core.generators import (
+    GENERATOR_TO_INSTRUCTION_MAP,
     GeneratorUnion,
     get_generator_by_instruction,
     get_remaining_generator_classes,
@@ -16,6 +19,7 @@ from sampletones_core.instructions import InstructionUnion
 from ..approximation import ApproximationData
 from ..candidates import CandidateProvider
 from ..phase import PhaseAligner
+from ..profile import ProfileCounter, ProfileStage, ReconstructionProfile
 from ..scorer import Scorer
 
 
@@ -24,6 +28,7 @@ class ScoredCandidate:
     instruction: InstructionUnion
     cost: float
     approximation: Fragment
+    phase: Optional[int] = None
 
 
 class Selector(ABC):
@@ -36,6 +41,7 @@ class Selector(ABC):
         candidate_provider: CandidateProvider,
         phase_aligner: PhaseAligner,
         feature_extractor: FeatureExtractor,
+        profile: Optional[ReconstructionProfile] = None,
     ) -> None:
         self.config = config
         self.window = window
@@ -45,6 +51,13 @@ class Selector(ABC):
         self.phase_aligner = phase_aligner
         self.feature_extractor = feature_extractor
         self.top_k = config.generation.decoder.top_k
+        self.shortlist_mode = config.generation.decoder.shortlist
+        self.shortlist_margin = config.generation.decoder.shortlist_margin
+        self.min_top_k = config.generation.decoder.min_top_k
+        self.max_top_k = config.generation.decoder.max_top_k
+        self.silence_floor = config.generation.decoder.silence_floor
+        self.silence_threshold = 0.0
+        self.profile = profile if profile is not None else ReconstructionProfile()
 
     @abstractmethod
     def select(
@@ -57,14 +70,53 @@ class Selector(ABC):
         approximations: Dict[GeneratorName, ApproximationData] = {}
         remaining_generators = dict(self.generators.items())
         while remaining_generators:
+            if self._is_silent(fragment):
+                self._count_skipped(len(remaining_generators))
+                for generator_name, generator in remaining_generators.items():
+                    approximations[generator_name] = self._silent_approximation(fragment, generator)
+                break
+
             remaining_generator_classes = get_remaining_generator_classes(remaining_generators)
             approximation_data = self._find_best_approximation(fragment, remaining_generator_classes)
-            fragment = self.feature_extractor.subtract(fragment, approximation_data.approximation)
+            fragment = self._subtract(fragment, approximation_data.approximation)
             approximations[approximation_data.generator_name] = approximation_data
             del remaining_generators[approximation_data.generator_name]
 
         return approximations
 
+    def set_silence_threshold(self, fragmented_audio: FragmentedAudio) -> None:
+        """
+        Set the level under which a frame or residual counts as silence for this audio.
+
+        The threshold is ``silence_floor`` times the audio's peak, the same relative floor
+        `active_frame_level` applies when it discards inaudible frames. A floor of zero
+        disables the fast path.
+
+        Args:
+            fragmented_audio: The framed audio about to be matched.
+        """
+        peak = float(abs(fragmented_audio.audio).max()) if fragmented_audio.audio.size else 0.0
+        self.silence_threshold = self.silence_floor * peak
+
+    def _is_silent(self, fragment: Fragment) -> bool:
+        if self.silence_threshold <= 0.0:
+            return False
+
+        return float(abs(fragment.audio).max()) < self.silence_threshold
+
+    def _silent_approximation(self, fragment: Fragment, generator: GeneratorUnion) -> ApproximationData:
+        instruction = GENERATOR_TO_INSTRUCTION_MAP[type(generator)].null_instruction()
+        return ApproximationData(
+            generator_name=GeneratorName(generator.name),
+            approximation=fragment * 0.0,
+            instruction=instruction,
+        )
+
+    def _count_skipped(self, channels: int) -> None:
+        self.profile.count(ProfileCounter.SKIPPED_SEARCHES, channels)
+        if channels == len(self.generators):
+            self.profile.count(ProfileCounter.SILENT_FRAMES)
+
     def _score_candidates(
         self,
         fragment: Fragment,
@@ -76,11 +128,10 @@ class Selector(ABC):
 
         The shortlist ranks every candidate by the spectral term alone, which compares
         phase-averaged features and is therefore immune to how the candidate waveform
-        happens to be phased. Each of the ``top_k`` shortlisted candidates is then built
-        at its best phase against the target and receives the full criterion cost, so
-        the temporal term measures waveform shape at the aligned phase. The aligned
-        phase stands in for the rendered phase, which keeps oscillator continuity
-        across frames.
+        happens to be phased. Each shortlisted candidate is then built at its best phase
+        against the target and receives the full criterion cost, so the temporal term
+        measures waveform shape at the aligned phase. The aligned phase stands in for the
+        rendered phase, which keeps oscillator continuity across frames.
 
         Args:
             fragment: Target fragment to match.
@@ -89,21 +140,42 @@ class Selector(ABC):
         Returns:
             The shortlisted candidates with their aligned costs, best first.
         """
-        valid_instructions, candidate_approximations = self.candidate_provider.candidates(remaining_generator_classes)
-        spectral_costs = self.scorer.spectral_costs(fragment, candidate_approximations)
-        shortlist = Scorer.top_k(spectral_costs, self.top_k)
-
+        with self.profile.stage(ProfileStage.SCORING):
+            valid_instructions, candidate_approximations = self.candidate_provider.candidates(
+                remaining_generator_classes
+            )
+            spectral_costs = self.scorer.spectral_costs(fragment, candidate_approximations)
+            shortlist = self._shortlist(spectral_costs)
+
+        self.profile.count_shortlist(len(shortlist))
         scored: List[ScoredCandidate] = []
         for index in shortlist:
             instruction = valid_instructions[index]
             generator = get_generator_by_instruction(instruction, remaining_generator_classes)
-            approximation = self._build_approximation(fragment, instruction, generator)
-            cost = self.scorer.aligned_cost(fragment, float(spectral_costs[index]), approximation)
-            scored.append(ScoredCandidate(instruction=instruction, cost=cost, approximation=approximation))
+            with self.profile.stage(ProfileStage.ALIGNMENT):
+                approximation, phase = self._build_approximation(fragment, instruction, generator)
+
+            with self.profile.stage(ProfileStage.SCORING):
+                cost = self.scorer.aligned_cost(fragment, float(spectral_costs[index]), approximation)
+            scored.append(ScoredCandidate(instruction=instruction, cost=cost, approximation=approximation, phase=phase))
 
         scored.sort(key=lambda candidate: candidate.cost)
         return scored
 
+    def _shortlist(self, spectral_costs: np.ndarray) -> np.ndarray:
+        """
+        The candidates worth phase-aligning, best first.
+
+        A fixed shortlist keeps the ``top_k`` lowest spectral costs. An adaptive one keeps
+        every candidate within ``shortlist_margin`` of the best, between ``min_top_k`` and
+        ``max_top_k`` of them, so alignment work goes to the frames where the spectral
+        ranking leaves the outcome open.
+        """
+        if self.shortlist_mode == ShortlistMode.ADAPTIVE:
+            return Scorer.within_margin(spectral_costs, self.shortlist_margin, self.min_top_k, self.max_top_k)
+
+        return Scorer.top_k(spectral_costs, self.top_k)
+
     def _find_best_approximation(
         self,
         fragment: Fragment,
@@ -123,7 +195,25 @@ class Selector(ABC):
         fragment: Fragment,
         instruction: InstructionUnion,
         generator: GeneratorUnion,
-    ) -> Fragment:
+    ) -> Tuple[Fragment, Optional[int]]:
+        """
+        Build a candidate's approximation, at its best phase when phase search is on.
+
+        Returns:
+            The approximation and the cyclic shift it was aligned at, or ``None`` when
+            the candidate was rendered from the generator's initial phase.
+        """
         if self.config.generation.calculation.find_best_phase:
-            return self.phase_aligner.align(fragment, instruction)
-        return self.candidate_provider.get_approximation(instruction, generator)
+            phase = self.phase_aligner.shift(fragment, instruction)
+            approximation = self.phase_aligner.at_shift(instruction, phase)
+            self.profile.count(ProfileCounter.ALIGNMENTS)
+            self.profile.count(ProfileCounter.BYTES_ALLOCATED, approximation.nbytes)
+            return approximation, phase
+        return self.candidate_provider.get_approximation(instruction, generator), None
+
+    def _subtract(self, fragment: Fragment, approximation: Fragment) -> Fragment:
+        with self.profile.stage(ProfileStage.FEATURES):
+            residual = self.feature_extractor.subtract(fragment, approximation)
+
+        self.profile.count(ProfileCounter.BYTES_ALLOCATED, residual.nbytes)
+        return residual
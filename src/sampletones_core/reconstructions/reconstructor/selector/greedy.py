@@ -13,4 +13,5 @@ class GreedySelector(Selector):
         fragmented_audio: FragmentedAudio,
         fragment_ids: List[int],
     ) -> Dict[int, Dict[GeneratorName, ApproximationData]]:
+        self.set_silence_threshold(fragmented_audio)
         return {fragment_id: self.reconstruct_fragment(fragmented_audio[fragment_id]) for fragment_id in fragment_ids}
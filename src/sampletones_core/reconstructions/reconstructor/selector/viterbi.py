@@ -1,5 +1,6 @@
 import itertools
-from typing import Dict, List, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Self, Tuple
 
 import numpy as np
 
@@ -7,17 +8,48 @@ from sampletones_core.configs import Config
 from sampletones_core.constants.enums import GeneratorName
 from sampletones_core.fft import Fragment, FragmentedAudio, Window
 from sampletones_core.fft.features import FeatureExtractor
-from sampletones_core.generators import GeneratorUnion
+from sampletones_core.generators import GENERATOR_TO_INSTRUCTION_MAP, GeneratorUnion
 from sampletones_core.instructions import InstructionUnion
 
 from ..approximation import ApproximationData
 from ..candidates import CandidateProvider
 from ..phase import PhaseAligner
+from ..profile import ProfileCounter, ProfileStage, ReconstructionProfile
 from ..scorer import Scorer
 from .base import ScoredCandidate, Selector
 
-ChannelLattice = List[List[ScoredCandidate]]
-FrameCandidates = Dict[GeneratorName, List[ScoredCandidate]]
+
+@dataclass(frozen=True, slots=True)
+class LatticeState:
+    """
+    One state of the decoding lattice: a shortlisted instruction and its cost.
+
+    A state keeps what it takes to render its candidate again, the cyclic shift the
+    candidate was aligned at, rather than the aligned audio and features themselves. The
+    lattice of a whole file therefore costs a few fields per state, and only the states on
+    the decoded path are rendered, once decoding is done.
+
+    Attributes:
+        instruction: The candidate instruction.
+        cost: The candidate's aligned cost against its residual.
+        phase: The shift the candidate was aligned at, or ``None`` when it was rendered
+            from the generator's initial phase.
+        silent: True for the null instruction standing in for a skipped search.
+    """
+
+    instruction: InstructionUnion
+    cost: float
+    phase: Optional[int] = None
+    silent: bool = False
+
+    @classmethod
+    def from_candidate(cls, candidate: ScoredCandidate) -> Self:
+        return cls(instruction=candidate.instruction, cost=candidate.cost, phase=candidate.phase)
+
+
+ChannelLattice = List[List[LatticeState]]
+FrameCandidates = Dict[GeneratorName, List[LatticeState]]
+ChannelPath = List[LatticeState]
 
 
 class ViterbiSelector(Selector):
@@ -30,6 +62,7 @@ class ViterbiSelector(Selector):
         candidate_provider: CandidateProvider,
         phase_aligner: PhaseAligner,
         feature_extractor: FeatureExtractor,
+        profile: Optional[ReconstructionProfile] = None,
     ) -> None:
         super().__init__(
             config,
@@ -39,6 +72,7 @@ class ViterbiSelector(Selector):
             candidate_provider,
             phase_aligner,
             feature_extractor,
+            profile,
         )
         decoder = config.generation.decoder
         self.pitch_weight = decoder.pitch_weight
@@ -51,8 +85,12 @@ class ViterbiSelector(Selector):
         fragmented_audio: FragmentedAudio,
         fragment_ids: List[int],
     ) -> Dict[int, Dict[GeneratorName, ApproximationData]]:
+        self.set_silence_threshold(fragmented_audio)
         lattices = self._build_lattices(fragmented_audio, fragment_ids)
-        return self._decode_lattices(lattices, fragment_ids)
+        with self.profile.stage(ProfileStage.DECODING):
+            paths = self._decode_lattices(lattices)
+
+        return self._render_paths(fragmented_audio, fragment_ids, paths)
 
     def _build_lattices(
         self,
@@ -66,34 +104,77 @@ class ViterbiSelector(Selector):
 
         return lattices
 
-    def _decode_lattices(
+    def _decode_lattices(self, lattices: Dict[GeneratorName, ChannelLattice]) -> Dict[GeneratorName, ChannelPath]:
+        paths: Dict[GeneratorName, ChannelPath] = {}
+        for generator_name, frames in lattices.items():
+            path = self._decode(frames)
+            paths[generator_name] = [frames[position][index] for position, index in enumerate(path)]
+
+        return paths
+
+    def _render_paths(
         self,
-        lattices: Dict[GeneratorName, ChannelLattice],
+        fragmented_audio: FragmentedAudio,
         fragment_ids: List[int],
+        paths: Dict[GeneratorName, ChannelPath],
     ) -> Dict[int, Dict[GeneratorName, ApproximationData]]:
         result: Dict[int, Dict[GeneratorName, ApproximationData]] = {fragment_id: {} for fragment_id in fragment_ids}
-        for generator_name, frames in lattices.items():
-            path = self._decode(frames)
-            for position, fragment_id in enumerate(fragment_ids):
-                state = frames[position][path[position]]
+        for generator_name, path in paths.items():
+            generator = self.generators[generator_name]
+            for fragment_id, state in zip(fragment_ids, path):
                 result[fragment_id][generator_name] = ApproximationData(
                     generator_name=generator_name,
-                    approximation=state.approximation,
+                    approximation=self._render_state(fragmented_audio[fragment_id], state, generator),
                     instruction=state.instruction,
                 )
 
         return result
 
+    def _render_state(self, fragment: Fragment, state: LatticeState, generator: GeneratorUnion) -> Fragment:
+        """
+        Render a decoded state's approximation again, as it was built when it was scored.
+
+        Args:
+            fragment: The frame the state belongs to; a silent state renders as its silence.
+            state: The decoded state.
+            generator: The channel's generator.
+
+        Returns:
+            The state's approximation.
+        """
+        if state.silent:
+            return fragment * 0.0
+
+        with self.profile.stage(ProfileStage.ALIGNMENT):
+            if state.phase is None:
+                approximation = self.candidate_provider.get_approximation(state.instruction, generator)
+            else:
+                approximation = self.phase_aligner.at_shift(state.instruction, state.phase)
+
+        self.profile.count(ProfileCounter.BYTES_ALLOCATED, approximation.nbytes)
+        return approximation
+
     def _frame_candidates(self, fragment: Fragment) -> FrameCandidates:
         candidates: FrameCandidates = {}
         residual = fragment
-        for generator_name, generator in self.generators.items():
-            channel_states = self._channel_candidates(residual, generator)
-            candidates[generator_name] = channel_states
-            residual = self.feature_extractor.subtract(residual, channel_states[0].approximation)
+        for position, (generator_name, generator) in enumerate(self.generators.items()):
+            if self._is_silent(residual):
+                self._count_skipped(len(self.generators) - position)
+                for name, remaining in list(self.generators.items())[position:]:
+                    candidates[name] = [self._silent_state(remaining)]
+                break
+
+            channel_candidates = self._channel_candidates(residual, generator)
+            candidates[generator_name] = [LatticeState.from_candidate(candidate) for candidate in channel_candidates]
+            residual = self._subtract(residual, channel_candidates[0].approximation)
 
         return candidates
 
+    @staticmethod
+    def _silent_state(generator: GeneratorUnion) -> LatticeState:
+        instruction = GENERATOR_TO_INSTRUCTION_MAP[type(generator)].null_instruction()
+        return LatticeState(instruction=instruction, cost=0.0, silent=True)
+
     def _channel_candidates(self, residual: Fragment, generator: GeneratorUnion) -> List[ScoredCandidate]:
         return self._score_candidates(residual, {generator.class_name(): generator})
 
@@ -124,7 +205,7 @@ class ViterbiSelector(Selector):
     def _best_predecessor(
         self,
         previous_costs: List[float],
-        previous_states: List[ScoredCandidate],
+        previous_states: List[LatticeState],
         instruction: InstructionUnion,
     ) -> Tuple[int, float]:
         best_index = 0
@@ -14,6 +14,7 @@ from sampletones_core.library import InstructionLibraryData
 from .approximation import ApproximationData
 from .candidates import CandidateProvider
 from .phase import PHASE_ALIGNERS, PhaseAligner
+from .profile import ReconstructionProfile
 from .scorer import Scorer
 from .selector import SELECTORS, Selector
 
@@ -25,6 +26,7 @@ class ReconstructorWorker:
     generators: Dict[GeneratorName, GeneratorUnion]
     library_data: InstructionLibraryData
     signal_length: int
+    profile: ReconstructionProfile = field(default_factory=ReconstructionProfile)
 
     scorer: Scorer = field(init=False)
     candidate_provider: CandidateProvider = field(init=False)
@@ -33,7 +35,7 @@ class ReconstructorWorker:
     selector: Selector = field(init=False)
 
     def __post_init__(self) -> None:
-        scorer = Scorer(self.config, self.window, self.signal_length)
+        scorer = Scorer(self.config, self.window, self.signal_length, self.profile)
         candidate_provider = CandidateProvider(self.config, self.window, self.library_data)
         phase_aligner_class = PHASE_ALIGNERS[self.config.generation.calculation.phase_aligner]
         phase_aligner = phase_aligner_class(self.config, self.window, self.library_data)
@@ -47,6 +49,7 @@ class ReconstructorWorker:
             candidate_provider=candidate_provider,
             phase_aligner=phase_aligner,
             feature_extractor=feature_extractor,
+            profile=self.profile,
         )
 
         object.__setattr__(self, "scorer", scorer)
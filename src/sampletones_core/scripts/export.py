@@ -0,0 +1,119 @@
+from pathlib import Path
+from typing import Optional
+
+from tqdm import tqdm
+
+from sampletones_core.configs import Config
+from sampletones_core.library import InstructionLibrary
+from sampletones_core.parallelization import TaskProgress, TaskStatus
+from sampletones_core.reconstructions import ReconstructionCache
+from sampletones_core.reconstructions.converter import ConversionStatus
+from sampletones_core.scripts.library import generate_library
+from sampletones_core.trackers.batch.exporter import BatchExporter, get_export_inputs
+from sampletones_core.trackers.format import TrackerFormat
+from sampletones_shared.logger import logger, null_logger
+from sampletones_shared.paths.extensions import EXT_FILE_RECONSTRUCTION
+
+
+def export_instruments(
+    input_path: Path,
+    config: Config,
+    tracker_format: TrackerFormat,
+    output_path: Optional[Path] = None,
+    *,
+    cache: Optional[ReconstructionCache] = None,
+) -> None:
+    if output_path is None:
+        output_path = input_path.parent if input_path.is_file() else input_path
+
+    if not input_path.exists():
+        raise FileNotFoundError(f"Export input does not exist: {input_path}")
+
+    inputs = get_export_inputs(input_path)
+    if any(path.suffix.lower() != EXT_FILE_RECONSTRUCTION for path in inputs):
+        library = InstructionLibrary.from_config(config)
+        if not library.exists(config):
+            logger.warning("Library does not exist for the given configuration, generating a new library")
+            generate_library(config)
+
+    progress_bar = tqdm(total=0, desc=f"Exporting {input_path.name}", unit="file")
+
+    def on_start() -> None:
+        progress_bar.disable = False
+        logger.info(f"Starting {tracker_format.value} export for {input_path}")
+
+    def on_completed(_path: Path) -> None:
+        progress_bar.close()
+        outcomes = exporter.outcomes
+        written = sum(len(outcome.paths) for outcome in outcomes)
+        logger.info(f"Exported {written} instrument files to {output_path}")
+
+        unsupported = [outcome for outcome in outcomes if outcome.status == ConversionStatus.UNSUPPORTED]
+        if unsupported:
+            logger.warning(f"Skipped {len(unsupported)} files in an unsupported audio format")
+
+        failed = [outcome for outcome in outcomes if outcome.status == ConversionStatus.FAILED]
+        if failed:
+            logger.warning(f"{len(failed)} files failed to export")
+            for outcome in failed:
+                logger.warning(f"{outcome.input_path}: {outcome.error}")
+
+        truncated = [outcome for outcome in outcomes if outcome.truncation is not None]
+        if truncated:
+            logger.warning(f"{len(truncated)} files had envelopes truncated to the format's limits")
+
+    def on_progress(
+        task_status: TaskStatus,
+        task_progress: TaskProgress,
+    ) -> None:
+        progress_bar.disable = False
+        total = task_progress.total
+        if total and total != progress_bar.total:
+            progress_bar.total = total
+            progress_bar.refresh()
+
+        delta = int(task_progress.completed) - int(progress_bar.n)
+        if delta > 0:
+            progress_bar.update(delta)
+
+        if task_progress.current_item:
+            progress_bar.set_description(f"{input_path.name}: {task_progress.current_item}")
+
+        if task_status in (
+            TaskStatus.COMPLETED,
+            TaskStatus.CANCELLED,
+            TaskStatus.FAILED,
+        ):
+            progress_bar.close()
+
+    def on_cancelled() -> None:
+        logger.info("Export cancelled by user")
+        progress_bar.close()
+
+    def on_error(_exception: Exception) -> None:
+        progress_bar.close()
+
+    exporter = BatchExporter(
+        config,
+        input_path,
+        output_path,
+        tracker_format,
+        logger=null_logger,
+        cache=cache,
+    )
+
+    exporter.set_callbacks(
+        on_start=on_start,
+        on_completed=on_completed,
+        on_progress=on_progress,
+        on_cancelled=on_cancelled,
+        on_error=on_error,
+    )
+
+    try:
+        exporter.start()
+        exporter.wait()
+    except KeyboardInterrupt:
+        logger.info("Export interrupted by user")
+    finally:
+        progress_bar.close()
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Tuple
 
 from tqdm import tqdm
@@ -6,8 +7,8 @@ from sampletones_core.configs import Config
 from sampletones_core.fft import Window
 from sampletones_core.library import (
     InstructionLibrary,
-    InstructionLibraryData,
     InstructionLibraryKey,
+    LibraryPartials,
 )
 from sampletones_core.library.creator import InstructionsLibraryCreator
 from sampletones_core.parallelization import TaskProgress, TaskStatus
@@ -19,19 +20,29 @@ def generate_library(config: Config) -> None:
     library = InstructionLibrary.from_config(config)
     key = library.create_key(config, window)
 
-    creator = InstructionsLibraryCreator(config, window=window, logger=null_logger)
+    creator = InstructionsLibraryCreator(
+        config,
+        window=window,
+        logger=null_logger,
+        library_directory=Path(library.directory),
+    )
 
     progress_bar = tqdm(total=0, desc="Generating library", unit="instruction", disable=False)
 
     def on_start() -> None:
         progress_bar.disable = False
         logger.info(f"Starting library generation for key {key}")
+        if creator.resumed_instructions:
+            logger.info(
+                f"Resuming from {creator.resumed_instructions} of {creator.total_instructions} "
+                "instructions generated by an interrupted run"
+            )
 
     def on_completed(
-        result: Tuple[InstructionLibraryKey, InstructionLibraryData],
+        result: Tuple[InstructionLibraryKey, LibraryPartials],
     ) -> None:
-        key, library_data = result
-        library.save_data(key, library_data)
+        key, partials = result
+        library.save_partials(key, partials)
         logger.info(f"Library {key.filename} generated successfully")
         progress_bar.close()
 
@@ -1,14 +1,19 @@
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
 from tqdm import tqdm
 
 from sampletones_core.configs import Config
 from sampletones_core.library import InstructionLibrary
-from sampletones_core.parallelization import TaskProgress, TaskStatus
-from sampletones_core.reconstructions import Reconstructor
+from sampletones_core.parallelization import TaskProcessor, TaskProgress, TaskStatus
+from sampletones_core.reconstructions import (
+    ReconstructionCache,
+    Reconstructor,
+    format_profiles,
+)
 from sampletones_core.reconstructions.converter import (
     ReconstructionConverter,
+    SharedReconstructionConverter,
     get_output_path,
 )
 from sampletones_core.reconstructions.converter import reconstruct_file as _reconstruct_file
@@ -20,6 +25,9 @@ def reconstruct_file(
     input_path: Path,
     config: Config,
     output_path: Optional[Path] = None,
+    *,
+    cache: Optional[ReconstructionCache] = None,
+    profile: bool = False,
 ) -> None:
     if output_path is None:
         output_path = get_output_path(config, input_path)
@@ -32,15 +40,21 @@ def reconstruct_file(
         raise IsADirectoryError(f"Expected a file path, got directory path: {input_path}")
 
     logger.info(f"Starting reconstruction for file {input_path}")
-    reconstructor = Reconstructor(config)
+    reconstructor = Reconstructor(config, cache=cache)
     _reconstruct_file((reconstructor, input_path, output_path))
     logger.info(f"Reconstruction file saved to {output_path}")
+    if profile:
+        logger.info(f"Reconstruction profile:\n{format_profiles({input_path.name: reconstructor.profile})}")
 
 
 def reconstruct_directory(
     input_path: Path,
     config: Config,
     output_path: Optional[Path] = None,
+    *,
+    resume: bool = False,
+    cache: Optional[ReconstructionCache] = None,
+    profile: bool = False,
 ) -> None:
     if output_path is None:
         output_path = get_output_path(config, input_path)
@@ -48,20 +62,87 @@ def reconstruct_directory(
     if not input_path.is_dir():
         raise NotADirectoryError(f"Expected a directory path, got file path: {input_path}")
 
+    _ensure_library(config)
+
+    def on_completed(_path: Path) -> None:
+        logger.info(f"Reconstruction directory saved to {output_path}")
+        if converter.skipped_files:
+            logger.info(f"Skipped {converter.skipped_files} files already reconstructed")
+
+        if converter.manifest is not None:
+            failed = converter.manifest.failed()
+            if failed:
+                logger.warning(f"{len(failed)} files failed, rerun with --resume to retry them")
+
+        if profile and converter.profiles:
+            profiles = {
+                path.relative_to(input_path).as_posix(): file_profile
+                for path, file_profile in sorted(converter.profiles.items())
+            }
+            logger.info(f"Reconstruction profile:\n{format_profiles(profiles)}")
+
+    converter = ReconstructionConverter(
+        config,
+        input_path=input_path,
+        is_file=False,
+        logger=null_logger,
+        manifest=True,
+        resume=resume,
+        cache=cache,
+    )
+    _run_with_progress(converter, input_path, on_completed)
+
+
+def reconstruct_configs(
+    input_path: Path,
+    configs: Sequence[Config],
+    *,
+    cache: Optional[ReconstructionCache] = None,
+) -> None:
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input path does not exist: {input_path}")
+
+    for config in configs:
+        _ensure_library(config)
+
+    def on_completed(_path: Path) -> None:
+        for config in configs:
+            logger.info(f"Reconstructions saved to {get_output_path(config, input_path)}")
+
+        if converter.skipped_files:
+            logger.info(f"Skipped {converter.skipped_files} files already reconstructed under every configuration")
+
+    converter = SharedReconstructionConverter(
+        configs,
+        input_path=input_path,
+        is_file=input_path.is_file(),
+        logger=null_logger,
+        cache=cache,
+    )
+    _run_with_progress(converter, input_path, on_completed)
+
+
+def _ensure_library(config: Config) -> None:
     library = InstructionLibrary.from_config(config)
     if not library.exists(config):
         logger.warning("Library does not exist for the given configuration, generating a new library")
         generate_library(config)
 
+
+def _run_with_progress(
+    converter: TaskProcessor[Path],
+    input_path: Path,
+    on_completed: Callable[[Path], None],
+) -> None:
     progress_bar = tqdm(total=0, desc=f"Reconstructing {input_path.name}", unit="file")
 
     def on_start() -> None:
         progress_bar.disable = False
-        logger.info(f"Starting reconstruction for directory {input_path}")
+        logger.info(f"Starting reconstruction for {input_path}")
 
-    def on_completed(_path: Path) -> None:
-        logger.info(f"Reconstruction directory saved to {output_path}")
+    def on_finished(path: Path) -> None:
         progress_bar.close()
+        on_completed(path)
 
     def on_progress(
         task_status: TaskStatus,
@@ -94,16 +175,9 @@ def reconstruct_directory(
     def on_error(_exception: Exception) -> None:
         progress_bar.close()
 
-    converter = ReconstructionConverter(
-        config,
-        input_path=input_path,
-        is_file=False,
-        logger=null_logger,
-    )
-
     converter.set_callbacks(
         on_start=on_start,
-        on_completed=on_completed,
+        on_completed=on_finished,
         on_progress=on_progress,
         on_cancelled=on_cancelled,
         on_error=on_error,
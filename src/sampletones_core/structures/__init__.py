@@ -1,12 +1,15 @@
 from .collection.bidirectional import BidirectionalHashMap
 from .collection.identified import Identifiable, IdentifiedCollection
 from .collection.indexed import IndexedCollection
+from .histogram.array import BinEdges, HistogramArray
 from .histogram.histogram import Histogram
 from .histogram.interval import Interval
 
 __all__ = [
     "BidirectionalHashMap",
+    "BinEdges",
     "Histogram",
+    "HistogramArray",
     "Identifiable",
     "IdentifiedCollection",
     "IndexedCollection",
@@ -1,7 +1,13 @@
+from .array import BinEdges, HistogramArray, HistogramClasses, HistogramLike, HistogramT
 from .histogram import Histogram
 from .interval import Interval
 
 __all__ = [
+    "BinEdges",
     "Histogram",
+    "HistogramArray",
+    "HistogramClasses",
+    "HistogramLike",
+    "HistogramT",
     "Interval",
 ]
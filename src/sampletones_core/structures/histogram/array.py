@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from functools import reduce
+from types import ModuleType
+from typing import Any, Sequence, Tuple, TypeVar, Union
+from weakref import WeakValueDictionary
+
+import numpy as np
+
+from sampletones_shared.array import to_numpy, xp
+from sampletones_shared.exceptions import DeserializationError, IncompleteHistogramRebinningWarning
+from sampletones_shared.types.array import (
+    Array,
+    ArrayClasses,
+    ArrayOrNumeric,
+    BinaryTransformation,
+    DTypeLike,
+    MultaryTransformation,
+    Numeric,
+    NumericClasses,
+    get_array_module,
+)
+from sampletones_shared.types.data import SerializedData
+from sampletones_shared.utils.arrays import is_increasing, isfinite
+
+from .histogram import Histogram, rebin_values
+
+_BinEdgesKey = Tuple[str, str, bytes]
+_INTERNED_BIN_EDGES: WeakValueDictionary[_BinEdgesKey, BinEdges] = WeakValueDictionary()
+
+
+def _freeze(array: Array) -> Array:
+    try:
+        array.setflags(write=False)
+    except AttributeError:
+        pass
+
+    return array
+
+
+@dataclass(frozen=True, eq=False, slots=True, weakref_slot=True)
+class BinEdges:
+    """
+    Read-only bin edges shared by every histogram laid over the same bins.
+
+    A spectrum method produces the same edges for every frame it analyses, so the edges,
+    and the bin widths derived from them, are validated and stored once per process and
+    then referenced by each histogram. Use `intern` to obtain an instance: equal edges on
+    the same array module resolve to the same object, which makes comparing the bins of
+    two histograms an identity check.
+
+    Attributes:
+        edges: The n + 1 strictly increasing bin edges.
+        widths: The n bin widths.
+    """
+
+    edges: Array
+    widths: Array
+
+    @classmethod
+    def intern(cls, edges: Union[Array, BinEdges]) -> BinEdges:
+        """
+        The shared bins for the given edges, validated the first time they are seen.
+
+        Args:
+            edges: Array of bin edges, or bins to pass through.
+
+        Returns:
+            The interned bins.
+
+        Raises:
+            ValueError: If the edges are not a one-dimensional array of at least two finite,
+                strictly increasing values.
+        """
+        if isinstance(edges, BinEdges):
+            return edges
+
+        module = get_array_module(edges)
+        key = (module.__name__, edges.dtype.str, to_numpy(edges).tobytes())
+        bins = _INTERNED_BIN_EDGES.get(key)
+        if bins is not None:
+            return bins
+
+        if edges.ndim != 1:
+            raise ValueError("edges must be a one-dimensional array")
+
+        if len(edges) < 2:
+            raise ValueError("At least two edges are required to create a histogram")
+
+        if not isfinite(edges):
+            raise ValueError("edges must contain only finite values")
+
+        if not is_increasing(edges):
+            raise ValueError("edges need to be strictly increasing")
+
+        edges = _freeze(module.array(edges, copy=True))
+        bins = cls(edges=edges, widths=_freeze(module.diff(edges)))
+        _INTERNED_BIN_EDGES[key] = bins
+        return bins
+
+    @property
+    def xp(self) -> ModuleType:
+        return get_array_module(self.edges)
+
+    def to_module(self, module: ModuleType) -> BinEdges:
+        """The same bins on another array module (NumPy or CuPy)."""
+        if module is self.xp:
+            return self
+
+        return BinEdges.intern(module.asarray(self.edges))
+
+    def __len__(self) -> int:
+        return len(self.widths)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (BinEdges.intern, (self.edges,))
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class HistogramArray:
+    """
+    A lightweight histogram: an array of bin values over shared, interned bin edges.
+
+    Carries the same quantities as `Histogram` — values per bin over strictly increasing
+    edges, with operations applied to densities (`values / widths`) — without the model
+    construction and validation a `Histogram` goes through on every operation. The edges
+    are validated once, when first interned, and the values are taken as given, so it is
+    meant for the hot paths that build a histogram per analysed frame or library fragment.
+    Values may be stacked: a two-dimensional array holds one histogram per row over the
+    same bins.
+
+    Convert to a validated `Histogram` with `to_histogram` for the operations only the
+    model offers, such as rebinning between differing edges.
+
+    Attributes:
+        bins: The shared bin edges and widths.
+        values: Array of n bin values, or of stacked rows of n values.
+    """
+
+    bins: BinEdges
+    values: Array
+
+    def __post_init__(self) -> None:
+        if self.values.shape[-1] != len(self.bins):
+            raise ValueError(
+                "edges should have exactly |values| + 1 elements, got "
+                f"{len(self.bins) + 1} edges and {self.values.shape[-1]} values",
+            )
+
+        _freeze(self.values)
+
+    @classmethod
+    def create(cls, edges: Union[Array, BinEdges], values: Array) -> HistogramArray:
+        return cls(BinEdges.intern(edges), values)
+
+    @classmethod
+    def from_histogram(cls, histogram: Histogram) -> HistogramArray:
+        return cls.create(histogram.edges, histogram.values)
+
+    def to_histogram(self) -> Histogram:
+        return Histogram(edges=self.edges, values=self.values)
+
+    @property
+    def edges(self) -> Array:
+        return self.bins.edges
+
+    @property
+    def widths(self) -> Array:
+        return self.bins.widths
+
+    @property
+    def densities(self) -> Array:
+        densities: Array = self.values / self.widths
+        return densities
+
+    @property
+    def total(self) -> Any:
+        return self.xp.sum(self.values, dtype=self.values.dtype)
+
+    @property
+    def xp(self) -> ModuleType:
+        return get_array_module(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.values.nbytes)
+
+    @classmethod
+    def _validate_bins(cls, *histograms: HistogramArray) -> BinEdges:
+        if not histograms:
+            raise ValueError("At least one histogram is required")
+
+        bins = histograms[0].bins
+        if any(histogram.bins is not bins for histogram in histograms):
+            raise ValueError("All histograms must have the same edges")
+
+        return bins
+
+    @classmethod
+    def apply(
+        cls,
+        function: MultaryTransformation[ArrayOrNumeric],
+        *histograms: HistogramArray,
+    ) -> HistogramArray:
+        """
+        Apply a function to histogram densities, as `Histogram.apply` does.
+
+        Args:
+            function: Function to apply to densities.
+            *histograms: Histograms to use as arguments.
+
+        Returns:
+            New histogram over the same bins.
+
+        Raises:
+            ValueError: If no histograms are provided or their edges differ.
+        """
+        bins = cls._validate_bins(*histograms)
+        density = function(*(histogram.densities for histogram in histograms))
+        return cls(bins, density * bins.widths)
+
+    def apply_with(
+        self,
+        function: MultaryTransformation[ArrayOrNumeric],
+        *histograms: HistogramArray,
+    ) -> HistogramArray:
+        return self.apply(function, self, *histograms)
+
+    @classmethod
+    def reduce(
+        cls,
+        function: BinaryTransformation[ArrayOrNumeric],
+        *histograms: HistogramArray,
+    ) -> HistogramArray:
+        """
+        Reduce histograms into one with a binary operation on densities, as `Histogram.reduce` does.
+
+        Args:
+            function: Binary operation to reduce with (e.g., np.add).
+            *histograms: Histograms to reduce.
+
+        Returns:
+            Reduced histogram over the same bins.
+
+        Raises:
+            ValueError: If no histograms are provided or their edges differ.
+        """
+        bins = cls._validate_bins(*histograms)
+        if len(histograms) == 1:
+            return histograms[0]
+
+        density = reduce(function, (histogram.densities for histogram in histograms))
+        return cls(bins, density * bins.widths)
+
+    def reduce_with(
+        self,
+        function: BinaryTransformation[ArrayOrNumeric],
+        *histograms: HistogramArray,
+    ) -> HistogramArray:
+        return self.reduce(function, self, *histograms)
+
+    @classmethod
+    def from_constant(cls, density: Numeric, edges: Union[Array, BinEdges]) -> HistogramArray:
+        bins = BinEdges.intern(edges)
+        return cls(bins, bins.xp.full(len(bins), density * bins.widths))
+
+    @classmethod
+    def stack(cls, histograms: Sequence[HistogramArray]) -> HistogramArray:
+        """
+        Stack histograms over the same bins into one histogram with a row per input.
+
+        Raises:
+            ValueError: If no histograms are provided or their edges differ.
+        """
+        bins = cls._validate_bins(*histograms)
+        module = histograms[0].xp
+        return cls(bins, module.stack([histogram.values for histogram in histograms]))
+
+    def rebin(self, target_bins: Union[Array, BinEdges]) -> HistogramArray:
+        """
+        Rebin the histogram to new edges, as `Histogram.rebin` does.
+
+        Args:
+            target_bins: Array of target bin edges, or interned bins.
+
+        Returns:
+            New histogram over the target bins.
+
+        Raises:
+            ValueError: If the target edges are not strictly increasing.
+
+        Warnings:
+            IncompleteHistogramRebinningWarning: If the target range does not contain the histogram range.
+        """
+        bins = BinEdges.intern(target_bins)
+        if bins.edges[0] > self.edges[0] or bins.edges[-1] < self.edges[-1]:
+            warnings.warn(
+                "Rebinning to intervals outside of the histogram range may lead to unexpected results",
+                IncompleteHistogramRebinningWarning,
+            )
+
+        edges, values = rebin_values(self.edges, self.values, bins.edges)
+        return HistogramArray.create(edges, values)
+
+    def astype(self, dtype: DTypeLike) -> HistogramArray:
+        return HistogramArray.create(self.edges.astype(dtype), self.values.astype(dtype))
+
+    def to_cupy(self) -> HistogramArray:
+        return HistogramArray(self.bins.to_module(xp), xp.asarray(self.values))
+
+    def pack(self) -> SerializedData:
+        """
+        The histogram in its stored form, the same layout `Histogram.serialize_inner` writes.
+
+        Raises:
+            ValueError: If the histogram is not a single one-dimensional float32 histogram.
+        """
+        edges, values = to_numpy(self.edges), to_numpy(self.values)
+        if edges.dtype != np.float32 or values.dtype != np.float32 or values.ndim != 1:
+            raise ValueError("Only one-dimensional float32 histograms can be packed")
+
+        return {"edges": edges.tobytes(), "values": values.tobytes()}
+
+    @classmethod
+    def unpack(cls, raw: SerializedData) -> HistogramArray:
+        """
+        Reads a histogram back from its stored form, interning its edges.
+
+        Args:
+            raw: The stored form written by `pack` or `Histogram.serialize_inner`.
+
+        Returns:
+            The histogram.
+
+        Raises:
+            DeserializationError: If a buffer is missing or the histogram is malformed.
+        """
+        try:
+            edges = np.frombuffer(raw["edges"], dtype=np.float32)
+            values = np.frombuffer(raw["values"], dtype=np.float32)
+            return cls.create(edges, values)
+        except (KeyError, TypeError, ValueError) as exception:
+            raise DeserializationError(f"Invalid histogram: {exception}") from exception
+
+    def validate(self) -> None:
+        """
+        Checks the values as a `Histogram` would.
+
+        Raises:
+            ValueError: If the values contain non-finite entries.
+        """
+        if not isfinite(self.values):
+            raise ValueError("values must contain only finite values")
+
+    def __len__(self) -> int:
+        return int(self.values.shape[-1])
+
+    def __getitem__(self, index: slice) -> HistogramArray:
+        start, stop, step = index.indices(len(self))
+        if step != 1 or stop <= start:
+            raise ValueError("Only non-empty contiguous slices of bins are supported")
+
+        return HistogramArray.create(self.edges[start : stop + 1], self.values[..., start:stop])
+
+    def __mul__(self, other: Union[Numeric, Array]) -> HistogramArray:
+        if not isinstance(other, (*NumericClasses, *ArrayClasses)):
+            return NotImplemented
+
+        return HistogramArray(self.bins, self.values * other)
+
+    def __rmul__(self, other: Union[Numeric, Array]) -> HistogramArray:
+        return self.__mul__(other)
+
+    def __truediv__(self, other: Union[Numeric, Array]) -> HistogramArray:
+        if not isinstance(other, (*NumericClasses, *ArrayClasses)):
+            return NotImplemented
+
+        return HistogramArray(self.bins, self.values / other)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HistogramArray):
+            return NotImplemented
+
+        return self.bins is other.bins and bool(self.xp.array_equal(self.values, other.values))
+
+    def __hash__(self) -> int:
+        return hash((id(self.bins), to_numpy(self.values).tobytes()))
+
+
+HistogramLike = Union[Histogram, HistogramArray]
+HistogramClasses = (Histogram, HistogramArray)  # pylint: disable=invalid-name
+HistogramT = TypeVar("HistogramT", Histogram, HistogramArray)
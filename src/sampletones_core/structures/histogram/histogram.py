@@ -6,7 +6,6 @@ from types import ModuleType
 from typing import (
     Dict,
     Iterator,
-    List,
     Optional,
     Tuple,
     Union,
@@ -650,22 +649,7 @@ class Histogram(DataModel):
         if not is_increasing(target_bins):
             raise ValueError("array of edges need to be strictly increasing")
 
-        target_bins = cast_to_float(target_bins)
-        assert isinstance(target_bins, ArrayClasses), "target_bins expected to be Array after cast_to_float"
-
-        zero = self.xp.array([0.0], dtype=self.xp.float32)
-        dtype = self.xp.promote_types(self.xp.float32, self.values.dtype)
-        dtype = self.xp.promote_types(dtype, target_bins.dtype)
-        cumsum: Array = self.xp.concatenate([zero, self.xp.cumsum(self.values, dtype=dtype)], dtype=dtype)
-        interpolation: Array = self.xp.interp(
-            target_bins,
-            self.edges,
-            cumsum,
-            left=cumsum[0],
-            right=cumsum[-1],
-        )
-        edges: Array = target_bins.astype(dtype)
-        values: Array = self.xp.diff(interpolation).astype(dtype)
+        edges, values = rebin_values(self.edges, self.values, target_bins)
         return self.__class__(edges=edges, values=values)
 
     @cached_property
@@ -723,8 +707,8 @@ class Histogram(DataModel):
         Returns:
             Array of densities (values / widths) for each bin.
         """
-        densities: List[Float] = [self.density(i) for i in range(len(self))]
-        return self.xp.array(densities, dtype=self.values.dtype)
+        densities: Array = self.xp.asarray(self.values / self.widths, dtype=self.values.dtype)
+        return densities
 
     @cached_property
     def total(self) -> Float:
@@ -1118,3 +1102,36 @@ class Histogram(DataModel):
     @field_serializer("edges", "values")
     def _serialize_array(self, array: Array) -> SerializedData:
         return serialize_array(array)
+
+
+def rebin_values(edges: Array, values: Array, target_bins: Array) -> Tuple[Array, Array]:
+    """
+    Rebin histogram values to target edges by interpolating their cumulative sum.
+
+    Always casts integers to at least float32, and returns edges and values of a
+    common dtype.
+
+    Args:
+        edges: Array of source bin edges.
+        values: Array of source bin values.
+        target_bins: Array of strictly increasing target bin edges.
+
+    Returns:
+        The target edges and the rebinned values.
+    """
+    module = get_array_module(values)
+    target_bins = cast_to_float(target_bins)
+    assert isinstance(target_bins, ArrayClasses), "target_bins expected to be Array after cast_to_float"
+
+    zero = module.array([0.0], dtype=module.float32)
+    dtype = module.promote_types(module.float32, values.dtype)
+    dtype = module.promote_types(dtype, target_bins.dtype)
+    cumsum: Array = module.concatenate([zero, module.cumsum(values, dtype=dtype)], dtype=dtype)
+    interpolation: Array = module.interp(
+        target_bins,
+        edges,
+        cumsum,
+        left=cumsum[0],
+        right=cumsum[-1],
+    )
+    return target_bins.astype(dtype), module.diff(interpolation).astype(dtype)
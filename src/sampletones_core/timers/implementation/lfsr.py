@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cache
 from typing import Any, Dict, Final, Optional, Tuple
 
 import numpy as np
@@ -17,6 +18,7 @@ from ..timer import Timer
 
 CYCLE_START: Final[int] = 0
 OFF_CYCLE: Final[int] = -1
+LFSR_BITS: Final[int] = MAX_LFSR.bit_length()
 
 
 def cycle_length(short: bool) -> int:
@@ -56,6 +58,52 @@ def step_lfsr_back(lfsr: int, short: bool) -> int:
     return (partial | feedback) & MAX_LFSR
 
 
+@cache
+def lfsr_cycle(short: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """One feedback mode's cycle of register values and the position of each value on it.
+
+    Bit ``i`` of the register after ``n`` steps is output bit ``n + i``, and the output bits
+    obey ``x[n + 15] = x[n] ^ x[n + tap]``. Squaring the feedback polynomial over GF(2) gives
+    the same recurrence at every power-of-two stride, ``x[n + 15m] = x[n] ^ x[n + tap * m]``,
+    so each round extends the known bits by a block as long as a fixed fraction of them, and
+    the cycle is built in a few dozen array operations rather than stepped value by value.
+    The cycle is the same for every timer, so it is built once per process and shared
+    read-only.
+
+    Args:
+        short: Whether to build the 93-step short-mode cycle.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The register values of one full cycle, starting
+            from the seed value 1, and the index of every register value on that cycle,
+            ``OFF_CYCLE`` for values this mode places on a different cycle.
+    """
+    length = cycle_length(short)
+    tap = 6 if short else 1
+    total = length + LFSR_BITS - 1
+    bits = np.zeros(total, dtype=np.int32)
+    bits[0] = 1
+
+    known = LFSR_BITS
+    while known < total:
+        stride = 1 << ((known // LFSR_BITS).bit_length() - 1)
+        block = min((LFSR_BITS - tap) * stride, total - known)
+        sources = np.arange(known - LFSR_BITS * stride, known - LFSR_BITS * stride + block)
+        bits[known : known + block] = bits[sources] ^ bits[sources + tap * stride]
+        known += block
+
+    lfsrs = np.zeros(length, dtype=np.int32)
+    for bit in range(LFSR_BITS):
+        lfsrs |= bits[bit : bit + length] << bit
+
+    lfsr_to_index = np.full(MAX_LFSR + 1, OFF_CYCLE, dtype=np.int32)
+    lfsr_to_index[lfsrs] = np.arange(length, dtype=np.int32)
+
+    lfsrs.flags.writeable = False
+    lfsr_to_index.flags.writeable = False
+    return lfsrs, lfsr_to_index
+
+
 @dataclass(frozen=True)
 class LFSRTables:
     """Lookups covering one feedback mode's shift-register cycle.
@@ -74,6 +122,31 @@ class LFSRTables:
     bit_prefix: np.ndarray
 
 
+@cache
+def lfsr_tables(short: bool, repeats: int) -> LFSRTables:
+    """The lookups over one feedback mode's cycle, with the bit prefix spanning ``repeats`` cycles.
+
+    Built once per process for each mode and span, and shared read-only by every timer.
+
+    Args:
+        short: Whether to cover the 93-step short-mode cycle.
+        repeats: How many cycles the bit prefix sum spans.
+
+    Returns:
+        LFSRTables: The cycle's register values, their index lookup and the bit prefix sum.
+    """
+    lfsrs, lfsr_to_index = lfsr_cycle(short)
+    bits = np.tile(lfsrs & 1, repeats)
+    bit_prefix = np.concatenate([[0], np.cumsum(bits)]).astype(np.int32)
+    bit_prefix.flags.writeable = False
+
+    return LFSRTables(
+        lfsrs=lfsrs,
+        lfsr_to_index=lfsr_to_index,
+        bit_prefix=bit_prefix,
+    )
+
+
 class LFSRTimer(Timer):
     def __init__(
         self,
@@ -131,7 +204,10 @@ class LFSRTimer(Timer):
             int: The value's index on the active cycle, or ``CYCLE_START`` for a value the
                 active mode reaches on another cycle.
         """
-        index = int(self.lfsr_tables[self.short].lfsr_to_index[lfsr])
+        return self._cycle_index(lfsr, self.short)
+
+    def _cycle_index(self, lfsr: int, short: bool) -> int:
+        index = int(self.lfsr_tables[short].lfsr_to_index[lfsr])
         return index if index != OFF_CYCLE else CYCLE_START
 
     def calculate_offset(self, initials: Initials = None) -> int:
@@ -162,6 +238,65 @@ class LFSRTimer(Timer):
         frame: np.ndarray = (2.0 * levels - 1.0).astype(np.float32)
         return frame
 
+    def generate_sequence(
+        self,
+        shorts: np.ndarray,
+        clocks_per_sample: np.ndarray,
+        frame_lengths: np.ndarray,
+        continuous: bool,
+    ) -> np.ndarray:
+        """Renders consecutive frames, one per mode and rate, as repeated calls would.
+
+        Each frame opens at the register value and clock fraction the previous one ended at,
+        or at the seed where setting the period resets them and ``continuous`` is unset. Those
+        openings are a scalar recurrence over the frames; every sample is then computed at once
+        with the arithmetic :meth:`generate_frame` uses, so each row matches its frame exactly.
+
+        Args:
+            shorts: Whether each frame runs the register in short mode.
+            clocks_per_sample: The register steps per output sample of each frame.
+            frame_lengths: The samples each frame spans.
+            continuous: Whether the register state carries across frames despite ``reset_phase``.
+
+        Returns:
+            np.ndarray: A ``(len(shorts), max(frame_lengths))`` float32 array of levels, each
+                row valid up to its own length.
+        """
+        samples = np.arange(frame_lengths.max() + 1, dtype=np.float64)
+        lengths = frame_lengths.astype(np.float64)
+        offsets = np.empty(len(shorts), dtype=np.int64)
+        openings = np.empty(len(shorts), dtype=np.float64)
+        lfsr, clock = self.lfsr, self.clock
+        for index, (short, rate, length) in enumerate(zip(shorts.tolist(), clocks_per_sample, lengths)):
+            if self.reset_phase and not continuous:
+                lfsr, clock = 1, 0.0
+
+            offsets[index] = self._cycle_index(lfsr, short)
+            openings[index] = clock
+            end = length * rate + clock
+            lfsr = int(self.lfsr_tables[short].lfsrs[(offsets[index] + int(np.floor(end))) % cycle_length(short)])
+            clock = float(end % 1.0)
+
+        self.lfsr, self.clock = lfsr, clock
+
+        clocks = samples * clocks_per_sample[:, None] + openings[:, None]
+        edges = np.floor(clocks).astype(np.int64)
+        starts = edges[:, :-1]
+        steps = edges[:, 1:] - starts
+
+        levels = np.empty(starts.shape, dtype=np.float64)
+        for short in (False, True):
+            rows = shorts == short
+            tables = self.lfsr_tables[short]
+            positions = (offsets[rows, None] + starts[rows]) % cycle_length(short)
+            row_steps = steps[rows]
+            held = tables.bit_prefix[positions + 1] - tables.bit_prefix[positions]
+            stepped = tables.bit_prefix[positions + row_steps + 1] - tables.bit_prefix[positions + 1]
+            levels[rows] = np.where(row_steps > 0, stepped / np.maximum(row_steps, 1), held)
+
+        frames: np.ndarray = (2.0 * levels - 1.0).astype(np.float32)
+        return frames
+
     @property
     def initials(self) -> Tuple[Any, ...]:
         return self.lfsr, self.clock
@@ -221,33 +356,17 @@ class LFSRTimer(Timer):
         self.clock = clock
 
     def precalculate_lfsr_tables(self, short: bool) -> LFSRTables:
-        """Walks one feedback mode's cycle and builds the lookups :meth:`generate_frame` reads.
+        """The lookups :meth:`generate_frame` reads for one feedback mode's cycle.
 
         Args:
-            short: Whether to walk the 93-step short-mode cycle.
+            short: Whether to read the 93-step short-mode cycle.
 
         Returns:
-            LFSRTables: The cycle's register values, their index lookup and the bit prefix sum.
+            LFSRTables: The cycle's register values, their index lookup and the bit prefix sum,
+                shared with every timer at this sample rate.
         """
-        length = cycle_length(short)
-        lfsrs = np.empty(length, dtype=np.int32)
-        lfsr_to_index = np.full(MAX_LFSR + 1, OFF_CYCLE, dtype=np.int32)
-
-        lfsr = 1
-        for index in range(length):
-            lfsrs[index] = lfsr
-            lfsr_to_index[lfsr] = index
-            lfsr = step_lfsr(lfsr, short)
-
-        repeats = 1 + int(np.ceil(self.maximum_steps_per_sample / length))
-        bits = np.tile(lfsrs & 1, repeats)
-        bit_prefix = np.concatenate([[0], np.cumsum(bits)]).astype(np.int32)
-
-        return LFSRTables(
-            lfsrs=lfsrs,
-            lfsr_to_index=lfsr_to_index,
-            bit_prefix=bit_prefix,
-        )
+        repeats = 1 + int(np.ceil(self.maximum_steps_per_sample / cycle_length(short)))
+        return lfsr_tables(short, repeats)
 
     @property
     def maximum_steps_per_sample(self) -> int:
@@ -60,6 +60,54 @@ class PhaseTimer(Timer):
 
         return frame
 
+    def generate_sequence(
+        self,
+        timer_ticks: np.ndarray,
+        frame_lengths: np.ndarray,
+        continuous: bool,
+    ) -> np.ndarray:
+        """Renders consecutive frames, one per timer setting, as repeated calls would.
+
+        Each frame opens at the phase the previous one ended at, or at zero where setting the
+        timer resets the phase and ``continuous`` is unset. Those opening phases are a scalar
+        recurrence over the frames; every sample is then computed at once with the same
+        float32 arithmetic :meth:`generate_frame` uses, so each row matches its frame exactly.
+        The phases stay positive, where subtracting the floor is the exact ``fmod`` at a
+        fraction of its cost.
+
+        Args:
+            timer_ticks: The APU timer ticks per waveform step of each frame.
+            frame_lengths: The samples each frame spans.
+            continuous: Whether the phase carries across frames despite ``reset_phase``.
+
+        Returns:
+            np.ndarray: A ``(len(timer_ticks), max(frame_lengths))`` float32 array of phases,
+                each row valid up to its own length.
+        """
+        indices = np.arange(frame_lengths.max(), dtype=np.float32) + 1
+        lengths = frame_lengths.astype(np.float32)
+        sounding = timer_ticks > 0
+        delta = np.zeros(len(timer_ticks), dtype=np.float32)
+        delta[sounding] = self.phase_increment / timer_ticks[sounding] * self._cycles_per_sample
+        lower = np.ceil(1.0 + np.abs(delta * lengths))
+        ends = lower + lengths * delta
+
+        phases = np.empty(len(timer_ticks), dtype=np.float32)
+        phase = self.phase
+        for index, opening in enumerate(sounding):
+            if self.reset_phase and not continuous:
+                phase = 0.0
+
+            phases[index] = phase
+            if opening:
+                phase = float(np.fmod(ends[index] + np.float32(phase), 1.0))
+
+        self.phase = phase
+        frames: np.ndarray = lower[:, None] + indices * delta[:, None] + phases[:, None]
+        frames -= np.floor(frames)
+        frames[~sounding] = phases[~sounding, None]
+        return frames
+
     @property
     def initials(self) -> Tuple[Any, ...]:
         return (self.phase,)
@@ -76,6 +124,10 @@ class PhaseTimer(Timer):
     def get_timer_ticks(timer: int) -> int:
         return (timer + 1) * 16 if timer > 0 else 0
 
+    @classmethod
+    def frequency_to_timer_ticks(cls, frequency: float) -> int:
+        return cls.get_timer_ticks(cls.frequency_to_timer(frequency))
+
     def round_frequency_by_timer(self) -> None:
         self._frequency = APU_CLOCK / (16 * (self._timer + 1))
 
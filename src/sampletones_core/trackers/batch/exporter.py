@@ -0,0 +1,116 @@
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from sampletones_core.configs import Config
+from sampletones_core.parallelization import TaskProcessor
+from sampletones_core.reconstructions import ReconstructionCache
+from sampletones_core.reconstructions.converter import ConversionStatus, get_audio_files, get_relative_path
+from sampletones_core.trackers.format import TrackerFormat
+from sampletones_core.trackers.registry import build_tracker_backends
+from sampletones_core.trackers.scope import ExportScope
+from sampletones_shared.exceptions import NoFilesToProcessError
+from sampletones_shared.logger import LoggerProtocol
+from sampletones_shared.logger import logger as default_logger
+from sampletones_shared.paths.extensions import EXT_FILE_RECONSTRUCTION, EXT_FILES_AUDIO
+
+from .task import ExportOutcome, ExportTask, export_file
+
+
+def get_export_inputs(input_path: Path) -> List[Path]:
+    """
+    The reconstructions and audio files a batch export reads, in path order.
+
+    An audio file with a reconstruction of the same name beside it is left out: the
+    reconstruction stands for it, so the audio is not reconstructed again.
+
+    Args:
+        input_path: A reconstruction or audio file, or a directory searched recursively.
+
+    Returns:
+        The files to export.
+    """
+    if input_path.is_file():
+        return [input_path]
+
+    files = get_audio_files(input_path, (EXT_FILE_RECONSTRUCTION, *EXT_FILES_AUDIO), sort=True)
+    reconstructed = {path.with_suffix("") for path in files if path.suffix.lower() == EXT_FILE_RECONSTRUCTION}
+    return [
+        path
+        for path in files
+        if path.suffix.lower() == EXT_FILE_RECONSTRUCTION or path.with_suffix("") not in reconstructed
+    ]
+
+
+class BatchExporter(TaskProcessor[Path]):
+    """Writes the tracker instruments of a file, or of every file under a directory, on a process pool.
+
+    Each input — a saved reconstruction, or an audio file reconstructed on the way — is
+    exported as the reconstruction panel exports a whole reconstruction, through the
+    backend of the chosen format, to a destination mirroring the input's place under the
+    input directory. Workers build their reconstructor once and reuse it for every audio
+    file they receive, so a batch pays for loading the library once per worker rather
+    than once per file. Given a :class:`ReconstructionCache`, audio converted before under
+    the same settings is read from the cache. A failing file is recorded in
+    :attr:`outcomes` rather than stopping the batch.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        input_path: Path,
+        output_path: Path,
+        tracker_format: TrackerFormat,
+        logger: LoggerProtocol = default_logger,
+        *,
+        cache: Optional[ReconstructionCache] = None,
+    ) -> None:
+        super().__init__(max_workers=config.general.max_workers, logger=logger)
+        self.config = config.model_copy()
+        self.input_path: Path = input_path
+        self.output_path: Path = output_path
+        self.tracker_format: TrackerFormat = tracker_format
+        self.cache: Optional[ReconstructionCache] = cache
+        self.input_files: List[Path] = []
+        self.outcomes: List[ExportOutcome] = []
+
+        self.current_file: Optional[str] = None
+
+    def start(self) -> None:
+        if self.running:
+            self.logger.warning("Export is already running")
+            return
+
+        super().start()
+
+    def _create_tasks(self) -> List[Any]:
+        self.outcomes.clear()
+        self.input_files = get_export_inputs(self.input_path)
+        if not self.input_files:
+            raise NoFilesToProcessError(f"No reconstructions or audio files found in {self.input_path}")
+
+        base_directory = self.input_path.parent if self.input_path.is_file() else self.input_path
+        extension = build_tracker_backends()[self.tracker_format].extension(ExportScope.SAMPLE)
+        tasks: List[ExportTask] = []
+        for input_file in self.input_files:
+            destination = get_relative_path(base_directory, input_file, self.output_path, extension)
+            tasks.append((self.config, self.cache, self.tracker_format, input_file, destination))
+
+        return tasks
+
+    def _get_task_function(self) -> Callable[[ExportTask], ExportOutcome]:
+        return export_file
+
+    def _on_result(self, result: ExportOutcome) -> None:
+        self.outcomes.append(result)
+        if result.status == ConversionStatus.FAILED:
+            self.logger.warning(f"Export of {result.input_path} failed: {result.error}")
+
+    def _process_results(self, results: List[Any]) -> Path:
+        return self.output_path
+
+    def _notify_progress(self) -> None:
+        if self.completed_tasks > 0 and self.completed_tasks <= len(self.input_files):
+            self.current_file = str(self.input_files[self.completed_tasks - 1])
+            self.current_item = self.current_file
+
+        super()._notify_progress()
@@ -0,0 +1,150 @@
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from sampletones_core.configs import Config
+from sampletones_core.exporters.naming import instrument_slice_name
+from sampletones_core.exporters.truncation import EnvelopeTruncation
+from sampletones_core.reconstructions import (
+    Reconstruction,
+    ReconstructionCache,
+    Reconstructor,
+    reconstruction_config_hash,
+)
+from sampletones_core.reconstructions.converter import ConversionStatus
+from sampletones_core.trackers.format import TrackerFormat
+from sampletones_core.trackers.registry import build_tracker_backends
+from sampletones_core.trackers.request import InstrumentExport, SampleExport
+from sampletones_shared.exceptions import UnsupportedAudioFormatError
+from sampletones_shared.logger import logger
+from sampletones_shared.paths.extensions import EXT_FILE_RECONSTRUCTION
+
+ExportTask = Tuple[Config, Optional[ReconstructionCache], TrackerFormat, Path, Path]
+ReconstructorKey = Tuple[str, str, Optional[ReconstructionCache]]
+
+_RECONSTRUCTORS: Dict[ReconstructorKey, Reconstructor] = {}
+
+
+@dataclass(frozen=True)
+class ExportOutcome:
+    """
+    What exporting one file of a batch came to, as a worker reports it.
+
+    Attributes:
+        input_path: The reconstruction or audio file exported.
+        paths: Every file the backend wrote, in write order.
+        status: Whether the file was exported, unreadable, or failed.
+        seconds: Time the worker spent on the file, reconstructing it included.
+        truncation: What the format's item limit left out of the written instruments.
+        error: The failure, when the file failed.
+    """
+
+    input_path: Path
+    paths: Tuple[Path, ...]
+    status: ConversionStatus
+    seconds: float
+    truncation: Optional[EnvelopeTruncation] = None
+    error: Optional[str] = None
+
+
+def sample_export(reconstruction: Reconstruction, name: str) -> SampleExport:
+    """
+    Package every channel a reconstruction plays as the reconstruction panel exports it.
+
+    Each channel describing a frame becomes an instrument named after ``name`` and its
+    generator, playing its envelopes once; a channel standing by is left out.
+
+    Args:
+        reconstruction: The reconstruction to export.
+        name: The name the slices are named after.
+
+    Returns:
+        The reconstruction's slices, ready for a backend's `write_sample`.
+    """
+    nes_frequency = reconstruction.config.library.nes_frequency
+    return SampleExport(
+        name=name,
+        instruments=tuple(
+            InstrumentExport(
+                name=instrument_slice_name(name, generator_name),
+                generator=generator_name,
+                features=features,
+                loop=False,
+                nes_frequency=nes_frequency,
+            )
+            for generator_name, features in reconstruction.export().items()
+            if features.has_frames
+        ),
+        nes_frequency=nes_frequency,
+    )
+
+
+def export_file(arguments: ExportTask) -> ExportOutcome:
+    """
+    Export the instruments of one file of a batch and report how it went rather than raising.
+
+    A reconstruction file is read as it is; an audio file is reconstructed first, by a
+    reconstructor each worker builds, and loads the library for, once per configuration,
+    library directory and reconstruction cache.
+    The instruments are written through the backend of the requested format, so a batch
+    lands on disk exactly as the same export from the reconstruction panel would. A failing
+    file is reported with its error so the batch carries on; only an interrupt propagates.
+
+    Args:
+        arguments: The configuration, the reconstruction cache, the tracker format, the
+            input file and the destination the backend writes to.
+
+    Returns:
+        The file's outcome with the paths written and the time spent on it.
+    """
+    config, cache, tracker_format, input_path, destination = arguments
+    start = time.perf_counter()
+    paths: Tuple[Path, ...] = ()
+    truncation: Optional[EnvelopeTruncation] = None
+    error: Optional[str] = None
+    try:
+        reconstruction = _load_reconstruction(config, cache, input_path)
+        if reconstruction is None:
+            status = ConversionStatus.UNSUPPORTED
+        else:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            backend = build_tracker_backends()[tracker_format]
+            artifact = backend.write_sample(destination, sample_export(reconstruction, input_path.stem))
+            status, paths, truncation = ConversionStatus.COMPLETED, artifact.paths, artifact.truncation
+    except UnsupportedAudioFormatError:
+        logger.warning(f"Skipping file due to unsupported audio format: {input_path}")
+        status = ConversionStatus.UNSUPPORTED
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        logger.error_with_traceback(exception, f"Failed to export {input_path}: {exception}")
+        status, error = ConversionStatus.FAILED, f"{type(exception).__name__}: {exception}"
+
+    return ExportOutcome(
+        input_path=input_path,
+        paths=paths,
+        status=status,
+        seconds=time.perf_counter() - start,
+        truncation=truncation,
+        error=error,
+    )
+
+
+def _load_reconstruction(
+    config: Config,
+    cache: Optional[ReconstructionCache],
+    input_path: Path,
+) -> Optional[Reconstruction]:
+    if input_path.suffix.lower() == EXT_FILE_RECONSTRUCTION:
+        return Reconstruction.load(input_path)
+
+    return _reconstructor(config, cache)(input_path)
+
+
+def _reconstructor(config: Config, cache: Optional[ReconstructionCache]) -> Reconstructor:
+    key = (reconstruction_config_hash(config), str(config.general.library_directory), cache)
+    reconstructor = _RECONSTRUCTORS.get(key)
+    if reconstructor is None:
+        reconstructor = Reconstructor(config, cache=cache)
+        _RECONSTRUCTORS[key] = reconstructor
+
+    return reconstructor
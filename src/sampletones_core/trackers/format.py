@@ -1,4 +1,5 @@
 from enum import StrEnum
+from typing import Dict, Final
 
 
 class TrackerFormat(StrEnum):
@@ -7,3 +8,9 @@ class TrackerFormat(StrEnum):
     FAMITRACKER = "famitracker"
     BITPHASE = "bitphase"
     BITPHASE_PRESET = "bitphase_preset"
+
+
+BATCH_EXPORT_FORMATS: Final[Dict[str, TrackerFormat]] = {
+    "fti": TrackerFormat.FAMITRACKER,
+    "bitphase": TrackerFormat.BITPHASE,
+}
@@ -1,5 +1,5 @@
 from importlib import metadata
-from typing import Final
+from typing import Final, Tuple
 
 SAMPLETONES_NAME: Final[str] = "SampleToNES"
 SAMPLETONES_PACKAGE_NAME: Final[str] = "sampletones"
@@ -7,7 +7,8 @@ SAMPLETONES_ENV_PREFIX: Final[str] = "SAMPLETONES_"
 
 SAMPLETONES_VERSION: Final[str] = metadata.version(SAMPLETONES_PACKAGE_NAME)
 SAMPLETONES_LIBRARY_DATA_VERSION: Final[str] = "2.0"
-SAMPLETONES_RECONSTRUCTION_DATA_VERSION: Final[str] = "2.1"
+SAMPLETONES_RECONSTRUCTION_DATA_VERSION: Final[str] = "2.2"
+SAMPLETONES_RECONSTRUCTION_READABLE_VERSIONS: Final[Tuple[str, ...]] = ("2.1",)
 SAMPLETONES_PROJECT_DATA_VERSION: Final[str] = "1.0"
 
 SAMPLETONES_NAME_VERSION: Final[str] = f"{SAMPLETONES_NAME} v{SAMPLETONES_VERSION}"
@@ -0,0 +1,3 @@
+from typing import Final
+
+BYTES_PER_MEBIBYTE: Final[int] = 1 << 20
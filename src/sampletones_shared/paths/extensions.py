@@ -3,6 +3,7 @@ from typing import Final, Tuple
 EXT_FILE_JSON: Final[str] = ".json"
 EXT_FILE_YAML: Final[str] = ".yaml"
 EXT_FILE_LIBRARY: Final[str] = ".ins"
+EXT_FILE_LIBRARY_PARTIAL: Final[str] = ".part"
 EXT_FILE_INSTRUMENT: Final[str] = ".fti"
 EXT_FILE_RECONSTRUCTION: Final[str] = ".stn"
 EXT_FILE_PROJECT: Final[str] = ".stp"
@@ -1,7 +1,12 @@
 from pathlib import Path
 from typing import Final
 
-from platformdirs import user_config_dir, user_data_dir, user_documents_path
+from platformdirs import (
+    user_cache_dir,
+    user_config_dir,
+    user_data_dir,
+    user_documents_path,
+)
 
 from sampletones_shared.application import (
     SAMPLETONES_GROUP,
@@ -11,11 +16,13 @@ from sampletones_shared.application import (
 USER_PATH_DOCUMENTS: Final[Path] = Path(user_documents_path()) / SAMPLETONES_NAME
 USER_PATH_DATA: Final[Path] = Path(user_data_dir(SAMPLETONES_NAME, SAMPLETONES_GROUP))
 USER_PATH_CONFIG: Final[Path] = Path(user_config_dir(SAMPLETONES_NAME, SAMPLETONES_GROUP))
+USER_PATH_CACHE: Final[Path] = Path(user_cache_dir(SAMPLETONES_NAME, SAMPLETONES_GROUP))
 
 LIBRARY_DIRECTORY: Final[Path] = USER_PATH_DOCUMENTS / "instructions"
 RECONSTRUCTIONS_DIRECTORY: Final[Path] = USER_PATH_DOCUMENTS / "reconstructions"
 PROJECTS_DIRECTORY: Final[Path] = USER_PATH_DOCUMENTS / "projects"
 CONFIG_PATH: Final[Path] = USER_PATH_DOCUMENTS / "config.json"
+RECONSTRUCTION_CACHE_DIRECTORY: Final[Path] = USER_PATH_CACHE / "reconstructions"
 APPLICATION_CONFIG_PATH: Final[Path] = USER_PATH_CONFIG / "config.yaml"
 
 PROJECTS_DIRECTORY.mkdir(parents=True, exist_ok=True)
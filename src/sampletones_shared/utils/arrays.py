@@ -395,6 +395,54 @@ def hold(
     return array[min(index, len(array) - 1)]
 
 
+def hold_span(
+    array: Array,
+    length: int,
+    *,
+    default: Numeric,
+) -> Array:
+    """
+    Reads an envelope over its first frames, holding its final value past its end.
+
+    This is `hold` read at every index below ``length`` at once: the envelope's own values
+    cover the frames it describes, its last value sustains over the rest, and an empty
+    envelope reads as ``default`` throughout.
+
+    Args:
+        array: The 1-dimensional envelope to read.
+        length: The number of frames to read.
+        default: The value an empty envelope reads as.
+
+    Returns:
+        An array of ``length`` values.
+
+    Raises:
+        TypeError: If array is not an Array.
+        ValueError: If array is not 1-dimensional, or if length is negative.
+
+    Examples:
+        >>> hold_span(np.array([12, 0, 3]), 5, default=0).tolist()
+        [12, 0, 3, 3, 3]
+        >>> hold_span(np.array([]), 2, default=7).tolist()
+        [7.0, 7.0]
+    """
+    if not isinstance(array, ArrayClasses):
+        raise TypeError(f"Expected array to be Array, got {type(array)}")
+
+    if array.ndim != 1:
+        raise ValueError("Array must be 1-dimensional")
+
+    if length < 0:
+        raise ValueError(f"Length must be at least 0, got {length}")
+
+    module = get_array_module(array)
+    if not array.size:
+        return module.full(length, default, dtype=array.dtype)
+
+    indices = module.minimum(module.arange(length), len(array) - 1)
+    return array[indices]
+
+
 def interpolate_segment(
     array: Array,
     start_index: int,
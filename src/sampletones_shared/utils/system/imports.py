@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType, TracebackType
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type
+
+
+@dataclass
+class ModuleTiming:
+    """
+    Seconds one module took to import.
+
+    Attributes:
+        name: Fully qualified module name.
+        cumulative: Seconds from the start to the end of its import, modules it imported included.
+        nested: Seconds spent importing the modules it imported for the first time.
+    """
+
+    name: str
+    cumulative: float = 0.0
+    nested: float = 0.0
+
+    @property
+    def own(self) -> float:
+        return self.cumulative - self.nested
+
+
+class _TimedLoader(Loader):
+    def __init__(self, loader: Loader, timer: ImportTimer) -> None:
+        self._loader = loader
+        self._timer = timer
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        with self._timer.measure(spec.name):
+            return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        try:
+            with self._timer.measure(module.__name__):
+                self._loader.exec_module(module)
+        finally:
+            module.__loader__ = self._loader
+            if module.__spec__ is not None:
+                module.__spec__.loader = self._loader
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class ImportTimer(MetaPathFinder):
+    """
+    Times every module imported for the first time while it is installed, as `-X importtime` does.
+
+    Installed as the first finder on `sys.meta_path`, it asks the finders behind it for each
+    spec and wraps the loader they return, so the time a module takes to create and execute
+    is recorded under its name; loaders are handed back to the module once it has run. A
+    module's own time excludes the modules it imported, which are recorded separately.
+    Imports are expected to happen on one thread while the timer is installed.
+
+    Attributes:
+        timings: Timing per imported module, in import order.
+    """
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, ModuleTiming] = {}
+        self._stack: List[ModuleTiming] = []
+
+    def __enter__(self) -> ImportTimer:
+        sys.meta_path.insert(0, self)
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]],
+        exception: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if finder is self or find_spec is None:
+                continue
+
+            spec: Optional[ModuleSpec] = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self)
+
+            return spec
+
+        return None
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        timing = self.timings.setdefault(name, ModuleTiming(name))
+        self._stack.append(timing)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            timing.cumulative += elapsed
+            if self._stack:
+                self._stack[-1].nested += elapsed
+
+    @property
+    def total(self) -> float:
+        """Seconds spent importing modules so far."""
+        return sum(timing.own for timing in self.timings.values())
+
+    def slowest(self, limit: int) -> List[ModuleTiming]:
+        """The modules with the longest own import time, slowest first."""
+        return sorted(self.timings.values(), key=lambda timing: timing.own, reverse=True)[:limit]
+
+    def by_package(self) -> Dict[str, float]:
+        """Own import seconds summed per top-level package, slowest first."""
+        packages: Dict[str, float] = {}
+        for timing in self.timings.values():
+            package = timing.name.partition(".")[0]
+            packages[package] = packages.get(package, 0.0) + timing.own
+
+        return dict(sorted(packages.items(), key=lambda item: item[1], reverse=True))
@@ -2,7 +2,6 @@ from typing import Final, Literal
 
 import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
-from scipy.signal import butter, sosfilt
 
 FILTER_TYPE: Final[str] = "highpass"
 
@@ -27,6 +26,8 @@ class ButterworthHighpassFilter(BaseModel):
         Returns:
             The filtered waveform as float64.
         """
+        from scipy.signal import butter, sosfilt
+
         sections = butter(
             self.order,
             self.cutoff_hz,
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Callable, List, Optional
 
 from sampletones_application.logic.sequencer.playback.synthesizer import RowSynthesizer
+from sampletones_application.services.render.plan import RenderPlan
 from sampletones_application.services.render.result import RenderResult
 from sampletones_application.services.result import (
     ServiceCancelled,
@@ -19,6 +20,7 @@ class RenderRequest:
     spec: AudioOutputSpec
     normalize: bool
     total_samples: int
+    plan: Optional[RenderPlan]
 
 
 class FakeRenderService:
@@ -47,6 +49,7 @@ class FakeRenderService:
         spec: AudioOutputSpec,
         normalize: bool,
         total_samples: int,
+        plan: Optional[RenderPlan] = None,
     ) -> bool:
         if not self.accepts:
             return False
@@ -58,6 +61,7 @@ class FakeRenderService:
                 spec=spec,
                 normalize=normalize,
                 total_samples=total_samples,
+                plan=plan,
             )
         )
         self.running = True
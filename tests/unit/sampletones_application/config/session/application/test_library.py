@@ -0,0 +1,17 @@
+import pytest
+from pydantic import ValidationError
+
+from sampletones_application.config.session.application.library import (
+    DEFAULT_LIBRARY_MEMORY_BUDGET,
+    LibraryCacheConfig,
+)
+
+
+class TestMemoryBudgetBounds:
+    @pytest.mark.parametrize("memory_budget", [0, -5])
+    def test_memory_budget_below_one_is_rejected(self, memory_budget: int) -> None:
+        with pytest.raises(ValidationError):
+            LibraryCacheConfig(memory_budget=memory_budget)
+
+    def test_default_memory_budget(self) -> None:
+        assert LibraryCacheConfig().memory_budget == DEFAULT_LIBRARY_MEMORY_BUDGET
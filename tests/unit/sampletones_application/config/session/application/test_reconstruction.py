@@ -0,0 +1,20 @@
+import pytest
+from pydantic import ValidationError
+
+from sampletones_application.config.session.application.reconstruction import (
+    ReconstructionCacheConfig,
+)
+from sampletones_core.reconstructions.cache import DEFAULT_RECONSTRUCTION_CACHE_SIZE
+
+
+class TestReconstructionCacheConfig:
+    def test_cache_is_opt_in(self) -> None:
+        assert ReconstructionCacheConfig().enabled is False
+
+    def test_default_size(self) -> None:
+        assert ReconstructionCacheConfig().size == DEFAULT_RECONSTRUCTION_CACHE_SIZE
+
+    @pytest.mark.parametrize("size", [0, -5])
+    def test_size_below_one_is_rejected(self, size: int) -> None:
+        with pytest.raises(ValidationError):
+            ReconstructionCacheConfig(size=size)
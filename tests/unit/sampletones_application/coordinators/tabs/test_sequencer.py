@@ -66,6 +66,7 @@ from sampletones_core.project.song_position import SongPosition
 from sampletones_shared.exceptions import InvalidReconstructionValuesError
 from tests.suite.language import FakeLanguageManager
 
+HISTORY_MEMORY_BUDGET: Final[int] = 1 << 30
 FREQUENCY_MISMATCH_MESSAGE_KEY: Final[str] = "global.dialog.message.frequency_mismatch"
 REMOVE_SAMPLE_MESSAGE_KEY: Final[str] = "global.dialog.message.remove_sample"
 
@@ -811,7 +812,7 @@ def wired_history_coordinator(
     """
     instance = object.__new__(SequencerTabCoordinator)
     controller = ProjectController(ProjectManager())
-    history = HistoryManager(controller, budget=10, strict=True)
+    history = HistoryManager(controller, budget=10, memory_budget=HISTORY_MEMORY_BUDGET, strict=True)
     controller.on_mutation = history.handle_mutation
     controller.on_project_replaced = instance._on_project_replaced
     instance._project_controller = controller
@@ -1288,7 +1289,7 @@ def view_coordinator() -> SequencerTabCoordinator:
 def _loop_entry(loop: bool) -> HistoryEntry:
     word = HistoryDetailWord.LOOP_ON if loop else HistoryDetailWord.LOOP_OFF
     return HistoryEntry(
-        project=MagicMock(),
+        snapshot=MagicMock(),
         action=HistoryAction.SET_SAMPLE_LOOP,
         created=datetime.now(tz=UTC),
         detail=(
@@ -1377,7 +1378,7 @@ def block_coordinator() -> SequencerTabCoordinator:
     """
     instance = object.__new__(SequencerTabCoordinator)
     controller = ProjectController(ProjectManager())
-    history = HistoryManager(controller, budget=10, strict=True)
+    history = HistoryManager(controller, budget=10, memory_budget=HISTORY_MEMORY_BUDGET, strict=True)
     controller.on_mutation = history.handle_mutation
     controller.new()
     history.reset()
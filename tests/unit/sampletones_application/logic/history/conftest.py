@@ -7,6 +7,7 @@ from sampletones_application.logic.project.controller import ProjectController
 from sampletones_application.logic.project.manager import ProjectManager
 
 DEFAULT_HISTORY_BUDGET: Final[int] = 10
+DEFAULT_HISTORY_MEMORY_BUDGET: Final[int] = 1 << 30
 
 
 class HistoryFactory(Protocol):
@@ -15,6 +16,7 @@ class HistoryFactory(Protocol):
         *,
         strict: bool = True,
         budget: int = DEFAULT_HISTORY_BUDGET,
+        memory_budget: int = DEFAULT_HISTORY_MEMORY_BUDGET,
     ) -> Tuple[ProjectController, HistoryManager]: ...
 
 
@@ -29,9 +31,10 @@ def history_factory() -> HistoryFactory:
         *,
         strict: bool = True,
         budget: int = DEFAULT_HISTORY_BUDGET,
+        memory_budget: int = DEFAULT_HISTORY_MEMORY_BUDGET,
     ) -> Tuple[ProjectController, HistoryManager]:
         controller = ProjectController(ProjectManager())
-        history = HistoryManager(controller, budget=budget, strict=strict)
+        history = HistoryManager(controller, budget=budget, memory_budget=memory_budget, strict=strict)
         controller.on_mutation = history.handle_mutation
         controller.new()
         history.reset()
@@ -94,7 +94,7 @@ class TestHashCache:
         cache.hash(kept)
         cache.hash(discarded)
 
-        cache.prune([project_controller.project])
+        cache.prune(sample.reconstruction for sample in project_controller.project.samples)
 
         cache.hash(kept)
         cache.hash(discarded)
@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import List
 
+import numpy as np
 import pytest
 
 from sampletones_application.logic.history.action import HistoryAction
@@ -9,6 +10,7 @@ from sampletones_application.view_model.shared.history import (
     HistoryDetailRole,
     HistoryDetailSegment,
 )
+from tests.conftest import ReconstructionFactory
 from tests.unit.sampletones_application.logic.history.conftest import HistoryFactory
 
 
@@ -514,3 +516,56 @@ class TestBudget:
 
         assert history.can_undo is False
         assert controller.project.settings.tempo == 102
+
+    def test_memory_budget_coalesces_the_oldest_entries(
+        self,
+        history_factory: HistoryFactory,
+    ) -> None:
+        _, reference = history_factory()
+        memory_budget = 2 * reference.retained_bytes
+        controller, history = history_factory(memory_budget=memory_budget)
+
+        tempos = range(100, 110)
+        for tempo in tempos:
+            with history.transaction(HistoryAction.SET_TEMPO):
+                controller.set_tempo(tempo)
+
+        assert len(history.entries) <= len(tempos)
+        assert history.retained_bytes <= memory_budget
+        assert history.cursor == len(history.entries) - 1
+
+    def test_memory_budget_keeps_the_current_entry(
+        self,
+        history_factory: HistoryFactory,
+    ) -> None:
+        controller, history = history_factory(memory_budget=1)
+
+        with history.transaction(HistoryAction.SET_TEMPO):
+            controller.set_tempo(150)
+
+        assert len(history.entries) == 1
+        assert history.can_undo is False
+        assert controller.project.settings.tempo == 150
+
+    def test_a_project_larger_than_the_memory_budget_keeps_its_undo_depth(
+        self,
+        history_factory: HistoryFactory,
+        reconstruction_factory: ReconstructionFactory,
+    ) -> None:
+        _, reference = history_factory()
+        memory_budget = 4 * reference.retained_bytes
+        controller, history = history_factory(memory_budget=memory_budget)
+        reconstruction = reconstruction_factory().model_copy(
+            update={"approximation": np.zeros(memory_budget, dtype=np.float32)}
+        )
+        with history.transaction(HistoryAction.ADD_SAMPLE):
+            controller.add_sample(reconstruction, name="lead")
+
+        tempos = range(100, 104)
+        for tempo in tempos:
+            with history.transaction(HistoryAction.SET_TEMPO):
+                controller.set_tempo(tempo)
+
+        assert reconstruction.nbytes > memory_budget
+        assert history.cursor == len(tempos) + 1
+        assert history.retained_bytes <= memory_budget
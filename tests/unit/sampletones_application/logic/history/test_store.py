@@ -0,0 +1,168 @@
+from typing import Final
+
+import numpy as np
+
+from sampletones_application.logic.history.fingerprint import fingerprint_snapshot
+from sampletones_application.logic.history.store import SnapshotStore
+from sampletones_application.logic.project.controller import ProjectController
+from sampletones_core.constants.enums import GeneratorName
+from sampletones_core.reconstructions import Reconstruction
+from sampletones_shared.utils.serialization import hash_model
+from tests.conftest import ReconstructionFactory
+
+EDITED_GENERATOR: Final[GeneratorName] = GeneratorName.PULSE1
+UNTOUCHED_GENERATOR: Final[GeneratorName] = GeneratorName.TRIANGLE
+EDITED_TRANSPOSE: Final[int] = 5
+LARGE_SAMPLE_LENGTH: Final[int] = 1 << 16
+
+
+class TestStructuralSharing:
+    def test_untouched_channels_share_one_node(self, project_controller: ProjectController) -> None:
+        store = SnapshotStore()
+        before = store.capture(project_controller.project)
+
+        project_controller.set_row(EDITED_GENERATOR, 0, 0, transpose=EDITED_TRANSPOSE)
+        after = store.capture(project_controller.project)
+
+        channels_before = {channel.generator: channel for channel in before.song.channels}
+        channels_after = {channel.generator: channel for channel in after.song.channels}
+        assert channels_after[UNTOUCHED_GENERATOR] is channels_before[UNTOUCHED_GENERATOR]
+        assert channels_after[EDITED_GENERATOR] is not channels_before[EDITED_GENERATOR]
+        assert after.song.order[0] is before.song.order[0]
+
+    def test_equal_content_interns_to_the_same_node(self, project_controller: ProjectController) -> None:
+        store = SnapshotStore()
+        original = store.capture(project_controller.project)
+
+        project_controller.set_row(EDITED_GENERATOR, 0, 0, transpose=EDITED_TRANSPOSE)
+        edited = store.capture(project_controller.project)
+        project_controller.clear_row(EDITED_GENERATOR, 0, 0)
+        reverted = store.capture(project_controller.project)
+
+        assert reverted.song is original.song
+        assert edited.song is not original.song
+
+    def test_digest_matches_across_stores(self, project_controller: ProjectController) -> None:
+        project_controller.set_row(EDITED_GENERATOR, 0, 0, transpose=EDITED_TRANSPOSE)
+
+        first = SnapshotStore().capture(project_controller.project)
+        second = SnapshotStore().capture(project_controller.project)
+
+        assert first.digest == second.digest
+
+    def test_an_unnamed_pattern_and_one_named_none_stay_apart(self, project_controller: ProjectController) -> None:
+        store = SnapshotStore()
+        pattern = project_controller.project.song.channels[EDITED_GENERATOR].patterns[0]
+        pattern.name = None
+        unnamed = store.capture(project_controller.project)
+
+        pattern.name = "None"
+        named = store.capture(project_controller.project)
+
+        restored = store.restore(named).song.channels[EDITED_GENERATOR].patterns[0]
+        assert named.digest != unnamed.digest
+        assert restored.name == "None"
+
+
+class TestRestore:
+    def test_restore_reproduces_the_fingerprint(
+        self,
+        project_controller: ProjectController,
+        reconstruction_factory: ReconstructionFactory,
+    ) -> None:
+        project_controller.add_sample(reconstruction_factory(), name="lead")
+        project_controller.set_row(EDITED_GENERATOR, 0, 0, transpose=EDITED_TRANSPOSE)
+        store = SnapshotStore()
+        snapshot = store.capture(project_controller.project)
+
+        restored = SnapshotStore().capture(store.restore(snapshot))
+
+        assert fingerprint_snapshot(restored, reconstruction_hash=hash_model) == fingerprint_snapshot(
+            snapshot, reconstruction_hash=hash_model
+        )
+
+    def test_editing_the_restored_project_leaves_the_snapshot(self, project_controller: ProjectController) -> None:
+        store = SnapshotStore()
+        snapshot = store.capture(project_controller.project)
+        restored = store.restore(snapshot)
+
+        restored.song.channels[EDITED_GENERATOR].set_row(0, 0, restored.song.channels[EDITED_GENERATOR].get_row(0, 1))
+        restored.settings.tempo = restored.settings.tempo + 1
+
+        assert SnapshotStore().capture(store.restore(snapshot)).digest == snapshot.digest
+
+
+class TestRetainedBytes:
+    def test_an_edit_retains_less_than_a_full_capture(self, project_controller: ProjectController) -> None:
+        store = SnapshotStore()
+        store.retain(store.capture(project_controller.project))
+        full = store.retained_bytes
+
+        project_controller.set_row(EDITED_GENERATOR, 0, 0, transpose=EDITED_TRANSPOSE)
+        store.retain(store.capture(project_controller.project))
+
+        assert 0 < store.retained_bytes - full < full
+
+    def test_releasing_every_snapshot_frees_everything(self, project_controller: ProjectController) -> None:
+        store = SnapshotStore()
+        first = store.capture(project_controller.project)
+        project_controller.set_row(EDITED_GENERATOR, 0, 0, transpose=EDITED_TRANSPOSE)
+        second = store.capture(project_controller.project)
+        store.retain(first)
+        store.retain(second)
+
+        store.release(first)
+        store.release(second)
+
+        assert store.retained_bytes == 0
+
+    def test_a_reconstruction_is_charged_once_the_project_lets_it_go(
+        self,
+        project_controller: ProjectController,
+        reconstruction_factory: ReconstructionFactory,
+    ) -> None:
+        store = SnapshotStore()
+        store.retain(store.capture(project_controller.project))
+        empty = store.retained_bytes
+        reconstruction = _large_reconstruction(reconstruction_factory)
+
+        lead = project_controller.add_sample(reconstruction, name="lead")
+        copy = project_controller.add_sample(reconstruction, name="copy")
+        store.retain(store.capture(project_controller.project))
+        live = store.retained_bytes
+        project_controller.remove_sample(lead.id)
+        project_controller.remove_sample(copy.id)
+        store.retain(store.capture(project_controller.project))
+
+        assert live - empty < reconstruction.nbytes
+        assert reconstruction.nbytes <= store.retained_bytes - live < 2 * reconstruction.nbytes
+
+    def test_a_reconstruction_edited_while_retained_is_refunded_what_it_was_charged(
+        self,
+        project_controller: ProjectController,
+        reconstruction_factory: ReconstructionFactory,
+    ) -> None:
+        store = SnapshotStore()
+        reconstruction = _large_reconstruction(reconstruction_factory)
+        sample = project_controller.add_sample(reconstruction, name="lead")
+        snapshot = store.capture(project_controller.project)
+        store.retain(snapshot)
+        project_controller.remove_sample(sample.id)
+        store.capture(project_controller.project)
+
+        reconstruction.update_generator_data(
+            GeneratorName.PULSE1,
+            [],
+            np.ones(2 * LARGE_SAMPLE_LENGTH, dtype=np.float32),
+            0,
+            (),
+        )
+        store.release(snapshot)
+
+        assert store.retained_bytes == 0
+
+
+def _large_reconstruction(reconstruction_factory: ReconstructionFactory) -> Reconstruction:
+    return reconstruction_factory().model_copy(
+        update={"approximation": np.zeros(LARGE_SAMPLE_LENGTH, dtype=np.float32)}
+    )
@@ -1,5 +1,5 @@
 import threading
-from typing import Dict, Final
+from typing import Dict, Final, Optional
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,6 +7,17 @@ import pytest
 from sampletones_application.categories.manager import LanguageManager
 from sampletones_application.logic.instruction.library import LibraryLogic
 from sampletones_application.paths import LANG_EN
+from sampletones_application.services.library import (
+    LibraryHeaderRead,
+    LibraryLoadError,
+    LibraryLoadSuperseded,
+    LoadedLibrary,
+)
+from sampletones_application.services.result import (
+    ServiceIntermediate,
+    ServiceProgress,
+    ServiceSuccess,
+)
 from sampletones_core.parallelization import TaskStatus
 from sampletones_shared.exceptions import (
     DeserializationError,
@@ -39,6 +50,8 @@ TEXTS: Final[Dict[str, str]] = {
     "instructions.library.template.library_loaded_template": "{} loaded.",
     "instructions.library.template.library_exists_template": "{} exists.",
     "instructions.library.template.library_not_exists_template": "{} doesn't exist.",
+    "instructions.library.template.library_loading_template": "Loading {}...",
+    "instructions.library.template.library_loading_progress_template": "Loading {}: {}/{}",
 }
 
 
@@ -67,59 +80,72 @@ class TestRequestGeneration:
         logic.generate_library.assert_called_once_with()
 
 
-def _load_logic(*, load_error: Exception) -> LibraryLogic:
-    """A library logic with only the state ``_load_library`` touches, bypassing the heavy
+def _load_logic(
+    *,
+    loading: bool = False,
+    loaded: bool = False,
+    current: Optional[MagicMock] = None,
+) -> LibraryLogic:
+    """A library logic with only the state the load path touches, bypassing the heavy
     constructor."""
     language_manager = FakeLanguageManager(TEXTS)
     logic = LibraryLogic.__new__(LibraryLogic)
     logic._is_locked_function = None
     logic._lock_function = None
     logic._unlock_function = MagicMock()
+    logic._status_lock = threading.Lock()
+    logic._config_manager = MagicMock()
     logic._library_manager = MagicMock()
-    logic._library_manager.load_library.side_effect = load_error
+    logic._library_manager.is_generating.return_value = True
+    logic._library_manager.is_library_loaded.return_value = loaded
+    logic._library_manager.current_library_key = current
+    logic._library_loader = MagicMock()
+    logic._library_loader.is_loading.return_value = loading
+    logic._requested_loads = set()
+    logic._load_progress = {}
+    logic._pending_instruction = None
     logic._language_manager = language_manager
     logic._msg_load_error = language_manager[LOAD_ERROR_KEY]
     logic.on_load_error = MagicMock()
+    logic.on_load_file_not_found = MagicMock()
+    logic.on_instruction_loaded = MagicMock()
     return logic
 
 
+def _fail(logic: LibraryLogic, error: Exception) -> MagicMock:
+    """Delivers a failed load of a library the reader asked for, returning its key."""
+    key = MagicMock()
+    logic._requested_loads.add(key)
+    logic._on_load_result(LibraryLoadError(key=key, exception=error))
+    return key
+
+
 class TestLoadLibraryTail:
     """The load pipeline wraps every unclassified deserialize failure in a ``LoadLibraryError``
     subtype, so the ladder's tail reports those through ``on_load_error`` with the generic
-    message; a failure outside the load contract is a bug and propagates. Both paths unlock.
+    message; a failure outside the load contract is a bug and propagates.
     """
 
     def test_unclassified_load_error_reports_the_generic_message(self) -> None:
         error = UnhandledLibraryError("wrapped")
-        logic = _load_logic(load_error=error)
+        logic = _load_logic()
 
-        logic._load_library(MagicMock())
+        _fail(logic, error)
 
         logic.on_load_error.assert_called_once_with(error, LOAD_ERROR_KEY)
-        logic._unlock_function.assert_called_once_with()
 
-    def test_unexpected_error_propagates_and_unlocks(self) -> None:
-        logic = _load_logic(load_error=RuntimeError("bug"))
+    def test_unexpected_error_propagates(self) -> None:
+        logic = _load_logic()
 
         with pytest.raises(RuntimeError):
-            logic._load_library(MagicMock())
+            _fail(logic, RuntimeError("bug"))
 
         logic.on_load_error.assert_not_called()
-        logic._unlock_function.assert_called_once_with()
-
-
-def _surfacing_load_logic(*, load_error: Exception) -> LibraryLogic:
-    """A library logic wired with every callback the ``_load_library`` ladder reports through, so a
-    concrete failure can be observed reaching the user-facing callbacks."""
-    logic = _load_logic(load_error=load_error)
-    logic.on_load_file_not_found = MagicMock()
-    return logic
 
 
 class TestLoadLibrarySurfacesConcreteErrors:
     """Each concrete load failure reaches the user through ``on_load_error`` with a populated
-    message, so a bad library file is reported rather than swallowed. The library unlocks in
-    every case."""
+    message, so a bad library file is reported rather than swallowed."""
 
     @pytest.mark.parametrize(
         "error, expected_message",
@@ -140,24 +166,22 @@ class TestLoadLibrarySurfacesConcreteErrors:
         error: Exception,
         expected_message: str,
     ) -> None:
-        logic = _surfacing_load_logic(load_error=error)
+        logic = _load_logic()
 
-        logic._load_library(MagicMock())
+        _fail(logic, error)
 
         logic.on_load_error.assert_called_once_with(error, expected_message)
-        logic._unlock_function.assert_called_once_with()
 
     def test_missing_file_reports_through_file_not_found_callback(self) -> None:
-        logic = _surfacing_load_logic(load_error=FileNotFoundError("gone"))
+        logic = _load_logic()
 
-        logic._load_library(MagicMock())
+        _fail(logic, FileNotFoundError("gone"))
 
         logic.on_load_file_not_found.assert_called_once_with(
             logic._library_manager.get_path.return_value,
             FILE_NOT_FOUND_KEY,
         )
         logic.on_load_error.assert_not_called()
-        logic._unlock_function.assert_called_once_with()
 
     def test_incompatible_version_reports_both_versions(self) -> None:
         error = IncompatibleLibraryDataVersionError(
@@ -165,12 +189,167 @@ class TestLoadLibrarySurfacesConcreteErrors:
             expected_version="2.0",
             actual_version="9.0",
         )
-        logic = _surfacing_load_logic(load_error=error)
+        logic = _load_logic()
 
-        logic._load_library(MagicMock())
+        _fail(logic, error)
 
         logic.on_load_error.assert_called_once_with(error, "got 9.0 expected 2.0")
-        logic._unlock_function.assert_called_once_with()
+
+    def test_failed_preload_is_not_reported(self) -> None:
+        logic = _load_logic()
+
+        logic._on_load_result(LibraryLoadError(key=MagicMock(), exception=OSError("io")))
+
+        logic.on_load_error.assert_not_called()
+
+
+class TestBackgroundLoad:
+    """Loading a library hands the file to the load service and returns at once; the library is
+    cached and shown when its result arrives on the main thread."""
+
+    def test_an_unloaded_library_is_handed_to_the_service(self) -> None:
+        logic = _load_logic()
+        key = MagicMock()
+
+        logic._load_library(key)
+
+        logic._library_loader.load.assert_called_once_with(key, logic._library_manager.get_path.return_value)
+
+    def test_a_library_already_loading_is_not_read_twice(self) -> None:
+        logic = _load_logic(loading=True)
+
+        logic._load_library(MagicMock())
+
+        logic._library_loader.load.assert_not_called()
+
+    def test_a_loaded_library_switches_without_the_service(self) -> None:
+        logic = _load_logic(loaded=True)
+        key = MagicMock()
+
+        logic._set_current_library(key)
+
+        logic._library_manager.set_current_library.assert_called_once_with(key)
+        logic._library_loader.load.assert_not_called()
+
+    def test_the_loaded_library_is_cached(self) -> None:
+        logic = _load_logic()
+        key, data = MagicMock(), MagicMock()
+
+        logic._on_load_result(ServiceSuccess(value=LoadedLibrary(key=key, data=data)))
+
+        logic._library_manager.store_library.assert_called_once_with(key, data)
+
+    def test_an_instruction_chosen_during_the_load_is_shown_once_it_lands(self) -> None:
+        key = MagicMock()
+        logic = _load_logic(loading=True, current=key)
+        instruction = MagicMock()
+
+        logic.load_instruction(instruction)
+        logic.on_instruction_loaded.assert_not_called()
+
+        logic._library_loader.is_loading.return_value = False
+        logic._on_load_result(ServiceSuccess(value=LoadedLibrary(key=key, data=MagicMock())))
+
+        logic._library_manager.load_instruction.assert_called_once_with(instruction)
+        logic.on_instruction_loaded.assert_called_once_with(logic._library_manager.load_instruction.return_value)
+
+    def test_a_failed_load_drops_the_waiting_instruction(self) -> None:
+        key = MagicMock()
+        logic = _load_logic(loading=True, current=key)
+        logic.load_instruction(MagicMock())
+
+        logic._on_load_result(LibraryLoadError(key=key, exception=OSError("io")))
+
+        assert logic._pending_instruction is None
+
+    def test_the_header_and_progress_are_remembered_for_the_status(self) -> None:
+        logic = _load_logic()
+        key = MagicMock()
+
+        logic._on_load_result(ServiceIntermediate(data=LibraryHeaderRead(key=key, header=MagicMock(size=40))))
+        assert logic._load_progress[key] == (0, 40)
+
+        logic._on_load_result(ServiceProgress(completed=12, total=40, current_item=key))
+        assert logic._load_progress[key] == (12, 40)
+
+
+class TestPreload:
+    """The current configuration's library is read ahead of its first use, unless it is already
+    in memory, absent, on its way, or a load the reader asked for is still running."""
+
+    def test_preloads_an_existing_unloaded_library(self) -> None:
+        logic = _load_logic()
+
+        logic.preload_config_library()
+
+        logic._library_loader.load.assert_called_once_with(
+            logic._config_manager.key,
+            logic._library_manager.get_path.return_value,
+        )
+
+    @pytest.mark.parametrize("state", ["loaded", "missing", "loading", "requested"])
+    def test_skips(self, state: str) -> None:
+        logic = _load_logic(loaded=state == "loaded", loading=state == "loading")
+        logic._library_manager.library_exists_for_key.return_value = state != "missing"
+        if state == "requested":
+            logic._requested_loads.add(MagicMock())
+
+        logic.preload_config_library()
+
+        logic._library_loader.load.assert_not_called()
+
+    def test_a_superseded_request_no_longer_holds_the_preload_off(self) -> None:
+        logic = _load_logic()
+        key = MagicMock()
+        logic._requested_loads.add(key)
+
+        logic._on_load_result(LibraryLoadSuperseded(key=key))
+        logic.preload_config_library()
+
+        assert not logic._requested_loads
+        logic._library_loader.load.assert_called_once()
+
+
+def _refresh_logic(*, listed: frozenset, relisted: frozenset, has_root: bool = True) -> LibraryLogic:
+    """A library logic whose manager lists ``listed`` before a rescan and ``relisted`` after."""
+    logic = _load_logic()
+    logic._library_manager.library_keys = listed
+    logic._library_manager.tree.root = MagicMock() if has_root else None
+    logic._library_manager.sync_with_config_key.return_value = None
+
+    def relist(_directory: object) -> None:
+        logic._library_manager.library_keys = relisted
+
+    logic._library_manager.set_library_directory.side_effect = relist
+    logic.on_rebuild_tree_needed = MagicMock()
+    logic.update_status = MagicMock()
+    return logic
+
+
+class TestRefreshLibraries:
+    """A rescan that finds the same libraries leaves the drawn tree alone."""
+
+    def test_unchanged_listing_skips_the_rebuild(self) -> None:
+        logic = _refresh_logic(listed=frozenset({"a"}), relisted=frozenset({"a"}))
+
+        logic.refresh_libraries()
+
+        logic.on_rebuild_tree_needed.assert_not_called()
+        logic.update_status.assert_called_once_with()
+
+    def test_a_new_library_rebuilds_the_tree(self) -> None:
+        logic = _refresh_logic(listed=frozenset({"a"}), relisted=frozenset({"a", "b"}))
+
+        logic.refresh_libraries()
+
+        logic.on_rebuild_tree_needed.assert_called_once_with()
+
+    def test_a_tree_never_drawn_is_built(self) -> None:
+        logic = _refresh_logic(listed=frozenset(), relisted=frozenset(), has_root=False)
+
+        logic.refresh_libraries()
+
+        logic.on_rebuild_tree_needed.assert_called_once_with()
 
 
 def _generation_logic(*, generating: bool = True) -> LibraryLogic:
@@ -182,6 +361,9 @@ def _generation_logic(*, generating: bool = True) -> LibraryLogic:
     logic._library_manager = MagicMock()
     logic._library_manager.is_generating.return_value = generating
     logic._library_manager.is_library_loaded.return_value = False
+    logic._library_loader = MagicMock()
+    logic._library_loader.is_loading.return_value = False
+    logic._load_progress = {}
     logic._language_manager = FakeLanguageManager(TEXTS)
     logic.on_view_changed = MagicMock()
     return logic
@@ -267,6 +449,33 @@ class TestGenerationEmits:
         assert view_model.status_text == "lib exists."
         assert view_model.generate_button_label == "Generate"
 
+    def test_update_status_counts_the_instructions_of_a_loading_library(self) -> None:
+        logic = _generation_logic(generating=False)
+        logic._library_loader.is_loading.return_value = True
+        logic._load_progress[logic._config_manager.key] = (12, 40)
+
+        with patch(
+            "sampletones_application.logic.instruction.library.get_display_name_from_key",
+            return_value="lib",
+        ):
+            logic.update_status()
+
+        view_model = logic.on_view_changed.call_args.args[0]
+        assert view_model.status_text == "Loading lib: 12/40"
+
+    def test_update_status_names_a_library_before_its_header(self) -> None:
+        logic = _generation_logic(generating=False)
+        logic._library_loader.is_loading.return_value = True
+
+        with patch(
+            "sampletones_application.logic.instruction.library.get_display_name_from_key",
+            return_value="lib",
+        ):
+            logic.update_status()
+
+        view_model = logic.on_view_changed.call_args.args[0]
+        assert view_model.status_text == "Loading lib..."
+
 
 class TestCancelledStatusLanguageKey:
     """The cancelled status resolves through ``LanguageManager`` at construction, so the language
@@ -97,7 +97,7 @@ class TestCompleteGeneration:
         library_manager: InstructionsLibraryManager,
     ) -> None:
         library_manager._library = MagicMock()
-        library_manager._library.save_data.side_effect = PermissionError("save failed")
+        library_manager._library.save_partials.side_effect = PermissionError("save failed")
         error_callback = MagicMock()
         completed_callback = MagicMock()
         library_manager.on_generation_error = error_callback
@@ -114,7 +114,7 @@ class TestCompleteGeneration:
         library_manager: InstructionsLibraryManager,
     ) -> None:
         library_manager._library = MagicMock()
-        library_manager._library.save_data.side_effect = RuntimeError("unexpected")
+        library_manager._library.save_partials.side_effect = RuntimeError("unexpected")
         error_callback = MagicMock()
         library_manager.on_generation_error = error_callback
 
@@ -136,3 +136,93 @@ class TestCompleteGeneration:
 
         assert library_manager._current_library_key is key
         completed_callback.assert_called_once()
+
+
+class TestLibraryCache:
+    """Loaded libraries survive a rescan of the same directory, so switching back to one is
+    immediate; pointing the manager at another directory starts afresh."""
+
+    def test_rescanning_the_same_directory_keeps_loaded_libraries(
+        self,
+        config_manager: ConfigManager,
+        library_manager: InstructionsLibraryManager,
+        tmp_path: Path,
+    ) -> None:
+        key = config_manager.key
+        _create_library_file(library_manager, key)
+        library_manager.store_library(key, MagicMock())
+
+        library_manager.set_library_directory(tmp_path / "libraries")
+
+        assert library_manager.is_library_loaded(key) is True
+
+    def test_a_library_whose_file_is_removed_is_dropped(
+        self,
+        config_manager: ConfigManager,
+        library_manager: InstructionsLibraryManager,
+    ) -> None:
+        key = config_manager.key
+        _create_library_file(library_manager, key)
+        library_manager.gather_available_libraries()
+        library_manager.store_library(key, MagicMock())
+
+        library_manager.get_path(key).unlink()
+        library_manager.gather_available_libraries()
+
+        assert key not in library_manager._library
+
+    def test_another_directory_drops_loaded_libraries(
+        self,
+        config_manager: ConfigManager,
+        library_manager: InstructionsLibraryManager,
+        tmp_path: Path,
+    ) -> None:
+        key = config_manager.key
+        _create_library_file(library_manager, key)
+        library_manager.store_library(key, MagicMock())
+
+        library_manager.set_library_directory(tmp_path / "elsewhere")
+
+        assert library_manager.is_library_loaded(key) is False
+
+
+class TestLibraryMemoryBudget:
+    """Under a memory budget the least recently used libraries are dropped, but never the
+    current one, whose pin follows the selection."""
+
+    @pytest.fixture
+    def budgeted_manager(self, config_manager: ConfigManager, tmp_path: Path) -> InstructionsLibraryManager:
+        manager = InstructionsLibraryManager(config_manager, language_manager=MagicMock(), memory_budget=100)
+        manager.set_library_directory(tmp_path / "libraries")
+        return manager
+
+    def test_current_library_survives_loading_others(self, budgeted_manager: InstructionsLibraryManager) -> None:
+        current, other = MagicMock(), MagicMock()
+        budgeted_manager.set_current_library(current)
+        budgeted_manager.store_library(current, MagicMock(nbytes=100))
+
+        budgeted_manager.store_library(other, MagicMock(nbytes=100))
+
+        assert set(budgeted_manager._library.keys()) == {current, other}
+
+    def test_previous_library_is_released_on_switching(self, budgeted_manager: InstructionsLibraryManager) -> None:
+        first, second = MagicMock(), MagicMock()
+        budgeted_manager.set_current_library(first)
+        budgeted_manager.store_library(first, MagicMock(nbytes=100))
+        budgeted_manager.store_library(second, MagicMock(nbytes=100))
+
+        budgeted_manager.set_current_library(second)
+
+        assert list(budgeted_manager._library.keys()) == [second]
+
+    def test_pin_follows_the_current_library_to_another_directory(
+        self,
+        budgeted_manager: InstructionsLibraryManager,
+        tmp_path: Path,
+    ) -> None:
+        key = MagicMock()
+        budgeted_manager.set_current_library(key)
+
+        budgeted_manager.set_library_directory(tmp_path / "elsewhere")
+
+        assert budgeted_manager._library.is_pinned(key) is True
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Iterator, List
 
@@ -99,19 +100,65 @@ class TestRefreshTree:
         write_reconstruction(directory, "Amen Breaks", "cw_amen02_165")
 
         listed: List[Path] = []
-        original_iterdir = Path.iterdir
+        original_scandir = os.scandir
 
-        def counting_iterdir(directory_path: Path) -> Iterator[Path]:
-            listed.append(directory_path)
-            return original_iterdir(directory_path)
+        def counting_scandir(directory_path: Path) -> Iterator[os.DirEntry[str]]:
+            listed.append(Path(directory_path))
+            return original_scandir(directory_path)
 
-        monkeypatch.setattr(Path, "iterdir", counting_iterdir)
+        monkeypatch.setattr(os, "scandir", counting_scandir)
         browser_manager.refresh_tree()
 
         assert tmp_path in listed
         assert sorted(listed) == sorted(set(listed))
 
 
+class TestIncrementalRefresh:
+    def test_a_refresh_finding_the_disk_as_it_was_keeps_the_tree(
+        self,
+        browser_manager: BrowserManager,
+        tmp_path: Path,
+    ) -> None:
+        write_reconstruction(config_directory(tmp_path, config_fields()), "song")
+        browser_manager.refresh_tree()
+        root = browser_manager.tree.get_root()
+
+        browser_manager.refresh_tree()
+
+        assert browser_manager.tree.get_root() is root
+
+    def test_a_new_reconstruction_is_picked_up(
+        self,
+        browser_manager: BrowserManager,
+        tmp_path: Path,
+    ) -> None:
+        directory = config_directory(tmp_path, config_fields())
+        write_reconstruction(directory, "first")
+        browser_manager.refresh_tree()
+
+        added = write_reconstruction(directory, "second")
+        browser_manager.refresh_tree()
+
+        assert added in browser_manager.get_all_reconstruction_files()
+        assert len(browser_manager.nodes_at(added)) == 2
+
+    def test_a_removed_reconstruction_leaves_no_rows(
+        self,
+        browser_manager: BrowserManager,
+        tmp_path: Path,
+    ) -> None:
+        directory = config_directory(tmp_path, config_fields())
+        write_reconstruction(directory, "first")
+        removed = write_reconstruction(directory, "second")
+        browser_manager.refresh_tree()
+
+        removed.unlink()
+        browser_manager.refresh_tree()
+
+        assert browser_manager.nodes_at(removed) == ()
+        assert removed not in browser_manager.get_all_reconstruction_files()
+
+
 class TestBranchShape:
     def test_a_lone_configuration_reads_as_one_row(
         self,
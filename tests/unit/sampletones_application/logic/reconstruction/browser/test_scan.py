@@ -1,4 +1,8 @@
+import os
 from pathlib import Path
+from typing import Iterator, List
+
+import pytest
 
 from sampletones_application.logic.reconstruction.browser.tree.entries.directory import (
     DirectoryEntry,
@@ -7,6 +11,8 @@ from sampletones_application.logic.reconstruction.browser.tree.entries.reconstru
     ReconstructionEntry,
 )
 from sampletones_application.logic.reconstruction.browser.tree.scan import (
+    MTIME_SETTLE_NS,
+    ReconstructionScanIndex,
     scan_reconstructions,
 )
 
@@ -108,3 +114,72 @@ class TestScanReconstructions:
 
         config_entry = next(entry for entry in scan.entries if isinstance(entry, DirectoryEntry))
         assert [entry.path for entry in scan.collect_reconstructions(config_entry.entries)] == [nested_path]
+
+
+def _settle(*directories: Path) -> None:
+    """Dates folders far enough back that the index trusts the time they carry."""
+    for directory in directories:
+        past = directory.stat().st_mtime_ns - 10 * MTIME_SETTLE_NS
+        os.utime(directory, ns=(past, past))
+
+
+@pytest.fixture
+def listed(monkeypatch: pytest.MonkeyPatch) -> List[Path]:
+    """The folders the scan reads, in the order it reads them."""
+    folders: List[Path] = []
+    original_scandir = os.scandir
+
+    def counting_scandir(directory: Path) -> Iterator[os.DirEntry[str]]:
+        folders.append(Path(directory))
+        return original_scandir(directory)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    return folders
+
+
+class TestScanIndex:
+    def test_an_unchanged_directory_yields_the_previous_scan(self, tmp_path: Path) -> None:
+        write_reconstruction(tmp_path / "folder", "song")
+        index = ReconstructionScanIndex()
+
+        first = index.scan(tmp_path)
+
+        assert index.scan(tmp_path) is first
+
+    def test_a_settled_folder_is_not_read_again(self, tmp_path: Path, listed: List[Path]) -> None:
+        folder = tmp_path / "folder"
+        write_reconstruction(folder, "song")
+        _settle(folder, tmp_path)
+        index = ReconstructionScanIndex()
+        index.scan(tmp_path)
+        listed.clear()
+
+        index.scan(tmp_path)
+
+        assert listed == []
+
+    def test_only_the_folder_that_changed_is_read_again(self, tmp_path: Path, listed: List[Path]) -> None:
+        quiet, busy = tmp_path / "quiet", tmp_path / "busy"
+        write_reconstruction(quiet, "song")
+        write_reconstruction(busy, "song")
+        _settle(quiet, busy, tmp_path)
+        index = ReconstructionScanIndex()
+        first = index.scan(tmp_path)
+        listed.clear()
+
+        added = write_reconstruction(busy, "another")
+        scan = index.scan(tmp_path)
+
+        assert listed == [busy]
+        assert ReconstructionEntry(path=added) in scan.reconstructions
+        assert scan.entries[1] is first.entries[1]
+
+    def test_a_rescan_matches_a_fresh_reading(self, tmp_path: Path) -> None:
+        write_reconstruction(tmp_path / "a", "one")
+        index = ReconstructionScanIndex()
+        index.scan(tmp_path)
+
+        write_reconstruction(tmp_path / "b" / "nested", "two")
+        (tmp_path / "a" / "one.stn").unlink()
+
+        assert index.scan(tmp_path) == scan_reconstructions(tmp_path)
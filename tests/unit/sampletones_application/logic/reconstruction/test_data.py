@@ -215,6 +215,15 @@ class TestWaveformData:
         assert waveform_data.coefficient == reconstruction.coefficient
         assert waveform_data.frame_length == reconstruction.config.frame_length
 
+    def test_the_projection_is_held_with_the_data(
+        self,
+        reconstruction_factory: Callable[[], Reconstruction],
+    ) -> None:
+        data = ReconstructionData.from_reconstruction(reconstruction_factory(), name="Sample")
+
+        assert data.waveform_data() is data.waveform_data()
+        assert data.with_reconstruction(reconstruction_factory()).waveform_data() is not data.waveform_data()
+
 
 class TestReconstructionDataGetPartials:
     def test_empty_generator_list_returns_zeros(
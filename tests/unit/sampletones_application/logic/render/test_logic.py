@@ -30,6 +30,7 @@ from tests.suite.render import FakeRenderService
 AUDIO_DIRECTORY: Final[Path] = Path("/home/user/audio")
 PROJECT_NAME: Final[str] = "chiptune"
 LOW_RATE: Final[int] = 8000
+LONG_SONG_FRAMES: Final[int] = 8
 
 
 class RenderFixture:
@@ -183,6 +184,22 @@ class TestStartingTheRender:
 
         assert render_whole_song(request.synthesizer) == request.total_samples
 
+    def test_a_short_song_renders_on_one_kernel(self, render: RenderFixture) -> None:
+        render.start_at(LOW_RATE)
+
+        assert render.service.request.plan is None
+
+    def test_a_long_song_is_split_across_the_pool_by_channel(self, render: RenderFixture) -> None:
+        for _ in range(LONG_SONG_FRAMES):
+            render.controller.append_frame()
+
+        render.start_at(LOW_RATE)
+
+        plan = render.service.request.plan
+        assert plan is not None
+        assert {part.channel for part in plan.parts} == set(range(plan.channels))
+        assert plan.source.sample_rate == LOW_RATE
+
     def test_a_declined_request_leaves_the_dialog_setting_up(self) -> None:
         render = RenderFixture(accepts=False)
         render.configure()
@@ -0,0 +1,108 @@
+from dataclasses import replace
+from typing import Final
+
+import numpy as np
+import pytest
+
+from sampletones_application.logic.project.controller import ProjectController
+from sampletones_application.logic.render.parallel import (
+    SegmentSource,
+    plan_parallel_render,
+)
+from sampletones_application.logic.sequencer.channels import ALL_CHANNELS
+from sampletones_application.logic.sequencer.playback.synthesizer import RowSynthesizer
+from sampletones_application.logic.shared.project_source import ProjectSnapshot
+from sampletones_application.services.render.mixer import PartMixer
+from sampletones_application.services.render.plan import RenderPlan
+from sampletones_application.services.render.service import SongRenderService
+from sampletones_core.configs import Config, GeneralConfig
+from sampletones_core.constants.enums import GeneratorName
+from tests.unit.sampletones_application.logic.sequencer.playback.conftest import (
+    add_sample,
+    make_controller,
+    make_noise_reconstruction,
+    make_pulse_reconstruction,
+    make_triangle_reconstruction,
+    place_modifier_row,
+    place_note_off,
+    place_row,
+)
+
+SAMPLE_RATE: Final[int] = 22050
+MINIMUM_ROWS: Final[int] = 6
+CONFIGURED_WORKERS: Final[int] = 1
+
+
+@pytest.fixture
+def source() -> SegmentSource:
+    """A loud song whose channels trigger, bend and cut notes at staggered rows."""
+    controller = make_controller()
+    pulse = add_sample(controller, make_pulse_reconstruction(count=12), loop=True)
+    triangle = add_sample(controller, make_triangle_reconstruction(count=20))
+    noise = add_sample(controller, make_noise_reconstruction(count=7), loop=True)
+    for row_index, transpose in ((0, 0), (9, 5), (21, -3)):
+        place_row(
+            controller, generator=GeneratorName.PULSE1, row_index=row_index, sample_id=pulse.id, transpose=transpose
+        )
+        place_row(controller, generator=GeneratorName.PULSE2, row_index=row_index + 2, sample_id=pulse.id)
+    place_modifier_row(controller, generator=GeneratorName.PULSE1, row_index=14, volume=6)
+    place_note_off(controller, generator=GeneratorName.PULSE1, row_index=40)
+    place_row(controller, generator=GeneratorName.TRIANGLE, row_index=4, sample_id=triangle.id)
+    place_row(controller, generator=GeneratorName.TRIANGLE, row_index=33, sample_id=triangle.id, transpose=7)
+    place_row(controller, generator=GeneratorName.NOISE, row_index=1, sample_id=noise.id, volume=9)
+    place_note_off(controller, generator=GeneratorName.NOISE, row_index=50)
+    return SegmentSource(project=controller.project, config=Config(), sample_rate=SAMPLE_RATE)
+
+
+def _render_serially(source: SegmentSource) -> np.ndarray:
+    synthesizer = RowSynthesizer(
+        ProjectSnapshot(project=source.project),
+        source.config,
+        active_channels=lambda: ALL_CHANNELS,
+        sample_rate=lambda: source.sample_rate,
+    )
+    chunks = []
+    while not synthesizer.is_finished:
+        chunks.append(synthesizer.render_row()[0])
+
+    return np.concatenate(chunks)
+
+
+def _render_in_parts(plan: RenderPlan) -> np.ndarray:
+    mixer = PartMixer(plan)
+    chunks = []
+    for index, part in reversed(list(enumerate(plan.parts))):
+        mixer.add(index, plan.renderer(plan.source, part.task))
+        chunk = mixer.drain()
+        if chunk is not None:
+            chunks.append(chunk)
+
+    return np.concatenate(chunks)
+
+
+class TestRenderingInParts:
+    def test_the_segments_mix_to_the_song_a_single_kernel_renders(
+        self,
+        source: SegmentSource,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr("sampletones_application.logic.render.parallel.SEGMENT_MINIMUM_ROWS", MINIMUM_ROWS)
+        plan = plan_parallel_render(source)
+        assert len(plan.parts) > len(GeneratorName.items())
+
+        whole = _render_serially(source)
+        assert np.any(whole)
+        np.testing.assert_array_equal(_render_in_parts(plan), whole)
+
+    def test_the_plan_opens_with_the_start_of_every_channel(self, source: SegmentSource) -> None:
+        plan = plan_parallel_render(source)
+
+        assert [part.channel for part in plan.parts[: plan.channels]] == list(range(plan.channels))
+
+    def test_the_plan_keeps_to_the_configured_workers(self, source: SegmentSource) -> None:
+        config = Config(general=GeneralConfig(max_workers=CONFIGURED_WORKERS))
+
+        plan = plan_parallel_render(replace(source, config=config))
+
+        assert plan.max_workers == CONFIGURED_WORKERS
+        assert SongRenderService()._pool_size(plan) == CONFIGURED_WORKERS
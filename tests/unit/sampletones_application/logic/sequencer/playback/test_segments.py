@@ -0,0 +1,71 @@
+from typing import Final, List
+
+from sampletones_application.logic.project.controller import ProjectController
+from sampletones_application.logic.sequencer.playback.synthesizer import (
+    ChannelSegment,
+    plan_channel_segments,
+)
+from sampletones_core.constants.enums import GeneratorName
+from tests.unit.sampletones_application.logic.sequencer.playback.conftest import (
+    add_sample,
+    make_pulse_reconstruction,
+    place_modifier_row,
+    place_note_off,
+    place_row,
+)
+
+MINIMUM_ROWS: Final[int] = 8
+
+
+def _segments(controller: ProjectController, generator: GeneratorName) -> List[ChannelSegment]:
+    segments = plan_channel_segments(controller.project.song, MINIMUM_ROWS)
+    return [segment for segment in segments if segment.generator_name == generator]
+
+
+def _total_rows(controller: ProjectController) -> int:
+    song = controller.project.song
+    return song.order_length() * song.rows_per_pattern
+
+
+class TestChannelSegments:
+    def test_a_channel_without_notes_is_one_segment_spanning_the_song(self, controller: ProjectController) -> None:
+        assert _segments(controller, GeneratorName.TRIANGLE) == [
+            ChannelSegment(GeneratorName.TRIANGLE, 0, _total_rows(controller)),
+        ]
+
+    def test_a_segment_opens_on_a_note_or_a_cut(self, controller: ProjectController) -> None:
+        sample = add_sample(controller, make_pulse_reconstruction())
+        place_row(controller, generator=GeneratorName.PULSE1, row_index=10, sample_id=sample.id)
+        place_note_off(controller, generator=GeneratorName.PULSE1, row_index=30)
+
+        assert _segments(controller, GeneratorName.PULSE1) == [
+            ChannelSegment(GeneratorName.PULSE1, 0, 10),
+            ChannelSegment(GeneratorName.PULSE1, 10, 30),
+            ChannelSegment(GeneratorName.PULSE1, 30, _total_rows(controller)),
+        ]
+
+    def test_notes_closer_than_the_minimum_stay_in_one_segment(self, controller: ProjectController) -> None:
+        sample = add_sample(controller, make_pulse_reconstruction())
+        for row_index in (MINIMUM_ROWS, MINIMUM_ROWS + 2, MINIMUM_ROWS * 2 + 1):
+            place_row(controller, generator=GeneratorName.PULSE1, row_index=row_index, sample_id=sample.id)
+
+        assert _segments(controller, GeneratorName.PULSE1) == [
+            ChannelSegment(GeneratorName.PULSE1, 0, MINIMUM_ROWS),
+            ChannelSegment(GeneratorName.PULSE1, MINIMUM_ROWS, MINIMUM_ROWS * 2 + 1),
+            ChannelSegment(GeneratorName.PULSE1, MINIMUM_ROWS * 2 + 1, _total_rows(controller)),
+        ]
+
+    def test_a_row_that_only_modifies_opens_no_segment(self, controller: ProjectController) -> None:
+        place_modifier_row(controller, generator=GeneratorName.PULSE1, row_index=20, volume=4)
+
+        assert len(_segments(controller, GeneratorName.PULSE1)) == 1
+
+    def test_the_segments_cover_every_channel_end_to_end(self, controller: ProjectController) -> None:
+        sample = add_sample(controller, make_pulse_reconstruction())
+        place_row(controller, generator=GeneratorName.PULSE1, row_index=12, sample_id=sample.id)
+
+        for generator in GeneratorName.items():
+            segments = _segments(controller, generator)
+            assert segments[0].first_row == 0
+            assert segments[-1].end_row == _total_rows(controller)
+            assert all(left.end_row == right.first_row for left, right in zip(segments, segments[1:]))
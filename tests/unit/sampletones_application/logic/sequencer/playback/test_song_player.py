@@ -1,5 +1,5 @@
 from typing import List, Tuple
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -7,6 +7,7 @@ from sampletones_application.constants.playback import FollowMode
 from sampletones_application.logic.sequencer.playback.song_player import SongPlayerLogic
 from sampletones_application.services.song_player.result import (
     SongPlaybackError,
+    SongPlaybackStatistics,
     SongPlaybackStopped,
     SongPositionUpdate,
 )
@@ -16,6 +17,17 @@ from tests.unit.sampletones_application.logic.sequencer.playback.conftest import
     make_controller,
 )
 
+LOGGER_TARGET = "sampletones_application.logic.sequencer.playback.song_player.logger"
+
+
+def _statistics(*, underruns: int) -> SongPlaybackStatistics:
+    return SongPlaybackStatistics(
+        underruns=underruns,
+        minimum_fill_seconds=0.1,
+        realtime_factor=20.0,
+        prefetch_seconds=0.25,
+    )
+
 
 def _make_logic(*, is_open: bool = True) -> SongPlayerLogic:
     controller = make_controller()
@@ -314,6 +326,34 @@ class TestOnServiceResult:
 
         assert errors == [error]
 
+    def test_statistics_leave_the_view_and_position_alone(self) -> None:
+        logic = _make_logic()
+        views = _capture_views(logic)
+        logic._position = SongPosition(order_position=3, row_index=2)
+
+        logic._on_service_result(_statistics(underruns=0))
+
+        assert views == []
+        assert logic._position == SongPosition(order_position=3, row_index=2)
+
+    def test_statistics_with_underruns_are_logged_as_a_warning(self) -> None:
+        logic = _make_logic()
+
+        with patch(LOGGER_TARGET) as logger:
+            logic._on_service_result(_statistics(underruns=2))
+
+        logger.warning.assert_called_once()
+        logger.info.assert_not_called()
+
+    def test_clean_statistics_are_logged_as_info(self) -> None:
+        logic = _make_logic()
+
+        with patch(LOGGER_TARGET) as logger:
+            logic._on_service_result(_statistics(underruns=0))
+
+        logger.info.assert_called_once()
+        logger.warning.assert_not_called()
+
 
 class TestOnProjectReplaced:
     def test_on_project_replaced_stops_playback_and_resets_position(self) -> None:
@@ -955,3 +955,53 @@ class TestChannelHeldValues:
         context.synthesizer.reset()
 
         assert _state(context).feature_values == CHANNEL_FEATURE_DEFAULTS
+
+    def test_a_regenerated_sample_is_read_through_its_new_reconstruction(self) -> None:
+        context = _make_context()
+        sample = add_sample(
+            _controller(context),
+            make_pulse_reconstruction(
+                volume=QUIET_VOLUME,
+                count=SUSTAINED_FRAMES,
+                held_features=(FeatureKey.VOLUME,),
+            ),
+            name="holds",
+        )
+        place_row(_controller(context), generator=GeneratorName.PULSE1, row_index=0, sample_id=sample.id)
+        writing = _make_context()
+        self._place(
+            writing,
+            make_pulse_reconstruction(volume=QUIET_VOLUME, count=SUSTAINED_FRAMES),
+            row_index=0,
+            name="writes",
+        )
+
+        held = _render(context)
+        _controller(context).replace_sample_reconstruction(
+            sample.id,
+            make_pulse_reconstruction(volume=QUIET_VOLUME, count=SUSTAINED_FRAMES),
+        )
+        written = _render(context)
+
+        assert self._peak(held) > self._peak(written)
+        assert self._peak(written) == pytest.approx(self._peak(_render(writing)))
+
+    def test_a_voice_is_let_go_with_its_sample(self) -> None:
+        context = _make_context()
+        removed = add_sample(_controller(context), make_pulse_reconstruction(count=SUSTAINED_FRAMES), name="removed")
+        regenerated = add_sample(_controller(context), make_pulse_reconstruction(count=SUSTAINED_FRAMES), name="kept")
+        place_row(_controller(context), generator=GeneratorName.PULSE1, row_index=0, sample_id=removed.id)
+        place_row(_controller(context), generator=GeneratorName.PULSE1, row_index=1, sample_id=regenerated.id)
+        _render(context)
+        _render(context)
+        assert len(context.synthesizer._voices) == 2
+
+        _controller(context).remove_sample(removed.id)
+        _controller(context).replace_sample_reconstruction(
+            regenerated.id,
+            make_pulse_reconstruction(count=SUSTAINED_FRAMES),
+        )
+        _render(context)
+
+        held = [reconstruction for reconstruction, _ in context.synthesizer._voices.values()]
+        assert held == [_controller(context).project.sample(regenerated.id).reconstruction]
@@ -5,7 +5,7 @@ from typing import Dict, Final, Iterable, List, Sequence
 import numpy as np
 import pytest
 
-from sampletones_application.logic.sequencer.playback.synthesizer import SampleVoice
+from sampletones_application.logic.sequencer.playback.synthesizer import SampleVoice, apply_modifiers
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import FeatureKey, GeneratorName
 from sampletones_core.constants.general import MAX_VOLUME
@@ -302,3 +302,46 @@ class TestAHeldDimensionSoundsAtTheChannelsValue(BaseTestSuite):
         voice.sound(rest, values)
 
         assert values[FeatureKey.DUTY_CYCLE] == DUTY_CYCLE
+
+
+class TestARepeatedFrameIsReadBack:
+    """A voice remembers each frame it sounded, so a looping sample builds each frame once."""
+
+    _INSTRUCTION = PulseInstruction(
+        on=True,
+        pitch=REFERENCE_PITCH,
+        volume=SAMPLE_VOLUME,
+        duty_cycle=DUTY_CYCLE,
+    )
+
+    def test_the_same_frame_in_the_same_state_is_the_same_instruction(self) -> None:
+        voice = _voice(GeneratorName.PULSE1, [self._INSTRUCTION], (FeatureKey.VOLUME,))
+
+        first = voice.sound(self._INSTRUCTION, _channel_values())
+
+        assert voice.sound(self._INSTRUCTION, _channel_values()) is first
+
+    def test_a_remembered_frame_still_hands_its_values_to_the_channel(self) -> None:
+        voice = _voice(GeneratorName.PULSE1, [self._INSTRUCTION], ())
+        voice.sound(self._INSTRUCTION, _channel_values())
+        values = _channel_values()
+
+        voice.sound(self._INSTRUCTION, values)
+
+        assert values[FeatureKey.VOLUME] == SAMPLE_VOLUME
+
+    def test_a_different_held_value_sounds_a_different_frame(self) -> None:
+        voice = _voice(GeneratorName.PULSE1, [self._INSTRUCTION], (FeatureKey.VOLUME,))
+        values = _channel_values()
+        voice.sound(self._INSTRUCTION, values)
+        values[FeatureKey.VOLUME] = CHANNEL_VOLUME
+
+        assert voice.sound(self._INSTRUCTION, values).volume == CHANNEL_VOLUME
+
+    def test_play_bends_the_sounded_frame_by_the_pattern(self) -> None:
+        voice = _voice(GeneratorName.PULSE1, [self._INSTRUCTION], ())
+
+        played = voice.play(self._INSTRUCTION, _channel_values(), CHANNEL_ARPEGGIO, MAX_VOLUME)
+
+        assert played == apply_modifiers(self._INSTRUCTION, CHANNEL_ARPEGGIO, MAX_VOLUME)
+        assert voice.play(self._INSTRUCTION, _channel_values(), CHANNEL_ARPEGGIO, MAX_VOLUME) is played
@@ -0,0 +1,191 @@
+from pathlib import Path
+from typing import Any, Dict, Final, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sampletones_application.services.library import (
+    LibraryHeaderRead,
+    LibraryLoadError,
+    LibraryLoadService,
+    LibraryLoadSuperseded,
+    LoadedLibrary,
+)
+from sampletones_application.services.result import (
+    ServiceIntermediate,
+    ServiceProgress,
+    ServiceSuccess,
+)
+from sampletones_application.utils.parallelization.thread import SingleThreadExecutor
+from sampletones_core.configs import Config
+from sampletones_core.fft import Window
+from sampletones_core.fft.features import get_feature_extractor
+from sampletones_core.generators import get_generators_by_names
+from sampletones_core.instructions import InstructionUnion
+from sampletones_core.library import (
+    InstructionLibraryData,
+    InstructionLibraryFragment,
+    InstructionLibraryKey,
+)
+
+INSTRUCTIONS_PER_GENERATOR: Final[int] = 2
+
+
+@pytest.fixture(scope="module")
+def library_data() -> InstructionLibraryData:
+    config = Config()
+    extractor = get_feature_extractor(config, Window.from_config(config))
+    data: Dict[InstructionUnion, InstructionLibraryFragment[Any]] = {}
+    for generator in get_generators_by_names(config, config.generation.generators).values():
+        for instruction in list(generator.get_possible_instructions())[:INSTRUCTIONS_PER_GENERATOR]:
+            data[instruction] = InstructionLibraryFragment.create(generator, instruction, extractor)
+
+    return InstructionLibraryData.create(config, data)
+
+
+@pytest.fixture
+def library_path(library_data: InstructionLibraryData, tmp_path: Path) -> Path:
+    path = tmp_path / "library.ins"
+    library_data.save(path)
+    return path
+
+
+@pytest.fixture
+def key() -> InstructionLibraryKey:
+    config = Config()
+    return InstructionLibraryKey.create(config.library, Window.from_config(config))
+
+
+def _service(results: List[Any]) -> LibraryLoadService:
+    service = LibraryLoadService()
+    service.subscribe(results.append)
+    return service
+
+
+class TestLibraryLoadServiceRun:
+    def test_header_comes_first_and_the_library_last(
+        self,
+        library_data: InstructionLibraryData,
+        library_path: Path,
+        key: InstructionLibraryKey,
+    ) -> None:
+        results: List[Any] = []
+
+        _service(results)._run(key, library_path)
+
+        assert isinstance(results[0], ServiceIntermediate)
+        assert results[0].data == LibraryHeaderRead(
+            key=key,
+            header=InstructionLibraryData.read_header(library_path),
+        )
+        assert isinstance(results[-1], ServiceSuccess)
+        loaded: LoadedLibrary = results[-1].value
+        assert loaded.key == key
+        assert list(loaded.data.keys()) == list(library_data.keys())
+
+    def test_progress_counts_up_to_every_item(
+        self,
+        library_data: InstructionLibraryData,
+        library_path: Path,
+        key: InstructionLibraryKey,
+    ) -> None:
+        results: List[Any] = []
+
+        _service(results)._run(key, library_path)
+
+        progress = [result for result in results if isinstance(result, ServiceProgress)]
+        assert progress
+        assert all(report.current_item == key for report in progress)
+        assert [report.completed for report in progress] == sorted(report.completed for report in progress)
+        assert progress[-1].completed == progress[-1].total == len(library_data.items)
+
+    def test_missing_file_emits_a_keyed_error(self, tmp_path: Path, key: InstructionLibraryKey) -> None:
+        results: List[Any] = []
+
+        _service(results)._run(key, tmp_path / "missing.ins")
+
+        assert len(results) == 1
+        assert isinstance(results[0], LibraryLoadError)
+        assert results[0].key == key
+        assert isinstance(results[0].exception, FileNotFoundError)
+
+    def test_shutdown_abandons_the_load_silently(
+        self,
+        library_path: Path,
+        key: InstructionLibraryKey,
+    ) -> None:
+        results: List[Any] = []
+        service = _service(results)
+
+        with patch.object(SingleThreadExecutor, "is_shutting_down", return_value=True):
+            service._run(key, library_path)
+
+        assert [type(result) for result in results] == [ServiceIntermediate]
+        assert service.is_loading(key) is False
+
+
+class TestLibraryLoadServiceIsLoading:
+    def test_a_key_loads_until_its_outcome_is_delivered(
+        self,
+        library_path: Path,
+        key: InstructionLibraryKey,
+    ) -> None:
+        loading_on_delivery: List[bool] = []
+        service = LibraryLoadService()
+        service.subscribe(lambda result: loading_on_delivery.append(service.is_loading(key)))
+
+        service.load(key, library_path)
+
+        assert loading_on_delivery[0] is True
+        assert loading_on_delivery[-1] is False
+        assert service.is_loading(key) is False
+
+    def test_an_error_retires_the_key(self, tmp_path: Path, key: InstructionLibraryKey) -> None:
+        service = LibraryLoadService()
+
+        service.load(key, tmp_path / "missing.ins")
+
+        assert service.is_loading(key) is False
+
+    def test_a_queued_key_counts_as_loading(self, key: InstructionLibraryKey) -> None:
+        service = LibraryLoadService()
+
+        with patch.object(service._executor, "submit", return_value=True):
+            service.load(key, Path("unused.ins"))
+
+        assert service.is_loading(key) is True
+
+
+class TestLibraryLoadServiceSupersede:
+    def test_a_queued_load_replaced_by_a_newer_request_is_reported(self) -> None:
+        results: List[Any] = []
+        service = _service(results)
+        first, second, third = MagicMock(), MagicMock(), MagicMock()
+        ran: List[Any] = []
+
+        def run(key: Any, _path: Path) -> None:
+            with service._lock:
+                if service._queued == key:
+                    service._queued = None
+            ran.append(key)
+            if key is first:
+                service.load(second, Path("second.ins"))
+                service.load(third, Path("third.ins"))
+
+        with patch.object(service, "_run", side_effect=run):
+            service.load(first, Path("first.ins"))
+
+        assert ran == [first, third]
+        assert results == [LibraryLoadSuperseded(key=second)]
+        assert service.is_loading(second) is False
+
+    def test_requesting_the_queued_key_again_reports_nothing(self, key: InstructionLibraryKey) -> None:
+        results: List[Any] = []
+        service = _service(results)
+
+        with patch.object(service._executor._executor, "execute", return_value=True):
+            service.load(key, Path("unused.ins"))
+            service.load(key, Path("unused.ins"))
+
+        assert not results
+        assert service.is_loading(key) is True
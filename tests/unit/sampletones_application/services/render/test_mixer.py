@@ -0,0 +1,74 @@
+from typing import Final
+
+import numpy as np
+
+from sampletones_application.services.render.mixer import PartMixer
+from sampletones_application.services.render.plan import RenderPart, RenderPlan
+
+PART_SAMPLES: Final[int] = 8
+
+
+def _never_called(source: object, task: object) -> np.ndarray:
+    raise AssertionError("A mixer never renders a part itself")
+
+
+def _plan(*channels: int) -> RenderPlan:
+    return RenderPlan(
+        renderer=_never_called,
+        source=None,
+        parts=tuple(RenderPart(channel=channel, task=index) for index, channel in enumerate(channels)),
+        channels=max(channels) + 1,
+    )
+
+
+def _part(level: float, samples: int = PART_SAMPLES) -> np.ndarray:
+    return np.full(samples, level, dtype=np.float32)
+
+
+class TestThePartMixer:
+    def test_nothing_is_released_before_every_channel_has_audio(self) -> None:
+        mixer = PartMixer(_plan(0, 1))
+
+        mixer.add(0, _part(0.25))
+
+        assert mixer.drain() is None
+
+    def test_the_channels_are_summed_over_the_stretch_they_share(self) -> None:
+        mixer = PartMixer(_plan(0, 1))
+
+        mixer.add(0, _part(0.25))
+        mixer.add(1, _part(0.5, samples=PART_SAMPLES // 2))
+
+        np.testing.assert_array_equal(mixer.drain(), _part(0.75, samples=PART_SAMPLES // 2))
+
+    def test_a_longer_channel_keeps_its_remainder_for_the_next_stretch(self) -> None:
+        mixer = PartMixer(_plan(0, 1, 1))
+        mixer.add(0, _part(0.25))
+        mixer.add(1, _part(0.5, samples=PART_SAMPLES // 2))
+        mixer.drain()
+
+        mixer.add(2, _part(0.125, samples=PART_SAMPLES // 2))
+
+        np.testing.assert_array_equal(mixer.drain(), _part(0.375, samples=PART_SAMPLES // 2))
+
+    def test_a_part_arriving_early_waits_for_the_one_before_it(self) -> None:
+        mixer = PartMixer(_plan(0, 0))
+
+        mixer.add(1, _part(0.5))
+
+        assert mixer.drain() is None
+
+        mixer.add(0, _part(0.25))
+
+        np.testing.assert_array_equal(
+            mixer.drain(),
+            np.concatenate([_part(0.25), _part(0.5)]),
+        )
+
+    def test_the_mix_is_clipped(self) -> None:
+        mixer = PartMixer(_plan(0, 1))
+
+        mixer.add(0, _part(0.75))
+        mixer.add(1, _part(0.75))
+
+        np.testing.assert_array_equal(mixer.drain(), _part(1.0))
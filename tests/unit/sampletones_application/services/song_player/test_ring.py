@@ -0,0 +1,90 @@
+from typing import Final
+
+import numpy as np
+
+from sampletones_application.services.song_player.ring import SampleRing
+from sampletones_core.project.song_position import SongPosition
+
+CAPACITY: Final[int] = 8
+
+
+class TestSampleRingFill:
+    def test_new_ring_is_empty(self) -> None:
+        ring = SampleRing(CAPACITY)
+
+        assert ring.fill == 0
+        assert ring.free == CAPACITY
+
+    def test_write_stops_at_the_capacity(self) -> None:
+        ring = SampleRing(CAPACITY)
+
+        written = ring.write(np.ones(CAPACITY + 3, dtype=np.float32))
+
+        assert written == CAPACITY
+        assert ring.free == 0
+
+    def test_read_stops_at_the_fill(self) -> None:
+        ring = SampleRing(CAPACITY)
+        ring.write(np.ones(3, dtype=np.float32))
+        out = np.full(5, -1.0, dtype=np.float32)
+
+        count = ring.read_into(out)
+
+        assert count == 3
+        np.testing.assert_array_equal(out, [1.0, 1.0, 1.0, -1.0, -1.0])
+
+
+class TestSampleRingWrap:
+    def test_frames_come_back_in_order_across_the_wrap(self) -> None:
+        ring = SampleRing(CAPACITY)
+        ring.write(np.arange(6, dtype=np.float32))
+        ring.read_into(np.zeros(6, dtype=np.float32))
+
+        ring.write(np.arange(6, 12, dtype=np.float32))
+        out = np.zeros(6, dtype=np.float32)
+        ring.read_into(out)
+
+        np.testing.assert_array_equal(out, np.arange(6, 12))
+
+    def test_clear_empties_the_ring(self) -> None:
+        ring = SampleRing(CAPACITY)
+        ring.write(np.ones(5, dtype=np.float32))
+        ring.mark(SongPosition())
+
+        ring.clear()
+
+        assert ring.fill == 0
+        assert ring.pop_played() == []
+
+
+class TestSampleRingMarkers:
+    def test_row_is_played_once_its_last_frame_is_read(self) -> None:
+        ring = SampleRing(CAPACITY)
+        position = SongPosition(order_position=1, row_index=2)
+        ring.write(np.ones(4, dtype=np.float32))
+        ring.mark(position)
+
+        ring.read_into(np.zeros(3, dtype=np.float32))
+        assert ring.pop_played() == []
+
+        ring.read_into(np.zeros(1, dtype=np.float32))
+        assert ring.pop_played() == [position]
+
+    def test_rows_read_together_come_back_in_play_order(self) -> None:
+        ring = SampleRing(CAPACITY)
+        first, second = SongPosition(row_index=0), SongPosition(row_index=1)
+        ring.write(np.ones(2, dtype=np.float32))
+        ring.mark(first)
+        ring.write(np.ones(2, dtype=np.float32))
+        ring.mark(second)
+
+        ring.read_into(np.zeros(4, dtype=np.float32))
+
+        assert ring.pop_played() == [first, second]
+
+    def test_empty_row_is_played_at_once(self) -> None:
+        ring = SampleRing(CAPACITY)
+        position = SongPosition(row_index=5)
+        ring.mark(position)
+
+        assert ring.pop_played() == [position]
@@ -1,26 +1,25 @@
 import threading
-from typing import Callable, Final, List, Optional, Tuple
+from typing import Callable, Dict, Final, List, Optional, Tuple
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pyaudio
 
-from sampletones_application.services.song_player.player import (
-    SongPlayerService,
-    _RenderedRow,
-)
+from sampletones_application.services.song_player.player import SongPlayerService
 from sampletones_application.services.song_player.result import (
     SongPlaybackError,
+    SongPlaybackStatistics,
     SongPlaybackStopped,
     SongPlayerResult,
     SongPositionUpdate,
 )
+from sampletones_core.audio import OutputStreamCallback
 from sampletones_core.project.song_position import SongPosition
 
 SAMPLE_RATE: Final[int] = 44100
-WRITE_BLOCK: Final[int] = 64
+BLOCK: Final[int] = 64
 WAIT_TIMEOUT: Final[float] = 5.0
 SHORT_JOIN_TIMEOUT: Final[float] = 0.05
-WRITE_RELEASE_DELAY: Final[float] = 0.05
 JOIN_TIMEOUT_TARGET: Final[str] = "sampletones_application.services.song_player.player.STOP_JOIN_TIMEOUT"
 
 
@@ -31,6 +30,7 @@ def _make_service(
     master_gain: float = 1.0,
 ) -> SongPlayerService:
     audio_device_manager = MagicMock()
+    audio_device_manager.sample_rate = SAMPLE_RATE
     synthesizer = MagicMock()
     synthesizer.is_finished = is_finished
     return SongPlayerService(
@@ -42,34 +42,31 @@ def _make_service(
 
 
 class _FakeStream:
-    """A stand-in for the device stream that records the frame count of every block handed to it."""
-
-    def __init__(
-        self,
-        *,
-        gate: Optional[threading.Event] = None,
-        error: Optional[Exception] = None,
-        after_write: Optional[Callable[[], None]] = None,
-    ) -> None:
-        self._gate = gate
-        self._error = error
-        self._after_write = after_write
-        self.writes: List[int] = []
-        self.entered_write = threading.Event()
+    """A stand-in for a callback-mode device stream that the test pulls buffers through."""
+
+    def __init__(self) -> None:
+        self.callback: Optional[OutputStreamCallback] = None
+        self.opened = threading.Event()
         self.stopped = threading.Event()
         self.closed = threading.Event()
 
-    def write(self, data: bytes) -> None:
-        self.writes.append(len(data) // np.dtype(np.float32).itemsize)
-        self.entered_write.set()
-        if self._gate is not None:
-            self._gate.wait(timeout=WAIT_TIMEOUT)
+    def open(self, **keywords: object) -> "_FakeStream":
+        self.callback = keywords["stream_callback"]  # type: ignore[assignment]
+        self.opened.set()
+        return self
 
-        if self._after_write is not None:
-            self._after_write()
+    def pull(self, frame_count: int = BLOCK) -> Tuple[np.ndarray, int]:
+        assert self.callback is not None
+        data, flag = self.callback(None, frame_count, {}, 0)
+        return np.frombuffer(data, dtype=np.float32), flag
 
-        if self._error is not None:
-            raise self._error
+    def pull_until_complete(self) -> int:
+        """Pulls buffers as the device would until the stream completes; returns how many it took."""
+        for pulls in range(1, 10_000):
+            if self.pull()[1] == pyaudio.paComplete:
+                return pulls
+
+        raise AssertionError("the stream never completed")
 
     def stop_stream(self) -> None:
         self.stopped.set()
@@ -81,9 +78,10 @@ class _FakeStream:
 class _FakeSynthesizer:
     """Renders a fixed number of equal-length rows and then reports itself finished."""
 
-    def __init__(self, *, rows: int, frames: int) -> None:
+    def __init__(self, *, rows: int, frames: int, error: Optional[Exception] = None) -> None:
         self._rows = rows
         self._frames = frames
+        self._error = error
         self._rendered = 0
         self.order_position = 0
         self.row_index = 0
@@ -100,6 +98,9 @@ class _FakeSynthesizer:
         self._rendered = 0
 
     def render_row(self) -> Tuple[np.ndarray, SongPosition]:
+        if self._error is not None:
+            raise self._error
+
         position = SongPosition(order_position=0, row_index=self._rendered)
         self._rendered += 1
         return np.ones(self._frames, dtype=np.float32), position
@@ -114,8 +115,9 @@ def _make_device_manager(stream: Optional[_FakeStream] = None) -> MagicMock:
     """A device manager that winds a handed-back stream down as the real one does."""
     audio_device_manager = MagicMock()
     audio_device_manager.sample_rate = SAMPLE_RATE
-    audio_device_manager.buffer_size = WRITE_BLOCK
-    audio_device_manager.open_output_stream.return_value = stream
+    audio_device_manager.buffer_size = BLOCK
+    if stream is not None:
+        audio_device_manager.open_output_stream.side_effect = stream.open
     audio_device_manager.close_output_stream.side_effect = _close_stream
     return audio_device_manager
 
@@ -124,16 +126,42 @@ def _make_streaming_service(
     audio_device_manager: MagicMock,
     *,
     rows: int = 1,
-    frames: int = 4 * WRITE_BLOCK,
+    frames: int = 4 * BLOCK,
+    error: Optional[Exception] = None,
+    master_gain: Callable[[], float] = lambda: 1.0,
 ) -> SongPlayerService:
     return SongPlayerService(
         audio_device_manager,
-        _FakeSynthesizer(rows=rows, frames=frames),
+        _FakeSynthesizer(rows=rows, frames=frames, error=error),
         should_loop=lambda: False,
-        master_gain=lambda: 1.0,
+        master_gain=master_gain,
     )
 
 
+def _prepared_service(
+    *,
+    rows: int = 1,
+    frames: int = 4 * BLOCK,
+    master_gain: Callable[[], float] = lambda: 1.0,
+) -> Tuple[SongPlayerService, List[SongPlayerResult]]:
+    """A service set up for a session without its threads, recording what it emits."""
+    service = _make_streaming_service(_make_device_manager(), rows=rows, frames=frames, master_gain=master_gain)
+    received: List[SongPlayerResult] = []
+    service.subscribe(received.append)
+    service._prepare_session(SAMPLE_RATE)
+    service._resume_event.set()
+    return service, received
+
+
+def _fill(service: SongPlayerService, frame_count: int = BLOCK) -> Tuple[np.ndarray, int]:
+    data, flag = service._fill_buffer(None, frame_count, {}, 0)
+    return np.frombuffer(data, dtype=np.float32), flag
+
+
+def _positions(received: List[SongPlayerResult]) -> List[int]:
+    return [result.position.row_index for result in received if isinstance(result, SongPositionUpdate)]
+
+
 def _wedged_thread(gate: threading.Event) -> threading.Thread:
     """A started worker that stays alive until ``gate`` is set."""
     thread = threading.Thread(
@@ -183,7 +211,7 @@ class TestSongPlayerServiceSeek:
 
     def test_seek_sets_synthesizer_position_when_alive(self) -> None:
         service = _make_service()
-        service._write_thread = MagicMock(is_alive=MagicMock(return_value=True))
+        service._stream_thread = MagicMock(is_alive=MagicMock(return_value=True))
 
         service.seek(2)
 
@@ -191,7 +219,7 @@ class TestSongPlayerServiceSeek:
 
     def test_seek_does_not_reset_voices(self) -> None:
         service = _make_service()
-        service._write_thread = MagicMock(is_alive=MagicMock(return_value=True))
+        service._stream_thread = MagicMock(is_alive=MagicMock(return_value=True))
 
         service.seek(2)
 
@@ -208,7 +236,7 @@ class TestSongPlayerServiceRelocate:
 
     def test_relocate_keeps_current_row_when_alive(self) -> None:
         service = _make_service()
-        service._write_thread = MagicMock(is_alive=MagicMock(return_value=True))
+        service._stream_thread = MagicMock(is_alive=MagicMock(return_value=True))
         service._synthesizer.row_index = 5
 
         service.relocate(2)
@@ -217,7 +245,7 @@ class TestSongPlayerServiceRelocate:
 
     def test_relocate_does_not_reset_voices(self) -> None:
         service = _make_service()
-        service._write_thread = MagicMock(is_alive=MagicMock(return_value=True))
+        service._stream_thread = MagicMock(is_alive=MagicMock(return_value=True))
         service._synthesizer.row_index = 0
 
         service.relocate(2)
@@ -235,14 +263,14 @@ class TestSongPlayerServiceStop:
         service = _make_service()
         service.stop()
         assert service._render_thread is None
-        assert service._write_thread is None
+        assert service._stream_thread is None
 
     def test_stop_is_idempotent_when_already_stopped(self) -> None:
         service = _make_service()
         service.stop()
         service.stop()
         assert service._render_thread is None
-        assert service._write_thread is None
+        assert service._stream_thread is None
 
 
 class TestSongPlayerServiceLoop:
@@ -299,46 +327,6 @@ class TestSongPlayerServiceSubscribeAndEmit:
         assert received_b == [result]
 
 
-class TestSongPlayerServicePlayRow:
-    def test_play_row_emits_position_update(self) -> None:
-        service = _make_service()
-        received = []
-        service.subscribe(received.append)
-
-        position = SongPosition(order_position=1, row_index=3)
-        row = _RenderedRow(chunk=np.zeros(100, dtype=np.float32), position=position)
-
-        mock_stream = MagicMock()
-        service._play_row(mock_stream, row)
-
-        assert len(received) == 1
-        assert isinstance(received[0], SongPositionUpdate)
-        assert received[0].position is position
-
-    def test_play_row_writes_non_empty_audio(self) -> None:
-        service = _make_service()
-        service.subscribe(lambda result: None)
-
-        audio = np.ones(100, dtype=np.float32)
-        row = _RenderedRow(chunk=audio, position=SongPosition())
-
-        mock_stream = MagicMock()
-        service._play_row(mock_stream, row)
-
-        mock_stream.write.assert_called_once_with(audio.tobytes())
-
-    def test_play_row_skips_write_for_empty_audio(self) -> None:
-        service = _make_service()
-        service.subscribe(lambda result: None)
-
-        row = _RenderedRow(chunk=np.zeros(0, dtype=np.float32), position=SongPosition())
-
-        mock_stream = MagicMock()
-        service._play_row(mock_stream, row)
-
-        mock_stream.write.assert_not_called()
-
-
 class TestSongPlayerServiceMasterGain:
     def test_unity_gain_leaves_samples_unchanged(self) -> None:
         service = _make_service(master_gain=1.0)
@@ -383,125 +371,290 @@ class TestSongPlayerServiceMasterGain:
         np.testing.assert_allclose(service._scale_to_gain(chunk), [1.0], rtol=1e-6)
 
 
-class TestSongPlayerServicePrefetch:
+class TestSongPlayerServiceRender:
     def test_render_loop_ends_when_finished_without_loop(self) -> None:
         service = _make_service(is_finished=True, should_loop=False)
+        service._prepare_session(SAMPLE_RATE)
 
         service._render_loop()
 
-        assert list(service._buffer) == [None]
+        assert service._rendered_event.is_set()
+        assert service._ring.fill == 0
         service._synthesizer.render_row.assert_not_called()
 
-    def test_drain_writes_buffered_rows_then_reports_stopped(self) -> None:
-        service = _make_service()
-        received = []
-        service.subscribe(received.append)
-        service._resume_event.set()
+    def test_rendered_rows_fill_the_ring(self) -> None:
+        service, _ = _prepared_service(rows=3, frames=10)
 
-        position = SongPosition(order_position=2, row_index=1)
-        service._buffer.append(_RenderedRow(chunk=np.ones(10, dtype=np.float32), position=position))
-        service._buffer.append(None)
+        service._render_loop()
 
-        mock_stream = MagicMock()
-        service._drain_to_stream(mock_stream)
+        assert service._ring.fill == 30
+        assert service._rendered_event.is_set()
 
-        mock_stream.write.assert_called_once()
-        assert isinstance(received[0], SongPositionUpdate)
-        assert received[0].position is position
-        assert isinstance(received[-1], SongPlaybackStopped)
+    def test_rendering_is_timed(self) -> None:
+        service, _ = _prepared_service(rows=3, frames=10)
 
-    def test_drain_returns_without_terminal_when_stopping(self) -> None:
-        service = _make_service()
-        received = []
-        service.subscribe(received.append)
-        service._resume_event.set()
+        service._render_loop()
+
+        assert service._telemetry.rendered_frames == 30
+        assert service._telemetry.render_seconds > 0.0
+
+    def test_synthesis_error_closes_the_song(self) -> None:
+        error = RuntimeError("synthesis failed")
+        service = _make_streaming_service(_make_device_manager(), error=error)
+        service._prepare_session(SAMPLE_RATE)
+
+        service._render_loop()
+
+        assert service._playback_error is error
+        assert service._rendered_event.is_set()
+
+    def test_push_waits_for_the_fill_to_fall_below_the_prefetch(self) -> None:
+        service, _ = _prepared_service()
+        service._prefetch_samples = 10
+        assert service._push_row(np.ones(10, dtype=np.float32), SongPosition()) is True
         service._stop_event.set()
-        service._buffer.append(_RenderedRow(chunk=np.ones(10, dtype=np.float32), position=SongPosition()))
 
-        mock_stream = MagicMock()
-        service._drain_to_stream(mock_stream)
+        assert service._push_row(np.ones(10, dtype=np.float32), SongPosition()) is False
+        assert service._ring.fill == 10
 
-        mock_stream.write.assert_not_called()
-        assert received == []
+    def test_row_longer_than_the_free_space_goes_in_as_room_frees(self) -> None:
+        service, _ = _prepared_service()
+        capacity = service._ring.capacity
+        service._ring.write(np.zeros(capacity - BLOCK, dtype=np.float32))
+        reader = threading.Timer(SHORT_JOIN_TIMEOUT, lambda: service._ring.read_into(np.zeros(capacity - BLOCK)))
+        service._prefetch_samples = capacity
 
-    def test_enqueue_row_tracks_queued_samples(self) -> None:
-        service = _make_service()
-        service._prefetch_samples = 100
+        reader.start()
+        try:
+            assert service._push_row(np.ones(2 * BLOCK, dtype=np.float32), SongPosition()) is True
+        finally:
+            reader.cancel()
 
-        service._enqueue_row(_RenderedRow(chunk=np.zeros(30, dtype=np.float32), position=SongPosition()))
+        assert service._ring.fill == 2 * BLOCK
 
-        assert service._queued_samples == 30
-        assert len(service._buffer) == 1
 
-    def test_dequeue_releases_queued_samples(self) -> None:
-        service = _make_service()
-        service._prefetch_samples = 100
-        service._enqueue_row(_RenderedRow(chunk=np.zeros(30, dtype=np.float32), position=SongPosition()))
+class TestSongPlayerServiceFillBuffer:
+    def test_buffer_carries_the_rendered_audio(self) -> None:
+        service, _ = _prepared_service()
+        service._push_row(np.full(BLOCK, 0.5, dtype=np.float32), SongPosition())
 
-        popped, row = service._dequeue()
+        data, flag = _fill(service)
 
-        assert popped is True
-        assert row is not None
-        assert service._queued_samples == 0
+        np.testing.assert_allclose(data, 0.5)
+        assert flag == pyaudio.paContinue
 
-    def test_dequeue_returns_no_row_after_stop(self) -> None:
-        service = _make_service()
+    def test_position_is_emitted_once_the_whole_row_is_handed_on(self) -> None:
+        service, received = _prepared_service()
+        service._push_row(np.ones(2 * BLOCK, dtype=np.float32), SongPosition(row_index=4))
+
+        _fill(service)
+        assert _positions(received) == []
+
+        _fill(service)
+        assert _positions(received) == [4]
+
+    def test_paused_stream_plays_silence_without_consuming(self) -> None:
+        service, _ = _prepared_service()
+        service._push_row(np.ones(BLOCK, dtype=np.float32), SongPosition())
+        service.pause()
+
+        data, flag = _fill(service)
+
+        assert not data.any()
+        assert flag == pyaudio.paContinue
+        assert service._ring.fill == BLOCK
+        assert service._telemetry.underruns == 0
+
+    def test_stopped_stream_completes_with_silence(self) -> None:
+        service, _ = _prepared_service()
+        service._push_row(np.ones(BLOCK, dtype=np.float32), SongPosition())
         service._stop_event.set()
 
-        assert service._dequeue() == (False, None)
+        data, flag = _fill(service)
 
+        assert not data.any()
+        assert flag == pyaudio.paComplete
 
-class TestSongPlayerServiceBoundedWrites:
-    def test_start_takes_the_write_block_from_the_device(self) -> None:
-        service = _make_streaming_service(_make_device_manager(_FakeStream()))
+    def test_drained_song_completes_the_stream(self) -> None:
+        service, _ = _prepared_service()
+        service._push_row(np.ones(BLOCK // 2, dtype=np.float32), SongPosition())
+        service._rendered_event.set()
 
-        service.start()
-        service.stop()
+        data, flag = _fill(service)
 
-        assert service._write_block_frames == WRITE_BLOCK
+        assert flag == pyaudio.paComplete
+        assert service._drained_event.is_set()
+        assert data[: BLOCK // 2].all() and not data[BLOCK // 2 :].any()
 
-    def test_row_reaches_the_device_in_buffer_sized_blocks(self) -> None:
-        service = _make_service()
+    def test_buffer_is_scaled_by_the_master_gain(self) -> None:
+        service, _ = _prepared_service(master_gain=lambda: 0.5)
+        service._push_row(np.ones(BLOCK, dtype=np.float32), SongPosition())
+
+        data, _ = _fill(service)
+
+        np.testing.assert_allclose(data, 0.5)
+
+    def test_failure_ends_the_stream_as_a_playback_error(self) -> None:
+        error = RuntimeError("gain unavailable")
+
+        def failing_gain() -> float:
+            raise error
+
+        service, _ = _prepared_service(master_gain=failing_gain)
+        service._push_row(np.ones(BLOCK, dtype=np.float32), SongPosition())
+
+        data, flag = _fill(service)
+
+        assert flag == pyaudio.paComplete
+        assert len(data) == BLOCK
+        assert service._playback_error is error
+        assert service._drained_event.is_set()
+
+
+class TestSongPlayerServiceUnderruns:
+    def test_short_buffer_counts_an_underrun(self) -> None:
+        service, _ = _prepared_service()
+        service._push_row(np.ones(BLOCK // 2, dtype=np.float32), SongPosition())
+
+        data, flag = _fill(service)
+
+        assert service._telemetry.underruns == 1
+        assert flag == pyaudio.paContinue
+        assert not data[BLOCK // 2 :].any()
+
+    def test_starved_stretch_counts_once(self) -> None:
+        service, _ = _prepared_service()
+
+        for _ in range(3):
+            _fill(service)
+
+        assert service._telemetry.underruns == 1
+
+    def test_recovery_lets_the_next_starvation_count(self) -> None:
+        service, _ = _prepared_service()
+        _fill(service)
+        service._push_row(np.ones(BLOCK, dtype=np.float32), SongPosition())
+        _fill(service)
+
+        _fill(service)
+
+        assert service._telemetry.underruns == 2
+
+    def test_underrun_deepens_the_prefetch(self) -> None:
+        service, _ = _prepared_service()
+        prefetch = service._prefetch_samples
+
+        _fill(service)
+
+        assert service._prefetch_samples > prefetch
+
+    def test_prefetch_never_outgrows_the_ring(self) -> None:
+        service, _ = _prepared_service()
+        for _ in range(100):
+            _fill(service)
+            service._telemetry.settle()
+
+        assert service._prefetch_samples == service._ring.capacity
+
+    def test_the_end_of_the_song_is_not_an_underrun(self) -> None:
+        service, _ = _prepared_service()
+        service._rendered_event.set()
+
+        _fill(service)
+
+        assert service._telemetry.underruns == 0
+
+    def test_minimum_fill_is_what_the_device_found(self) -> None:
+        service, _ = _prepared_service()
+        service._push_row(np.ones(3 * BLOCK, dtype=np.float32), SongPosition())
+
+        _fill(service)
+        _fill(service)
+
+        assert service._telemetry.minimum_fill == 2 * BLOCK
+
+
+class TestSongPlayerServiceSession:
+    def test_session_plays_every_row_then_reports_statistics_and_stopped(self) -> None:
+        stream = _FakeStream()
+        service = _make_streaming_service(_make_device_manager(stream), rows=3, frames=BLOCK)
+        received: List[SongPlayerResult] = []
+        service.subscribe(received.append)
+
+        service.start()
+        assert stream.opened.wait(timeout=WAIT_TIMEOUT)
+        stream.pull_until_complete()
+        assert service._stream_thread is not None
+        service._stream_thread.join(timeout=WAIT_TIMEOUT)
+
+        assert _positions(received) == [0, 1, 2]
+        assert isinstance(received[-2], SongPlaybackStatistics)
+        assert received[-2].underruns == 0
+        assert isinstance(received[-1], SongPlaybackStopped)
+
+    def test_stream_opens_on_a_primed_ring(self) -> None:
+        stream = _FakeStream()
+        service = _make_streaming_service(_make_device_manager(stream), rows=3, frames=BLOCK)
         service.subscribe(lambda result: None)
-        service._write_block_frames = WRITE_BLOCK
 
+        service.start()
+        try:
+            assert stream.opened.wait(timeout=WAIT_TIMEOUT)
+            assert service._ring.fill == 3 * BLOCK
+        finally:
+            service.stop()
+
+    def test_render_error_is_reported_once_the_ring_drains(self) -> None:
+        error = RuntimeError("synthesis failed")
         stream = _FakeStream()
-        row = _RenderedRow(chunk=np.ones(3 * WRITE_BLOCK + 8, dtype=np.float32), position=SongPosition())
-        service._play_row(stream, row)
+        service = _make_streaming_service(_make_device_manager(stream), error=error)
+        received: List[SongPlayerResult] = []
+        service.subscribe(received.append)
 
-        assert stream.writes == [WRITE_BLOCK, WRITE_BLOCK, WRITE_BLOCK, 8]
+        service.start()
+        assert stream.opened.wait(timeout=WAIT_TIMEOUT)
+        stream.pull_until_complete()
+        assert service._stream_thread is not None
+        service._stream_thread.join(timeout=WAIT_TIMEOUT)
 
-    def test_stop_mid_row_leaves_the_remaining_blocks_unwritten(self) -> None:
-        service = _make_service()
+        assert received[-1] == SongPlaybackError(error=error)
+
+    def test_stop_reports_statistics_without_a_terminal(self) -> None:
+        stream = _FakeStream()
+        service = _make_streaming_service(_make_device_manager(stream), rows=1000, frames=BLOCK)
         received: List[SongPlayerResult] = []
         service.subscribe(received.append)
-        service._write_block_frames = WRITE_BLOCK
 
-        stream = _FakeStream(after_write=service._stop_event.set)
-        row = _RenderedRow(chunk=np.ones(4 * WRITE_BLOCK, dtype=np.float32), position=SongPosition())
-        service._play_row(stream, row)
+        service.start()
+        assert stream.opened.wait(timeout=WAIT_TIMEOUT)
+        service.stop()
+
+        assert [type(result) for result in received] == [SongPlaybackStatistics]
+
+    def test_failing_open_reports_stopped(self) -> None:
+        audio_device_manager = _make_device_manager()
+        audio_device_manager.open_output_stream.side_effect = OSError("no device")
+        service = _make_streaming_service(audio_device_manager)
+        received: List[SongPlayerResult] = []
+        service.subscribe(received.append)
+
+        service.start()
+        assert service._stream_thread is not None
+        service._stream_thread.join(timeout=WAIT_TIMEOUT)
+        service.stop()
 
-        assert stream.writes == [WRITE_BLOCK]
-        assert received == []
+        assert received == [SongPlaybackStopped()]
 
 
 class TestSongPlayerServiceStopQuiescence:
-    def test_stop_returns_after_the_writer_closed_its_stream(self) -> None:
-        gate = threading.Event()
-        stream = _FakeStream(gate=gate)
-        service = _make_streaming_service(_make_device_manager(stream), rows=8)
+    def test_stop_returns_after_the_stream_thread_closed_its_stream(self) -> None:
+        stream = _FakeStream()
+        service = _make_streaming_service(_make_device_manager(stream), rows=1000, frames=BLOCK)
         service.subscribe(lambda result: None)
 
         service.start()
-        assert stream.entered_write.wait(timeout=WAIT_TIMEOUT)
-
-        releaser = threading.Timer(WRITE_RELEASE_DELAY, gate.set)
-        releaser.start()
-        try:
-            service.stop()
-        finally:
-            releaser.cancel()
-            gate.set()
+        assert stream.opened.wait(timeout=WAIT_TIMEOUT)
+        service.stop()
 
         assert service.alive is False
         assert stream.stopped.is_set()
@@ -510,13 +663,13 @@ class TestSongPlayerServiceStopQuiescence:
     def test_stop_keeps_a_worker_that_outlives_the_deadline(self) -> None:
         gate = threading.Event()
         service = _make_service()
-        service._write_thread = _wedged_thread(gate)
+        service._stream_thread = _wedged_thread(gate)
 
         try:
             with patch(JOIN_TIMEOUT_TARGET, SHORT_JOIN_TIMEOUT):
                 service.stop()
 
-            assert service._write_thread is not None
+            assert service._stream_thread is not None
             assert service.alive is True
         finally:
             gate.set()
@@ -525,7 +678,7 @@ class TestSongPlayerServiceStopQuiescence:
         gate = threading.Event()
         audio_device_manager = _make_device_manager(_FakeStream())
         service = _make_streaming_service(audio_device_manager)
-        service._write_thread = _wedged_thread(gate)
+        service._stream_thread = _wedged_thread(gate)
 
         try:
             with patch(JOIN_TIMEOUT_TARGET, SHORT_JOIN_TIMEOUT):
@@ -537,52 +690,51 @@ class TestSongPlayerServiceStopQuiescence:
 
 
 class TestSongPlayerServiceStreamOwnership:
-    """The device hands out a stream against a release, and gets it back when the writer finishes."""
+    """The device hands out a stream against a release, and gets it back when the session ends."""
 
-    def test_the_stream_is_opened_against_a_release_that_stops_playback(self) -> None:
-        audio_device_manager = _make_device_manager(_FakeStream())
+    def test_the_stream_is_opened_in_callback_mode_against_a_release_that_stops_playback(self) -> None:
+        stream = _FakeStream()
+        audio_device_manager = _make_device_manager(stream)
         service = _make_streaming_service(audio_device_manager)
         service.subscribe(lambda result: None)
 
         service.start()
+        assert stream.opened.wait(timeout=WAIT_TIMEOUT)
         service.stop()
 
         _, keywords = audio_device_manager.open_output_stream.call_args
         assert keywords["release"] == service.stop
+        assert keywords["stream_callback"] == service._fill_buffer
+        assert keywords["buffer_size"] == BLOCK
 
-    def test_the_writer_hands_the_stream_back(self) -> None:
+    def test_the_stream_thread_hands_the_stream_back(self) -> None:
         stream = _FakeStream()
         audio_device_manager = _make_device_manager(stream)
         service = _make_streaming_service(audio_device_manager)
         service.subscribe(lambda result: None)
 
         service.start()
+        assert stream.opened.wait(timeout=WAIT_TIMEOUT)
         service.stop()
 
         audio_device_manager.close_output_stream.assert_called_once_with(stream)
 
 
-class TestSongPlayerServiceWriteFailure:
-    def test_a_failing_write_reports_a_playback_error(self) -> None:
-        error = OSError("device disappeared")
-        service = _make_streaming_service(_make_device_manager(_FakeStream(error=error)))
-        received: List[SongPlayerResult] = []
-        service.subscribe(received.append)
-        service._resume_event.set()
-        service._buffer.append(_RenderedRow(chunk=np.ones(WRITE_BLOCK, dtype=np.float32), position=SongPosition()))
+class TestSongPlayerServiceSessionReset:
+    def test_ring_is_reused_at_the_same_rate(self) -> None:
+        service, _ = _prepared_service()
+        ring = service._ring
 
-        service._write_loop()
+        service._prepare_session(SAMPLE_RATE)
 
-        assert received == [SongPlaybackError(error=error)]
+        assert service._ring is ring
 
-    def test_a_failing_write_still_closes_the_stream(self) -> None:
-        stream = _FakeStream(error=OSError("device disappeared"))
-        service = _make_streaming_service(_make_device_manager(stream))
-        service.subscribe(lambda result: None)
-        service._resume_event.set()
-        service._buffer.append(_RenderedRow(chunk=np.ones(WRITE_BLOCK, dtype=np.float32), position=SongPosition()))
+    def test_new_session_starts_from_the_base_prefetch(self) -> None:
+        service, _ = _prepared_service()
+        prefetch = service._prefetch_samples
+        _fill(service)
 
-        service._write_loop()
+        service._prepare_session(SAMPLE_RATE)
 
-        assert stream.stopped.is_set()
-        assert stream.closed.is_set()
+        assert service._prefetch_samples == prefetch
+        assert service._telemetry.underruns == 0
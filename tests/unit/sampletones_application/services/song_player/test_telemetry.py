@@ -0,0 +1,54 @@
+from typing import Final
+
+import pytest
+
+from sampletones_application.services.song_player.telemetry import PlaybackTelemetry
+
+SAMPLE_RATE: Final[int] = 1000
+
+
+class TestUnderruns:
+    def test_covered_request_is_not_an_underrun(self) -> None:
+        telemetry = PlaybackTelemetry()
+
+        assert telemetry.record_request(fill=100, requested=64) is False
+        assert telemetry.underruns == 0
+
+    def test_starved_stretch_counts_once(self) -> None:
+        telemetry = PlaybackTelemetry()
+
+        started = [telemetry.record_request(fill=0, requested=64) for _ in range(3)]
+
+        assert started == [True, False, False]
+        assert telemetry.underruns == 1
+
+    def test_settling_ends_a_stretch_without_counting(self) -> None:
+        telemetry = PlaybackTelemetry()
+        telemetry.record_request(fill=0, requested=64)
+
+        telemetry.settle()
+        telemetry.record_request(fill=0, requested=64)
+
+        assert telemetry.underruns == 2
+
+
+class TestSummary:
+    def test_minimum_fill_is_the_lowest_seen(self) -> None:
+        telemetry = PlaybackTelemetry()
+        for fill in (300, 100, 200):
+            telemetry.record_request(fill=fill, requested=64)
+
+        assert telemetry.summarize(SAMPLE_RATE, prefetch_samples=250).minimum_fill_seconds == pytest.approx(0.1)
+
+    def test_realtime_factor_is_audio_per_render_second(self) -> None:
+        telemetry = PlaybackTelemetry()
+        telemetry.record_render(frames=2 * SAMPLE_RATE, seconds=0.5)
+
+        assert telemetry.summarize(SAMPLE_RATE, prefetch_samples=250).realtime_factor == pytest.approx(4.0)
+
+    def test_nothing_rendered_reports_zero(self) -> None:
+        statistics = PlaybackTelemetry().summarize(SAMPLE_RATE, prefetch_samples=250)
+
+        assert statistics.realtime_factor == 0.0
+        assert statistics.minimum_fill_seconds == 0.0
+        assert statistics.prefetch_seconds == pytest.approx(0.25)
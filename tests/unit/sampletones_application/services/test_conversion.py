@@ -92,6 +92,15 @@ class TestConversionServiceStart:
 
         assert cls.call_count == 1
 
+    def test_start_hands_the_cache_to_the_converter(self, mock_converter_class: MockConverterClass) -> None:
+        cls, _, _ = mock_converter_class
+        cache = MagicMock()
+
+        conversion_service = ConversionService(cache=cache)
+        conversion_service.start(MagicMock(), MagicMock())
+
+        assert cls.call_args.kwargs["cache"] is cache
+
 
 class TestConversionServiceEmissions:
     def test_on_start_emits_service_started_with_total(
@@ -201,7 +201,7 @@ class TestRegenerationServiceRun:
         assert len(results) == 1
         assert isinstance(results[0], ServiceSuccess)
         outcome = results[0].value
-        assert outcome.reconstruction is reconstruction.model_copy.return_value
+        assert outcome.reconstruction is reconstruction.with_generator_data.return_value
         assert outcome.reconstruction is not reconstruction
         assert outcome.generator_name is synthesis_mocks.generator_name
         assert outcome.feature_key is FeatureKey.VOLUME
@@ -242,10 +242,9 @@ class TestRegenerationServiceRun:
             1,
         )
 
-        updated = reconstruction.model_copy.return_value
-        updated.update_generator_data.assert_called_once()
+        reconstruction.with_generator_data.assert_called_once()
         reconstruction.update_generator_data.assert_not_called()
-        call_args = updated.update_generator_data.call_args
+        call_args = reconstruction.with_generator_data.call_args
         assert call_args.args[0] == synthesis_mocks.generator_name
 
     def test_run_carries_the_reference_pitch_through_an_arpeggio_edit(
@@ -269,7 +268,7 @@ class TestRegenerationServiceRun:
             np.array([12, 0], dtype=np.int8),
         )
 
-        call_args = reconstruction.model_copy.return_value.update_generator_data.call_args
+        call_args = reconstruction.with_generator_data.call_args
         assert call_args.args[3] == REFERENCE_PITCH
 
     def test_run_carries_a_moved_reference_pitch(
@@ -290,10 +289,10 @@ class TestRegenerationServiceRun:
             moved_pitch,
         )
 
-        call_args = reconstruction.model_copy.return_value.update_generator_data.call_args
+        call_args = reconstruction.with_generator_data.call_args
         assert call_args.args[3] == moved_pitch
 
-    def test_run_calls_generator_for_each_instruction(
+    def test_run_renders_every_instruction_in_one_pass(
         self,
         synthesis_mocks: SynthesisMocks,
         reconstruction: MockReconstruction,
@@ -314,7 +313,9 @@ class TestRegenerationServiceRun:
             1,
         )
 
-        assert synthesis_mocks.generator.call_count == 2
+        synthesis_mocks.generator.render_sequence.assert_called_once_with(
+            [synthesis_mocks.instruction, extra_instruction],
+        )
 
     def test_run_exception_emits_service_error(
         self,
@@ -365,7 +366,7 @@ class TestRegenerationServiceRun:
                 1,
             )
 
-        reconstruction.update_generator_data.assert_not_called()
+        reconstruction.with_generator_data.assert_not_called()
 
 
 class TestClearingEveryEnvelope:
@@ -7,6 +7,7 @@ from sampletones_application.logic.project.controller import ProjectController
 from sampletones_application.logic.project.manager import ProjectManager
 
 HISTORY_BUDGET: Final[int] = 10
+HISTORY_MEMORY_BUDGET: Final[int] = 1 << 30
 FIRST_HIGHLIGHT: Final[int] = 3
 SECOND_HIGHLIGHT: Final[int] = 12
 
@@ -17,7 +18,12 @@ def _application() -> Application:
     """
     application = Application.__new__(Application)
     controller = ProjectController(ProjectManager())
-    history = HistoryManager(controller, budget=HISTORY_BUDGET, strict=True)
+    history = HistoryManager(
+        controller,
+        budget=HISTORY_BUDGET,
+        memory_budget=HISTORY_MEMORY_BUDGET,
+        strict=True,
+    )
     controller.on_mutation = history.handle_mutation
     controller.new()
     history.reset()
@@ -1,12 +1,15 @@
 from types import SimpleNamespace
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from sampletones_application.ui.elements.graphs import waveform as waveform_module
+from sampletones_application.ui.elements.graphs.layers.array import ArrayLayer
 from sampletones_application.ui.elements.graphs.waveform import GUIWaveformGraph
 from sampletones_application.utils.palette.colors.written import LiteralColor
+from sampletones_core.audio import MinMaxPyramid
 
 
 class _FakeDPG:
@@ -99,6 +102,7 @@ def _graph() -> GUIWaveformGraph:
     graph.position_indicator_tag = "indicator"
     graph.overlay_rectangle_tag = "overlay"
     graph.layers = {}
+    graph._visible_window = None
     graph._reconstruction_dimmed = False
     graph._lbl_waveform_reconstruction = "Reconstruction"
     graph._status_bar = MagicMock()
@@ -207,3 +211,67 @@ class TestWaveformReconstructionDim:
 
         graph.set_reconstruction_dimmed(False)
         graph._status_bar.set.assert_called_with("")
+
+
+class TestWaveformLevelOfDetail:
+    LENGTH = 100_000
+    POINTS = 64
+
+    def _array_graph(self, fake_dpg: _FakeDPG, monkeypatch: pytest.MonkeyPatch) -> GUIWaveformGraph:
+        graph = _graph()
+        graph.x_axis_tag = "axis"
+        audio = np.sin(np.arange(self.LENGTH, dtype=np.float32) / 50.0)
+        layer = ArrayLayer(
+            data=MinMaxPyramid.build(audio),
+            name="Reconstruction",
+            color=LiteralColor((255, 255, 255, 255)),
+            max_display_points=self.POINTS,
+        )
+        graph.layers = {layer.name: layer}
+        fake_dpg.set_children("axis", [graph._series_tag(layer.name)])
+        return graph
+
+    def _follow(self, graph: GUIWaveformGraph, monkeypatch: pytest.MonkeyPatch, limits: Tuple[float, float]) -> None:
+        monkeypatch.setattr(waveform_module.dpg, "get_axis_limits", lambda tag: limits)
+        graph._follow_visible_window()
+
+    def test_a_zoom_redraws_the_visible_window_at_a_bounded_size(
+        self,
+        fake_dpg: _FakeDPG,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        graph = self._array_graph(fake_dpg, monkeypatch)
+        drawn: List[Tuple[np.ndarray, np.ndarray]] = []
+        monkeypatch.setattr(
+            waveform_module.dpg,
+            "configure_item",
+            lambda tag, x, y: drawn.append((x, y)),
+        )
+
+        self._follow(graph, monkeypatch, (40_000.0, 45_000.0))
+
+        x_values, _ = drawn[-1]
+        assert len(x_values) <= 2 * self.POINTS
+        assert 39_000 < x_values[0] <= 40_000 and x_values[-1] < 45_000
+
+    def test_an_unmoved_view_is_not_redrawn(self, fake_dpg: _FakeDPG, monkeypatch: pytest.MonkeyPatch) -> None:
+        graph = self._array_graph(fake_dpg, monkeypatch)
+        self._follow(graph, monkeypatch, (0.0, 1_000.0))
+        configured = len(fake_dpg.configured)
+
+        self._follow(graph, monkeypatch, (0.0, 1_000.0))
+
+        assert len(fake_dpg.configured) == configured
+
+    def test_a_scaled_layer_scales_the_points_of_every_window(self) -> None:
+        audio = np.linspace(-0.5, 0.5, self.LENGTH, dtype=np.float32)
+        layer = ArrayLayer(
+            data=MinMaxPyramid.build(audio),
+            name="Sample",
+            color=LiteralColor((255, 255, 255, 255)),
+            max_display_points=self.POINTS,
+            scale=2.0,
+        )
+
+        assert layer.y_data.min() == pytest.approx(-1.0)
+        assert layer.window(0, 10)[1] == pytest.approx(2.0 * audio[:10])
@@ -91,6 +91,27 @@ class TestLatestWinsExecutor:
         assert done.wait(1.0)
         assert ran == ["a", "c"]
 
+    def test_a_replaced_task_reports_it_was_superseded(self) -> None:
+        executor = LatestWinsExecutor()
+        superseded: List[str] = []
+        first_started = threading.Event()
+        release = threading.Event()
+        done = threading.Event()
+
+        def first() -> None:
+            first_started.set()
+            release.wait(1.0)
+
+        executor.submit(first, on_superseded=lambda: superseded.append("a"))
+        assert first_started.wait(1.0)
+
+        executor.submit(lambda: None, on_superseded=lambda: superseded.append("b"))
+        executor.submit(done.set, on_superseded=lambda: superseded.append("c"))
+
+        release.set()
+        assert done.wait(1.0)
+        assert superseded == ["b"]
+
     def test_launch_failure_reports_false_and_stays_idle(self) -> None:
         executor = LatestWinsExecutor()
 
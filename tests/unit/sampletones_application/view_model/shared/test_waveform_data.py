@@ -60,3 +60,26 @@ class TestPartials:
         result = waveform_data.partials([GeneratorName.PULSE1, GeneratorName.TRIANGLE])
 
         assert np.array_equal(result, approximations[GeneratorName.PULSE1])
+
+
+class TestPyramids:
+    def test_the_original_pyramid_is_built_once(self, waveform_data: WaveformData) -> None:
+        assert waveform_data.original_pyramid() is waveform_data.original_pyramid()
+
+    def test_the_partials_pyramid_is_kept_per_selection(self, waveform_data: WaveformData) -> None:
+        pulse = waveform_data.partials_pyramid([GeneratorName.PULSE1])
+
+        assert waveform_data.partials_pyramid([GeneratorName.PULSE1]) is pulse
+        assert waveform_data.partials_pyramid([GeneratorName.NOISE]) is not pulse
+        assert np.array_equal(pulse.audio, waveform_data.partials([GeneratorName.PULSE1]))
+
+    def test_a_waveform_without_an_original_has_no_original_pyramid(self, waveform_data: WaveformData) -> None:
+        detached = WaveformData(
+            original_audio=None,
+            approximation=waveform_data.approximation,
+            approximations=waveform_data.approximations,
+            coefficient=1.0,
+            frame_length=2,
+        )
+
+        assert detached.original_pyramid() is None
@@ -0,0 +1,80 @@
+from typing import Final
+
+import numpy as np
+import pytest
+
+from sampletones_core.audio.pyramid import MinMaxPyramid
+from tests.suite.arrays import assert_array_equal
+
+NUM_BUCKETS: Final[int] = 16
+LENGTH: Final[int] = 1001
+
+
+@pytest.fixture
+def audio() -> np.ndarray:
+    return np.random.default_rng(0).uniform(-1.0, 1.0, LENGTH).astype(np.float32)
+
+
+def _bucket_extremes(audio: np.ndarray, x_values: np.ndarray) -> np.ndarray:
+    """The minimum and maximum of every bucket a window names, read from the audio itself."""
+    starts = x_values[0::2].astype(int)
+    width = int(starts[1] - starts[0])
+    extremes = np.empty(len(x_values), dtype=np.float32)
+    for index, start in enumerate(starts):
+        bucket = audio[start : start + width]
+        extremes[2 * index] = bucket.min()
+        extremes[2 * index + 1] = bucket.max()
+
+    return extremes
+
+
+class TestMinMaxPyramid:
+    def test_each_level_halves_the_buckets_down_to_one(self, audio: np.ndarray) -> None:
+        pyramid = MinMaxPyramid.build(audio)
+
+        lengths = [len(level) for level in pyramid.minimums]
+        assert lengths[0] == (LENGTH + 1) // 2
+        assert lengths[-1] == 1
+        assert pyramid.minimums[-1][0] == audio.min()
+        assert pyramid.maximums[-1][0] == audio.max()
+
+    def test_a_short_window_is_the_audio_itself(self, audio: np.ndarray) -> None:
+        x_values, y_values = MinMaxPyramid.build(audio).window(100, 110, num_buckets=NUM_BUCKETS)
+
+        assert_array_equal(x_values, np.arange(100, 110, dtype=np.float64))
+        assert_array_equal(y_values, audio[100:110])
+
+    @pytest.mark.parametrize("start, end", [(0, LENGTH), (37, 291), (500.5, 999.2), (900, LENGTH)])
+    def test_a_long_window_keeps_the_extremes_of_every_bucket(
+        self,
+        audio: np.ndarray,
+        start: float,
+        end: float,
+    ) -> None:
+        x_values, y_values = MinMaxPyramid.build(audio).window(start, end, num_buckets=NUM_BUCKETS)
+
+        assert len(x_values) <= 2 * NUM_BUCKETS
+        assert x_values[0] <= start and x_values[-1] < end
+        assert_array_equal(y_values, _bucket_extremes(audio, x_values))
+
+    def test_the_window_is_clamped_to_the_audio(self, audio: np.ndarray) -> None:
+        pyramid = MinMaxPyramid.build(audio)
+
+        assert_array_equal(
+            pyramid.window(-500, 2 * LENGTH, num_buckets=NUM_BUCKETS)[1],
+            pyramid.window(0, LENGTH, num_buckets=NUM_BUCKETS)[1],
+        )
+
+    def test_an_empty_array_has_nothing_to_draw(self) -> None:
+        x_values, y_values = MinMaxPyramid.build(np.array([], dtype=np.float32)).window(0, 10, num_buckets=4)
+
+        assert x_values.size == 0
+        assert y_values.size == 0
+
+    def test_a_bucket_count_must_be_positive(self, audio: np.ndarray) -> None:
+        with pytest.raises(ValueError):
+            MinMaxPyramid.build(audio).window(0, LENGTH, num_buckets=0)
+
+    def test_a_multichannel_array_is_refused(self) -> None:
+        with pytest.raises(ValueError):
+            MinMaxPyramid.build(np.zeros((2, 4)))
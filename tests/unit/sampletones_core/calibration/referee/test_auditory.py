@@ -1,10 +1,13 @@
-from typing import Final
+from typing import Final, List
 
 import numpy as np
 import pytest
 
 from sampletones_core.calibration.config.referee import RefereeConfig
-from sampletones_core.calibration.referee.auditory import MultiResolutionAuditoryReferee
+from sampletones_core.calibration.referee.auditory import (
+    MultiResolutionAuditoryReferee,
+    erb_band_matrix,
+)
 
 SAMPLE_RATE: Final[int] = 22050
 SIGNAL_SECONDS: Final[float] = 1.0
@@ -69,3 +72,46 @@ class TestMultiResolutionAuditoryReferee:
         tone = _tone(440.0)
         with pytest.raises(ValueError):
             referee.score(tone, tone[:-1])
+
+    def test_batched_scores_match_single_scores(self, referee: MultiResolutionAuditoryReferee) -> None:
+        generator = np.random.default_rng(3)
+        tone = _tone(440.0)
+        estimates = [tone, _tone(445.0), tone + (0.1 * generator.standard_normal(tone.shape[0])).astype(np.float32)]
+
+        batched = referee.score_many(tone, estimates)
+
+        assert batched == pytest.approx([referee.score(tone, estimate) for estimate in estimates], rel=1e-9)
+
+    def test_batched_length_mismatch_raises_value_error(self, referee: MultiResolutionAuditoryReferee) -> None:
+        tone = _tone(440.0)
+        with pytest.raises(ValueError):
+            referee.score_many(tone, [tone, tone[:-1]])
+
+
+class TestReferenceCache:
+    def test_reference_is_analysed_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        referee = MultiResolutionAuditoryReferee(SAMPLE_RATE, config=RefereeConfig.load())
+        analysed: List[int] = []
+        band_energy = referee._band_energy
+
+        def counting(audio: np.ndarray, window_size: int, band_matrix: np.ndarray) -> np.ndarray:
+            analysed.append(audio.ndim)
+            return band_energy(audio, window_size, band_matrix)
+
+        monkeypatch.setattr(referee, "_band_energy", counting)
+        tone = _tone(440.0)
+
+        first = referee.score(tone, _tone(445.0))
+        second = referee.score(tone.copy(), _tone(445.0))
+
+        assert first == second
+        assert analysed.count(1) == len(referee.config.window_sizes)
+
+    def test_band_matrices_are_shared_between_referees(self) -> None:
+        config = RefereeConfig.load()
+        first = MultiResolutionAuditoryReferee(SAMPLE_RATE, config=config)
+        second = MultiResolutionAuditoryReferee(SAMPLE_RATE, config=config)
+
+        for window_size in config.window_sizes:
+            assert first._band_matrices[window_size] is second._band_matrices[window_size]
+            assert first._band_matrices[window_size] is erb_band_matrix(SAMPLE_RATE, window_size, config)
@@ -0,0 +1,88 @@
+import math
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from sampletones_core.calibration.report import (
+    append_csv,
+    read_csv,
+    write_csv,
+    write_markdown,
+)
+from sampletones_core.calibration.runner import UNAVAILABLE_REFEREE, CalibrationRow
+
+
+def _row(variant: str, item: str, score: float = 0.25, referee: str = "auditory") -> CalibrationRow:
+    return CalibrationRow(variant=variant, item=item, category="tones", referee=referee, score=score)
+
+
+class TestCsv:
+    def test_written_rows_read_back(self, tmp_path: Path) -> None:
+        rows = [_row("fft", "tone"), _row("cqt", "tone", 0.5)]
+        path = tmp_path / "report.csv"
+
+        write_csv(rows, path)
+
+        assert read_csv(path) == rows
+
+    def test_appended_rows_follow_the_written_ones(self, tmp_path: Path) -> None:
+        path = tmp_path / "report.csv"
+        write_csv([_row("fft", "tone")], path)
+
+        append_csv([_row("fft", "snare")], path)
+        append_csv([_row("cqt", "tone")], path)
+
+        assert [(row.variant, row.item) for row in read_csv(path)] == [
+            ("fft", "tone"),
+            ("fft", "snare"),
+            ("cqt", "tone"),
+        ]
+
+    def test_appending_starts_a_missing_report_with_its_header(self, tmp_path: Path) -> None:
+        path = tmp_path / "report.csv"
+
+        append_csv([_row("fft", "tone")], path)
+
+        assert path.read_text().splitlines()[0] == "variant,item,category,referee,score"
+        assert len(read_csv(path)) == 1
+
+    def test_an_unavailable_row_reads_back_unscored(self, tmp_path: Path) -> None:
+        path = tmp_path / "report.csv"
+
+        append_csv([_row("fft", "tone", float("nan"), referee=UNAVAILABLE_REFEREE)], path)
+
+        (row,) = read_csv(path)
+        assert (row.variant, row.item, row.is_scored) == ("fft", "tone", False)
+        assert math.isnan(row.score)
+
+    def test_missing_report_holds_no_rows(self, tmp_path: Path) -> None:
+        assert read_csv(tmp_path / "report.csv") == []
+
+
+class TestMarkdown:
+    def test_pivot_holds_each_variant_mean(self, tmp_path: Path) -> None:
+        rows: List[CalibrationRow] = [_row("fft", "tone", 0.25), _row("fft", "snare", 0.75)]
+        path = tmp_path / "report.md"
+
+        write_markdown(rows, path)
+
+        assert "| fft | 0.500 | 0.500 |" in path.read_text()
+
+    def test_unavailable_rows_are_left_out(self, tmp_path: Path) -> None:
+        rows = [_row("fft", "tone", 0.25), _row("fft", "snare", float("nan"), referee=UNAVAILABLE_REFEREE)]
+        path = tmp_path / "report.md"
+
+        write_markdown(rows, path)
+
+        text = path.read_text()
+        assert "| fft | 0.250 | 0.250 |" in text
+        assert UNAVAILABLE_REFEREE not in text
+
+    @pytest.mark.parametrize("rows", [[]])
+    def test_empty_report_has_a_title(self, rows: List[CalibrationRow], tmp_path: Path) -> None:
+        path = tmp_path / "report.md"
+
+        write_markdown(rows, path)
+
+        assert path.read_text().startswith("# Calibration report")
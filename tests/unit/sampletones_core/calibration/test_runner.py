@@ -1,9 +1,27 @@
+import pickle
 import warnings
-from typing import Final, List
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Final, Iterator, List, Sequence, Tuple
 
+import numpy as np
 import pytest
 
-from sampletones_core.calibration.runner import build_variants
+from sampletones_core.calibration import runner
+from sampletones_core.calibration.config.referee import RefereeConfig
+from sampletones_core.calibration.corpus.item import CorpusItem
+from sampletones_core.calibration.referee.auditory import MultiResolutionAuditoryReferee
+from sampletones_core.calibration.referee.protocol import Referee
+from sampletones_core.calibration.runner import (
+    UNAVAILABLE_REFEREE,
+    CalibrationPair,
+    CalibrationRow,
+    CalibrationVariant,
+    build_variants,
+    evaluate_variants,
+    plan_pairs,
+    prepared_audio,
+)
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import SpectrumMethod
 
@@ -32,3 +50,181 @@ class TestBuildVariants:
             warnings.simplefilter("error", UserWarning)
             for variant in variants:
                 variant.config.model_dump()
+
+
+def _items() -> List[CorpusItem]:
+    return [
+        CorpusItem(name="tone", category="tones", audio=np.zeros(4)),
+        CorpusItem(name="snare", category="percussion", audio=np.zeros(4)),
+    ]
+
+
+def _item_paths() -> Dict[str, Path]:
+    return {"tone": Path("tone.wav"), "snare": Path("snare.wav")}
+
+
+def _rows(pair: CalibrationPair, referees: Sequence[Referee]) -> List[CalibrationRow]:
+    return [CalibrationRow(variant=pair.variant.label, item=pair.item, category=pair.category, referee="r", score=0.5)]
+
+
+class TestPlanPairs:
+    def test_variants_sharing_a_library_are_adjacent(self) -> None:
+        fft, cqt = build_variants(Config(), METHODS, EXPONENTS, [])
+        fft_again = CalibrationVariant(label="fft-again", config=fft.config)
+
+        pairs = plan_pairs([fft, cqt, fft_again], _items(), _item_paths())
+
+        assert [pair.variant.label for pair in pairs] == ["fft-pe1"] * 2 + ["fft-again"] * 2 + ["cqt-pe1"] * 2
+
+    def test_items_follow_corpus_order(self) -> None:
+        (variant,) = build_variants(Config(), [SpectrumMethod.FFT], EXPONENTS, [])
+
+        pairs = plan_pairs([variant], _items(), _item_paths())
+
+        assert [(pair.item, pair.category, pair.path) for pair in pairs] == [
+            ("tone", "tones", Path("tone.wav")),
+            ("snare", "percussion", Path("snare.wav")),
+        ]
+
+    def test_completed_pairs_are_left_out(self) -> None:
+        (variant,) = build_variants(Config(), [SpectrumMethod.FFT], EXPONENTS, [])
+
+        pairs = plan_pairs([variant], _items(), _item_paths(), completed={("fft-pe1", "tone")})
+
+        assert [pair.item for pair in pairs] == ["snare"]
+
+
+class TestEvaluateVariants:
+    @pytest.fixture(autouse=True)
+    def _stub_evaluation(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(runner, "ensure_library", lambda config: None)
+        monkeypatch.setattr(runner, "evaluate_pair", _rows)
+
+    def test_rows_are_handed_over_per_pair(self) -> None:
+        variants = build_variants(Config(), METHODS, EXPONENTS, [])
+        batches: List[List[CalibrationRow]] = []
+
+        rows = evaluate_variants(variants, _items(), _item_paths(), [], on_rows=batches.append)
+
+        assert len(batches) == 4
+        assert [row for batch in batches for row in batch] == rows
+
+    def test_completed_pairs_are_skipped(self) -> None:
+        variants = build_variants(Config(), METHODS, EXPONENTS, [])
+
+        rows = evaluate_variants(
+            variants,
+            _items(),
+            _item_paths(),
+            [],
+            completed={("fft-pe1", "tone"), ("fft-pe1", "snare")},
+        )
+
+        assert {row.variant for row in rows} == {"cqt-pe1"}
+
+    def test_an_unavailable_pair_is_handed_over_as_an_unscored_row(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(runner, "evaluate_pair", lambda pair, referees: [])
+        (variant,) = build_variants(Config(), [SpectrumMethod.FFT], EXPONENTS, [])
+        batches: List[List[CalibrationRow]] = []
+
+        rows = evaluate_variants([variant], _items(), _item_paths(), [], on_rows=batches.append)
+
+        assert rows == []
+        assert [(row.item, row.referee, row.is_scored) for (row,) in batches] == [
+            ("tone", UNAVAILABLE_REFEREE, False),
+            ("snare", UNAVAILABLE_REFEREE, False),
+        ]
+        recorded = {(row.variant, row.item) for batch in batches for row in batch}
+        assert plan_pairs([variant], _items(), _item_paths(), completed=recorded) == []
+
+    def test_every_distinct_library_is_ensured_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ensured: List[Config] = []
+        monkeypatch.setattr(runner, "ensure_library", ensured.append)
+        fft, cqt = build_variants(Config(), METHODS, EXPONENTS, [])
+        fft_again = CalibrationVariant(label="fft-again", config=fft.config)
+
+        evaluate_variants([fft, cqt, fft_again], _items(), _item_paths(), [])
+
+        assert ensured == [fft.config, cqt.config]
+
+
+class _WorkerPool:
+    """A one-worker pool that copies what crosses the process boundary as a spawned pool does:
+    the initializer's arguments once per worker, the task function with every chunk."""
+
+    def __init__(
+        self,
+        *,
+        initializer: Callable[..., None],
+        initargs: Tuple[Any, ...],
+        **_: Any,
+    ) -> None:
+        initializer(*pickle.loads(pickle.dumps(initargs)))
+
+    def __enter__(self) -> "_WorkerPool":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        return None
+
+    def map(self, function: Callable[[Any], Any], items: List[Any], chunksize: int) -> Any:
+        def results() -> Iterator[Any]:
+            for start in range(0, len(items), chunksize):
+                chunk_function = pickle.loads(pickle.dumps(function))
+                yield from map(chunk_function, items[start : start + chunksize])
+
+        return SimpleNamespace(result=results, cancel=lambda: None)
+
+
+class TestPoolEvaluation:
+    def test_workers_reuse_the_reference_analysis_across_variants(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sample_rate = 16000
+        audio = np.sin(2.0 * np.pi * 440.0 * np.arange(sample_rate) / sample_rate)
+        reconstructor = SimpleNamespace(
+            reconstruct_audio=lambda audio, path: SimpleNamespace(coefficient=1.0, approximation=0.5 * audio)
+        )
+        monkeypatch.setattr(runner, "ProcessPool", _WorkerPool)
+        monkeypatch.setattr(runner, "prepared_audio", lambda *_: audio)
+        monkeypatch.setattr(runner._PROCESS_CACHE, "reconstructor", lambda variant: reconstructor)
+        monkeypatch.setattr(runner._PROCESS_CACHE, "referees", [])
+        variants = build_variants(Config(), METHODS, EXPONENTS, [])
+        pairs = runner.plan_pairs(variants, _items()[:1], _item_paths())
+        referee = MultiResolutionAuditoryReferee(sample_rate, config=RefereeConfig.load())
+
+        rows = list(runner._evaluate_pairs(pairs, [referee], max_workers=2, chunksize=1))
+
+        (worker_referee,) = runner._PROCESS_CACHE.referees
+        assert len(rows) == len(variants)
+        assert worker_referee is not referee
+        assert len(worker_referee._references) == 1
+
+
+class TestPreparedAudio:
+    def test_each_file_is_prepared_once_per_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: List[Path] = []
+
+        def load(path: Path, **_: object) -> np.ndarray:
+            calls.append(path)
+            return np.zeros(4)
+
+        monkeypatch.setattr(runner, "load_audio", load)
+        prepared_audio.cache_clear()
+        try:
+            first = prepared_audio(Path("tone.wav"), 44100, True, False, 16)
+            second = prepared_audio(Path("tone.wav"), 44100, True, False, 16)
+            prepared_audio(Path("tone.wav"), 48000, True, False, 16)
+        finally:
+            prepared_audio.cache_clear()
+
+        assert first is second
+        assert calls == [Path("tone.wav"), Path("tone.wav")]
+
+    def test_prepared_audio_is_read_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(runner, "load_audio", lambda path, **_: np.zeros(4))
+        prepared_audio.cache_clear()
+        try:
+            audio = prepared_audio(Path("tone.wav"), 44100, True, False, 16)
+        finally:
+            prepared_audio.cache_clear()
+
+        assert not audio.flags.writeable
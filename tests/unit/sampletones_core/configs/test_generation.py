@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from sampletones_core.configs.generation import DecoderConfig
+
+
+class TestDecoderConfig:
+    def test_shortlist_bounds_may_meet(self) -> None:
+        decoder = DecoderConfig(min_top_k=4, max_top_k=4)
+        assert decoder.min_top_k == decoder.max_top_k == 4
+
+    def test_minimum_above_maximum_is_refused(self) -> None:
+        with pytest.raises(ValidationError):
+            DecoderConfig(min_top_k=5, max_top_k=4)
@@ -4,8 +4,14 @@ from typing import Any, Callable, Dict, Final, List, Optional, Sequence, Tuple
 import numpy as np
 import pytest
 
-from sampletones_core.constants.enums import FeatureKey
-from sampletones_core.constants.general import MAX_VOLUME
+from sampletones_core.constants.enums import FeatureKey, InstructionClassName
+from sampletones_core.constants.general import (
+    MAX_DUTY_CYCLE,
+    MAX_PITCH,
+    MAX_VOLUME,
+    MIN_PITCH,
+    NUM_PERIODS,
+)
 from sampletones_core.exporters import (
     ExporterTypeUnion,
     Features,
@@ -13,12 +19,15 @@ from sampletones_core.exporters import (
     PulseExporter,
     TriangleExporter,
 )
+from sampletones_core.features import CHANNEL_FEATURE_DEFAULTS
 from sampletones_core.instructions import (
+    InstructionArray,
     InstructionUnion,
     NoiseInstruction,
     PulseInstruction,
     TriangleInstruction,
 )
+from sampletones_shared.utils.arrays import hold
 from tests.suite.base import BaseTestSuite
 from tests.suite.case import BaseRegularTestCase
 
@@ -547,3 +556,110 @@ class TestSingleFrameReading(BaseTestSuite):
         values[FeatureKey.HI_PITCH] = 3
 
         assert test_case.exporter.instruction_from_values(values, test_case.reference) == test_case.instruction
+
+
+def _random_pulse(rng: np.random.Generator) -> PulseInstruction:
+    return PulseInstruction(
+        on=bool(rng.integers(2)),
+        pitch=int(rng.integers(MIN_PITCH, MAX_PITCH + 1)),
+        volume=int(rng.integers(MAX_VOLUME + 1)),
+        duty_cycle=int(rng.integers(MAX_DUTY_CYCLE + 1)),
+    )
+
+
+def _random_triangle(rng: np.random.Generator) -> TriangleInstruction:
+    return TriangleInstruction(on=bool(rng.integers(2)), pitch=int(rng.integers(MIN_PITCH, MAX_PITCH + 1)))
+
+
+def _random_noise(rng: np.random.Generator) -> NoiseInstruction:
+    return NoiseInstruction(
+        on=bool(rng.integers(2)),
+        period=int(rng.integers(NUM_PERIODS)),
+        volume=int(rng.integers(MAX_VOLUME + 1)),
+        short=bool(rng.integers(2)),
+    )
+
+
+class TestColumnarConversions(BaseTestSuite):
+    """Whole-column conversions read a stream the way walking it frame by frame does.
+
+    The frame-by-frame forms are the reference: an envelope is what the instructions state
+    frame after frame, and a stream rebuilt from envelopes is the instruction each row of
+    held values describes.
+    """
+
+    @dataclass(frozen=True, kw_only=True)
+    class TestCase(BaseRegularTestCase):
+        exporter: ExporterTypeUnion
+        instruction_class: InstructionClassName
+        make: Callable[[np.random.Generator], InstructionUnion]
+
+    test_cases = (
+        TestCase(
+            label="pulse",
+            exporter=PulseExporter,
+            instruction_class=InstructionClassName.PULSE_INSTRUCTION,
+            make=_random_pulse,
+        ),
+        TestCase(
+            label="triangle",
+            exporter=TriangleExporter,
+            instruction_class=InstructionClassName.TRIANGLE_INSTRUCTION,
+            make=_random_triangle,
+        ),
+        TestCase(
+            label="noise",
+            exporter=NoiseExporter,
+            instruction_class=InstructionClassName.NOISE_INSTRUCTION,
+            make=_random_noise,
+        ),
+    )
+
+    @staticmethod
+    def _stream(test_case: TestCase, seed: int, length: int = 64) -> List[InstructionUnion]:
+        rng = np.random.default_rng(seed)
+        return [test_case.make(rng) for _ in range(length)]
+
+    @pytest.mark.parametrize(
+        "test_case",
+        test_cases,
+        ids=lambda test_case: test_case.label,
+    )
+    def test_an_array_exports_as_its_list_does(self, test_case: TestCase) -> None:
+        instructions = self._stream(test_case, seed=1)
+        array = InstructionArray.from_instructions(test_case.instruction_class, instructions)
+        reference = test_case.exporter.derive_initial_pitch(instructions)
+
+        assert test_case.exporter.derive_initial_pitch(array) == reference
+        columnar = test_case.exporter().to_features(array, reference, ()).feature_map
+        listed = test_case.exporter().to_features(instructions, reference, ()).feature_map
+        assert columnar.keys() == listed.keys()
+        for key, value in listed.items():
+            assert np.array_equal(columnar[key], value) if isinstance(value, np.ndarray) else columnar[key] == value
+
+    @pytest.mark.parametrize(
+        "test_case",
+        test_cases,
+        ids=lambda test_case: test_case.label,
+    )
+    def test_rebuilt_stream_matches_the_frame_by_frame_reading(self, test_case: TestCase) -> None:
+        rng = np.random.default_rng(2)
+        features = test_case.exporter().to_features(self._stream(test_case, seed=3), 0, ())
+        arpeggio = features[FeatureKey.ARPEGGIO]
+        assert isinstance(arpeggio, np.ndarray)
+        features[FeatureKey.ARPEGGIO] = rng.integers(-OCTAVE * 8, OCTAVE * 8, size=len(arpeggio) // 2).astype(np.int8)
+
+        envelopes = {key: value for key, value in features.items() if isinstance(value, np.ndarray)}
+        length = max(len(value) for value in envelopes.values())
+        expected = [
+            test_case.exporter.instruction_from_values(
+                {
+                    key: int(hold(value, index, default=CHANNEL_FEATURE_DEFAULTS[key]))
+                    for key, value in envelopes.items()
+                },
+                features.initial_pitch,
+            )
+            for index in range(length)
+        ]
+
+        assert test_case.exporter.from_features(features) == expected
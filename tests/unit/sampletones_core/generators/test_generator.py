@@ -1,3 +1,6 @@
+import random
+from typing import Final, List, Type
+
 import numpy as np
 import pytest
 
@@ -5,8 +8,15 @@ from sampletones_core.configs import Config
 from sampletones_core.constants.algorithm import MIN_SAMPLE_LENGTH
 from sampletones_core.constants.enums import GeneratorName
 from sampletones_core.fft import CyclicArray
+from sampletones_core.generators import GeneratorUnion, NoiseGenerator, TriangleGenerator
 from sampletones_core.generators.implementation.pulse import PulseGenerator
-from sampletones_core.instructions import PulseInstruction
+from sampletones_core.instructions import InstructionUnion, NoiseInstruction, PulseInstruction
+
+STREAM_LENGTH: Final[int] = 300
+STREAM_SEED: Final[int] = 7
+SILENT_SHARE: Final[int] = 4
+FRAME_LENGTH_OFFSETS: Final[List[int]] = [-300, -1, 0, 1, 500]
+GENERATOR_CLASSES: Final[List[Type[GeneratorUnion]]] = [PulseGenerator, TriangleGenerator, NoiseGenerator]
 
 
 @pytest.fixture
@@ -82,3 +92,113 @@ class TestGeneratorGenerateSampleOff:
         instruction = PulseInstruction(on=False, pitch=60, volume=0, duty_cycle=0)
         result = generator.generate_sample(instruction)
         assert result.sample_rate == config.library.sample_rate
+
+
+def _stream(generator: GeneratorUnion) -> List[InstructionUnion]:
+    """A random stream mixing sounding instructions with a share of silent ones."""
+    possible = generator.get_possible_instructions()
+    choices = possible[:1] * (len(possible) // SILENT_SHARE) + possible[1:]
+    rng = random.Random(STREAM_SEED)
+    return [rng.choice(choices) for _ in range(STREAM_LENGTH)]
+
+
+def _render_frame_by_frame(
+    generator: GeneratorUnion,
+    instructions: List[InstructionUnion],
+    resume: bool,
+) -> np.ndarray:
+    return np.concatenate(
+        [
+            generator(instruction, initials=generator.initials if resume else None, save=True)  # type: ignore[arg-type]
+            for instruction in instructions
+        ]
+    )
+
+
+def _config(reset_phase: bool) -> Config:
+    config = Config()
+    return config.model_copy(
+        update={"generation": config.generation.model_copy(update={"reset_phase": reset_phase})},
+    )
+
+
+class TestGeneratorRenderSequence:
+    @pytest.mark.parametrize("generator_class", GENERATOR_CLASSES)
+    @pytest.mark.parametrize("reset_phase", [False, True])
+    @pytest.mark.parametrize("resume", [False, True])
+    def test_matches_the_frame_loop_exactly(
+        self,
+        generator_class: Type[GeneratorUnion],
+        reset_phase: bool,
+        resume: bool,
+    ) -> None:
+        looped = generator_class(_config(reset_phase))
+        sequenced = generator_class(_config(reset_phase))
+        instructions = _stream(looped)
+
+        expected = _render_frame_by_frame(looped, instructions, resume)
+        result = sequenced.render_sequence(
+            instructions,  # type: ignore[arg-type]
+            initials=sequenced.initials if resume else None,
+        )
+
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("generator_class", GENERATOR_CLASSES)
+    def test_matches_the_frame_loop_at_varying_frame_lengths(self, generator_class: Type[GeneratorUnion]) -> None:
+        looped = generator_class(Config())
+        sequenced = generator_class(Config())
+        instructions = _stream(looped)
+        rng = random.Random(STREAM_SEED)
+        frame_lengths = [looped.frame_length + rng.choice(FRAME_LENGTH_OFFSETS) for _ in instructions]
+
+        expected = []
+        for instruction, frame_length in zip(instructions, frame_lengths):
+            looped.frame_length = frame_length
+            expected.append(looped(instruction, save=True))  # type: ignore[arg-type]
+
+        result = sequenced.render_sequence(instructions, frame_lengths=frame_lengths)  # type: ignore[arg-type]
+
+        np.testing.assert_array_equal(result, np.concatenate(expected))
+        assert sequenced.initials == looped.initials
+
+    def test_mismatched_frame_lengths_raise(self, generator: PulseGenerator) -> None:
+        instruction = PulseInstruction(on=True, pitch=60, volume=15, duty_cycle=0)
+
+        with pytest.raises(ValueError):
+            generator.render_sequence([instruction] * 2, frame_lengths=[generator.frame_length])
+
+    @pytest.mark.parametrize("generator_class", GENERATOR_CLASSES)
+    def test_leaves_the_state_the_frame_loop_leaves(self, generator_class: Type[GeneratorUnion]) -> None:
+        looped = generator_class(Config())
+        sequenced = generator_class(Config())
+        instructions = _stream(looped)
+
+        _render_frame_by_frame(looped, instructions, resume=False)
+        sequenced.render_sequence(instructions)  # type: ignore[arg-type]
+
+        assert sequenced.initials == looped.initials
+        assert sequenced.previous_instruction is looped.previous_instruction
+        assert sequenced.timer.real_frequency == looped.timer.real_frequency
+
+    def test_an_empty_stream_renders_an_empty_waveform(self, generator: PulseGenerator) -> None:
+        result = generator.render_sequence([])
+
+        assert result.size == 0
+        assert result.dtype == np.float32
+
+    def test_silent_instructions_render_zero_frames(self, generator: PulseGenerator) -> None:
+        instruction = PulseInstruction(on=False, pitch=60, volume=0, duty_cycle=0)
+
+        result = generator.render_sequence([instruction] * 3)
+
+        assert len(result) == 3 * generator.frame_length
+        assert np.all(result == 0.0)
+        assert generator.previous_instruction is None
+
+    def test_wrong_instruction_type_raises(self, generator: PulseGenerator) -> None:
+        noise = NoiseInstruction(on=True, period=3, volume=15, short=False)
+
+        with pytest.raises(TypeError):
+            generator.render_sequence([noise])  # type: ignore[list-item]
@@ -0,0 +1,231 @@
+from dataclasses import dataclass
+from typing import Final, List
+
+import msgpack
+import numpy as np
+import pytest
+
+from sampletones_core.constants.enums import InstructionClassName
+from sampletones_core.constants.general import MAX_PITCH, MAX_VOLUME, MIN_PITCH
+from sampletones_core.instructions import (
+    InstructionArray,
+    InstructionUnion,
+    NoiseInstruction,
+    PulseInstruction,
+    TriangleInstruction,
+    as_instruction_array,
+    instruction_dtype,
+)
+from sampletones_shared.exceptions import DeserializationError
+from tests.suite.base import BaseTestSuite
+from tests.suite.case import BaseRegularTestCase
+
+_PULSE: Final[InstructionClassName] = InstructionClassName.PULSE_INSTRUCTION
+
+
+def _pulses() -> List[PulseInstruction]:
+    return [
+        PulseInstruction(on=True, pitch=60, volume=MAX_VOLUME, duty_cycle=2),
+        PulseInstruction.null_instruction(),
+        PulseInstruction(on=True, pitch=MAX_PITCH, volume=3, duty_cycle=0),
+    ]
+
+
+class TestInstructionDtype(BaseTestSuite):
+    @dataclass(frozen=True, kw_only=True)
+    class TestCase(BaseRegularTestCase):
+        instruction_class: InstructionClassName
+        expected: List[str]
+
+    test_cases = (
+        TestCase(
+            instruction_class=InstructionClassName.PULSE_INSTRUCTION,
+            expected=["on", "pitch", "volume", "duty_cycle"],
+            label="pulse",
+        ),
+        TestCase(
+            instruction_class=InstructionClassName.TRIANGLE_INSTRUCTION,
+            expected=["on", "pitch"],
+            label="triangle",
+        ),
+        TestCase(
+            instruction_class=InstructionClassName.NOISE_INSTRUCTION,
+            expected=["on", "period", "volume", "short"],
+            label="noise",
+        ),
+    )
+
+    @pytest.mark.parametrize(
+        "test_case",
+        test_cases,
+        ids=lambda test_case: test_case.label,
+    )
+    def test_one_byte_per_field_in_declaration_order(self, test_case: TestCase) -> None:
+        dtype = instruction_dtype(test_case.instruction_class)
+
+        assert list(dtype.names or ()) == test_case.expected
+        assert dtype.itemsize == len(test_case.expected)
+
+
+class TestInstructionArrayViews:
+    def test_list_view_round_trips(self) -> None:
+        instructions = _pulses()
+
+        array = InstructionArray.from_instructions(_PULSE, instructions)
+
+        assert array.to_instructions() == instructions
+        assert list(array) == instructions
+        assert len(array) == len(instructions)
+
+    def test_indexing_reads_one_frame(self) -> None:
+        array = InstructionArray.from_instructions(_PULSE, _pulses())
+
+        assert array[0] == _pulses()[0]
+        assert array[-1] == _pulses()[-1]
+
+    def test_slicing_keeps_the_columnar_form(self) -> None:
+        array = InstructionArray.from_instructions(_PULSE, _pulses())
+
+        sliced = array[::2]
+
+        assert isinstance(sliced, InstructionArray)
+        assert sliced.to_instructions() == _pulses()[::2]
+
+    def test_columns_read_whole(self) -> None:
+        array = InstructionArray.from_instructions(_PULSE, _pulses())
+
+        assert array.column("pitch").tolist() == [60, MIN_PITCH, MAX_PITCH]
+        assert array.column("on").tolist() == [True, False, True]
+
+    def test_values_are_read_only(self) -> None:
+        array = InstructionArray.from_instructions(_PULSE, _pulses())
+
+        with pytest.raises(ValueError):
+            array.values["volume"][0] = 0
+
+    def test_empty_stream(self) -> None:
+        array = InstructionArray.empty(InstructionClassName.TRIANGLE_INSTRUCTION)
+
+        assert len(array) == 0
+        assert array.to_instructions() == []
+        assert array == InstructionArray.from_instructions(InstructionClassName.TRIANGLE_INSTRUCTION, [])
+
+    def test_another_instruction_type_is_refused(self) -> None:
+        instructions: List[InstructionUnion] = [TriangleInstruction.default_instruction()]
+
+        with pytest.raises(TypeError):
+            InstructionArray.from_instructions(_PULSE, instructions)
+
+    def test_an_array_passes_through_unchanged(self) -> None:
+        array = InstructionArray.from_instructions(_PULSE, _pulses())
+
+        assert as_instruction_array(_PULSE, array) is array
+        assert as_instruction_array(_PULSE, _pulses()) == array
+
+
+class TestInstructionArrayEquality:
+    def test_equal_streams_compare_and_hash_equal(self) -> None:
+        first = InstructionArray.from_instructions(_PULSE, _pulses())
+        second = InstructionArray.from_instructions(_PULSE, _pulses())
+
+        assert first == second
+        assert hash(first) == hash(second)
+
+    def test_streams_of_another_length_differ(self) -> None:
+        array = InstructionArray.from_instructions(_PULSE, _pulses())
+
+        assert array != array[:1]
+
+
+class TestInstructionArrayFromColumns(BaseTestSuite):
+    @dataclass(frozen=True, kw_only=True)
+    class TestCase(BaseRegularTestCase):
+        volume: List[int]
+        pitch: List[int]
+        expected: bool
+
+    test_cases = (
+        TestCase(volume=[0, MAX_VOLUME], pitch=[MIN_PITCH, MAX_PITCH], expected=True, label="in_range"),
+        TestCase(volume=[0, MAX_VOLUME + 1], pitch=[MIN_PITCH, MAX_PITCH], expected=False, label="volume_above"),
+        TestCase(volume=[0, 1], pitch=[MIN_PITCH - 1, MAX_PITCH], expected=False, label="pitch_below"),
+        TestCase(volume=[-1, 1], pitch=[MIN_PITCH, MAX_PITCH], expected=False, label="volume_below"),
+    )
+
+    @pytest.mark.parametrize(
+        "test_case",
+        test_cases,
+        ids=lambda test_case: test_case.label,
+    )
+    def test_columns_are_held_to_the_field_ranges(self, test_case: TestCase) -> None:
+        columns = {
+            "on": np.array([False, True]),
+            "pitch": np.array(test_case.pitch),
+            "volume": np.array(test_case.volume),
+            "duty_cycle": np.array([0, 1]),
+        }
+
+        if not test_case.expected:
+            with pytest.raises(ValueError):
+                InstructionArray.from_columns(_PULSE, columns)
+            return
+
+        array = InstructionArray.from_columns(_PULSE, columns)
+        assert array.to_instructions() == [
+            PulseInstruction(on=False, pitch=test_case.pitch[0], volume=test_case.volume[0], duty_cycle=0),
+            PulseInstruction(on=True, pitch=test_case.pitch[1], volume=test_case.volume[1], duty_cycle=1),
+        ]
+
+    def test_a_missing_column_is_refused(self) -> None:
+        with pytest.raises(ValueError):
+            InstructionArray.from_columns(_PULSE, {"on": np.array([True]), "pitch": np.array([60])})
+
+    def test_columns_of_different_lengths_are_refused(self) -> None:
+        columns = {
+            "on": np.array([True, True]),
+            "period": np.array([1]),
+            "volume": np.array([1, 2]),
+            "short": np.array([False, True]),
+        }
+
+        with pytest.raises(ValueError):
+            InstructionArray.from_columns(InstructionClassName.NOISE_INSTRUCTION, columns)
+
+
+class TestInstructionArrayPacking:
+    def test_pack_round_trips_through_msgpack(self) -> None:
+        array = InstructionArray.from_instructions(_PULSE, _pulses())
+
+        packed = msgpack.packb(array.pack(), use_bin_type=True)
+        unpacked = InstructionArray.unpack(msgpack.unpackb(packed, raw=False))
+
+        assert unpacked == array
+        assert unpacked.to_instructions() == _pulses()
+
+    def test_packed_buffer_views_the_array_memory(self) -> None:
+        array = InstructionArray.from_instructions(_PULSE, _pulses())
+
+        buffer = array.pack()["values"]
+
+        assert isinstance(buffer, memoryview)
+        assert buffer.nbytes == array.nbytes == len(_pulses()) * instruction_dtype(_PULSE).itemsize
+
+    def test_a_partial_row_is_refused(self) -> None:
+        with pytest.raises(DeserializationError):
+            InstructionArray.unpack({"instruction_class": str(_PULSE), "values": b"\x01\x3c\x0f"})
+
+    def test_an_unknown_instruction_type_is_refused(self) -> None:
+        with pytest.raises(DeserializationError):
+            InstructionArray.unpack({"instruction_class": "Unknown", "values": b""})
+
+    def test_validate_refuses_out_of_range_rows(self) -> None:
+        raw = NoiseInstruction.null_instruction()
+        array = InstructionArray.from_instructions(InstructionClassName.NOISE_INSTRUCTION, [raw])
+        corrupted = bytearray(array.values.tobytes())
+        corrupted[1] = 99
+
+        unpacked = InstructionArray.unpack(
+            {"instruction_class": str(InstructionClassName.NOISE_INSTRUCTION), "values": bytes(corrupted)}
+        )
+
+        with pytest.raises(ValueError):
+            unpacked.validate()
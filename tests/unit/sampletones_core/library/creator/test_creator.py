@@ -0,0 +1,82 @@
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from sampletones_core.configs import Config
+from sampletones_core.fft import Window
+from sampletones_core.library.creator import InstructionsLibraryCreator
+from sampletones_shared.logger import null_logger
+
+CHUNK_SIZE: Final[int] = 16
+
+
+@pytest.fixture(scope="module")
+def config() -> Config:
+    return Config()
+
+
+@pytest.fixture(scope="module")
+def window(config: Config) -> Window:
+    return Window.from_config(config)
+
+
+@pytest.fixture
+def creator(tmp_path: Path, config: Config, window: Window) -> InstructionsLibraryCreator:
+    return InstructionsLibraryCreator(
+        config,
+        window,
+        logger=null_logger,
+        library_directory=tmp_path,
+        chunk_size=CHUNK_SIZE,
+    )
+
+
+def test_every_instruction_belongs_to_one_chunk(creator: InstructionsLibraryCreator) -> None:
+    tasks = creator._create_tasks()
+
+    chunked = [
+        (generator_class_name, instruction) for (generator_class_name, chunk), _, _, _ in tasks for instruction in chunk
+    ]
+    assert chunked == creator.instructions
+    assert all(len(chunk) <= CHUNK_SIZE for (_, chunk), _, _, _ in tasks)
+    assert [path for _, _, _, path in tasks] == creator.partial_paths
+    assert all(path.parent == creator.partials_directory for path in creator.partial_paths)
+
+
+def test_finished_chunks_are_not_generated_again(creator: InstructionsLibraryCreator) -> None:
+    tasks = creator._create_tasks()
+    (_, finished), _, _, finished_path = tasks[1]
+    finished_path.touch()
+    (creator.partials_directory / "interrupted.tmp").touch()
+
+    resumed = creator._create_tasks()
+
+    assert [task[3] for task in resumed] == [task[3] for task in tasks if task[3] != finished_path]
+    assert creator.resumed_instructions == len(finished)
+    assert not (creator.partials_directory / "interrupted.tmp").exists()
+
+
+def test_progress_counts_resumed_and_generated_instructions(creator: InstructionsLibraryCreator) -> None:
+    tasks = creator._create_tasks()
+    (_, finished), _, _, finished_path = tasks[0]
+    finished_path.touch()
+    resumed = creator._create_tasks()
+    (_, generated), _, _, generated_path = resumed[0]
+
+    creator._on_result((generated_path, len(generated)))
+    creator._notify_progress()
+
+    assert creator.total_instructions == len(creator.instructions)
+    assert creator.completed_instructions == len(finished) + len(generated)
+
+
+def test_results_are_the_key_and_every_partial_in_order(creator: InstructionsLibraryCreator) -> None:
+    creator._create_tasks()
+
+    key, partials = creator._process_results([])
+
+    assert key == creator.key
+    assert partials.paths == tuple(creator.partial_paths)
+    assert partials.size == len(creator.instructions)
+    assert partials.directory == creator.partials_directory
@@ -1,12 +1,18 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from sampletones_core.configs import Config
 from sampletones_core.data import Metadata
+from sampletones_core.fft import Window
+from sampletones_core.fft.features import get_feature_extractor
+from sampletones_core.generators import get_generators_by_names
+from sampletones_core.instructions import InstructionUnion
+from sampletones_core.library import InstructionLibraryFragment
 from sampletones_core.library.data import InstructionLibraryData
 from sampletones_shared.application import SAMPLETONES_LIBRARY_DATA_VERSION
 from sampletones_shared.exceptions import (
@@ -21,6 +27,8 @@ from tests.suite.base import BaseTestSuite
 from tests.suite.case import BaseRegularTestCase
 from tests.suite.errors import DIRECTORY_READ_ERRORS
 
+INSTRUCTIONS_PER_GENERATOR: Final[int] = 2
+
 
 def _library(metadata: Optional[Metadata] = None) -> InstructionLibraryData:
     library = InstructionLibraryData.create(Config(), {})
@@ -30,6 +38,18 @@ def _library(metadata: Optional[Metadata] = None) -> InstructionLibraryData:
     return library
 
 
+@pytest.fixture(scope="module")
+def populated_library() -> InstructionLibraryData:
+    config = Config()
+    extractor = get_feature_extractor(config, Window.from_config(config))
+    data: Dict[InstructionUnion, InstructionLibraryFragment[Any]] = {}
+    for generator in get_generators_by_names(config, config.generation.generators).values():
+        for instruction in list(generator.get_possible_instructions())[:INSTRUCTIONS_PER_GENERATOR]:
+            data[instruction] = InstructionLibraryFragment.create(generator, instruction, extractor)
+
+    return InstructionLibraryData.create(config, data)
+
+
 class TestRoundTrip:
     def test_save_load_round_trip(self, tmp_path: Path) -> None:
         library = _library()
@@ -149,3 +169,142 @@ class TestLoadWrapping(BaseTestSuite):
         ):
             with pytest.raises(test_case.expected):
                 InstructionLibraryData.load(path)
+
+
+class TestReadHeader:
+    def test_header_describes_the_library(
+        self,
+        populated_library: InstructionLibraryData,
+        tmp_path: Path,
+    ) -> None:
+        path = tmp_path / "library.ins"
+        populated_library.save(path)
+
+        header = InstructionLibraryData.read_header(path)
+
+        assert header.config == populated_library.config
+        assert header.metadata == populated_library.metadata
+        assert header.size == len(populated_library.items)
+
+    def test_header_skips_the_items(
+        self,
+        populated_library: InstructionLibraryData,
+        tmp_path: Path,
+    ) -> None:
+        path = tmp_path / "library.ins"
+        populated_library.save(path)
+
+        with patch("sampletones_core.library.item.LibraryItem.deserialize_inner") as deserialize_item:
+            InstructionLibraryData.read_header(path)
+
+        deserialize_item.assert_not_called()
+
+    def test_incompatible_version_propagates(self, tmp_path: Path) -> None:
+        path = tmp_path / "old.ins"
+        _library(Metadata(library_data_version="0.0")).save(path)
+
+        with pytest.raises(IncompatibleLibraryDataVersionError):
+            InstructionLibraryData.read_header(path)
+
+    def test_garbage_file_raises_load_library_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "foreign.ins"
+        path.write_bytes(b"garbage-not-a-flatbuffer")
+
+        with pytest.raises(LoadLibraryError):
+            InstructionLibraryData.read_header(path)
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            InstructionLibraryData.read_header(tmp_path / "fake.ins")
+
+
+class TestLoadIncrementally:
+    def test_matches_a_whole_load(
+        self,
+        populated_library: InstructionLibraryData,
+        tmp_path: Path,
+    ) -> None:
+        path = tmp_path / "library.ins"
+        populated_library.save(path)
+
+        streamed = InstructionLibraryData.load_incrementally(path)
+        loaded = InstructionLibraryData.load(path)
+
+        assert streamed.config == loaded.config
+        assert streamed.metadata == loaded.metadata
+        assert list(streamed.keys()) == list(loaded.keys())
+        for instruction, fragment in loaded.data.items():
+            np.testing.assert_array_equal(streamed[instruction].sample.array, fragment.sample.array)
+
+    def test_reports_every_item(
+        self,
+        populated_library: InstructionLibraryData,
+        tmp_path: Path,
+    ) -> None:
+        path = tmp_path / "library.ins"
+        populated_library.save(path)
+        reports: List[Tuple[int, int]] = []
+
+        InstructionLibraryData.load_incrementally(path, on_progress=lambda done, total: reports.append((done, total)))
+
+        size = len(populated_library.items)
+        assert reports == [(done, size) for done in range(1, size + 1)]
+
+    def test_progress_exception_propagates_unchanged(
+        self,
+        populated_library: InstructionLibraryData,
+        tmp_path: Path,
+    ) -> None:
+        path = tmp_path / "library.ins"
+        populated_library.save(path)
+
+        class Abandoned(Exception):
+            pass
+
+        def abandon(_done: int, _total: int) -> None:
+            raise Abandoned()
+
+        with pytest.raises(Abandoned):
+            InstructionLibraryData.load_incrementally(path, on_progress=abandon)
+
+    def test_incompatible_version_propagates(self, tmp_path: Path) -> None:
+        path = tmp_path / "old.ins"
+        _library(Metadata(library_data_version="0.0")).save(path)
+
+        with pytest.raises(IncompatibleLibraryDataVersionError):
+            InstructionLibraryData.load_incrementally(path)
+
+    def test_garbage_file_raises_load_library_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "foreign.ins"
+        path.write_bytes(b"garbage-not-a-flatbuffer")
+
+        with pytest.raises(LoadLibraryError):
+            InstructionLibraryData.load_incrementally(path)
+
+    def test_truncated_file_raises_load_library_error(
+        self,
+        populated_library: InstructionLibraryData,
+        tmp_path: Path,
+    ) -> None:
+        path = tmp_path / "library.ins"
+        path.write_bytes(populated_library.serialize()[:-16])
+
+        with pytest.raises(LoadLibraryError):
+            InstructionLibraryData.load_incrementally(path)
+
+
+class TestMemoryFootprint:
+    def test_empty_library_holds_no_bytes(self) -> None:
+        assert _library().nbytes == 0
+
+    def test_library_bytes_sum_its_fragment_arrays(self, populated_library: InstructionLibraryData) -> None:
+        expected = sum(
+            fragment.sample.array.nbytes + fragment.feature.values.nbytes for fragment in populated_library.values()
+        )
+
+        assert populated_library.nbytes == expected > 0
+
+    def test_fragment_features_share_their_edges(self, populated_library: InstructionLibraryData) -> None:
+        loaded = InstructionLibraryData.deserialize(populated_library.serialize())
+
+        assert len({id(fragment.feature.bins) for fragment in loaded.values()}) == 1
@@ -1,4 +1,5 @@
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -179,3 +180,97 @@ class TestInstructionLibrarySaveLoad:
     ) -> None:
         path = library.get_path(library_key)
         assert path.name == library_key.filename
+
+
+def _library_data(nbytes: int) -> MagicMock:
+    return MagicMock(nbytes=nbytes)
+
+
+class TestInstructionLibraryBudget:
+    def test_unbounded_library_keeps_everything(self, tmp_path: Path) -> None:
+        library = InstructionLibrary(directory=str(tmp_path))
+        keys = [MagicMock() for _ in range(3)]
+        for key in keys:
+            library.store(key, _library_data(1 << 30))
+
+        assert list(library.keys()) == keys
+
+    def test_least_recently_used_library_is_evicted(self, tmp_path: Path) -> None:
+        library = InstructionLibrary(directory=str(tmp_path), memory_budget=200)
+        first, second, third = MagicMock(), MagicMock(), MagicMock()
+        library.store(first, _library_data(100))
+        library.store(second, _library_data(100))
+        library[first]
+        library.store(third, _library_data(100))
+
+        assert list(library.keys()) == [first, third]
+
+    def test_library_larger_than_the_budget_still_loads(self, tmp_path: Path) -> None:
+        library = InstructionLibrary(directory=str(tmp_path), memory_budget=100)
+        key = MagicMock()
+        library.store(key, _library_data(500))
+
+        assert list(library.keys()) == [key]
+
+    def test_pinned_library_is_not_evicted(self, tmp_path: Path) -> None:
+        library = InstructionLibrary(directory=str(tmp_path), memory_budget=200)
+        first, second, third = MagicMock(), MagicMock(), MagicMock()
+        library.store(first, _library_data(100))
+        library.store(second, _library_data(100))
+
+        with library.pinned(first):
+            library.store(third, _library_data(100))
+
+            assert list(library.keys()) == [first, third]
+
+    def test_unpinning_evicts_past_the_budget(self, tmp_path: Path) -> None:
+        library = InstructionLibrary(directory=str(tmp_path), memory_budget=100)
+        first, second = MagicMock(), MagicMock()
+        library.pin(first)
+        library.store(first, _library_data(100))
+        library.store(second, _library_data(100))
+        library.touch(second)
+
+        library.unpin(first)
+
+        assert list(library.keys()) == [second]
+        assert library.nbytes == 100
+
+    def test_evicting_drops_an_unpinned_library(self, tmp_path: Path) -> None:
+        library = InstructionLibrary(directory=str(tmp_path))
+        key = MagicMock()
+        library.store(key, _library_data(100))
+
+        assert library.evict(key) is True
+        assert key not in library
+        assert library.evict(key) is False
+
+    def test_evicting_spares_a_pinned_library(self, tmp_path: Path) -> None:
+        library = InstructionLibrary(directory=str(tmp_path))
+        key = MagicMock()
+        library.store(key, _library_data(100))
+
+        with library.pinned(key):
+            assert library.evict(key) is False
+            assert key in library
+
+    def test_pins_are_counted(self, tmp_path: Path) -> None:
+        library = InstructionLibrary(directory=str(tmp_path))
+        key = MagicMock()
+        library.pin(key)
+        library.pin(key)
+        library.unpin(key)
+
+        assert library.is_pinned(key) is True
+        library.unpin(key)
+        assert library.is_pinned(key) is False
+
+    def test_saved_library_counts_its_fragment_bytes(
+        self,
+        library: InstructionLibrary,
+        library_key: InstructionLibraryKey,
+        empty_library_data: InstructionLibraryData,
+    ) -> None:
+        library.save_data(library_key, empty_library_data)
+
+        assert library.nbytes == 0
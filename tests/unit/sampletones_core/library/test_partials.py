@@ -0,0 +1,159 @@
+from pathlib import Path
+from typing import Any, Dict, Final, List, Tuple
+
+import pytest
+
+from sampletones_core.configs import Config
+from sampletones_core.constants.enums import GeneratorClassName
+from sampletones_core.fft import Window
+from sampletones_core.generators import get_generators_map
+from sampletones_core.instructions import InstructionUnion
+from sampletones_core.library import InstructionLibraryFragment, LibraryPartials
+from sampletones_core.library.creator.creation import generate_partial_task, generate_single_instruction_task
+from sampletones_core.library.data import InstructionLibraryData
+from sampletones_core.library.key import InstructionLibraryKey
+from sampletones_core.library.library import InstructionLibrary
+from sampletones_core.library.partials import (
+    get_partial_filename,
+    get_partials_directory,
+    remove_temporary_partials,
+)
+
+INSTRUCTIONS_PER_CHUNK: Final[int] = 2
+
+
+@pytest.fixture(scope="module")
+def config() -> Config:
+    return Config()
+
+
+@pytest.fixture(scope="module")
+def window(config: Config) -> Window:
+    return Window.from_config(config)
+
+
+@pytest.fixture(scope="module")
+def chunks(config: Config) -> List[Tuple[GeneratorClassName, List[InstructionUnion]]]:
+    return [
+        (generator.class_name(), generator.get_possible_instructions()[:INSTRUCTIONS_PER_CHUNK])
+        for generator in get_generators_map(config).values()
+    ]
+
+
+def _write_partials(
+    directory: Path,
+    chunks: List[Tuple[GeneratorClassName, List[InstructionUnion]]],
+    config: Config,
+    window: Window,
+) -> LibraryPartials:
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: List[Path] = []
+    size = 0
+    for generator_class_name, instructions in chunks:
+        path = directory / get_partial_filename(generator_class_name, 0, len(instructions))
+        _, written = generate_partial_task(((generator_class_name, instructions), config, window, path))
+        paths.append(path)
+        size += written
+
+    return LibraryPartials(config=config.library, directory=directory, paths=tuple(paths), size=size)
+
+
+def test_partials_directory_sits_beside_the_library_file(tmp_path: Path) -> None:
+    library_path = tmp_path / "library.ins"
+
+    directory = get_partials_directory(library_path)
+
+    assert directory.parent == tmp_path
+    assert directory.name.startswith("library_v")
+    assert directory != library_path
+
+
+def test_partial_filenames_tell_chunks_apart() -> None:
+    names = {
+        get_partial_filename(GeneratorClassName.PULSE_GENERATOR, 0, 64),
+        get_partial_filename(GeneratorClassName.PULSE_GENERATOR, 64, 64),
+        get_partial_filename(GeneratorClassName.PULSE_GENERATOR, 0, 32),
+        get_partial_filename(GeneratorClassName.NOISE_GENERATOR, 0, 64),
+    }
+
+    assert len(names) == 4
+
+
+def test_assembled_library_equals_the_library_saved_whole(
+    tmp_path: Path,
+    config: Config,
+    window: Window,
+    chunks: List[Tuple[GeneratorClassName, List[InstructionUnion]]],
+) -> None:
+    partials = _write_partials(tmp_path / "partials", chunks, config, window)
+    data: Dict[InstructionUnion, InstructionLibraryFragment[Any]] = dict(
+        generate_single_instruction_task(((generator_class_name, instruction), config, window))
+        for generator_class_name, instructions in chunks
+        for instruction in instructions
+    )
+
+    partials.assemble(tmp_path / "library.ins")
+
+    expected = InstructionLibraryData.create(config, data).serialize()
+    assert (tmp_path / "library.ins").read_bytes() == expected
+    assert InstructionLibraryData.read_header(tmp_path / "library.ins").size == len(data)
+
+
+def test_assembling_removes_the_partials(
+    tmp_path: Path,
+    config: Config,
+    window: Window,
+    chunks: List[Tuple[GeneratorClassName, List[InstructionUnion]]],
+) -> None:
+    partials = _write_partials(tmp_path / "partials", chunks, config, window)
+
+    partials.assemble(tmp_path / "library.ins")
+
+    assert not partials.directory.exists()
+    assert [path.name for path in tmp_path.iterdir()] == ["library.ins"]
+
+
+def test_a_failed_assembly_keeps_the_partials(
+    tmp_path: Path,
+    config: Config,
+    window: Window,
+    chunks: List[Tuple[GeneratorClassName, List[InstructionUnion]]],
+) -> None:
+    partials = _write_partials(tmp_path / "partials", chunks, config, window)
+    partials.paths[-1].unlink()
+
+    with pytest.raises(FileNotFoundError):
+        partials.assemble(tmp_path / "library.ins")
+
+    assert all(path.exists() for path in partials.paths[:-1])
+    assert not (tmp_path / "library.ins").exists()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_temporary_partials_are_removed(tmp_path: Path) -> None:
+    (tmp_path / "kept.part").touch()
+    (tmp_path / "interrupted.tmp").touch()
+
+    remove_temporary_partials(tmp_path)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["kept.part"]
+
+
+def test_save_partials_writes_the_library_and_drops_the_cached_one(
+    tmp_path: Path,
+    config: Config,
+    window: Window,
+    chunks: List[Tuple[GeneratorClassName, List[InstructionUnion]]],
+) -> None:
+    library = InstructionLibrary(directory=str(tmp_path / "libraries"))
+    key = InstructionLibraryKey.create(config.library, window)
+    library.store(key, InstructionLibraryData.create(config, {}))
+    partials = _write_partials(tmp_path / "partials", chunks, config, window)
+
+    library.save_partials(key, partials)
+
+    assert key not in library.data
+    assert library.exists(key)
+    library_data = library.get(config, window)
+    assert library_data is not None
+    assert len(library_data.items) == partials.size
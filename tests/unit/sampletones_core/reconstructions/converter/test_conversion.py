@@ -3,14 +3,23 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from sampletones_core.reconstructions.converter.conversion import reconstruct_file
+from sampletones_core.reconstructions.converter import conversion
+from sampletones_core.reconstructions.converter.conversion import (
+    reconstruct_file,
+    reconstruct_file_recorded,
+    reconstruct_file_shared,
+)
+from sampletones_core.reconstructions.converter.manifest import ConversionStatus
+from sampletones_core.reconstructions.reconstructor.profile import ReconstructionProfile
 from sampletones_core.reconstructions.reconstructor.reconstructor import Reconstructor
 from sampletones_shared.exceptions import UnsupportedAudioFormatError
 
 
 @pytest.fixture
 def mock_reconstructor() -> MagicMock:
-    return MagicMock(spec=Reconstructor)
+    reconstructor = MagicMock(spec=Reconstructor)
+    reconstructor.profile = ReconstructionProfile()
+    return reconstructor
 
 
 class TestReconstructFile:
@@ -73,3 +82,64 @@ class TestReconstructFile:
             reconstruct_file(
                 (mock_reconstructor, tmp_path / "song.wav", tmp_path / "song.stn"),
             )
+
+
+class TestReconstructFileRecorded:
+    def test_saved_reconstruction_is_completed(self, mock_reconstructor: MagicMock, tmp_path: Path) -> None:
+        outcome = reconstruct_file_recorded((mock_reconstructor, tmp_path / "song.wav", tmp_path / "song.stn"))
+
+        assert outcome.status == ConversionStatus.COMPLETED
+        assert outcome.error is None
+        assert outcome.seconds >= 0.0
+        assert outcome.profile is mock_reconstructor.profile
+
+    def test_unsupported_audio_format_is_reported(self, mock_reconstructor: MagicMock, tmp_path: Path) -> None:
+        mock_reconstructor.side_effect = UnsupportedAudioFormatError("bad format")
+
+        outcome = reconstruct_file_recorded((mock_reconstructor, tmp_path / "song.wav", tmp_path / "song.stn"))
+
+        assert outcome.status == ConversionStatus.UNSUPPORTED
+
+    def test_failure_is_reported_instead_of_raised(self, mock_reconstructor: MagicMock, tmp_path: Path) -> None:
+        mock_reconstructor.side_effect = ValueError("broken")
+
+        outcome = reconstruct_file_recorded((mock_reconstructor, tmp_path / "song.wav", tmp_path / "song.stn"))
+
+        assert outcome.status == ConversionStatus.FAILED
+        assert outcome.error == "ValueError: broken"
+        assert outcome.profile is None
+
+    def test_keyboard_interrupt_is_reraised(self, mock_reconstructor: MagicMock, tmp_path: Path) -> None:
+        mock_reconstructor.side_effect = KeyboardInterrupt
+        with pytest.raises(KeyboardInterrupt):
+            reconstruct_file_recorded((mock_reconstructor, tmp_path / "song.wav", tmp_path / "song.stn"))
+
+
+class TestReconstructFileShared:
+    def test_saves_each_reconstruction_to_its_output_path(
+        self,
+        mock_reconstructor: MagicMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        reconstructions = [MagicMock(), None, MagicMock()]
+        monkeypatch.setattr(conversion, "reconstruct_shared", MagicMock(return_value=reconstructions))
+        output_paths = tuple(tmp_path / directory / "song.stn" for directory in ("a", "b", "c"))
+
+        result = reconstruct_file_shared(((mock_reconstructor,) * 3, tmp_path / "song.wav", output_paths))
+
+        assert result == output_paths
+        assert all(output_path.parent.exists() for output_path in output_paths)
+        reconstructions[0].save.assert_called_once_with(output_paths[0])
+        reconstructions[2].save.assert_called_once_with(output_paths[2])
+
+    def test_unsupported_format_is_skipped(
+        self,
+        mock_reconstructor: MagicMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(conversion, "reconstruct_shared", MagicMock(side_effect=UnsupportedAudioFormatError("x")))
+        output_paths = (tmp_path / "song.stn",)
+
+        assert reconstruct_file_shared(((mock_reconstructor,), tmp_path / "song.wav", output_paths)) == output_paths
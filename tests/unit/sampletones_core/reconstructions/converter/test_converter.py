@@ -4,9 +4,17 @@ from unittest.mock import patch
 import pytest
 
 from sampletones_core.configs import Config
+from sampletones_core.configs.general import GeneralConfig
 from sampletones_core.reconstructions.converter import (
+    ConversionOutcome,
+    ConversionStatus,
     ReconstructionConverter,
     reconstruct_file,
+    reconstruct_file_recorded,
+)
+from sampletones_core.reconstructions.reconstructor.profile import (
+    ProfileCounter,
+    ReconstructionProfile,
 )
 from sampletones_shared.exceptions import NoFilesToProcessError
 
@@ -170,3 +178,102 @@ class TestReconstructionConverterNotifyProgress:
         assert converter.current_file == str(path_a)
         converter._notify_progress()
         assert converter.current_file == str(path_a)
+
+
+class TestReconstructionConverterManifest:
+    @pytest.fixture
+    def manifest_config(self, tmp_path: Path) -> Config:
+        return Config(general=GeneralConfig(reconstructions_directory=str(tmp_path / "reconstructions")))
+
+    @pytest.fixture
+    def input_directory(self, tmp_path: Path) -> Path:
+        directory = tmp_path / "pack"
+        directory.mkdir()
+        (directory / "a.wav").write_bytes(b"a")
+        (directory / "b.wav").write_bytes(b"b")
+        return directory
+
+    def _finish(self, converter: ReconstructionConverter, tasks: list, status: ConversionStatus) -> None:
+        for _, input_path, output_path in tasks:
+            if status == ConversionStatus.COMPLETED:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_path.touch()
+
+            converter._on_result(
+                ConversionOutcome(input_path=input_path, output_path=output_path, status=status, seconds=0.1)
+            )
+
+    def test_manifest_mode_uses_the_recording_task_function(
+        self,
+        manifest_config: Config,
+        input_directory: Path,
+    ) -> None:
+        converter = ReconstructionConverter(manifest_config, input_directory, is_file=False, manifest=True)
+        assert converter._get_task_function() is reconstruct_file_recorded
+
+    def test_resume_skips_files_already_reconstructed(self, manifest_config: Config, input_directory: Path) -> None:
+        first = ReconstructionConverter(manifest_config, input_directory, is_file=False, manifest=True)
+        with patch(_RECONSTRUCTOR_PATCH):
+            tasks = first._create_tasks()
+        self._finish(first, tasks[:1], ConversionStatus.COMPLETED)
+
+        resumed = ReconstructionConverter(manifest_config, input_directory, is_file=False, resume=True)
+        with patch(_RECONSTRUCTOR_PATCH):
+            pending = resumed._create_tasks()
+
+        assert [task[1] for task in pending] == [tasks[1][1]]
+        assert resumed.skipped_files == 1
+
+    def test_resume_retries_failed_files(self, manifest_config: Config, input_directory: Path) -> None:
+        first = ReconstructionConverter(manifest_config, input_directory, is_file=False, manifest=True)
+        with patch(_RECONSTRUCTOR_PATCH):
+            tasks = first._create_tasks()
+        self._finish(first, tasks, ConversionStatus.FAILED)
+
+        resumed = ReconstructionConverter(manifest_config, input_directory, is_file=False, resume=True)
+        with patch(_RECONSTRUCTOR_PATCH):
+            pending = resumed._create_tasks()
+
+        assert len(pending) == 2
+
+    def test_resume_with_nothing_left_does_not_raise(self, manifest_config: Config, input_directory: Path) -> None:
+        first = ReconstructionConverter(manifest_config, input_directory, is_file=False, manifest=True)
+        with patch(_RECONSTRUCTOR_PATCH):
+            tasks = first._create_tasks()
+        self._finish(first, tasks, ConversionStatus.COMPLETED)
+
+        resumed = ReconstructionConverter(manifest_config, input_directory, is_file=False, resume=True)
+        with patch(_RECONSTRUCTOR_PATCH):
+            assert resumed._create_tasks() == []
+
+    def test_resume_reconstructs_changed_files(self, manifest_config: Config, input_directory: Path) -> None:
+        first = ReconstructionConverter(manifest_config, input_directory, is_file=False, manifest=True)
+        with patch(_RECONSTRUCTOR_PATCH):
+            tasks = first._create_tasks()
+        self._finish(first, tasks, ConversionStatus.COMPLETED)
+        (input_directory / "a.wav").write_bytes(b"changed")
+
+        resumed = ReconstructionConverter(manifest_config, input_directory, is_file=False, resume=True)
+        with patch(_RECONSTRUCTOR_PATCH):
+            pending = resumed._create_tasks()
+
+        assert [task[1].name for task in pending] == ["a.wav"]
+
+    def test_profiles_are_collected_by_input_path(self, manifest_config: Config, input_directory: Path) -> None:
+        converter = ReconstructionConverter(manifest_config, input_directory, is_file=False, manifest=True)
+        with patch(_RECONSTRUCTOR_PATCH):
+            tasks = converter._create_tasks()
+
+        _, input_path, output_path = tasks[0]
+        profile = ReconstructionProfile(counters={ProfileCounter.FRAMES: 4})
+        converter._on_result(
+            ConversionOutcome(
+                input_path=input_path,
+                output_path=output_path,
+                status=ConversionStatus.COMPLETED,
+                seconds=0.1,
+                profile=profile,
+            )
+        )
+
+        assert converter.profiles == {input_path: profile}
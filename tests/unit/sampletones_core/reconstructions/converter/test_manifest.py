@@ -0,0 +1,132 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from sampletones_core.reconstructions.converter.manifest import (
+    MANIFEST_FILENAME,
+    ConversionOutcome,
+    ConversionStatus,
+    ReconstructionManifest,
+    hash_file,
+)
+
+CONFIG_HASH = "0" * 32
+
+
+def _outcome(input_path: Path, output_path: Path, status: ConversionStatus) -> ConversionOutcome:
+    return ConversionOutcome(input_path=input_path, output_path=output_path, status=status, seconds=1.5)
+
+
+@pytest.fixture
+def audio_file(tmp_path: Path) -> Path:
+    path = tmp_path / "input" / "kick.wav"
+    path.parent.mkdir()
+    path.write_bytes(b"RIFF kick")
+    return path
+
+
+@pytest.fixture
+def output_file(tmp_path: Path) -> Path:
+    path = tmp_path / "output" / "kick.stn"
+    path.parent.mkdir()
+    path.write_bytes(b"stn")
+    return path
+
+
+class TestReconstructionManifest:
+    def test_recorded_entries_survive_a_reload(self, tmp_path: Path, audio_file: Path, output_file: Path) -> None:
+        manifest = ReconstructionManifest.for_output(tmp_path / "output")
+        manifest.record(_outcome(audio_file, output_file, ConversionStatus.COMPLETED), "kick.wav", CONFIG_HASH)
+
+        reloaded = ReconstructionManifest.for_output(tmp_path / "output")
+        entry = reloaded.get("kick.wav")
+
+        assert entry is not None
+        assert entry.status == ConversionStatus.COMPLETED
+        assert entry.seconds == 1.5
+        assert entry.fingerprint.content_hash == hash_file(audio_file)
+
+    def test_last_entry_of_an_input_wins(self, tmp_path: Path, audio_file: Path, output_file: Path) -> None:
+        manifest = ReconstructionManifest.for_output(tmp_path / "output")
+        manifest.record(_outcome(audio_file, output_file, ConversionStatus.FAILED), "kick.wav", CONFIG_HASH)
+        manifest.record(_outcome(audio_file, output_file, ConversionStatus.COMPLETED), "kick.wav", CONFIG_HASH)
+
+        reloaded = ReconstructionManifest.for_output(tmp_path / "output")
+
+        assert len(reloaded) == 1
+        assert reloaded.failed() == []
+
+    def test_truncated_line_is_ignored(self, tmp_path: Path, audio_file: Path, output_file: Path) -> None:
+        manifest = ReconstructionManifest.for_output(tmp_path / "output")
+        manifest.record(_outcome(audio_file, output_file, ConversionStatus.COMPLETED), "kick.wav", CONFIG_HASH)
+        with (tmp_path / "output" / MANIFEST_FILENAME).open("a") as file:
+            file.write('{"input": "snare.wav", "finger')
+
+        reloaded = ReconstructionManifest.for_output(tmp_path / "output")
+
+        assert len(reloaded) == 1
+
+    def test_completed_file_is_current(self, tmp_path: Path, audio_file: Path, output_file: Path) -> None:
+        manifest = ReconstructionManifest.for_output(tmp_path / "output")
+        manifest.record(_outcome(audio_file, output_file, ConversionStatus.COMPLETED), "kick.wav", CONFIG_HASH)
+
+        reloaded = ReconstructionManifest.for_output(tmp_path / "output")
+
+        assert reloaded.is_current(audio_file, "kick.wav", output_file, CONFIG_HASH)
+
+    def test_failed_file_is_not_current(self, tmp_path: Path, audio_file: Path, output_file: Path) -> None:
+        manifest = ReconstructionManifest.for_output(tmp_path / "output")
+        manifest.record(_outcome(audio_file, output_file, ConversionStatus.FAILED), "kick.wav", CONFIG_HASH)
+
+        assert not manifest.is_current(audio_file, "kick.wav", output_file, CONFIG_HASH)
+
+    def test_other_configuration_is_not_current(self, tmp_path: Path, audio_file: Path, output_file: Path) -> None:
+        manifest = ReconstructionManifest.for_output(tmp_path / "output")
+        manifest.record(_outcome(audio_file, output_file, ConversionStatus.COMPLETED), "kick.wav", CONFIG_HASH)
+
+        assert not manifest.is_current(audio_file, "kick.wav", output_file, "1" * 32)
+
+    def test_missing_output_is_not_current(self, tmp_path: Path, audio_file: Path, output_file: Path) -> None:
+        manifest = ReconstructionManifest.for_output(tmp_path / "output")
+        manifest.record(_outcome(audio_file, output_file, ConversionStatus.COMPLETED), "kick.wav", CONFIG_HASH)
+        output_file.unlink()
+
+        assert not manifest.is_current(audio_file, "kick.wav", output_file, CONFIG_HASH)
+
+    def test_changed_contents_are_not_current(self, tmp_path: Path, audio_file: Path, output_file: Path) -> None:
+        manifest = ReconstructionManifest.for_output(tmp_path / "output")
+        manifest.record(_outcome(audio_file, output_file, ConversionStatus.COMPLETED), "kick.wav", CONFIG_HASH)
+        audio_file.write_bytes(b"RIFF snare")
+
+        reloaded = ReconstructionManifest.for_output(tmp_path / "output")
+
+        assert not reloaded.is_current(audio_file, "kick.wav", output_file, CONFIG_HASH)
+
+    def test_touched_but_unchanged_file_is_current(self, tmp_path: Path, audio_file: Path, output_file: Path) -> None:
+        manifest = ReconstructionManifest.for_output(tmp_path / "output")
+        manifest.record(_outcome(audio_file, output_file, ConversionStatus.COMPLETED), "kick.wav", CONFIG_HASH)
+        stat = audio_file.stat()
+        os.utime(audio_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        reloaded = ReconstructionManifest.for_output(tmp_path / "output")
+
+        assert reloaded.is_current(audio_file, "kick.wav", output_file, CONFIG_HASH)
+
+    def test_unchanged_file_is_not_read_again(
+        self,
+        tmp_path: Path,
+        audio_file: Path,
+        output_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        manifest = ReconstructionManifest.for_output(tmp_path / "output")
+        manifest.record(_outcome(audio_file, output_file, ConversionStatus.COMPLETED), "kick.wav", CONFIG_HASH)
+        reloaded = ReconstructionManifest.for_output(tmp_path / "output")
+
+        def fail(path: Path) -> str:
+            raise AssertionError(f"{path} was hashed")
+
+        monkeypatch.setattr("sampletones_core.reconstructions.converter.manifest.hash_file", fail)
+
+        assert reloaded.is_current(audio_file, "kick.wav", output_file, CONFIG_HASH)
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Callable, Final, List
 from unittest.mock import patch
 
+import msgpack
 import numpy as np
 import pytest
 
@@ -10,9 +11,15 @@ from sampletones_core.configs import Config
 from sampletones_core.constants.enums import FeatureKey, GeneratorName
 from sampletones_core.data import Metadata
 from sampletones_core.features import resting_reference
-from sampletones_core.instructions import PulseInstruction
+from sampletones_core.instructions import (
+    InstructionArray,
+    InstructionData,
+    NoiseInstruction,
+    PulseInstruction,
+)
 from sampletones_core.reconstructions import Reconstruction
 from sampletones_core.reconstructions.reconstruction.instructions import InstructionsItem
+from sampletones_core.reconstructions.reconstruction.reconstruction import REMIX_REBUILD_INTERVAL
 from sampletones_shared.application import (
     SAMPLETONES_RECONSTRUCTION_DATA_VERSION,
 )
@@ -39,6 +46,11 @@ _BASE_PITCH: Final[int] = 60
 _OCTAVE: Final[int] = 12
 _CONTOUR_MIDPOINT: Final[int] = 66
 _RESET_PITCH: Final[int] = 48
+_SHORT_LENGTH: Final[int] = _AUDIO_LENGTH // 2
+_LONG_LENGTH: Final[int] = _AUDIO_LENGTH * 2
+_PER_FRAME_LAYOUT_VERSION: Final[str] = "2.1"
+_DRIFT_EDITS: Final[int] = 16 * REMIX_REBUILD_INTERVAL
+_DRIFT_TOLERANCE: Final[float] = 1e-6
 
 
 def _pulse(pitch: int) -> PulseInstruction:
@@ -101,6 +113,40 @@ class TestRoundTrip:
 
         assert loaded.audio_filepath is None
 
+    def test_shortlist_sizes_round_trip(self, tmp_path: Path) -> None:
+        reconstruction = _reconstruction([_pulse(_BASE_PITCH)])
+        reconstruction.shortlist_sizes = [0, 3, 5]
+        path = tmp_path / "shortlist.stn"
+
+        reconstruction.save(path)
+        loaded = Reconstruction.load(path)
+
+        assert loaded.shortlist_sizes == [0, 3, 5]
+
+    def test_a_file_without_shortlist_sizes_reads_them_as_empty(self) -> None:
+        reconstruction = _reconstruction([_pulse(_BASE_PITCH)])
+        raw = reconstruction.serialize_inner()
+        del raw["shortlist_sizes"]
+
+        loaded = Reconstruction.deserialize_inner(raw)
+
+        assert loaded.shortlist_sizes == []
+
+    def test_skipped_work_round_trips_and_defaults_to_zero(self, tmp_path: Path) -> None:
+        reconstruction = _reconstruction([_pulse(_BASE_PITCH)])
+        reconstruction.silent_frames = 2
+        reconstruction.skipped_searches = 7
+        path = tmp_path / "skipped.stn"
+
+        reconstruction.save(path)
+        loaded = Reconstruction.load(path)
+        raw = reconstruction.serialize_inner()
+        del raw["silent_frames"], raw["skipped_searches"]
+        older = Reconstruction.deserialize_inner(raw)
+
+        assert (loaded.silent_frames, loaded.skipped_searches) == (2, 7)
+        assert (older.silent_frames, older.skipped_searches) == (0, 0)
+
 
 class TestDetachSource:
     def test_detach_clears_the_source_location(
@@ -284,6 +330,15 @@ class TestInitialPitchReference:
 
         assert reconstruction.initial_pitches[GeneratorName.PULSE1] == _RESET_PITCH
 
+    def test_update_generator_data_resizes_the_held_bytes(self) -> None:
+        reconstruction = _reconstruction([_pulse(_BASE_PITCH)])
+        before = reconstruction.nbytes
+        longer = np.ones(2 * _AUDIO_LENGTH, dtype=np.float32)
+
+        reconstruction.update_generator_data(GeneratorName.PULSE1, [_pulse(_BASE_PITCH)] * 2, longer, _BASE_PITCH, ())
+
+        assert reconstruction.nbytes > before
+
     def test_reference_survives_a_save_load_round_trip(self, tmp_path: Path) -> None:
         reconstruction = _reconstruction([_pulse(_BASE_PITCH), _pulse(_BASE_PITCH + _OCTAVE)])
         path = tmp_path / "anchored.stn"
@@ -511,6 +566,111 @@ class TestChannelSet:
         assert [item.generator_name for item in loaded.instructions_data] == list(GeneratorName.items())
 
 
+def _mixed_reconstruction() -> Reconstruction:
+    """Two channels in play, a rising pulse and a flat triangle, sharing one length."""
+    approximations = {
+        GeneratorName.PULSE1: np.linspace(0.0, 1.0, _AUDIO_LENGTH, dtype=np.float32),
+        GeneratorName.TRIANGLE: np.full(_AUDIO_LENGTH, 0.25, dtype=np.float32),
+    }
+    return Reconstruction.create(
+        approximation=approximations[GeneratorName.PULSE1] + approximations[GeneratorName.TRIANGLE],
+        approximations=approximations,
+        instructions={GeneratorName.PULSE1: [_pulse(_BASE_PITCH)]},
+        config=Config(),
+        coefficient=1.0,
+        audio_filepath=Path("/dev/null"),
+    )
+
+
+def _edit(reconstruction: Reconstruction, length: int) -> Reconstruction:
+    return reconstruction.with_generator_data(
+        GeneratorName.PULSE1,
+        [_pulse(_RESET_PITCH)],
+        np.full(length, 0.5, dtype=np.float32),
+        _RESET_PITCH,
+        (),
+    )
+
+
+class TestWithGeneratorData:
+    """An edit copies on write: the edited channel is new, every other channel is shared."""
+
+    def test_untouched_channels_share_their_items(self) -> None:
+        reconstruction = _mixed_reconstruction()
+
+        edited = _edit(reconstruction, _AUDIO_LENGTH)
+
+        assert edited.approximations_data[1] is reconstruction.approximations_data[1]
+        assert edited.streams[GeneratorName.TRIANGLE] is reconstruction.streams[GeneratorName.TRIANGLE]
+        assert edited.streams[GeneratorName.PULSE1] is not reconstruction.streams[GeneratorName.PULSE1]
+
+    def test_leaves_the_source_intact(self) -> None:
+        reconstruction = _mixed_reconstruction()
+        approximation = reconstruction.approximation.copy()
+
+        edited = _edit(reconstruction, _AUDIO_LENGTH)
+
+        assert edited is not reconstruction
+        assert_array_equal(reconstruction.approximation, approximation)
+        assert reconstruction.initial_pitches[GeneratorName.PULSE1] == _BASE_PITCH
+        assert edited.initial_pitches[GeneratorName.PULSE1] == _RESET_PITCH
+
+    @pytest.mark.parametrize("length", [_SHORT_LENGTH, _AUDIO_LENGTH, _LONG_LENGTH])
+    def test_the_mix_matches_the_sum_of_the_channels(self, length: int) -> None:
+        edited = _edit(_mixed_reconstruction(), length)
+
+        expected = np.sum(np.array(list(edited.approximations.values())), axis=0).astype(np.float32)
+        assert_array_equal(edited.approximation, expected)
+
+    @pytest.mark.parametrize("length", [_SHORT_LENGTH, _AUDIO_LENGTH, _LONG_LENGTH])
+    def test_matches_the_in_place_update(self, length: int) -> None:
+        reconstruction = _mixed_reconstruction()
+        edited = _edit(reconstruction, length)
+
+        reconstruction.update_generator_data(
+            GeneratorName.PULSE1,
+            [_pulse(_RESET_PITCH)],
+            np.full(length, 0.5, dtype=np.float32),
+            _RESET_PITCH,
+            (),
+        )
+
+        assert_array_equal(edited.approximation, reconstruction.approximation)
+        assert edited.instructions == reconstruction.instructions
+        assert {name: len(audio) for name, audio in edited.approximations.items()} == {
+            name: len(audio) for name, audio in reconstruction.approximations.items()
+        }
+
+    def test_many_edits_leave_the_mix_a_fresh_mix_gives(self) -> None:
+        generator = np.random.default_rng(0)
+        reconstruction = _mixed_reconstruction()
+        for edit in range(_DRIFT_EDITS):
+            audio = generator.uniform(-1.0, 1.0, _AUDIO_LENGTH).astype(np.float32)
+            if edit % 2:
+                reconstruction.update_generator_data(GeneratorName.TRIANGLE, [], audio, _BASE_PITCH, ())
+            else:
+                reconstruction = reconstruction.with_generator_data(
+                    GeneratorName.PULSE1, [_pulse(_BASE_PITCH)], audio, _BASE_PITCH, ()
+                )
+
+            fresh = np.sum(np.array(list(reconstruction.approximations.values())), axis=0).astype(np.float32)
+            np.testing.assert_allclose(reconstruction.approximation, fresh, rtol=0.0, atol=_DRIFT_TOLERANCE)
+
+        assert_array_equal(reconstruction.approximation, fresh)
+
+    def test_a_longer_channel_extends_every_channel(self) -> None:
+        edited = _edit(_mixed_reconstruction(), _LONG_LENGTH)
+
+        assert len(edited.approximation) == _LONG_LENGTH
+        assert len(edited.approximations[GeneratorName.TRIANGLE]) == _LONG_LENGTH
+
+    def test_a_shorter_channel_keeps_the_longest_other_channel(self) -> None:
+        edited = _edit(_mixed_reconstruction(), _SHORT_LENGTH)
+
+        assert len(edited.approximation) == _AUDIO_LENGTH
+        assert len(edited.approximations[GeneratorName.PULSE1]) == _AUDIO_LENGTH
+
+
 class TestWithNesFrequency:
     def test_rebuilds_config(self, reconstruction_factory: ReconstructionFactory) -> None:
         reconstruction = reconstruction_factory()
@@ -586,3 +746,51 @@ class TestWithNesFrequency:
         retuned = reconstruction.with_nes_frequency(reconstruction.config.nes_frequency)
 
         assert retuned is reconstruction
+
+
+def _saved_in_the_per_frame_layout(reconstruction: Reconstruction, path: Path) -> Path:
+    """Writes a reconstruction the way a file saved before the columnar layout holds one.
+
+    Such a file stores every frame of a stream as its own tagged instruction, at the data
+    version preceding the columnar layout.
+    """
+    data = msgpack.unpackb(reconstruction.serialize(), raw=False)
+    data["metadata"]["reconstruction_data_version"] = _PER_FRAME_LAYOUT_VERSION
+    for item in data["instructions_data"]:
+        stream = reconstruction.instructions[GeneratorName(item["generator_name"])]
+        item["instructions"] = [InstructionData.create(instruction).serialize_inner() for instruction in stream]
+
+    path.write_bytes(msgpack.packb(data, use_bin_type=True))
+    return path
+
+
+class TestColumnarStreams:
+    def test_each_stream_is_held_as_an_instruction_array(self) -> None:
+        reconstruction = _reconstruction([_pulse(_BASE_PITCH), _pulse(_BASE_PITCH + _OCTAVE)])
+        stream = reconstruction.streams[GeneratorName.PULSE1].instructions
+
+        assert isinstance(stream, InstructionArray)
+        assert stream.to_instructions() == reconstruction.instructions[GeneratorName.PULSE1]
+
+    def test_a_channel_standing_by_holds_an_empty_stream_of_its_type(self) -> None:
+        stream = _reconstruction([_pulse(_BASE_PITCH)]).streams[GeneratorName.NOISE].instructions
+
+        assert len(stream) == 0
+        assert stream.instruction_type is NoiseInstruction
+
+    def test_a_file_in_the_per_frame_layout_reads_back(self, tmp_path: Path) -> None:
+        reconstruction = _reconstruction([_pulse(_BASE_PITCH), _pulse(_BASE_PITCH + _OCTAVE)])
+
+        loaded = Reconstruction.load(_saved_in_the_per_frame_layout(reconstruction, tmp_path / "per_frame.stn"))
+
+        assert loaded.instructions == reconstruction.instructions
+        assert loaded.streams == reconstruction.streams
+
+    def test_a_file_in_the_per_frame_layout_saves_in_the_columnar_one(self, tmp_path: Path) -> None:
+        reconstruction = _reconstruction([_pulse(_BASE_PITCH)])
+        loaded = Reconstruction.load(_saved_in_the_per_frame_layout(reconstruction, tmp_path / "per_frame.stn"))
+
+        path = tmp_path / "columnar.stn"
+        loaded.model_copy(update={"metadata": Metadata()}).save(path)
+
+        assert Reconstruction.load(path).instructions == reconstruction.instructions
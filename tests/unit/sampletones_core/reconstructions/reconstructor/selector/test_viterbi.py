@@ -2,13 +2,15 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
+import numpy as np
+
 from sampletones_core.configs import Config
 from sampletones_core.constants.enums import GeneratorName
 from sampletones_core.fft import Window
 from sampletones_core.generators import GeneratorUnion
 from sampletones_core.instructions import PulseInstruction
-from sampletones_core.reconstructions.reconstructor.selector.base import ScoredCandidate
 from sampletones_core.reconstructions.reconstructor.selector.viterbi import (
+    LatticeState,
     ViterbiSelector,
 )
 from sampletones_core.reconstructions.reconstructor.worker import ReconstructorWorker
@@ -34,11 +36,11 @@ def _selector(
     )
 
 
-def _state(instruction: PulseInstruction, cost: float) -> ScoredCandidate:
-    return ScoredCandidate(instruction=instruction, cost=cost, approximation=None)  # type: ignore[arg-type]
+def _state(instruction: PulseInstruction, cost: float) -> LatticeState:
+    return LatticeState(instruction=instruction, cost=cost)
 
 
-def _per_frame_best(frames: List[List[ScoredCandidate]]) -> List[PulseInstruction]:
+def _per_frame_best(frames: List[List[LatticeState]]) -> List[PulseInstruction]:
     return [min(frame, key=lambda state: state.cost).instruction for frame in frames]
 
 
@@ -46,7 +48,7 @@ STEADY = PulseInstruction(on=True, pitch=60, volume=10, duty_cycle=0)
 JUMPED = PulseInstruction(on=True, pitch=72, volume=10, duty_cycle=0)
 
 
-def _flickering_frames() -> List[List[ScoredCandidate]]:
+def _flickering_frames() -> List[List[LatticeState]]:
     return [
         [_state(STEADY, 0.00), _state(JUMPED, 0.05)],
         [_state(STEADY, 0.05), _state(JUMPED, 0.00)],
@@ -143,3 +145,43 @@ class TestViterbiSelectIntegration:
         for fragment_id in fragment_ids:
             for generator_name in first[fragment_id]:
                 assert first[fragment_id][generator_name].instruction == second[fragment_id][generator_name].instruction
+
+
+class TestViterbiLatticeStates:
+    def test_states_render_back_to_their_scored_approximations(
+        self,
+        config: Config,
+        window: Window,
+        generators: Dict[GeneratorName, GeneratorUnion],
+        worker: ReconstructorWorker,
+        fragmented_audio: Any,
+    ) -> None:
+        selector = _selector(config, window, generators, worker)
+        fragment = fragmented_audio[fragmented_audio.fragments_ids[0]]
+        generator_name, generator = next(iter(generators.items()))
+
+        candidates = selector._channel_candidates(fragment, generator)
+        states = selector._frame_candidates(fragment)[generator_name]
+
+        assert [state.instruction for state in states] == [candidate.instruction for candidate in candidates]
+        for state, candidate in zip(states, candidates):
+            rendered = selector._render_state(fragment, state, generator)
+            np.testing.assert_array_equal(rendered.audio, candidate.approximation.audio)
+
+    def test_a_silent_state_renders_as_silence(
+        self,
+        config: Config,
+        window: Window,
+        generators: Dict[GeneratorName, GeneratorUnion],
+        worker: ReconstructorWorker,
+        fragmented_audio: Any,
+    ) -> None:
+        selector = _selector(config, window, generators, worker)
+        fragment = fragmented_audio[fragmented_audio.fragments_ids[0]]
+        generator = next(iter(generators.values()))
+
+        state = selector._silent_state(generator)
+        rendered = selector._render_state(fragment, state, generator)
+
+        assert not state.instruction.on
+        assert not np.any(rendered.audio)
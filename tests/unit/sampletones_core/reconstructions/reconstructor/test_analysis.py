@@ -0,0 +1,118 @@
+from pathlib import Path
+from typing import Any, Final, List, Tuple
+
+import numpy as np
+import pytest
+
+from sampletones_core.audio import load_audio, write_wave
+from sampletones_core.configs import Config
+from sampletones_core.fft import Window
+from sampletones_core.reconstructions.reconstructor import analysis as analysis_module
+from sampletones_core.reconstructions.reconstructor.analysis import SharedAnalysis
+
+FILE_SAMPLE_RATE: Final[int] = 48000
+COEFFICIENT: Final[float] = 0.25
+
+
+def _configure(config: Config, **library: Any) -> Config:
+    return config.model_copy(update={"library": config.library.model_copy(update=library)})
+
+
+def _with_drive(config: Config, drive: float) -> Config:
+    return config.model_copy(update={"generation": config.generation.model_copy(update={"drive": drive})})
+
+
+@pytest.fixture
+def audio_path(tmp_path: Path) -> Path:
+    path = tmp_path / "input.wav"
+    time = np.arange(FILE_SAMPLE_RATE // 4) / FILE_SAMPLE_RATE
+    write_wave(path, FILE_SAMPLE_RATE, (0.5 * np.sin(2.0 * np.pi * 220.0 * time)).astype(np.float32))
+    return path
+
+
+@pytest.fixture
+def decodes(monkeypatch: pytest.MonkeyPatch) -> List[Path]:
+    calls: List[Path] = []
+    decode_audio = analysis_module.decode_audio
+
+    def counting(path: Path, *, normalize: bool = True) -> Tuple[np.ndarray, int]:
+        calls.append(path)
+        return decode_audio(path, normalize=normalize)
+
+    monkeypatch.setattr(analysis_module, "decode_audio", counting)
+    return calls
+
+
+class TestSharedAnalysisPreparedAudio:
+    @pytest.mark.parametrize("sample_rate", [44100, 22050])
+    def test_matches_load_audio(self, config: Config, audio_path: Path, sample_rate: int) -> None:
+        target = _configure(config, sample_rate=sample_rate)
+
+        prepared = SharedAnalysis(audio_path).prepared_audio(target)
+
+        expected = load_audio(
+            audio_path,
+            target_sample_rate=sample_rate,
+            normalize=target.general.normalize,
+            quantize=target.general.quantize,
+            quantization_levels=target.general.quantization_levels,
+        )
+        np.testing.assert_array_equal(prepared, expected)
+
+    def test_the_file_is_decoded_once_across_sample_rates(
+        self,
+        config: Config,
+        audio_path: Path,
+        decodes: List[Path],
+    ) -> None:
+        analysis = SharedAnalysis(audio_path)
+
+        analysis.prepared_audio(config)
+        analysis.prepared_audio(_configure(config, sample_rate=22050))
+        analysis.prepared_audio(_configure(config, nes_frequency=50))
+
+        assert decodes == [audio_path]
+
+    def test_shared_audio_is_read_only(self, config: Config, audio_path: Path) -> None:
+        prepared = SharedAnalysis(audio_path).prepared_audio(config)
+
+        with pytest.raises(ValueError):
+            prepared[0] = 0.0
+
+
+class TestSharedAnalysisFragments:
+    def test_configurations_matching_differently_share_the_fragments(self, config: Config, audio_path: Path) -> None:
+        analysis = SharedAnalysis(audio_path)
+        other = _with_drive(config, 0.5)
+        audio = analysis.prepared_audio(config)
+
+        first = analysis.fragmented_audio(audio, COEFFICIENT, config, Window.from_config(config))
+        second = analysis.fragmented_audio(
+            analysis.prepared_audio(other), COEFFICIENT, other, Window.from_config(other)
+        )
+
+        assert second is first
+
+    def test_another_nes_frequency_frames_the_audio_again(self, config: Config, audio_path: Path) -> None:
+        analysis = SharedAnalysis(audio_path)
+        other = _configure(config, nes_frequency=50)
+        audio = analysis.prepared_audio(config)
+
+        first = analysis.fragmented_audio(audio, COEFFICIENT, config, Window.from_config(config))
+        second = analysis.fragmented_audio(
+            analysis.prepared_audio(other), COEFFICIENT, other, Window.from_config(other)
+        )
+
+        assert analysis.prepared_audio(other) is audio
+        assert second is not first
+        assert second.fragments[0].audio.shape[0] == other.library.frame_length
+
+    def test_another_working_level_frames_the_audio_again(self, config: Config, audio_path: Path) -> None:
+        analysis = SharedAnalysis(audio_path)
+        audio = analysis.prepared_audio(config)
+        window = Window.from_config(config)
+
+        first = analysis.fragmented_audio(audio, COEFFICIENT, config, window)
+        second = analysis.fragmented_audio(audio, 2.0 * COEFFICIENT, config, window)
+
+        assert second is not first
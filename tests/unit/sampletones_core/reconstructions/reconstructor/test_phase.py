@@ -67,3 +67,40 @@ class TestPhaseAlignerDrive:
         aligned = aligner.align(target, audible_instruction)
 
         assert _rmse(target, aligned) == pytest.approx(0.0, abs=1e-4)
+
+
+class TestPhaseAlignerShift:
+    @pytest.mark.parametrize("aligner_class", [SlidingRmsePhaseAligner, CrossCorrelationPhaseAligner])
+    def test_rendering_at_the_found_shift_reproduces_the_alignment(
+        self,
+        aligner_class: Type[PhaseAligner],
+        config: Config,
+        window: Window,
+        library_data: InstructionLibraryData,
+        audible_instruction: InstructionUnion,
+    ) -> None:
+        aligner = aligner_class(config, window, library_data)
+        library_fragment = library_data[audible_instruction]
+        target = library_fragment.get_fragment(library_fragment.length // 3, config, window)
+
+        shift = aligner.shift(target, audible_instruction)
+
+        np.testing.assert_array_equal(
+            aligner.at_shift(audible_instruction, shift).audio,
+            aligner.align(target, audible_instruction).audio,
+        )
+
+
+class TestSlidingCorrelation:
+    @pytest.mark.parametrize("frame_length", [368, 735, 1024])
+    def test_matches_scipy_fftconvolve_exactly(self, frame_length: int) -> None:
+        from scipy.signal import fftconvolve
+
+        generator = np.random.default_rng(frame_length)
+        array = generator.standard_normal(2 * frame_length + 17)
+        target = generator.standard_normal(frame_length)
+
+        np.testing.assert_array_equal(
+            CrossCorrelationPhaseAligner._sliding_correlation(array, target),
+            fftconvolve(array, target[::-1], mode="valid"),
+        )
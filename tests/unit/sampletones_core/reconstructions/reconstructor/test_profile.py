@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+
+from sampletones_core.reconstructions.reconstructor.profile import (
+    PROFILE_TOTAL_LABEL,
+    ProfileCounter,
+    ProfileStage,
+    ReconstructionProfile,
+    format_profiles,
+)
+
+
+class TestReconstructionProfile:
+    def test_stage_accumulates_across_entries(self) -> None:
+        profile = ReconstructionProfile()
+        with profile.stage(ProfileStage.SCORING):
+            pass
+        first = profile.stages[ProfileStage.SCORING]
+        with profile.stage(ProfileStage.SCORING):
+            pass
+
+        assert profile.stages[ProfileStage.SCORING] >= first >= 0.0
+
+    def test_stage_is_recorded_when_the_block_raises(self) -> None:
+        profile = ReconstructionProfile()
+        with pytest.raises(RuntimeError):
+            with profile.stage(ProfileStage.DECODING):
+                raise RuntimeError("boom")
+
+        assert ProfileStage.DECODING in profile.stages
+
+    def test_count_adds_amounts(self) -> None:
+        profile = ReconstructionProfile()
+        profile.count(ProfileCounter.FRAMES, 3)
+        profile.count(ProfileCounter.FRAMES)
+        assert profile.counters[ProfileCounter.FRAMES] == 4
+
+    def test_other_is_the_time_no_stage_claims(self) -> None:
+        profile = ReconstructionProfile(stages={ProfileStage.SCORING: 1.5}, elapsed=2.0)
+        assert profile.other == pytest.approx(0.5)
+
+    def test_aggregate_sums_stages_counters_and_elapsed(self) -> None:
+        first = ReconstructionProfile(
+            stages={ProfileStage.SCORING: 1.0},
+            counters={ProfileCounter.FRAMES: 2},
+            elapsed=1.5,
+        )
+        second = ReconstructionProfile(
+            stages={ProfileStage.SCORING: 2.0, ProfileStage.DECODING: 0.5},
+            counters={ProfileCounter.FRAMES: 3, ProfileCounter.ALIGNMENTS: 4},
+            elapsed=3.0,
+        )
+
+        total = ReconstructionProfile.aggregate([first, second])
+
+        assert total.stages == {ProfileStage.SCORING: 3.0, ProfileStage.DECODING: 0.5}
+        assert total.counters == {ProfileCounter.FRAMES: 5, ProfileCounter.ALIGNMENTS: 4}
+        assert total.elapsed == pytest.approx(4.5)
+
+    def test_shortlist_sizes_merge_and_read_as_a_histogram(self) -> None:
+        first = ReconstructionProfile()
+        first.count_shortlist(2)
+        first.count_shortlist(2)
+        second = ReconstructionProfile()
+        second.count_shortlist(4)
+
+        total = ReconstructionProfile.aggregate([first, second])
+
+        assert total.shortlist_sizes == {2: 2, 4: 1}
+        assert total.shortlist_histogram == [0, 0, 2, 0, 1]
+        assert ReconstructionProfile().shortlist_histogram == []
+
+
+class TestFormatProfiles:
+    def test_single_file_has_no_aggregate_row(self) -> None:
+        table = format_profiles({"a.wav": ReconstructionProfile()})
+        lines = table.splitlines()
+        assert len(lines) == 3
+        assert lines[2].startswith("a.wav")
+
+    def test_several_files_end_with_the_aggregate_row(self) -> None:
+        profiles = {
+            "a.wav": ReconstructionProfile(counters={ProfileCounter.FRAMES: 2}),
+            "b.wav": ReconstructionProfile(counters={ProfileCounter.FRAMES: 5}),
+        }
+        lines = format_profiles(profiles).splitlines()
+
+        assert lines[-1].startswith(PROFILE_TOTAL_LABEL)
+        frames_column = lines[0].split().index(ProfileCounter.FRAMES.value)
+        assert lines[-1].split()[frames_column] == "7"
+
+    def test_header_names_every_stage_and_counter(self) -> None:
+        header = format_profiles({"a.wav": ReconstructionProfile()}).splitlines()[0].split()
+        assert all(stage.value in header for stage in ProfileStage)
+        assert all(counter.value in header for counter in ProfileCounter)
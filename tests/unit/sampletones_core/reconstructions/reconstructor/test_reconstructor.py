@@ -13,6 +13,10 @@ from sampletones_core.library import InstructionLibraryData
 from sampletones_core.reconstructions.reconstructor.approximation import (
     ApproximationData,
 )
+from sampletones_core.reconstructions.reconstructor.profile import (
+    ProfileCounter,
+    ProfileStage,
+)
 from sampletones_core.reconstructions.reconstructor.reconstructor import Reconstructor
 from sampletones_core.reconstructions.reconstructor.state import ReconstructionState
 from sampletones_shared.exceptions import NoLibraryDataError
@@ -194,7 +198,7 @@ class TestReconstructorUpdateState:
             synthetic_fragment,
             final_regeneration=False,
         )
-        reconstructor.update_state(approximation_data)
+        reconstructor.update_state([approximation_data])
         expected = np.asarray(synthetic_fragment.audio) * reconstructor.config.generation.drive
         np.testing.assert_array_almost_equal(
             reconstructor.state.approximations[generator_name][0],
@@ -213,7 +217,7 @@ class TestReconstructorUpdateState:
             synthetic_fragment,
             final_regeneration=False,
         )
-        reconstructor.update_state(approximation_data)
+        reconstructor.update_state([approximation_data])
         assert reconstructor.generators[generator_name].previous_instruction is None
 
     def test_with_final_regeneration_reruns_generator(
@@ -228,7 +232,7 @@ class TestReconstructorUpdateState:
             synthetic_fragment,
             final_regeneration=True,
         )
-        reconstructor.update_state(approximation_data)
+        reconstructor.update_state([approximation_data])
         assert reconstructor.generators[generator_name].previous_instruction is approximation_data.instruction
 
 
@@ -289,3 +293,142 @@ class TestReconstructorCall:
         reconstructor = _make_reconstructor(config, library_data)
         result = reconstructor(audio_path)
         assert isinstance(result, Reconstruction)
+
+    def test_profile_records_stages_and_counters(
+        self,
+        config: Config,
+        library_data: InstructionLibraryData,
+        synthetic_fragment: Fragment,
+        tmp_path: Path,
+    ) -> None:
+        from sampletones_core.audio import write_wave
+
+        audio_path = tmp_path / "test.wav"
+        audio = np.tile(synthetic_fragment.audio, 3).astype(np.float32)
+        write_wave(audio_path, config.library.sample_rate, audio)
+        reconstructor = _make_reconstructor(config, library_data)
+        reconstructor(audio_path)
+
+        profile = reconstructor.profile
+        assert {ProfileStage.LOAD_AUDIO, ProfileStage.FEATURES, ProfileStage.SCORING} <= set(profile.stages)
+        assert profile.counters[ProfileCounter.FRAMES] >= 1
+        assert profile.counters[ProfileCounter.CANDIDATES_SCORED] >= profile.counters[ProfileCounter.FRAMES]
+        assert profile.counters[ProfileCounter.BYTES_ALLOCATED] > 0
+        assert profile.elapsed >= sum(profile.stages.values())
+
+    def test_reconstruction_records_the_shortlist_sizes(
+        self,
+        config: Config,
+        library_data: InstructionLibraryData,
+        synthetic_fragment: Fragment,
+        tmp_path: Path,
+    ) -> None:
+        from sampletones_core.audio import write_wave
+
+        audio_path = tmp_path / "test.wav"
+        audio = np.tile(synthetic_fragment.audio, 3).astype(np.float32)
+        write_wave(audio_path, config.library.sample_rate, audio)
+        reconstructor = _make_reconstructor(config, library_data)
+        reconstruction = reconstructor(audio_path)
+
+        assert reconstruction is not None
+        assert reconstruction.shortlist_sizes == reconstructor.profile.shortlist_histogram
+        assert sum(reconstruction.shortlist_sizes) >= reconstructor.profile.counters[ProfileCounter.FRAMES]
+
+    def test_reconstruction_records_the_silence_skipped(
+        self,
+        config: Config,
+        library_data: InstructionLibraryData,
+        synthetic_fragment: Fragment,
+        tmp_path: Path,
+    ) -> None:
+        from sampletones_core.audio import write_wave
+
+        audio_path = tmp_path / "test.wav"
+        silence = np.zeros_like(synthetic_fragment.audio)
+        audio = np.concatenate([synthetic_fragment.audio, silence, silence]).astype(np.float32)
+        write_wave(audio_path, config.library.sample_rate, audio)
+        reconstructor = _make_reconstructor(config, library_data)
+        reconstruction = reconstructor(audio_path)
+
+        assert reconstruction is not None
+        counters = reconstructor.profile.counters
+        assert reconstruction.silent_frames == counters[ProfileCounter.SILENT_FRAMES] > 0
+        assert reconstruction.skipped_searches == counters[ProfileCounter.SKIPPED_SEARCHES]
+
+    def test_cached_audio_is_not_reconstructed_again(
+        self,
+        config: Config,
+        library_data: InstructionLibraryData,
+        synthetic_fragment: Fragment,
+        tmp_path: Path,
+    ) -> None:
+        from sampletones_core.audio import write_wave
+        from sampletones_core.reconstructions.cache import ReconstructionCache
+
+        audio = np.tile(synthetic_fragment.audio, 3).astype(np.float32)
+        first_path = tmp_path / "first.wav"
+        second_path = tmp_path / "second.wav"
+        write_wave(first_path, config.library.sample_rate, audio)
+        write_wave(second_path, config.library.sample_rate, audio)
+        reconstructor = _make_reconstructor(config, library_data)
+        reconstructor.cache = ReconstructionCache(directory=tmp_path / "cache")
+
+        first = reconstructor(first_path)
+        reconstructor.reconstruct = MagicMock()  # type: ignore[method-assign]
+        second = reconstructor(second_path)
+
+        reconstructor.reconstruct.assert_not_called()
+        assert reconstructor.profile.counters == {ProfileCounter.CACHE_HITS: 1}
+        assert first is not None and second is not None
+        assert second.audio_filepath == second_path
+        assert second.id != first.id
+        np.testing.assert_array_equal(second.approximation, first.approximation)
+
+
+class TestReconstructShared:
+    def test_matches_reconstructing_under_each_configuration(
+        self,
+        config: Config,
+        library_data: InstructionLibraryData,
+        synthetic_fragment: Fragment,
+        tmp_path: Path,
+    ) -> None:
+        from sampletones_core.audio import write_wave
+        from sampletones_core.reconstructions.reconstructor.reconstructor import reconstruct_shared
+
+        audio_path = tmp_path / "test.wav"
+        audio = np.tile(synthetic_fragment.audio, 3).astype(np.float32)
+        write_wave(audio_path, config.library.sample_rate, audio)
+        louder = config.model_copy(update={"generation": config.generation.model_copy(update={"drive": 0.5})})
+        reconstructors = [_make_reconstructor(config, library_data), _make_reconstructor(louder, library_data)]
+
+        shared = reconstruct_shared(reconstructors, audio_path)
+        separate = [reconstructor(audio_path) for reconstructor in reconstructors]
+
+        assert len(shared) == len(separate) == 2
+        for shared_reconstruction, separate_reconstruction in zip(shared, separate):
+            assert shared_reconstruction is not None and separate_reconstruction is not None
+            assert shared_reconstruction.coefficient == separate_reconstruction.coefficient
+            np.testing.assert_array_equal(shared_reconstruction.approximation, separate_reconstruction.approximation)
+
+    def test_each_reconstructor_profiles_its_own_run(
+        self,
+        config: Config,
+        library_data: InstructionLibraryData,
+        synthetic_fragment: Fragment,
+        tmp_path: Path,
+    ) -> None:
+        from sampletones_core.audio import write_wave
+        from sampletones_core.reconstructions.reconstructor.reconstructor import reconstruct_shared
+
+        audio_path = tmp_path / "test.wav"
+        write_wave(audio_path, config.library.sample_rate, np.tile(synthetic_fragment.audio, 3).astype(np.float32))
+        reconstructors = [_make_reconstructor(config, library_data), _make_reconstructor(config, library_data)]
+
+        reconstruct_shared(reconstructors, audio_path)
+
+        first, second = (reconstructor.profile for reconstructor in reconstructors)
+        assert first is not second
+        assert first.counters[ProfileCounter.FRAMES] == second.counters[ProfileCounter.FRAMES]
+        assert ProfileStage.LOAD_AUDIO in second.stages
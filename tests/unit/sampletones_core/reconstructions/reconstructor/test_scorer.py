@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Tuple
+from dataclasses import dataclass
+from typing import List, Tuple
 
 import numpy as np
 import pytest
@@ -11,6 +12,8 @@ from sampletones_core.instructions import InstructionUnion
 from sampletones_core.library import InstructionLibraryData
 from sampletones_core.reconstructions.reconstructor.scorer import Scorer
 from sampletones_core.reconstructions.reconstructor.worker import ReconstructorWorker
+from tests.suite.base import BaseTestSuite
+from tests.suite.case import BaseRegularTestCase
 
 
 def _candidate_approximations(
@@ -124,3 +127,35 @@ class TestTopK:
         costs = worker.scorer.spectral_costs(synthetic_fragment, candidates)
         indices = Scorer.top_k(costs, costs.shape[0] + 10)
         assert indices.shape[0] == costs.shape[0]
+
+
+class TestWithinMargin(BaseTestSuite):
+    @dataclass(frozen=True, kw_only=True)
+    class TestCase(BaseRegularTestCase):
+        costs: List[float]
+        margin: float
+        min_k: int
+        max_k: int
+        expected: List[int]
+
+    test_cases = (
+        TestCase(costs=[0.1, 1.0, 2.0, 3.0], margin=0.5, min_k=1, max_k=4, expected=[0], label="decisive"),
+        TestCase(costs=[1.1, 1.0, 1.2, 5.0], margin=0.5, min_k=1, max_k=4, expected=[1, 0, 2], label="ambiguous"),
+        TestCase(costs=[0.1, 1.0, 2.0, 3.0], margin=0.5, min_k=2, max_k=4, expected=[0, 1], label="min_k"),
+        TestCase(costs=[1.1, 1.0, 1.2, 1.3], margin=0.5, min_k=1, max_k=2, expected=[1, 0], label="max_k"),
+        TestCase(costs=[1.0, 2.0], margin=0.0, min_k=5, max_k=8, expected=[0, 1], label="min_k_clamped"),
+        TestCase(costs=[0.0, 0.0, 1.0], margin=1.0, min_k=1, max_k=3, expected=[0, 1], label="zero_best"),
+    )
+
+    @pytest.mark.parametrize(
+        "test_case",
+        test_cases,
+        ids=lambda test_case: test_case.label,
+    )
+    def test_keeps_the_costs_within_the_margin_of_the_best(self, test_case: TestCase) -> None:
+        costs = np.array(test_case.costs)
+
+        indices = Scorer.within_margin(costs, test_case.margin, test_case.min_k, test_case.max_k)
+
+        assert set(indices.tolist()) == set(test_case.expected)
+        assert bool(np.all(np.diff(costs[indices]) >= 0.0))
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+from typing import Any, Dict, Final
+
+import numpy as np
 import pytest
 
 from sampletones_core.configs import Config
-from sampletones_core.fft import Fragment, Window
+from sampletones_core.constants.enums import GeneratorName, SelectorName, ShortlistMode
+from sampletones_core.fft import Fragment, FragmentedAudio, Window
+from sampletones_core.generators import GeneratorUnion
 from sampletones_core.instructions import InstructionUnion
 from sampletones_core.library import InstructionLibraryData
+from sampletones_core.reconstructions.reconstructor.profile import (
+    ProfileCounter,
+    ReconstructionProfile,
+)
 from sampletones_core.reconstructions.reconstructor.worker import ReconstructorWorker
 
+from .conftest import WORKER_SIGNAL_LENGTH
+
+SILENT_TAIL_FRAMES: Final[int] = 2
+
 
 class TestTwoStageScoring:
     def test_shortlist_is_ranked_by_aligned_cost_best_first(
@@ -47,3 +60,102 @@ class TestTwoStageScoring:
 
         assert scored[0].instruction == instruction
         assert scored[0].cost == pytest.approx(0.0, abs=1e-3)
+
+    def test_adaptive_shortlist_keeps_a_decisive_frame_short(
+        self,
+        config: Config,
+        window: Window,
+        generators: Dict[GeneratorName, GeneratorUnion],
+        library_data: InstructionLibraryData,
+        audible_instruction: InstructionUnion,
+    ) -> None:
+        decoder = config.generation.decoder.model_copy(
+            update={"shortlist": ShortlistMode.ADAPTIVE, "shortlist_margin": 0.0, "min_top_k": 1, "max_top_k": 16}
+        )
+        generation = config.generation.model_copy(update={"decoder": decoder})
+        worker = ReconstructorWorker(
+            config=config.model_copy(update={"generation": generation}),
+            window=window,
+            generators=generators,
+            library_data=library_data,
+            signal_length=WORKER_SIGNAL_LENGTH,
+            profile=ReconstructionProfile(),
+        )
+        library_fragment = library_data[audible_instruction]
+        target = library_fragment.get_fragment(0, config, window)
+
+        remaining_generators = dict(worker.generators.items())
+        remaining_generator_classes = worker.get_remaining_generator_classes(remaining_generators)
+        scored = worker.selector._score_candidates(target, remaining_generator_classes)
+
+        assert scored[0].instruction == audible_instruction
+        assert len(scored) < decoder.max_top_k
+        assert worker.profile.shortlist_sizes == {len(scored): 1}
+
+
+class TestSilenceFastPath:
+    @staticmethod
+    def _worker(
+        config: Config,
+        window: Window,
+        generators: Dict[GeneratorName, GeneratorUnion],
+        library_data: InstructionLibraryData,
+        **decoder_overrides: Any,
+    ) -> ReconstructorWorker:
+        decoder = config.generation.decoder.model_copy(update=decoder_overrides)
+        generation = config.generation.model_copy(update={"decoder": decoder})
+        return ReconstructorWorker(
+            config=config.model_copy(update={"generation": generation}),
+            window=window,
+            generators=generators,
+            library_data=library_data,
+            signal_length=WORKER_SIGNAL_LENGTH,
+            profile=ReconstructionProfile(),
+        )
+
+    @staticmethod
+    def _audio_with_tail(config: Config, window: Window, synthetic_fragment: Fragment) -> FragmentedAudio:
+        tail = np.zeros(SILENT_TAIL_FRAMES * config.library.frame_length, dtype=np.float32)
+        audio = np.concatenate([np.tile(synthetic_fragment.audio, 3).astype(np.float32), tail])
+        return FragmentedAudio.create(audio, config, window)
+
+    @pytest.mark.parametrize("selector", [SelectorName.GREEDY, SelectorName.VITERBI])
+    def test_silent_frames_are_switched_off_without_a_search(
+        self,
+        config: Config,
+        window: Window,
+        generators: Dict[GeneratorName, GeneratorUnion],
+        library_data: InstructionLibraryData,
+        synthetic_fragment: Fragment,
+        selector: SelectorName,
+    ) -> None:
+        worker = self._worker(config, window, generators, library_data, selector=selector)
+        fragmented_audio = self._audio_with_tail(config, window, synthetic_fragment)
+
+        result = worker(fragmented_audio, fragmented_audio.fragments_ids)
+
+        for fragment_id in fragmented_audio.fragments_ids[-SILENT_TAIL_FRAMES:]:
+            approximations = result[fragment_id]
+            assert set(approximations) == set(generators)
+            assert all(not approximation.instruction.on for approximation in approximations.values())
+            assert all(not np.any(approximation.approximation.audio) for approximation in approximations.values())
+
+        counters = worker.profile.counters
+        assert counters[ProfileCounter.SILENT_FRAMES] == SILENT_TAIL_FRAMES
+        assert counters[ProfileCounter.SKIPPED_SEARCHES] >= SILENT_TAIL_FRAMES * len(generators)
+
+    def test_zero_floor_searches_every_frame(
+        self,
+        config: Config,
+        window: Window,
+        generators: Dict[GeneratorName, GeneratorUnion],
+        library_data: InstructionLibraryData,
+        synthetic_fragment: Fragment,
+    ) -> None:
+        worker = self._worker(config, window, generators, library_data, silence_floor=0.0)
+        fragmented_audio = self._audio_with_tail(config, window, synthetic_fragment)
+
+        worker(fragmented_audio, fragmented_audio.fragments_ids)
+
+        assert ProfileCounter.SILENT_FRAMES not in worker.profile.counters
+        assert ProfileCounter.SKIPPED_SEARCHES not in worker.profile.counters
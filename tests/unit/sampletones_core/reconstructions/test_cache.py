@@ -0,0 +1,135 @@
+import os
+from pathlib import Path
+from typing import Final, List, Tuple
+
+import numpy as np
+import pytest
+
+from sampletones_core.configs import Config
+from sampletones_core.configs.general import GeneralConfig
+from sampletones_core.constants.enums import GeneratorName
+from sampletones_core.instructions import PulseInstruction
+from sampletones_core.reconstructions import Reconstruction
+from sampletones_core.reconstructions.cache import (
+    EVICTION_TARGET,
+    ReconstructionCache,
+    reconstruction_config_hash,
+)
+
+AUDIO_LENGTH: Final[int] = 64
+
+
+def _reconstruction(length: int = AUDIO_LENGTH) -> Reconstruction:
+    return Reconstruction.create(
+        approximation=np.linspace(-1.0, 1.0, length, dtype=np.float32),
+        approximations={GeneratorName.PULSE1: np.linspace(-1.0, 1.0, length, dtype=np.float32)},
+        instructions={GeneratorName.PULSE1: [PulseInstruction(on=True, pitch=60, volume=8, duty_cycle=0)]},
+        config=Config(),
+        coefficient=0.5,
+        audio_filepath=Path("original.wav"),
+    )
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ReconstructionCache:
+    return ReconstructionCache(directory=tmp_path / "cache")
+
+
+class TestReconstructionCacheKey:
+    def test_same_audio_and_settings_share_a_key(self, cache: ReconstructionCache) -> None:
+        audio = np.linspace(0.0, 1.0, AUDIO_LENGTH)
+
+        assert cache.key(audio, Config()) == cache.key(audio.copy(), Config())
+
+    def test_different_audio_has_another_key(self, cache: ReconstructionCache) -> None:
+        audio = np.linspace(0.0, 1.0, AUDIO_LENGTH)
+
+        assert cache.key(audio, Config()) != cache.key(audio[::-1], Config())
+
+    def test_different_settings_have_another_key(self, cache: ReconstructionCache) -> None:
+        audio = np.linspace(0.0, 1.0, AUDIO_LENGTH)
+        config = Config()
+        quantized = config.model_copy(update={"general": GeneralConfig(quantize=not config.general.quantize)})
+
+        assert cache.key(audio, config) != cache.key(audio, quantized)
+
+
+class TestReconstructionCacheEntries:
+    def test_missing_entry_is_a_miss(self, cache: ReconstructionCache) -> None:
+        assert cache.get("0" * 32, Config(), Path("song.wav")) is None
+
+    def test_stored_reconstruction_reads_back_for_the_asking_file(self, cache: ReconstructionCache) -> None:
+        stored = _reconstruction()
+        cache.put("a" * 32, stored)
+
+        hit = cache.get("a" * 32, Config(), Path("copy.wav"))
+
+        assert hit is not None
+        assert hit.audio_filepath == Path("copy.wav")
+        assert hit.id != stored.id
+        assert hit.coefficient == stored.coefficient
+        np.testing.assert_array_equal(hit.approximation, stored.approximation)
+
+    def test_unreadable_entry_is_discarded(self, cache: ReconstructionCache) -> None:
+        cache.directory.mkdir(parents=True)
+        entry = cache.directory / f"{'b' * 32}.stn"
+        entry.write_bytes(b"not a reconstruction")
+
+        assert cache.get("b" * 32, Config(), Path("song.wav")) is None
+        assert not entry.exists()
+
+    def test_least_recently_used_entries_are_evicted_past_the_cap(self, tmp_path: Path) -> None:
+        probe = ReconstructionCache(directory=tmp_path / "probe")
+        probe.put("0" * 32, _reconstruction())
+        entry_size = probe.nbytes
+        cache = ReconstructionCache(directory=tmp_path / "cache", max_bytes=3 * entry_size)
+
+        entries = []
+        for index in range(3):
+            key = str(index + 1) * 32
+            cache.put(key, _reconstruction())
+            entries.append(cache.directory / f"{key}.stn")
+            os.utime(entries[-1], ns=(0, (index + 1) * 1_000_000_000))
+        assert cache.get("1" * 32, Config(), Path("song.wav")) is not None
+        cache.put("4" * 32, _reconstruction())
+
+        first, second, third = entries
+        assert first.exists()
+        assert not second.exists()
+        assert not third.exists()
+        assert cache.nbytes <= cache.max_bytes * EVICTION_TARGET
+
+    def test_writes_under_the_cap_do_not_scan_the_directory(
+        self,
+        cache: ReconstructionCache,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        cache.put("1" * 32, _reconstruction())
+        scans: List[Path] = []
+        entries = ReconstructionCache._entries
+
+        def counted(scanned: ReconstructionCache) -> List[Tuple[int, Path, int]]:
+            scans.append(scanned.directory)
+            return entries(scanned)
+
+        monkeypatch.setattr(ReconstructionCache, "_entries", counted)
+
+        cache.put("2" * 32, _reconstruction())
+        cache.put("3" * 32, _reconstruction())
+
+        assert not scans
+        assert cache.nbytes == 3 * len(_reconstruction().serialize())
+
+
+class TestReconstructionConfigHash:
+    def test_worker_count_does_not_change_the_hash(self) -> None:
+        config = Config()
+        more_workers = config.model_copy(update={"general": GeneralConfig(max_workers=config.general.max_workers + 1)})
+
+        assert reconstruction_config_hash(config) == reconstruction_config_hash(more_workers)
+
+    def test_preprocessing_changes_the_hash(self) -> None:
+        config = Config()
+        quantized = config.model_copy(update={"general": GeneralConfig(quantize=not config.general.quantize)})
+
+        assert reconstruction_config_hash(config) != reconstruction_config_hash(quantized)
@@ -0,0 +1,161 @@
+import pickle
+from dataclasses import dataclass
+from typing import Final
+
+import msgpack
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from sampletones_core.structures.histogram import BinEdges, Histogram, HistogramArray
+from sampletones_shared.exceptions import DeserializationError
+from tests.suite.base import BaseTestSuite
+from tests.suite.case import BaseRegularTestCase
+
+EDGES: Final[np.ndarray] = np.array([0.0, 1.0, 3.0, 6.0], dtype=np.float32)
+VALUES: Final[np.ndarray] = np.array([2.0, 4.0, 9.0], dtype=np.float32)
+OTHER_VALUES: Final[np.ndarray] = np.array([1.0, 6.0, 3.0], dtype=np.float32)
+
+
+def _histogram(values: np.ndarray = VALUES) -> HistogramArray:
+    return HistogramArray.create(EDGES.copy(), values.copy())
+
+
+class TestBinEdges(BaseTestSuite):
+    @dataclass(frozen=True, kw_only=True)
+    class TestCase(BaseRegularTestCase):
+        edges: np.ndarray
+
+    test_cases = (
+        TestCase(edges=np.array([1.0], dtype=np.float32), label="single_edge"),
+        TestCase(edges=np.array([0.0, 2.0, 1.0], dtype=np.float32), label="decreasing"),
+        TestCase(edges=np.array([0.0, np.inf], dtype=np.float32), label="infinite"),
+        TestCase(edges=np.zeros((2, 2), dtype=np.float32), label="two_dimensional"),
+    )
+
+    @pytest.mark.parametrize(
+        "test_case",
+        test_cases,
+        ids=lambda test_case: test_case.label,
+    )
+    def test_invalid_edges_are_refused(self, test_case: TestCase) -> None:
+        with pytest.raises(ValueError):
+            BinEdges.intern(test_case.edges)
+
+    def test_equal_edges_intern_to_one_object(self) -> None:
+        assert BinEdges.intern(EDGES.copy()) is BinEdges.intern(EDGES.copy())
+
+    def test_edges_of_another_dtype_are_other_bins(self) -> None:
+        assert BinEdges.intern(EDGES) is not BinEdges.intern(EDGES.astype(np.float64))
+
+    def test_edges_and_widths_are_read_only(self) -> None:
+        bins = BinEdges.intern(EDGES)
+
+        assert_array_equal(bins.widths, np.diff(EDGES))
+        with pytest.raises(ValueError):
+            bins.edges[0] = 1.0
+
+    def test_unpickled_bins_are_interned(self) -> None:
+        bins = BinEdges.intern(EDGES)
+
+        assert pickle.loads(pickle.dumps(bins)) is bins
+
+
+class TestHistogramArrayMatchesHistogram:
+    def test_densities(self) -> None:
+        assert_array_equal(_histogram().densities, Histogram(edges=EDGES, values=VALUES).densities)
+
+    def test_apply(self) -> None:
+        result = HistogramArray.apply(np.sqrt, _histogram())
+        expected = Histogram.apply(np.sqrt, Histogram(edges=EDGES, values=VALUES))
+
+        assert_array_equal(result.values, expected.values)
+
+    def test_reduce(self) -> None:
+        result = HistogramArray.reduce(np.add, _histogram(), _histogram(OTHER_VALUES))
+        expected = Histogram.reduce(
+            np.add,
+            Histogram(edges=EDGES, values=VALUES),
+            Histogram(edges=EDGES, values=OTHER_VALUES),
+        )
+
+        assert_array_equal(result.values, expected.values)
+
+    def test_from_constant(self) -> None:
+        result = HistogramArray.from_constant(2.0, EDGES)
+
+        assert_array_equal(result.values, Histogram.from_constant(2.0, EDGES).values)
+
+    def test_rebin(self) -> None:
+        target = np.array([0.0, 2.0, 6.0], dtype=np.float32)
+
+        result = _histogram().rebin(target)
+
+        assert_allclose(result.values, Histogram(edges=EDGES, values=VALUES).rebin(target).values)
+        assert result.bins is BinEdges.intern(target)
+
+    def test_conversion_round_trips(self) -> None:
+        histogram = _histogram()
+
+        assert HistogramArray.from_histogram(histogram.to_histogram()) == histogram
+
+
+class TestHistogramArrayOperations:
+    def test_results_share_the_bins(self) -> None:
+        histogram = _histogram()
+
+        assert (histogram * 2.0).bins is histogram.bins
+        assert histogram.apply_with(np.sqrt).bins is histogram.bins
+
+    def test_histograms_over_other_edges_are_refused(self) -> None:
+        other = HistogramArray.create(EDGES * 2.0, VALUES)
+
+        with pytest.raises(ValueError):
+            HistogramArray.reduce(np.add, _histogram(), other)
+
+    def test_values_of_another_length_are_refused(self) -> None:
+        with pytest.raises(ValueError):
+            HistogramArray.create(EDGES, VALUES[:2])
+
+    def test_values_are_read_only(self) -> None:
+        histogram = _histogram()
+
+        with pytest.raises(ValueError):
+            histogram.values[0] = 0.0
+
+    def test_stack_holds_one_row_per_histogram(self) -> None:
+        stacked = HistogramArray.stack([_histogram(), _histogram(OTHER_VALUES)])
+
+        assert stacked.values.shape == (2, len(VALUES))
+        assert_array_equal(stacked.densities[1], _histogram(OTHER_VALUES).densities)
+
+    def test_slicing_keeps_the_leading_bins(self) -> None:
+        sliced = _histogram()[:2]
+
+        assert_array_equal(sliced.edges, EDGES[:3])
+        assert_array_equal(sliced.values, VALUES[:2])
+
+
+class TestHistogramArrayPacking:
+    def test_packed_layout_matches_the_histogram_model(self) -> None:
+        histogram = _histogram()
+
+        assert histogram.pack() == Histogram(edges=EDGES, values=VALUES).serialize_inner()
+
+    def test_pack_round_trips_through_msgpack(self) -> None:
+        histogram = _histogram()
+
+        unpacked = HistogramArray.unpack(msgpack.unpackb(msgpack.packb(histogram.pack()), raw=False))
+
+        assert unpacked == histogram
+        assert unpacked.bins is histogram.bins
+
+    def test_a_malformed_histogram_is_refused(self) -> None:
+        with pytest.raises(DeserializationError):
+            HistogramArray.unpack({"edges": EDGES.tobytes(), "values": VALUES[:1].tobytes()})
+
+    def test_validate_refuses_non_finite_values(self) -> None:
+        histogram = HistogramArray.create(EDGES, np.array([1.0, np.inf, 2.0], dtype=np.float32))
+
+        with pytest.raises(ValueError):
+            histogram.validate()
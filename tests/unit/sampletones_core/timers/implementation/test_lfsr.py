@@ -4,7 +4,12 @@ import numpy as np
 import pytest
 
 from sampletones_core.constants.general import MAX_LFSR, MAX_LFSR_SHORT, NOISE_PERIODS
-from sampletones_core.timers.implementation.lfsr import LFSRTimer
+from sampletones_core.timers.implementation.lfsr import (
+    OFF_CYCLE,
+    LFSRTimer,
+    lfsr_cycle,
+    step_lfsr,
+)
 from tests.suite.case import BaseTestCase
 from tests.suite.noise import (
     NoiseReferenceState,
@@ -127,6 +132,34 @@ class TestLFSRPeriod:
         assert len(set(visited)) == MAX_LFSR_SHORT
 
 
+class TestLFSRTables:
+    @pytest.mark.parametrize("short", [False, True], ids=["long", "short"])
+    def test_cycle_matches_stepping_the_register(self, short: bool) -> None:
+        lfsrs, lfsr_to_index = lfsr_cycle(short)
+
+        expected = [1]
+        while len(expected) < len(lfsrs):
+            expected.append(step_lfsr(expected[-1], short))
+
+        assert lfsrs.tolist() == expected
+        assert step_lfsr(expected[-1], short) == 1
+        assert lfsr_to_index[lfsrs].tolist() == list(range(len(lfsrs)))
+        assert int(np.count_nonzero(lfsr_to_index != OFF_CYCLE)) == len(lfsrs)
+
+    def test_timers_share_one_set_of_tables(self) -> None:
+        first = LFSRTimer(sample_rate=SAMPLE_RATE, nes_frequency=NES_FREQUENCY)
+        second = LFSRTimer(sample_rate=SAMPLE_RATE, nes_frequency=NES_FREQUENCY)
+
+        for short in (False, True):
+            assert first.lfsr_tables[short] is second.lfsr_tables[short]
+
+    def test_shared_tables_are_read_only(self, long_timer: LFSRTimer) -> None:
+        tables = long_timer.lfsr_tables[False]
+
+        with pytest.raises(ValueError):
+            tables.bit_prefix[0] = 1
+
+
 class TestLFSRValidate:
     @pytest.mark.parametrize(
         "initials",
@@ -0,0 +1,181 @@
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Final, List
+
+import pytest
+
+from sampletones_core.configs import Config
+from sampletones_core.constants.enums import GeneratorName
+from sampletones_core.exporters.naming import instrument_slice_name
+from sampletones_core.reconstructions import ReconstructionCache
+from sampletones_core.reconstructions.converter import ConversionStatus
+from sampletones_core.trackers.batch import task
+from sampletones_core.trackers.batch.exporter import BatchExporter, get_export_inputs
+from sampletones_core.trackers.batch.task import export_file, sample_export
+from sampletones_core.trackers.format import BATCH_EXPORT_FORMATS, TrackerFormat
+from sampletones_shared.logger import null_logger
+from sampletones_shared.paths.extensions import EXT_FILE_BITPHASE, EXT_FILE_INSTRUMENT
+from tests.conftest import ReconstructionFactory
+from tests.suite.base import BaseTestSuite
+from tests.suite.case import BaseRegularTestCase
+
+SAMPLE_NAME: Final[str] = "kick"
+
+
+def _write_files(root: Path, *relatives: str) -> None:
+    for relative in relatives:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+class TestGetExportInputs(BaseTestSuite):
+    @dataclass(frozen=True, kw_only=True)
+    class TestCase(BaseRegularTestCase):
+        files: List[str]
+        expected: List[str]
+
+    test_cases = (
+        TestCase(
+            files=["a.wav", "b/c.mp3"],
+            expected=["a.wav", "b/c.mp3"],
+            label="audio_only",
+        ),
+        TestCase(
+            files=["a.wav", "a.stn", "b.wav"],
+            expected=["a.stn", "b.wav"],
+            label="reconstruction_stands_for_its_audio",
+        ),
+        TestCase(
+            files=["a.wav", "b/a.stn", "notes.txt"],
+            expected=["a.wav", "b/a.stn"],
+            label="reconstruction_elsewhere_keeps_the_audio",
+        ),
+    )
+
+    @pytest.mark.parametrize(
+        "test_case",
+        test_cases,
+        ids=lambda test_case: test_case.label,
+    )
+    def test_inputs(self, test_case: TestCase, tmp_path: Path) -> None:
+        _write_files(tmp_path, *test_case.files)
+
+        inputs = get_export_inputs(tmp_path)
+
+        assert [path.relative_to(tmp_path).as_posix() for path in inputs] == test_case.expected
+
+    def test_a_file_is_its_own_input(self, tmp_path: Path) -> None:
+        _write_files(tmp_path, "a.wav", "a.stn")
+
+        assert get_export_inputs(tmp_path / "a.wav") == [tmp_path / "a.wav"]
+
+
+def test_sample_export_names_each_playing_channel(reconstruction_factory: ReconstructionFactory) -> None:
+    reconstruction = reconstruction_factory()
+
+    sample = sample_export(reconstruction, SAMPLE_NAME)
+
+    assert sample.name == SAMPLE_NAME
+    assert [instrument.name for instrument in sample.instruments] == [
+        instrument_slice_name(SAMPLE_NAME, GeneratorName.PULSE1)
+    ]
+    assert all(not instrument.loop for instrument in sample.instruments)
+
+
+class TestExportFile(BaseTestSuite):
+    @dataclass(frozen=True, kw_only=True)
+    class TestCase(BaseRegularTestCase):
+        tracker_format: TrackerFormat
+        extension: str
+
+    test_cases = (
+        TestCase(tracker_format=TrackerFormat.FAMITRACKER, extension=EXT_FILE_INSTRUMENT, label="famitracker"),
+        TestCase(tracker_format=TrackerFormat.BITPHASE, extension=EXT_FILE_BITPHASE, label="bitphase"),
+    )
+
+    @pytest.mark.parametrize(
+        "test_case",
+        test_cases,
+        ids=lambda test_case: test_case.label,
+    )
+    def test_a_reconstruction_is_written(
+        self,
+        test_case: TestCase,
+        tmp_path: Path,
+        reconstruction_factory: ReconstructionFactory,
+    ) -> None:
+        input_path = tmp_path / f"{SAMPLE_NAME}.stn"
+        reconstruction_factory().save(input_path)
+        destination = tmp_path / "out" / "nested" / f"{SAMPLE_NAME}{test_case.extension}"
+
+        outcome = export_file((Config(), None, test_case.tracker_format, input_path, destination))
+
+        assert outcome.status == ConversionStatus.COMPLETED
+        assert outcome.paths
+        assert all(path.exists() and path.suffix == test_case.extension for path in outcome.paths)
+
+    def test_an_unreadable_reconstruction_fails_without_raising(self, tmp_path: Path) -> None:
+        input_path = tmp_path / f"{SAMPLE_NAME}.stn"
+        input_path.write_bytes(b"not a reconstruction")
+
+        outcome = export_file((Config(), None, TrackerFormat.FAMITRACKER, input_path, tmp_path / "out.fti"))
+
+        assert outcome.status == ConversionStatus.FAILED
+        assert outcome.error
+        assert not outcome.paths
+
+
+class TestWorkerReconstructor:
+    @pytest.fixture(autouse=True)
+    def _stub_reconstructor(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(task, "_RECONSTRUCTORS", {})
+        monkeypatch.setattr(
+            task,
+            "Reconstructor",
+            lambda config, cache=None: SimpleNamespace(config=config, cache=cache),
+        )
+
+    def test_one_configuration_shares_its_reconstructor(self) -> None:
+        config = Config()
+
+        assert task._reconstructor(config, None) is task._reconstructor(config.model_copy(), None)
+
+    def test_another_library_directory_gets_its_own_reconstructor(self, tmp_path: Path) -> None:
+        config = Config()
+        moved = config.model_copy(
+            update={"general": config.general.model_copy(update={"library_directory": str(tmp_path)})}
+        )
+
+        reconstructor = task._reconstructor(moved, None)
+
+        assert reconstructor is not task._reconstructor(config, None)
+        assert reconstructor.config is moved
+
+    def test_the_reconstruction_cache_is_passed_through(self, tmp_path: Path) -> None:
+        cache = ReconstructionCache(directory=tmp_path)
+
+        task._reconstructor(Config(), None)
+        reconstructor = task._reconstructor(Config(), cache)
+
+        assert reconstructor.cache is cache
+
+
+def test_destinations_mirror_the_input_directory(tmp_path: Path) -> None:
+    _write_files(tmp_path / "in", "a.stn", "b/c.wav")
+    output_path = tmp_path / "out"
+    exporter = BatchExporter(
+        Config(),
+        tmp_path / "in",
+        output_path,
+        BATCH_EXPORT_FORMATS["bitphase"],
+        logger=null_logger,
+    )
+
+    tasks = exporter._create_tasks()
+
+    assert [task[4] for task in tasks] == [
+        (output_path / "a").with_suffix(EXT_FILE_BITPHASE).absolute(),
+        (output_path / "b" / "c").with_suffix(EXT_FILE_BITPHASE).absolute(),
+    ]
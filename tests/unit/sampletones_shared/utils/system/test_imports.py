@@ -0,0 +1,85 @@
+import importlib
+import sys
+import time
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterator
+
+import pytest
+
+from sampletones_shared.utils.system import imports
+from sampletones_shared.utils.system.imports import ImportTimer
+
+OUTER_MODULE = "timed_outer_module"
+INNER_MODULE = "timed_inner_module"
+
+
+class Clock:
+    """A clock that only moves when a module sleeps, so the timings a test reads are exact."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+    monkeypatch.setattr(imports, "time", SimpleNamespace(perf_counter=clock.perf_counter))
+    return clock
+
+
+@pytest.fixture
+def modules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    (tmp_path / f"{INNER_MODULE}.py").write_text("import time\ntime.sleep(0.02)\n")
+    (tmp_path / f"{OUTER_MODULE}.py").write_text(f"import time\nimport {INNER_MODULE}\ntime.sleep(0.01)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.invalidate_caches()
+    yield tmp_path
+    for name in (OUTER_MODULE, INNER_MODULE):
+        sys.modules.pop(name, None)
+
+
+def test_records_own_and_nested_import_time(modules: Path) -> None:
+    with ImportTimer() as timer:
+        importlib.import_module(OUTER_MODULE)
+
+    outer, inner = timer.timings[OUTER_MODULE], timer.timings[INNER_MODULE]
+    assert inner.own == pytest.approx(0.02)
+    assert outer.own == pytest.approx(0.01)
+    assert outer.nested == pytest.approx(inner.cumulative)
+    assert outer.cumulative == pytest.approx(0.03)
+    assert timer.slowest(1) == [inner]
+    assert timer.total == pytest.approx(outer.cumulative)
+
+
+def test_groups_timings_by_top_level_package(modules: Path) -> None:
+    with ImportTimer() as timer:
+        importlib.import_module(OUTER_MODULE)
+
+    assert set(timer.by_package()) == {OUTER_MODULE, INNER_MODULE}
+
+
+def test_hands_the_loader_back_and_uninstalls(modules: Path) -> None:
+    with ImportTimer() as timer:
+        module = importlib.import_module(OUTER_MODULE)
+
+    assert timer not in sys.meta_path
+    assert isinstance(module.__loader__, SourceFileLoader)
+    assert isinstance(module.__spec__.loader, SourceFileLoader)
+
+
+def test_modules_already_imported_are_not_timed(modules: Path) -> None:
+    importlib.import_module(INNER_MODULE)
+
+    with ImportTimer() as timer:
+        importlib.import_module(OUTER_MODULE)
+
+    assert INNER_MODULE not in timer.timings
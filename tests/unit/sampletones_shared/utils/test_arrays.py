@@ -10,6 +10,7 @@ from sampletones_shared.utils.arrays import (
     cast_to_float,
     clamp,
     hold,
+    hold_span,
     infer_dtype,
     interpolate_segment,
     is_increasing,
@@ -1803,6 +1804,90 @@ class TestHold(BaseTestSuite):
         assert result == test_case.expected
 
 
+class TestHoldSpan(BaseTestSuite):
+    @dataclass(frozen=True, kw_only=True)
+    class TestCase(BaseRegularTestCase):
+        expected: Union[np.ndarray, Type[Exception]]
+        array: Any
+        length: Any
+        default: Any
+
+    test_cases = (
+        TestCase(
+            array=np.array([12, 5, 7]),
+            length=5,
+            default=0,
+            expected=np.array([12, 5, 7, 7, 7]),
+            label="final_value_held_past_the_end",
+        ),
+        TestCase(
+            array=np.array([12, 5, 7]),
+            length=2,
+            default=0,
+            expected=np.array([12, 5]),
+            label="shorter_span_reads_the_leading_frames",
+        ),
+        TestCase(
+            array=np.array([12, 5, 7]),
+            length=0,
+            default=0,
+            expected=np.array([], dtype=np.int64),
+            label="empty_span",
+        ),
+        TestCase(
+            array=np.array([], dtype=np.int8),
+            length=3,
+            default=7,
+            expected=np.array([7, 7, 7], dtype=np.int8),
+            label="empty_envelope_reads_as_the_default",
+        ),
+        TestCase(
+            array=np.array([1, 2, 3]),
+            length=-1,
+            default=0,
+            expected=ValueError,
+            label="negative_length_rejected",
+        ),
+        TestCase(
+            array=np.array([[1, 2], [3, 4]]),
+            length=2,
+            default=0,
+            expected=ValueError,
+            label="array_not_1d",
+        ),
+        TestCase(
+            array=[1, 2, 3],
+            length=2,
+            default=0,
+            expected=TypeError,
+            label="list_not_array",
+        ),
+    )
+
+    @pytest.mark.parametrize(
+        "test_case",
+        test_cases,
+        ids=lambda test_case: test_case.label,
+    )
+    def test_hold_span(self, test_case: TestCase) -> None:
+        if expect_error(
+            hold_span,
+            test_case.expected,
+            test_case.array,
+            test_case.length,
+            default=test_case.default,
+        ):
+            return
+
+        result = hold_span(test_case.array, test_case.length, default=test_case.default)
+        assert_array_equal(result, test_case.expected)
+
+    def test_matches_hold_at_every_index(self) -> None:
+        array = np.array([3, 1, 4, 1, 5])
+        result = hold_span(array, 9, default=0)
+        assert result.tolist() == [hold(array, index, default=0) for index in range(9)]
+
+
 class TestInterpolateSegment(BaseTestSuite):
     @dataclass(frozen=True, kw_only=True)
     class TestCase(BaseRegularTestCase):